@@ -5,7 +5,7 @@ a = Analysis(
     ['main.py'],
     pathex=[],
     binaries=[],
-    datas=[('data/cultures.json', 'data')],
+    datas=[('data/cultures.json', 'data'), ('data/buildings.json', 'data'), ('data/events.json', 'data')],
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
@@ -0,0 +1,58 @@
+"""Simulation throughput (months/sec) against the number of AI rulers.
+
+    PYTHONPATH=. python3 benchmarks/bench_ai_events.py [months]
+
+Every AI ruler gets an event roll each month. "batched" is the engine's
+process_ai_events; "one by one" rolls each ruler with get_random_event
+and its own random numbers, for comparison. Past a few hundred rulers the
+time goes into the events' effects (a feast touches every character's
+opinion of the host), not into rolling.
+"""
+from bloodlines.engine import GameEngine, EVENT_CHANCE
+from bloodlines.logbook import LogLevel
+from bloodlines.models import Character, Polity, GovernmentType
+import random
+import sys
+import time
+
+RULER_COUNTS = (0, 10, 100, 1000, 2000)
+
+def one_by_one(engine):
+    for char_id in engine.ai_rulers():
+        if random.random() < EVENT_CHANCE:
+            event = engine.event_manager.get_random_event(engine, char_id)
+            if event:
+                engine.apply_event_option(char_id, event, engine.ai_event_policy(engine, event, char_id))
+
+def world(rulers):
+    random.seed(15)
+    engine = GameEngine()
+    engine.create_test_scenario()
+    engine.logbook.set_level("economy", LogLevel.OFF)
+    for i in range(rulers):
+        ruler = Character(name=f"Ruler {i}", age=random.randint(20, 40))
+        engine.characters[ruler.id] = ruler
+        polity = Polity(name=f"Realm {i}", government_type=GovernmentType.TRIBE, ruler_id=ruler.id)
+        engine.polities[polity.id] = polity
+    return engine
+
+def months_per_sec(engine, months):
+    start = time.perf_counter()
+    for _ in range(months):
+        engine.advance_month()
+        engine.current_event = None  # The player always dismisses their event
+    return months / (time.perf_counter() - start)
+
+def main():
+    months = int(sys.argv[1]) if len(sys.argv) > 1 else 24
+    months_per_sec(world(10), 12)  # Warm up lazy imports
+    print(f"{'AI rulers':>9} {'batched':>12} {'one by one':>12}")
+    for rulers in RULER_COUNTS:
+        batched = months_per_sec(world(rulers), months)
+        engine = world(rulers)
+        engine.process_ai_events = lambda: one_by_one(engine)
+        sequential = months_per_sec(engine, months)
+        print(f"{rulers:>9} {batched:>8.1f} m/s {sequential:>8.1f} m/s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Autosave latency: full binary snapshot vs. one journalled delta.
+
+    PYTHONPATH=. python3 benchmarks/bench_autosave.py [characters ...]
+
+Each month a small fraction of the population is touched (wealth, health,
+opinions) and a few children are born, then the world is autosaved.
+"""
+from bloodlines.engine import GameEngine
+from bloodlines.models import Character
+from bloodlines import autosave
+import os
+import random
+import sys
+import tempfile
+import time
+
+def build_world(size):
+    engine = GameEngine()
+    engine.create_test_scenario()
+    for i in range(size):
+        char = Character(name=f"Citizen {i}", age=random.randint(0, 70),
+                         gender=random.choice(("Male", "Female")), culture="Roman",
+                         wealth=random.randint(0, 500))
+        engine.characters[char.id] = char
+    return engine
+
+def touch_month(engine, ids, changed):
+    for char_id in random.sample(ids, changed):
+        engine.modify_wealth(char_id, random.randint(-20, 20))
+        engine.modify_health(char_id, -0.01)
+        engine.modify_opinion(char_id, random.choice(ids), 5)
+    player_id = engine.player_character_id
+    for _ in range(3):
+        engine.create_child(engine.characters[player_id].spouse_id, player_id)
+
+def run(size, months=5):
+    random.seed(9)
+    engine = build_world(size)
+    ids = list(engine.characters)
+    changed = max(10, size // 1000)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "auto.sav")
+        engine.enable_autosave(path, compact_every=months + 1)
+        start = time.perf_counter()
+        engine.autosaver.save()
+        full = time.perf_counter() - start
+
+        deltas = []
+        for _ in range(months):
+            touch_month(engine, ids, changed)
+            start = time.perf_counter()
+            engine.autosaver.save()
+            deltas.append(time.perf_counter() - start)
+        journal = os.path.getsize(autosave.journal_path(path))
+
+        loaded = GameEngine()
+        start = time.perf_counter()
+        assert loaded.load_game(path)
+        load = time.perf_counter() - start
+    delta = sum(deltas) / len(deltas)
+    print(f"{size:>9} chars, ~{changed} touched/month | full {full * 1000:8.1f} ms | "
+          f"delta {delta * 1000:7.2f} ms ({full / delta:6.0f}x) | "
+          f"journal {journal / 1e3:7.1f} kB | load+replay {load:6.2f}s")
+
+def main():
+    sizes = [int(a) for a in sys.argv[1:]] or [10_000, 100_000, 1_000_000]
+    for size in sizes:
+        run(size)
+
+if __name__ == "__main__":
+    main()
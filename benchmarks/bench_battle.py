@@ -0,0 +1,41 @@
+"""Battles: one army-scale battle, and win odds by Monte Carlo vs. fighting battles one by one.
+
+    PYTHONPATH=. python3 benchmarks/bench_battle.py [men per side] [battles]
+
+Both armies are levied in units of 100, so the default 300k men a side is
+3000 units each.
+"""
+from bloodlines.battle import Army, resolve_battle, win_probability
+from bloodlines.models import Terrain
+import numpy as np
+import sys
+import time
+
+def main():
+    men = int(sys.argv[1]) if len(sys.argv) > 1 else 300_000
+    battles = int(sys.argv[2]) if len(sys.argv) > 2 else 10_000
+    rng = np.random.default_rng(25)
+    attacker = lambda: Army.levy("Roman", men)
+    defender = lambda: Army.levy("Greek", int(men * 0.85), elite_share=0.3)
+
+    start = time.perf_counter()
+    result = resolve_battle(attacker(), defender(), Terrain.HILLS, rng)
+    battle_ms = (time.perf_counter() - start) * 1000
+
+    sample = 200
+    start = time.perf_counter()
+    fought = sum(resolve_battle(attacker(), defender(), Terrain.HILLS, rng).winner == "attacker"
+                 for _ in range(sample)) / sample
+    one_by_one_s = (time.perf_counter() - start) / sample * battles
+
+    start = time.perf_counter()
+    odds = win_probability(attacker(), defender(), Terrain.HILLS, rng, battles)
+    odds_ms = (time.perf_counter() - start) * 1000
+
+    print(f"{len(attacker())} vs {len(defender())} units: {result.winner} wins in {result.rounds} rounds, "
+          f"{battle_ms:.0f} ms")
+    print(f"odds one by one   {one_by_one_s:7.1f} s for {battles} battles (estimated from {sample}): {fought:.2f}")
+    print(f"odds Monte Carlo  {odds_ms:7.0f} ms for {battles} battles: {odds:.2f}")
+
+if __name__ == "__main__":
+    main()
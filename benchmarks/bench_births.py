@@ -0,0 +1,61 @@
+"""process_births: fertility candidate set vs. the old full character scan.
+
+    PYTHONPATH=. python3 benchmarks/bench_births.py [characters]
+"""
+from bloodlines.engine import GameEngine, BIRTH_CHANCE
+from bloodlines.models import Character
+import random
+import sys
+import time
+
+def scan_births(engine):
+    """The pre-index process_births candidate loop (returns mothers instead of creating children)."""
+    mothers = []
+    for char_id, char in list(engine.characters.items()):
+        if not char.is_alive or char.gender != "Female":
+            continue
+        if 16 <= char.age <= 45 and char.spouse_id:
+            spouse = engine.characters.get(char.spouse_id)
+            if spouse and spouse.is_alive:
+                if random.random() < BIRTH_CHANCE:
+                    mothers.append(char_id)
+    return mothers
+
+def build_population(engine, size):
+    """Married couples of all ages; only a fraction of the wives are fertile."""
+    while len(engine.characters) < size:
+        husband = Character(name="Husband", age=random.randint(16, 80), gender="Male")
+        wife = Character(name="Wife", age=random.randint(10, 80), gender="Female",
+                         spouse_id=husband.id, is_alive=random.random() < 0.7)
+        husband.spouse_id = wife.id
+        engine.characters[husband.id] = husband
+        engine.characters[wife.id] = wife
+    engine.fertility.rebuild()
+
+def timeit(fn, months):
+    start = time.perf_counter()
+    births = 0
+    for _ in range(months):
+        births += len(fn())
+    return (time.perf_counter() - start) / months, births / months
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    months = 100
+    random.seed(3)
+    engine = GameEngine()
+    build_population(engine, size)
+    print(f"{len(engine.characters)} characters, {len(engine.fertility)} fertile candidates")
+
+    scan, scan_births_avg = timeit(lambda: scan_births(engine), months)
+    engine.fertility.mode = "per_candidate"
+    per, per_births = timeit(lambda: engine.fertility.pick_mothers(BIRTH_CHANCE), months)
+    engine.fertility.mode = "binomial"
+    binom, binom_births = timeit(lambda: engine.fertility.pick_mothers(BIRTH_CHANCE), months)
+
+    print(f"Full scan:            {scan * 1000:8.3f} ms/month  ({scan_births_avg:.1f} births/month)")
+    print(f"Candidate set:        {per * 1000:8.3f} ms/month  ({per_births:.1f} births/month, {scan / per:.0f}x)")
+    print(f"Binomial + sampling:  {binom * 1000:8.3f} ms/month  ({binom_births:.1f} births/month, {scan / binom:.0f}x)")
+
+if __name__ == "__main__":
+    main()
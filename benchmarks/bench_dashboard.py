@@ -0,0 +1,89 @@
+"""Terminal output per turn: full dashboard reprint vs. the incremental Live dashboard.
+
+    PYTHONPATH=. python3 benchmarks/bench_dashboard.py [months] [width] [height]
+
+Both render into an in-memory terminal of the given size. "reprint" is the
+old main loop: a new Layout each turn, printed below a separator.
+"""
+from bloodlines.engine import GameEngine
+from bloodlines.dashboard import Dashboard
+from rich.console import Console
+from rich.layout import Layout
+from rich.panel import Panel
+from rich.table import Table
+import io
+import sys
+import time
+
+def generate_dashboard(engine) -> Layout:
+    """The dashboard as main.py built it before bloodlines.dashboard."""
+    layout = Layout()
+    layout.split_column(Layout(name="header", size=3), Layout(name="body"), Layout(name="footer", size=3))
+    layout["body"].split_row(Layout(name="left"), Layout(name="right"))
+    player = engine.characters[engine.player_character_id]
+    dynasty = engine.dynasties[player.dynasty_id]
+    title = engine.get_character_title(player.id)
+    location = engine.regions[player.location_id].name if player.location_id else "Unknown"
+    layout["header"].update(Panel(f"DATE: {engine.get_date_string()} | DYNASTY: {dynasty.name} | "
+                                  f"HEAD: {player.name} ({title}) | LOC: {location}", style="bold white on blue"))
+    stats_table = Table(title=f"Character Stats ({player.culture})")
+    stats_table.add_column("Stat", style="cyan")
+    stats_table.add_column("Value", style="magenta")
+    stats_table.add_row("Title", title)
+    stats_table.add_row("Age", str(player.age))
+    stats_table.add_row("Wealth", str(player.wealth))
+    stats_table.add_row("Health", f"{player.health:.1f}")
+    stats_table.add_row("Martial", str(player.martial))
+    stats_table.add_row("Diplomacy", str(player.diplomacy))
+    if player.location_id:
+        current_region = engine.regions[player.location_id]
+        stats_table.add_row("Neighbors", ", ".join(engine.regions[nid].name for nid in current_region.neighbors))
+    layout["left"].update(Panel(stats_table, title="Current Character"))
+    layout["right"].update(Panel("\n".join(engine.logbook.tail(10)), title="Events Log", style="green"))
+    layout["footer"].update(Panel("[ENTER] Next Month | [M] Move | [B] Build | [R] Relationships | [S] Save | "
+                                  "[L] Load | [Q] Quit", title="Commands"))
+    return layout
+
+def world():
+    engine = GameEngine(seed=17)
+    engine.create_test_scenario()
+    return engine
+
+def turn(engine):
+    engine.advance_month()
+    if engine.current_event:
+        engine.resolve_event(0)
+
+def main():
+    months = int(sys.argv[1]) if len(sys.argv) > 1 else 120
+    width = int(sys.argv[2]) if len(sys.argv) > 2 else 120
+    height = int(sys.argv[3]) if len(sys.argv) > 3 else 40
+
+    engine, out = world(), io.StringIO()
+    console = Console(file=out, force_terminal=True, force_interactive=True, width=width, height=height)
+    start = time.perf_counter()
+    for _ in range(months):
+        turn(engine)
+        out.write("\n" + "=" * 60 + "\n\n")
+        console.print(generate_dashboard(engine))
+        out.write("=" * 60 + "\n")
+    reprint_time = time.perf_counter() - start
+    reprint = len(out.getvalue().encode("utf-8"))
+
+    engine, out = world(), io.StringIO()
+    console = Console(file=out, force_terminal=True, force_interactive=True, width=width, height=height)
+    start = time.perf_counter()
+    with Dashboard(engine, console) as dashboard:
+        for _ in range(months):
+            turn(engine)
+            dashboard.update(force=True)
+    live_time = time.perf_counter() - start
+    live = len(out.getvalue().encode("utf-8"))
+
+    print(f"{months} turns on a {width}x{height} terminal")
+    print(f"reprint {reprint / months:9.0f} bytes/turn {reprint_time / months * 1000:6.2f} ms/turn")
+    print(f"live    {live / months:9.0f} bytes/turn {live_time / months * 1000:6.2f} ms/turn "
+          f"({reprint / live:.0f}x fewer bytes, {dashboard.rebuilds} section rebuilds)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Regional demography: a Python loop over Region objects vs. the vectorized RegionalEconomy step.
+
+    PYTHONPATH=. python3 benchmarks/bench_demography.py [regions] [months]
+
+The loop applies the same model to one region at a time, as a per-region
+process_regions would. The rulers' tax collection is timed alongside the
+vectorized step.
+"""
+from bloodlines.demography import (ADULTHOOD_MONTHS, BIRTH_RATE, CHILDHOOD_MONTHS, COHORT_SHARES, DEATH_RATES,
+                                   FAMINE_MORTALITY, FARM_HARVEST, FOOD_PRICE, RATIONS, TAX_RATE, TERRAIN_YIELDS,
+                                   WEALTH_DECAY)
+from bloodlines.engine import GameEngine
+import sys
+import time
+
+def loop_step(regions, cohorts, wealth):
+    """The same month, one region at a time."""
+    for region in regions:
+        children, adults, elders = cohorts[region.id]
+        food_yield, land, trade = TERRAIN_YIELDS[region.terrain]
+        harvest = food_yield * adults / (1 + adults / land) + region.buildings.get("farm", 0) * FARM_HARVEST
+        eaten = children * RATIONS[0] + adults * RATIONS[1] + elders * RATIONS[2]
+        hunger = min(max(1 - harvest / eaten, 0.0), 1.0) if eaten > 0 else 0.0
+        output = adults * trade + max(harvest - eaten, 0.0) * FOOD_PRICE
+        wealth[region.id] += output * (1 - TAX_RATE) - wealth[region.id] * WEALTH_DECAY
+        births = adults * BIRTH_RATE * (1 - hunger)
+        grown, aged = children / CHILDHOOD_MONTHS, adults / ADULTHOOD_MONTHS
+        scale = 1 + FAMINE_MORTALITY * hunger
+        cohorts[region.id] = (
+            max(children * (1 - DEATH_RATES[0] * scale) + births - grown, 0.0),
+            max(adults * (1 - DEATH_RATES[1] * scale) + grown - aged, 0.0),
+            max(elders * (1 - DEATH_RATES[2] * scale) + aged, 0.0),
+        )
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    months = int(sys.argv[2]) if len(sys.argv) > 2 else 24
+    engine = GameEngine(seed=24)
+    engine.create_test_scenario()
+    engine.world_manager.generate_map(count, seed=24)
+    regions = list(engine.regions.values())
+
+    cohorts = {r.id: tuple(r.population * share for share in COHORT_SHARES) for r in regions}
+    wealth = {r.id: float(r.wealth) for r in regions}
+    start = time.perf_counter()
+    for _ in range(months):
+        loop_step(regions, cohorts, wealth)
+    loop_ms = (time.perf_counter() - start) * 1000 / months
+
+    start = time.perf_counter()
+    engine.enable_demography()
+    setup_ms = (time.perf_counter() - start) * 1000
+    demography = engine.demography
+    start = time.perf_counter()
+    for _ in range(months):
+        demography.step()
+        demography.ruler_taxes()
+    vector_ms = (time.perf_counter() - start) * 1000 / months
+
+    loop_total = sum(sum(c) for c in cohorts.values())
+    vector_total = demography.cohorts.sum()
+    assert abs(loop_total - vector_total) < 1e-6 * vector_total
+    print(f"{len(regions)} regions, {months} months, population {vector_total:,.0f}")
+    print(f"loop       {loop_ms:8.1f} ms/month")
+    print(f"vectorized {vector_ms:8.2f} ms/month ({loop_ms / vector_ms:.0f}x; arrays built in {setup_ms:.0f} ms)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Loading a large event pack: parsing and validating JSON vs. the compiled cache.
+
+    PYTHONPATH=. python3 benchmarks/bench_eventpacks.py [events]
+
+The pack repeats the shapes of the core events with varied thresholds.
+"""
+from bloodlines.eventpacks import load_pack
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+def synthetic_pack(count):
+    triggers = ["True", "wealth >= {n} and character_count > 1", "age > {n} and not married",
+                "health < {n} or year < 0", "is_ruler and children >= 2"]
+    events = []
+    for i in range(count):
+        n = random.randint(1, 100)
+        events.append({
+            "id": f"event_{i}", "title": f"Event {i}", "description": "Something happens.",
+            "weight": random.randint(1, 20), "trigger": random.choice(triggers).format(n=n),
+            "options": [
+                {"text": "Pay", "effects": [{"if": f"wealth >= {n}", "then": [{"wealth": -n}],
+                                             "else": [{"log": "Too poor.", "kind": "event"}]}]},
+                {"text": "Refuse", "target": "random_other",
+                 "effects": [{"chance": 0.5, "then": [{"target_opinion": -5}], "else": [{"health": -0.5}]}]},
+            ],
+        })
+    return {"pack": "bench", "events": events}
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    random.seed(14)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "pack.json")
+        with open(path, "w") as f:
+            json.dump(synthetic_pack(count), f)
+        cache = os.path.join(tmp, "cache")
+
+        start = time.perf_counter()
+        load_pack(path, cache)
+        cold = time.perf_counter() - start
+        start = time.perf_counter()
+        events = load_pack(path, cache)
+        warm = time.perf_counter() - start
+
+    print(f"{len(events)} events")
+    print(f"cold (parse + validate) {cold * 1000:8.1f} ms")
+    print(f"warm (cached)           {warm * 1000:8.1f} ms ({cold / warm:.1f}x)")
+
+if __name__ == "__main__":
+    main()
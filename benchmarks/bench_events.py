@@ -0,0 +1,76 @@
+"""Event rolls with many events: linear scan vs. the cached eligibility index.
+
+    PYTHONPATH=. python3 benchmarks/bench_events.py [events] [rolls]
+
+Synthetic events mimic the built-ins: most depend on wealth or the character
+count, a few on nothing at all.
+"""
+from bloodlines.engine import GameEngine
+from bloodlines.events import Event, EventManager, EventOption
+import random
+import sys
+import time
+
+def linear_pick(events, engine, char_id):
+    """get_random_event as it was before the eligibility index."""
+    valid = [e for e in events if e.trigger_condition(engine, char_id)]
+    if not valid:
+        return None
+    pick = random.uniform(0, sum(e.weight for e in valid))
+    current = 0
+    for event in valid:
+        current += event.weight
+        if pick <= current:
+            return event
+    return None
+
+def synthetic_events(count):
+    option = [EventOption(text="Ok", effect=lambda engine, char_id: None)]
+    events = []
+    for i in range(count):
+        kind = i % 3
+        if kind == 0:
+            threshold = random.randint(0, 500)
+            condition = lambda engine, char_id, t=threshold: engine.get_wealth(char_id) >= t
+            depends = ("wealth",)
+        elif kind == 1:
+            condition = lambda engine, char_id: len(engine.characters) > 1
+            depends = ("character_count",)
+        else:
+            condition = lambda engine, char_id: True
+            depends = ()
+        events.append(Event(id=f"event_{i}", title="", description="", options=option,
+                             trigger_condition=condition, weight=random.randint(1, 20), depends_on=depends))
+    return events
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    rolls = int(sys.argv[2]) if len(sys.argv) > 2 else 20_000
+    random.seed(13)
+    engine = GameEngine()
+    engine.create_test_scenario()
+    player_id = engine.player_character_id
+    events = synthetic_events(count)
+    manager = EventManager()
+    manager.add_events(events)
+
+    start = time.perf_counter()
+    for i in range(rolls):
+        if i % 12 == 0:
+            engine.modify_wealth(player_id, 5)  # Monthly income changes wealth now and then
+        linear_pick(manager.events, engine, player_id)
+    linear = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(rolls):
+        if i % 12 == 0:
+            engine.modify_wealth(player_id, 5)
+        manager.get_random_event(engine, player_id)
+    indexed = time.perf_counter() - start
+
+    print(f"{len(manager.events)} events, {rolls} rolls")
+    print(f"linear  {linear / rolls * 1e6:8.1f} us/roll")
+    print(f"indexed {indexed / rolls * 1e6:8.1f} us/roll ({linear / indexed:.0f}x)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""Months per second: pressing Enter with the dashboard drawn every month vs. fast_forward.
+
+    PYTHONPATH=. python3 benchmarks/bench_fastforward.py [months]
+
+Player events are switched off so both runs go the full distance; AI
+rulers still roll theirs.
+"""
+from bloodlines.engine import GameEngine
+from bloodlines.events import EventManager
+from bloodlines.dashboard import Dashboard
+from bloodlines.fastforward import fast_forward
+from rich.console import Console
+import io
+import sys
+import time
+
+def world():
+    engine = GameEngine(seed=18)
+    engine.create_test_scenario()
+    engine.event_manager = EventManager(packs=())
+    return engine
+
+def main():
+    months = int(sys.argv[1]) if len(sys.argv) > 1 else 480
+
+    engine = world()
+    console = Console(file=io.StringIO(), force_terminal=True, force_interactive=True, width=120, height=40)
+    start = time.perf_counter()
+    with Dashboard(engine, console) as dashboard:
+        for _ in range(months):
+            engine.advance_month()
+            dashboard.update(force=True)
+    rendered = months / (time.perf_counter() - start)
+
+    result = fast_forward(world(), months=months)
+    print(f"{result.months_run} of {months} months (stopped: {result.stopped_by})")
+    print(f"per-month dashboard {rendered:9.0f} months/sec")
+    print(f"fast_forward        {result.months_per_sec:9.0f} months/sec ({result.months_per_sec / rendered:.1f}x)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Memory and speed of integer ids vs. the uuid4 strings they replaced.
+
+    PYTHONPATH=. python3 benchmarks/bench_ids.py [characters]
+
+"uuid" builds the same population with explicit str(uuid4()) ids, the way
+models.py assigned them before; "int" uses the registry defaults. Each
+character has a few children and opinions so id references are counted too.
+Note that CPython stores dicts whose keys are all str more compactly, so
+opinion dicts give back part of what the smaller id objects save.
+"""
+from bloodlines.models import Character
+from bloodlines.ids import new_id
+import random
+import sys
+import time
+import tracemalloc
+import uuid
+
+def build(size, make_id):
+    ids = [make_id() for _ in range(size)]
+    characters = {}
+    for i, char_id in enumerate(ids):
+        char = Character(id=char_id, name="Citizen", age=30)
+        char.children_ids = [ids[(i + k) % size] for k in (1, 2)]
+        char.opinions = {ids[(i * 7 + k) % size]: 10 for k in range(3)}
+        characters[char_id] = char
+    return characters, ids
+
+def id_bytes(size, make_id):
+    tracemalloc.start()
+    ids = [make_id() for _ in range(size)]
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return memory / len(ids)
+
+def measure(size, label, make_id):
+    per_id = id_bytes(size, make_id)
+    tracemalloc.start()
+    start = time.perf_counter()
+    characters, ids = build(size, make_id)
+    elapsed = time.perf_counter() - start
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    sample = random.sample(ids, min(size, 100_000))
+    start = time.perf_counter()
+    for char_id in sample:
+        characters[char_id].opinions.get(char_id)
+    lookup = (time.perf_counter() - start) / len(sample)
+    print(f"{label:5s} create {elapsed:6.2f}s | {per_id:4.0f} B/id | {memory / size:6.0f} B/character | "
+          f"lookup {lookup * 1e9:5.0f} ns")
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    random.seed(10)
+    print(f"{size} characters")
+    measure(size, "uuid", lambda: str(uuid.uuid4()))
+    measure(size, "int", new_id)
+
+if __name__ == "__main__":
+    main()
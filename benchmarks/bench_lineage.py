@@ -0,0 +1,68 @@
+"""Family tree lookups: lineage index vs. the old full-table scan.
+
+    PYTHONPATH=. python3 benchmarks/bench_lineage.py [characters]
+"""
+from bloodlines.engine import GameEngine
+from bloodlines.models import Character
+import random
+import sys
+import time
+
+def scan_family_tree(engine, char_id):
+    """The pre-index get_family_tree: two passes over every character."""
+    char = engine.characters[char_id]
+    children = [c for c in engine.characters.values()
+                if c.father_id == char_id or c.mother_id == char_id]
+    siblings = []
+    if char.father_id or char.mother_id:
+        siblings = [c for cid, c in engine.characters.items() if cid != char_id and (
+            (char.father_id and c.father_id == char.father_id) or
+            (char.mother_id and c.mother_id == char.mother_id))]
+    return children, siblings
+
+def build_dynasty(engine, size):
+    """Grow the starting dynasty to `size` characters through create_child."""
+    player = engine.characters[engine.player_character_id]
+    couples = [(player.spouse_id, player.id)]
+    while len(engine.characters) < size:
+        mother_id, father_id = random.choice(couples)
+        engine.create_child(mother_id, father_id)
+        child = engine.characters[engine.characters[father_id].children_ids[-1]]
+        # Marry about half of the children to outsiders to grow new branches
+        if random.random() < 0.5:
+            outsider = Character(name="Spouse", gender="Female" if child.gender == "Male" else "Male")
+            engine.characters[outsider.id] = outsider
+            engine.lineage.add(outsider)
+            couples.append((outsider.id, child.id) if child.gender == "Male" else (child.id, outsider.id))
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    random.seed(1)
+    engine = GameEngine()
+    engine.create_test_scenario()
+
+    start = time.perf_counter()
+    build_dynasty(engine, size)
+    print(f"Built {len(engine.characters)} characters in {time.perf_counter() - start:.2f}s")
+
+    sample = random.sample([c.id for c in engine.characters.values() if c.father_id], 50)
+
+    start = time.perf_counter()
+    for cid in sample:
+        scan_family_tree(engine, cid)
+    scan = (time.perf_counter() - start) / len(sample)
+
+    start = time.perf_counter()
+    for cid in sample:
+        engine.get_family_tree(cid)
+    indexed = (time.perf_counter() - start) / len(sample)
+
+    print(f"Full scan:     {scan * 1000:.3f} ms/tree")
+    print(f"Lineage index: {indexed * 1000:.3f} ms/tree ({scan / indexed:.0f}x faster)")
+
+    start = time.perf_counter()
+    problems = engine.lineage.check_consistency(engine.characters)
+    print(f"Consistency check: {len(problems)} problem(s) in {time.perf_counter() - start:.2f}s")
+
+if __name__ == "__main__":
+    main()
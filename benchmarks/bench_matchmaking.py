@@ -0,0 +1,69 @@
+"""AI marriage pass: per-month cost with the matchmaking buckets vs. a pairwise scan.
+
+    PYTHONPATH=. python3 benchmarks/bench_matchmaking.py [singles]
+
+"scan" pairs proposers the naive way: each one scores every unmarried woman
+and takes the best (O(proposers * n)); it is only run on a small world and
+extrapolated. The indexed pass is timed over a year of months at each size.
+"""
+from bloodlines.engine import GameEngine
+from bloodlines.matchmaking import MARRIAGE_CHANCE
+from bloodlines.models import Character
+import random
+import sys
+import time
+
+def build_world(singles):
+    engine = GameEngine(seed=20)
+    engine.create_test_scenario()
+    rng = random.Random(20)
+    for i in range(singles):
+        char = Character(name=f"Single {i}", age=rng.randint(16, 40), gender=rng.choice(["Male", "Female"]),
+                         culture=rng.choice(["Roman", "Greek", "Celtic"]))
+        engine.characters[char.id] = char
+    return engine
+
+def scan_month(engine, rng):
+    """Proposers as in the indexed pass, but every woman is scored for each."""
+    chars = engine.characters
+    men = [c for c in chars.values() if c.is_alive and not c.spouse_id and c.gender == "Male" and c.age >= 16]
+    couples = 0
+    for man in men:
+        if rng.random() >= MARRIAGE_CHANCE:
+            continue
+        best, best_score = None, None
+        for woman in chars.values():
+            if woman.is_alive and not woman.spouse_id and woman.gender == "Female" and woman.age >= 16 \
+                    and engine.marriage_blocker(man.id, woman.id) is None:
+                score = engine.matchmaker.score(man, woman)
+                if best_score is None or score > best_score:
+                    best, best_score = woman, score
+        if best is not None:
+            engine.marry(man.id, best.id)
+            couples += 1
+    return couples
+
+def main():
+    largest = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    engine = build_world(2000)
+    start = time.perf_counter()
+    couples = scan_month(engine, random.Random(1))
+    scan_ms = (time.perf_counter() - start) * 1000
+    print(f"scan      2000 singles: {scan_ms:8.1f} ms/month for {couples} couples "
+          f"(~{scan_ms * (largest / 2000) ** 2 / 1000:.0f} s/month at {largest})")
+
+    for size in (1000, 10_000, largest):
+        engine = build_world(size)
+        start = time.perf_counter()
+        engine.matchmaker.rebuild()
+        build_ms = (time.perf_counter() - start) * 1000
+        couples = 0
+        start = time.perf_counter()
+        for _ in range(12):
+            couples += len(engine.matchmaker.run())
+        month_ms = (time.perf_counter() - start) * 1000 / 12
+        print(f"indexed {size:6d} singles: {month_ms:8.2f} ms/month, {couples / 12:6.0f} couples/month "
+              f"({month_ms * 1000 / max(couples / 12, 1):5.1f} us/couple; index built in {build_ms:.0f} ms)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Resident memory of a large world grown entirely through create_child.
+
+    PYTHONPATH=. python3 benchmarks/bench_memory.py [characters]
+
+Couples are formed from the children as they are born, so the world ends up
+with realistic family links (parents, children lists, dynasty members,
+lineage index). RSS is read from /proc (Linux) or getrusage as a fallback.
+"""
+from bloodlines.engine import GameEngine
+import random
+import resource
+import sys
+import time
+
+def rss_bytes() -> int:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * resource.getpagesize()
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    random.seed(11)
+    engine = GameEngine()
+    engine.create_test_scenario()
+    player = engine.characters[engine.player_character_id]
+    couples = [(player.spouse_id, player.id)]
+    single = {"Male": [], "Female": []}
+
+    before = rss_bytes()
+    start = time.perf_counter()
+    for _ in range(size):
+        mother_id, father_id = random.choice(couples)
+        engine.create_child(mother_id, father_id)
+        child = engine.characters[engine.characters[father_id].children_ids[-1]]
+        single[child.gender].append(child.id)
+        if single["Male"] and single["Female"]:
+            couples.append((single["Female"].pop(), single["Male"].pop()))
+    elapsed = time.perf_counter() - start
+    grown = rss_bytes() - before
+
+    print(f"{len(engine.characters)} characters built in {elapsed:.1f}s")
+    print(f"RSS growth {grown / 1e6:8.1f} MB | {grown / size:6.0f} B per character")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Natural mortality: death scheduler vs. per-character monthly rolls.
+
+    PYTHONPATH=. python3 benchmarks/bench_mortality.py [characters]
+"""
+from bloodlines.engine import GameEngine
+from bloodlines.models import Character
+from bloodlines.logbook import LogLevel
+import random
+import sys
+import time
+
+def build_world(size):
+    engine = GameEngine()
+    engine.logbook.set_level("death", LogLevel.OFF)
+    for _ in range(size):
+        char = Character(name="Subject", age=random.randint(0, 70))
+        engine.characters[char.id] = char
+    return engine
+
+def run_year(engine):
+    start = time.perf_counter()
+    deaths = 0
+    for _ in range(12):
+        engine.month = engine.month % 12 + 1
+        if engine.month == 1:
+            engine.year -= 1  # BC years count down
+        engine.process_characters()
+    return time.perf_counter() - start
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+
+    random.seed(4)
+    engine = build_world(size)
+    loop = run_year(engine)
+    loop_dead = sum(not c.is_alive for c in engine.characters.values())
+
+    random.seed(4)
+    engine = build_world(size)
+    start = time.perf_counter()
+    engine.enable_death_scheduler()
+    setup = time.perf_counter() - start
+    scheduled = run_year(engine)
+    scheduled_dead = sum(not c.is_alive for c in engine.characters.values())
+
+    print(f"{size} characters, one simulated year")
+    print(f"Monthly rolls:   {loop * 1000 / 12:8.2f} ms/month ({loop_dead} deaths)")
+    print(f"Death scheduler: {scheduled * 1000 / 12:8.2f} ms/month ({scheduled_dead} deaths, "
+          f"{loop / scheduled:.1f}x faster; one-off scheduling {setup * 1000:.0f} ms)")
+
+if __name__ == "__main__":
+    main()
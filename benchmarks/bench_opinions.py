@@ -0,0 +1,55 @@
+"""Opinion store: feasts, monthly decay and top-K queries.
+
+    PYTHONPATH=. python3 benchmarks/bench_opinions.py [characters]
+
+"dicts" replays the original per-character dict approach (a feast writes
+into every guest's dict one by one, "who likes X" scans everyone); the
+stores are driven through the same operations.
+"""
+from bloodlines.opinions import DictOpinionStore, OpinionStore, np
+import heapq
+import random
+import sys
+import time
+import tracemalloc
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+def run_dicts(ids, hosts):
+    opinions = {cid: {} for cid in ids}
+    tracemalloc.start()
+    feast, _ = timed(lambda: [opinions[cid].__setitem__(host, min(100, opinions[cid].get(host, 0) + 10))
+                              for host in hosts for cid in ids if cid != host])
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    query, _ = timed(lambda: heapq.nlargest(5, ((cid, row.get(hosts[0], 0)) for cid, row in opinions.items()),
+                                            key=lambda p: p[1]))
+    print(f"dicts   feasts {feast:6.2f}s | decay    n/a  | who-likes-X {query * 1000:7.1f} ms | "
+          f"{memory / 1e6:7.1f} MB")
+
+def run_store(label, store, ids, hosts):
+    tracemalloc.start()
+    feast, _ = timed(lambda: [store.add_toward(host, ids, 10) for host in hosts])
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    decay, _ = timed(lambda: store.decay(1))
+    query, _ = timed(lambda: store.top_toward(hosts[0], 5))
+    print(f"{label:7s} feasts {feast:6.2f}s | decay {decay * 1000:6.1f} ms | who-likes-X {query * 1000:7.1f} ms | "
+          f"{memory / 1e6:7.1f} MB")
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    random.seed(12)
+    ids = list(range(1, size + 1))
+    hosts = random.sample(ids, 10)
+    print(f"{size} characters, {len(hosts)} feasts")
+    run_dicts(ids, hosts)
+    run_store("dict", DictOpinionStore(), ids, hosts)
+    if np is not None:
+        run_store("arrays", OpinionStore(), ids, hosts)
+
+if __name__ == "__main__":
+    main()
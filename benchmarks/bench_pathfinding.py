@@ -0,0 +1,63 @@
+"""Route planning on a large generated map: Dijkstra vs. A* with landmarks, and the route cache.
+
+    PYTHONPATH=. python3 benchmarks/bench_pathfinding.py [regions] [travellers]
+
+Times random cross-map routes with plain Dijkstra (the same search with a
+zero heuristic) and with ALT. Then, for three months, every traveller
+routes to somewhere within about fifteen regions of home. Travellers share
+1500 distinct trips, the way neighbours head for the same court or market.
+"""
+from bloodlines.engine import GameEngine
+from bloodlines.pathfinding import Router
+import math
+import random
+import sys
+import time
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    travellers = int(sys.argv[2]) if len(sys.argv) > 2 else 5000
+    engine = GameEngine(seed=23)
+    regions = engine.world_manager.generate_map(count, seed=23)
+    ids = [region.id for region in regions]
+    rng = random.Random(23)
+    pairs = [(rng.choice(ids), rng.choice(ids)) for _ in range(20)]
+
+    dijkstra = Router(engine, landmarks=0)
+    start = time.perf_counter()
+    plain = [dijkstra.route(a, b).cost for a, b in pairs]
+    plain_ms = (time.perf_counter() - start) * 1000 / len(pairs)
+
+    router = engine.world_manager.router
+    start = time.perf_counter()
+    router._sync()
+    router._ensure_landmarks()
+    setup_s = time.perf_counter() - start
+    start = time.perf_counter()
+    alt = [router.route(a, b).cost for a, b in pairs]
+    alt_ms = (time.perf_counter() - start) * 1000 / len(pairs)
+    assert plain == alt
+
+    width = math.ceil(math.sqrt(count))
+    trips = []
+    while len(trips) < 1500:
+        home = rng.randrange(count)
+        there = home + rng.randint(-15, 15) * width + rng.randint(-15, 15)
+        if 0 <= there < count:
+            trips.append((ids[home], ids[there]))
+    trips = [rng.choice(trips) for _ in range(travellers)]
+    months = []
+    for _ in range(3):
+        start = time.perf_counter()
+        for a, b in trips:
+            router.route(a, b)
+        months.append((time.perf_counter() - start) * 1000)
+
+    print(f"{count} regions, {len(router._landmarks[0])} landmarks built in {setup_s:.1f} s")
+    print(f"dijkstra {plain_ms:7.1f} ms/route")
+    print(f"ALT      {alt_ms:7.1f} ms/route ({plain_ms / alt_ms:.0f}x)")
+    print(f"{travellers} travellers routing: " + ", ".join(f"{ms:.0f} ms" for ms in months) +
+          f" (months 1-3; {router.hits} cache hits, {router.misses} searches)")
+
+if __name__ == "__main__":
+    main()
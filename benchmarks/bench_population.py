@@ -0,0 +1,43 @@
+"""Aging + mortality: vectorized population store vs. the per-character loop.
+
+    PYTHONPATH=. python3 benchmarks/bench_population.py [characters]
+
+Reports the aging/mortality pass on its own (deaths only flag is_alive) and
+the full tick including kill_character for everyone who dies.
+"""
+from bloodlines.engine import GameEngine
+from bloodlines.models import Character
+import random
+import sys
+import time
+
+def build_world(size, seed, vectorized, full_kill):
+    random.seed(seed)
+    engine = GameEngine()
+    for _ in range(size):
+        char = Character(name="Subject", age=random.randint(0, 70))
+        engine.characters[char.id] = char
+    if not full_kill:
+        engine.kill_character = lambda char_id, reason: setattr(engine.characters[char_id], "is_alive", False)
+    if vectorized:
+        engine.enable_population_store(seed=seed)
+    return engine
+
+def time_tick(engine, months=3):
+    start = time.perf_counter()
+    for month in range(months):
+        engine.month = 1 if month == 0 else 2  # One January (aging) tick
+        engine.process_characters()
+    return (time.perf_counter() - start) / months
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    for full_kill, label in ((False, "Aging + mortality rolls"), (True, "Full tick with kill_character")):
+        loop = time_tick(build_world(size, 11, False, full_kill))
+        vectorized = time_tick(build_world(size, 11, True, full_kill))
+        print(f"{label} ({size} characters)")
+        print(f"  Per-character loop: {loop * 1000:9.2f} ms/month")
+        print(f"  Population store:   {vectorized * 1000:9.2f} ms/month ({loop / vectorized:.0f}x faster)")
+
+if __name__ == "__main__":
+    main()
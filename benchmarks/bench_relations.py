@@ -0,0 +1,71 @@
+"""Relationships screen: listing every living character vs. one indexed page.
+
+    PYTHONPATH=. python3 benchmarks/bench_relations.py [characters]
+
+"scan" is the old [R] screen: every living character with the player's
+opinion and a status line, and marriage candidates by a full scan. The
+index is built once (on first use) and then kept current by the engine.
+"""
+from bloodlines.engine import GameEngine
+from bloodlines.models import Character
+from bloodlines.relations import MARRIAGE_AGE, RelationView, opinion_band
+import random
+import sys
+import time
+
+def build_world(size):
+    engine = GameEngine(seed=19)
+    engine.create_test_scenario()
+    player = engine.characters[engine.player_character_id]
+    rng = random.Random(19)
+    while len(engine.characters) < size:
+        char = Character(name=f"{rng.choice(['Julia', 'Claudia', 'Marcus', 'Titus'])} {len(engine.characters)}",
+                         age=rng.randint(0, 70), gender=rng.choice(["Male", "Female"]),
+                         dynasty_id=player.dynasty_id if rng.random() < 0.05 else None,
+                         is_alive=rng.random() < 0.8)
+        engine.characters[char.id] = char
+    return engine
+
+def scan_screen(engine):
+    player_id = engine.player_character_id
+    lines = []
+    for cid, char in engine.characters.items():
+        if char.is_alive and cid != player_id:
+            opinion = engine.get_opinion(player_id, cid)
+            lines.append(f"{char.name} - Opinion: {opinion:+d} ({opinion_band(opinion)})")
+    return lines
+
+def scan_candidates(engine):
+    player = engine.characters[engine.player_character_id]
+    return [cid for cid, c in engine.characters.items()
+            if c.is_alive and c.gender != player.gender and c.age >= MARRIAGE_AGE and not c.spouse_id]
+
+def page_screen(engine, **filters):
+    player_id = engine.player_character_id
+    view = RelationView(engine, player_id, **filters)
+    lines = []
+    for cid in view.page(0):
+        opinion = engine.get_opinion(player_id, cid)
+        lines.append(f"{engine.characters[cid].name} - Opinion: {opinion:+d} ({opinion_band(opinion)})")
+    return lines
+
+def timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    fn(*args, **kwargs)
+    return (time.perf_counter() - start) * 1000
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    engine = build_world(size)
+    print(f"{len(engine.characters)} characters")
+    print(f"scan: all living         {timed(scan_screen, engine):8.2f} ms")
+    print(f"scan: spouse candidates  {timed(scan_candidates, engine):8.2f} ms")
+    print(f"index build (first use)  {timed(engine.relations.rebuild):8.2f} ms")
+    for label, filters in (("all", {"relation": "all"}), ("spouse candidates", {"relation": "spouse"}),
+                           ("dynasty", {"relation": "all", "dynasty_id": engine.characters[
+                               engine.player_character_id].dynasty_id}),
+                           ("name 'Titus 9'", {"relation": "all", "prefix": "Titus 9"})):
+        print(f"page: {label:19s} {timed(page_screen, engine, **filters):8.2f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Save/load: streamed binary format vs. the original gzip-JSON.
+
+    PYTHONPATH=. python3 benchmarks/bench_savefile.py [characters]
+
+Peak memory is the tracemalloc peak above the live world during the call.
+"""
+from bloodlines.engine import GameEngine
+from bloodlines.models import Character
+from bloodlines import savefile
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+def build_world(size):
+    engine = GameEngine()
+    engine.create_test_scenario()
+    ids = []
+    for _ in range(size):
+        char = Character(name=f"Citizen {len(ids)}", age=random.randint(0, 70),
+                         gender=random.choice(("Male", "Female")), culture="Roman",
+                         wealth=random.randint(0, 500))
+        for other in random.sample(ids, min(len(ids), 3)):
+            char.opinions[other] = random.randint(-100, 100)
+        engine.characters[char.id] = char
+        ids.append(char.id)
+    return engine
+
+def measure(fn):
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1] - base
+    tracemalloc.stop()
+    return elapsed, peak, result
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    random.seed(8)
+    engine = build_world(size)
+    print(f"{len(engine.characters)} characters")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        runs = [("gzip-JSON", "json", None)] + [(f"binary/{c}", "binary", c) for c in savefile.available_codecs()]
+        for label, save_format, codec in runs:
+            path = os.path.join(tmp, f"{label.replace('/', '-')}.sav")
+            save_time, save_peak, _ = measure(lambda: engine.save_game(path, save_format=save_format, codec=codec))
+            loaded = GameEngine()
+            load_time, load_peak, ok = measure(lambda: loaded.load_game(path))
+            assert ok
+            print(f"{label:12s} size {os.path.getsize(path) / 1e6:7.2f} MB | "
+                  f"save {save_time:6.2f}s peak {save_peak / 1e6:7.1f} MB | "
+                  f"load {load_time:6.2f}s peak {load_peak / 1e6:7.1f} MB")
+
+if __name__ == "__main__":
+    main()
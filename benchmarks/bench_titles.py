@@ -0,0 +1,69 @@
+"""Character titles: the old per-call polity scan vs. the cached TitleService.
+
+    PYTHONPATH=. python3 benchmarks/bench_titles.py [characters] [polities]
+
+Titles every character once, as a court list would.
+"""
+from bloodlines.engine import GameEngine
+from bloodlines.models import Character, Polity, GovernmentType
+import random
+import sys
+import time
+
+def scan_title(engine, char_id):
+    """get_character_title before the title service."""
+    char = engine.characters[char_id]
+    for polity in engine.polities.values():
+        if polity.ruler_id == char.id:
+            return engine.culture_manager.get_title(char.culture, "ruler")
+    if char.father_id:
+        father = engine.characters[char.father_id]
+        is_prince = any(polity.ruler_id == father.id for polity in engine.polities.values())
+        if is_prince and father.children_ids[0] == char.id:
+            return engine.culture_manager.get_title(char.culture, "heir")
+    return engine.culture_manager.get_title(char.culture, "noble")
+
+def build_world(characters, polities):
+    engine = GameEngine(seed=21)
+    engine.create_test_scenario()
+    rng = random.Random(21)
+    cultures = ["Roman", "Greek", "Tribal"]
+    for i in range(polities):
+        ruler = Character(name=f"Ruler {i}", age=40, gender="Male", culture=rng.choice(cultures))
+        engine.characters[ruler.id] = ruler
+        polity = Polity(name=f"Realm {i}", government_type=GovernmentType.TRIBE, ruler_id=ruler.id)
+        engine.polities[polity.id] = polity
+    fathers = list(engine.characters.values())
+    while len(engine.characters) < characters:
+        father = rng.choice(fathers)
+        child = Character(name="Child", age=rng.randint(0, 30), culture=father.culture, father_id=father.id,
+                          is_alive=rng.random() > 0.1)
+        engine.characters[child.id] = child
+        father.children_ids.append(child.id)
+    return engine
+
+def main():
+    characters = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    polities = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    engine = build_world(characters, polities)
+    ids = list(engine.characters)
+
+    start = time.perf_counter()
+    old = [scan_title(engine, cid) for cid in ids]
+    scan_us = (time.perf_counter() - start) * 1e6 / len(ids)
+
+    start = time.perf_counter()
+    engine.titles.refresh()
+    build_ms = (time.perf_counter() - start) * 1000
+    start = time.perf_counter()
+    new = [engine.get_character_title(cid) for cid in ids]
+    cached_us = (time.perf_counter() - start) * 1e6 / len(ids)
+
+    changed = sum(a != b for a, b in zip(old, new))
+    print(f"{len(ids)} characters, {len(engine.polities)} polities")
+    print(f"scan   {scan_us:7.2f} us/title")
+    print(f"cached {cached_us:7.2f} us/title ({scan_us / cached_us:.0f}x; index built in {build_ms:.1f} ms)")
+    print(f"{changed} titles differ (dead eldest children no longer count as heirs)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Procedural map generation, and CSR adjacency vs. Region.neighbors lists.
+
+    PYTHONPATH=. python3 benchmarks/bench_worldgen.py [regions]
+
+Times generate_map and measures its peak memory, then compares the bytes
+held by the CSR arrays with those held by one neighbour list per region,
+and times a million adjacency checks against each.
+"""
+from bloodlines.worldgen import RegionGraph, generate_map
+import random
+import sys
+import time
+import tracemalloc
+
+def list_bytes(regions):
+    return sum(sys.getsizeof(region.neighbors) + sum(sys.getsizeof(n) for n in region.neighbors)
+               for region in regions)
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    start = time.perf_counter()
+    regions, graph = generate_map(count, random.Random(22))
+    gen_s = time.perf_counter() - start
+    # A second, traced run for memory (tracing slows it down several times)
+    del regions, graph
+    tracemalloc.start()
+    regions, graph = generate_map(count, random.Random(22))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    RegionGraph.from_regions({region.id: region for region in regions})
+    rebuild_ms = (time.perf_counter() - start) * 1000
+
+    rng = random.Random(1)
+    pairs = []
+    for _ in range(1_000_000):
+        region = regions[rng.randrange(count)]
+        other = rng.choice(region.neighbors) if rng.random() < 0.5 else regions[rng.randrange(count)].id
+        pairs.append((region, other))
+    start = time.perf_counter()
+    listed = sum(other in region.neighbors for region, other in pairs)
+    list_ns = (time.perf_counter() - start) * 1e9 / len(pairs)
+    adjacent = graph.adjacent
+    start = time.perf_counter()
+    csr = sum(adjacent(region.id, other) for region, other in pairs)
+    csr_ns = (time.perf_counter() - start) * 1e9 / len(pairs)
+    assert listed == csr
+
+    print(f"{count} regions, {graph.edge_count} borders ({2 * graph.edge_count / count:.2f} neighbours each)")
+    print(f"generate  {gen_s:6.2f} s, peak {peak / 2**20:.0f} MiB")
+    print(f"rebuild   {rebuild_ms:6.0f} ms (graph from Region.neighbors, as after a load)")
+    print(f"adjacency lists {list_bytes(regions) / 2**20:6.1f} MiB, CSR {graph.nbytes() / 2**20:5.1f} MiB")
+    print(f"adjacent? lists {list_ns:6.0f} ns, CSR {csr_ns:5.0f} ns")
+
+if __name__ == "__main__":
+    main()
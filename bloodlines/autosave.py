@@ -0,0 +1,190 @@
+"""Incremental autosave: a full binary snapshot plus a journal of delta segments.
+
+Each autosave appends one segment to ``<save>.journal`` holding only the
+entities that changed (or were created) since the previous autosave. Every
+``compact_every`` deltas the world is written out as a fresh snapshot and
+the journal starts over. load_game replays snapshot + journal.
+"""
+from typing import Dict, Optional
+from itertools import islice
+from .models import Character, Dynasty, Polity, Region
+from .logbook import month_index
+from . import savefile
+import io
+import os
+import struct
+
+JOURNAL_MAGIC = b"AETJ"
+_SEGMENT = struct.Struct("<I")
+
+def journal_path(filename: str) -> str:
+    return filename + ".journal"
+
+def discard_journal(filename: str):
+    """Remove a journal that no longer matches its snapshot."""
+    path = journal_path(filename)
+    if os.path.exists(path):
+        os.remove(path)
+
+class ChangeTracker:
+    """Collects models written to since the last checkpoint."""
+
+    def __init__(self):
+        self.dirty: Dict[int, object] = {}
+
+    def mark(self, obj):
+        self.dirty[obj.id] = obj
+
+    def attach(self, objects):
+        for obj in objects:
+            obj._tracker = self
+
+    def detach(self, objects):
+        for obj in objects:
+            if obj._tracker is self:
+                obj._tracker = None
+
+    def clear(self):
+        self.dirty = {}
+
+class Autosaver:
+    def __init__(self, engine, filename: str, compact_every: int = 10, codec: Optional[str] = None):
+        if not filename.endswith(".sav"):
+            filename += ".sav"
+        self.engine = engine
+        self.filename = filename
+        self.compact_every = compact_every
+        self.codec = codec or engine.save_codec
+        self.tracker = ChangeTracker()
+        self.deltas = 0
+        self._counts = None  # Table sizes at the last checkpoint; None forces a snapshot
+
+    def close(self):
+        """Stop tracking this engine's models."""
+        for table in self._tables():
+            self.tracker.detach(table.values())
+        self.tracker.clear()
+        self._counts = None
+
+    def _tables(self):
+        engine = self.engine
+        return (engine.characters, engine.dynasties, engine.polities, engine.regions)
+
+    def reset(self):
+        """Forget the current checkpoint (e.g. after a load); the next autosave is a full snapshot."""
+        self._counts = None
+
+    def save(self) -> str:
+        """Write a delta segment, or a full snapshot when one is due. Returns "full" or "delta"."""
+        if (self._counts is None or self.deltas >= self.compact_every
+                or not os.path.exists(journal_path(self.filename))):
+            self._snapshot()
+            return "full"
+        self._append_delta()
+        return "delta"
+
+    def _snapshot(self):
+        self.engine.absorb_opinions()
+        token = os.urandom(8)
+        meta = self.engine.save_meta("binary")  # Writes the demography totals back before the tables
+        meta["journal_token"] = token.hex()
+        savefile.write_binary(self.engine, self.filename, meta, self.codec)
+        with open(journal_path(self.filename), "wb") as f:
+            f.write(JOURNAL_MAGIC + token)
+        for table in self._tables():
+            self.tracker.attach(table.values())
+        self._checkpoint()
+        self.deltas = 0
+
+    def _checkpoint(self):
+        self.tracker.clear()
+        self._counts = [len(table) for table in self._tables()]
+
+    def _append_delta(self):
+        self.engine.absorb_opinions()
+        # Before collecting changes: save_meta writes the demography totals back into the regions
+        meta = self.engine.save_meta("binary")
+        # Entities are never removed, so anything past the old table size is new
+        changed = {}
+        for table, count in zip(self._tables(), self._counts):
+            new = list(islice(table.values(), count, None))
+            self.tracker.attach(new)
+            for obj in new:
+                changed[obj.id] = obj
+        changed.update(self.tracker.dirty)
+
+        characters = [o for o in changed.values() if isinstance(o, Character)]
+        schedule = None
+        scheduler = self.engine.death_scheduler
+        if scheduler is not None:
+            schedule = [(c.id, scheduler.due.get(c.id, savefile.NO_MONTH)) for c in characters]
+
+        buffer = io.BytesIO()
+        savefile.write_stream(
+            buffer, meta, characters,
+            [o for o in changed.values() if isinstance(o, Dynasty)],
+            [o for o in changed.values() if isinstance(o, Polity)],
+            [o for o in changed.values() if isinstance(o, Region)],
+            schedule, self.codec, self.engine.opinions
+        )
+        segment = buffer.getvalue()
+        with open(journal_path(self.filename), "ab") as f:
+            f.write(_SEGMENT.pack(len(segment)))
+            f.write(segment)
+        self.deltas += 1
+        self._checkpoint()
+
+def replay_journal(filename: str, data: Dict) -> int:
+    """Apply a snapshot's journal to its loaded state in place. Returns the number of segments."""
+    token = data.get("journal_token")
+    path = journal_path(filename)
+    if not token or not os.path.exists(path):
+        return 0
+    with open(path, "rb") as f:
+        header = f.read(len(JOURNAL_MAGIC) + 8)
+        if header != JOURNAL_MAGIC + bytes.fromhex(token):
+            return 0  # Journal belongs to another snapshot
+        segments = 0
+        while True:
+            size = f.read(_SEGMENT.size)
+            if len(size) < _SEGMENT.size:
+                break
+            (length,) = _SEGMENT.unpack(size)
+            payload = f.read(length)
+            if len(payload) < length:
+                break  # Torn final write; keep what was complete
+            _apply_delta(data, savefile.read_stream(io.BytesIO(payload)))
+            segments += 1
+    return segments
+
+def _apply_delta(data: Dict, delta: Dict):
+    # Ages are not tracked: everyone still alive and not in the delta had their birthdays
+    before = month_index(data["month"], data["year"], data["is_bc"])
+    after = month_index(delta["month"], delta["year"], delta["is_bc"])
+    birthdays = after // 12 - before // 12
+    if birthdays:
+        changed = delta["characters"]
+        for char_id, char in data["characters"].items():
+            if char.is_alive and char_id not in changed:
+                char.age += birthdays
+
+    for key in ("characters", "dynasties", "polities", "regions"):
+        data[key].update(delta[key])
+    for key in ("year", "month", "is_bc", "player_character_id", "logs"):
+        data[key] = delta[key]
+    if "rng" in delta:
+        data["rng"] = delta["rng"]
+    if "demography" in delta:
+        data["demography"] = delta["demography"]
+    # Journeys are saved whole in every segment; none in the delta means none under way
+    data["journeys"] = delta.get("journeys", {})
+
+    if "death_schedule" in delta:
+        schedule = data.setdefault("death_schedule", {})
+        schedule["modifiers"] = delta["death_schedule"].get("modifiers", {})
+        due = schedule.setdefault("due", {})
+        for char_id, month in delta["death_schedule"].get("due", {}).items():
+            if month == savefile.NO_MONTH:
+                due.pop(char_id, None)
+            else:
+                due[char_id] = month
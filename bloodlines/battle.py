@@ -0,0 +1,200 @@
+"""Army battles resolved over arrays of units, and Monte Carlo odds.
+
+An Army is parallel NumPy arrays with one entry per unit: strength (men),
+morale (0-1) and tier (an index into UNIT_TIERS, named per culture by
+CultureManager.get_unit_name). A battle is fought in rounds, and both
+sides strike at once in each round:
+
+- A side's blow is the sum over its fighting units of strength, tier power
+  and morale. It is scaled by its commander and, for the defender, by the
+  terrain (TERRAIN_DEFENSE), then by a random swing for the round.
+- The blow kills CASUALTY_RATE of its weight in enemy men. Losses fall on
+  the enemy's fighting units by size, with some random spread.
+- A unit's morale drops with the share of its men it lost. Below
+  ROUT_MORALE the unit flees and stops fighting.
+- A side breaks when its fighting men fall under BREAK_SHARE of what it
+  started with. The defender holds if nobody breaks within MAX_ROUNDS,
+  and wins if both sides break together.
+
+Every draw for a round is made in one batch. The round works on arrays
+shaped (battles, units), so the same code fights one battle of thousands
+of units or, for win_probability, thousands of battles at once. For the
+odds, each army is first reduced to one unit per tier. The rules stay the
+same; only the uneven spread of losses within a tier is lost. The odds
+then land within a few points of fighting the battles out, and 10k
+battles take well under a second. Requires numpy.
+"""
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+from .models import Terrain
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional
+    np = None
+
+UNIT_TIERS = ("basic", "elite")
+TIER_POWER = (1.0, 1.6)  # Fighting weight per man
+TIER_MORALE = (0.7, 0.9)  # Morale of a fresh unit
+
+# Defender's multiplier by terrain
+TERRAIN_DEFENSE = {
+    Terrain.PLAINS: 1.0,
+    Terrain.COASTAL: 1.05,
+    Terrain.DESERT: 1.1,
+    Terrain.HILLS: 1.25,
+    Terrain.MOUNTAINS: 1.5,
+}
+
+CASUALTY_RATE = 0.05  # Enemy men killed per point of blow, per round
+MORALE_SHOCK = 1.5  # Morale lost per share of a unit's men lost
+ROUT_MORALE = 0.25
+BREAK_SHARE = 0.4  # A side breaks with fewer fighting men than this share of its start
+MAX_ROUNDS = 20
+LUCK_SIGMA = 0.25  # Spread of each side's lognormal swing per round
+SPREAD_SHAPE = 4.0  # Gamma shape of how losses spread over units (higher = more even)
+COMMAND_BONUS = 0.02  # Per point of the commander's martial
+
+ODDS_BATTLES = 10_000
+
+def numpy_available() -> bool:
+    return np is not None
+
+@dataclass
+class Army:
+    """One side's units as parallel arrays."""
+    culture: str
+    strength: "np.ndarray"
+    morale: "np.ndarray"
+    tier: "np.ndarray"
+    commander_id: Optional[int] = None
+
+    @classmethod
+    def levy(cls, culture: str, men: int, elite_share: float = 0.2, unit_size: int = 100,
+             commander_id: Optional[int] = None) -> 'Army':
+        """Split men into units of unit_size (the last takes the rest); elite_share of them are elite."""
+        if np is None:
+            raise ImportError("Battles require numpy (pip install numpy)")
+        units = max(1, -(-men // unit_size))
+        strength = np.full(units, float(unit_size))
+        strength[-1] = men - unit_size * (units - 1)
+        tier = np.zeros(units, dtype=np.int8)
+        tier[:int(round(units * elite_share))] = UNIT_TIERS.index("elite")
+        morale = np.asarray(TIER_MORALE)[tier]
+        return cls(culture, strength, morale, tier, commander_id)
+
+    def __len__(self) -> int:
+        return len(self.strength)
+
+    @property
+    def men(self) -> int:
+        return int(self.strength.sum())
+
+    def fighting(self) -> "np.ndarray":
+        return (self.strength >= 1.0) & (self.morale > ROUT_MORALE)
+
+    def composition(self, culture_manager) -> Dict[str, int]:
+        """Men still standing by unit name, e.g. {"Hastati": 800, "Triarii": 200}."""
+        men = np.bincount(self.tier, weights=self.strength, minlength=len(UNIT_TIERS))
+        return {culture_manager.get_unit_name(self.culture, name): int(men[i])
+                for i, name in enumerate(UNIT_TIERS) if men[i] >= 1}
+
+    def by_tier(self) -> 'Army':
+        """One unit per tier, with the tier's men and their strength-weighted morale."""
+        men = np.bincount(self.tier, weights=self.strength, minlength=len(UNIT_TIERS))
+        spirit = np.bincount(self.tier, weights=self.strength * self.morale, minlength=len(UNIT_TIERS))
+        present = men > 0
+        tiers = np.flatnonzero(present).astype(np.int8)
+        return Army(self.culture, men[present], spirit[present] / men[present], tiers, self.commander_id)
+
+@dataclass
+class BattleResult:
+    winner: str  # "attacker" or "defender"
+    rounds: int
+    attacker_losses: int
+    defender_losses: int
+    attacker_routed: int = 0  # Units that fled
+    defender_routed: int = 0
+
+@dataclass
+class _Side:
+    """One army tiled over a batch of battles: arrays shaped (battles, units)."""
+    strength: "np.ndarray"
+    morale: "np.ndarray"
+    power: "np.ndarray"  # Per unit: tier power times the side's multipliers
+    start: "np.ndarray" = field(default=None)  # Fighting men at the start, per battle
+
+    @classmethod
+    def tile(cls, army: Army, battles: int, multiplier: float) -> '_Side':
+        power = np.asarray(TIER_POWER)[army.tier] * multiplier
+        side = cls(np.tile(army.strength, (battles, 1)), np.tile(army.morale, (battles, 1)),
+                   np.broadcast_to(power, (battles, len(army))))
+        side.start = side.fighting_men()
+        return side
+
+    def fighting(self) -> "np.ndarray":
+        return (self.strength >= 1.0) & (self.morale > ROUT_MORALE)
+
+    def fighting_men(self) -> "np.ndarray":
+        return np.where(self.fighting(), self.strength, 0.0).sum(axis=1)
+
+    def blow(self, rng, active: "np.ndarray") -> "np.ndarray":
+        weight = np.where(self.fighting(), self.strength * self.power * self.morale, 0.0).sum(axis=1)
+        return weight * rng.lognormal(0.0, LUCK_SIGMA, len(weight)) * active
+
+    def suffer(self, killed: "np.ndarray", rng):
+        fighting = self.fighting()
+        spread = np.where(fighting, self.strength * rng.gamma(SPREAD_SHAPE, 1.0 / SPREAD_SHAPE, self.strength.shape),
+                          0.0)
+        total = spread.sum(axis=1, keepdims=True)
+        share = np.divide(spread, total, out=np.zeros_like(spread), where=total > 0)
+        lost = np.minimum(killed[:, None] * share, self.strength)
+        self.morale -= MORALE_SHOCK * np.divide(lost, self.strength, out=np.zeros_like(lost), where=self.strength > 0)
+        np.maximum(self.morale, 0.0, out=self.morale)
+        self.strength -= lost
+
+def _fight(attacker: _Side, defender: _Side, rng, max_rounds: int = MAX_ROUNDS) -> Tuple["np.ndarray", "np.ndarray"]:
+    """Fight a batch of battles. Returns (attacker won, rounds fought) per battle."""
+    battles = len(attacker.strength)
+    active = np.ones(battles, dtype=bool)
+    attacker_won = np.zeros(battles, dtype=bool)
+    rounds = np.zeros(battles, dtype=np.int64)
+    for _ in range(max_rounds):
+        attack, defence = attacker.blow(rng, active), defender.blow(rng, active)
+        defender.suffer(attack * CASUALTY_RATE, rng)
+        attacker.suffer(defence * CASUALTY_RATE, rng)
+        rounds += active
+        attacker_broken = attacker.fighting_men() < BREAK_SHARE * attacker.start
+        defender_broken = defender.fighting_men() < BREAK_SHARE * defender.start
+        attacker_won |= active & defender_broken & ~attacker_broken
+        active &= ~(attacker_broken | defender_broken)
+        if not active.any():
+            break
+    return attacker_won, rounds
+
+def resolve_battle(attacker: Army, defender: Army, terrain: Terrain, rng,
+                   attacker_bonus: float = 1.0, defender_bonus: float = 1.0) -> BattleResult:
+    """Fight one battle; both armies' arrays are left with the survivors."""
+    a = _Side.tile(attacker, 1, attacker_bonus)
+    d = _Side.tile(defender, 1, defender_bonus * TERRAIN_DEFENSE[terrain])
+    men_before = attacker.men, defender.men
+    routed_before = int((~attacker.fighting()).sum()), int((~defender.fighting()).sum())
+    won, rounds = _fight(a, d, rng)
+    attacker.strength, attacker.morale = a.strength[0], a.morale[0]
+    defender.strength, defender.morale = d.strength[0], d.morale[0]
+    return BattleResult(
+        winner="attacker" if won[0] else "defender",
+        rounds=int(rounds[0]),
+        attacker_losses=men_before[0] - attacker.men,
+        defender_losses=men_before[1] - defender.men,
+        attacker_routed=int((~attacker.fighting()).sum()) - routed_before[0],
+        defender_routed=int((~defender.fighting()).sum()) - routed_before[1],
+    )
+
+def win_probability(attacker: Army, defender: Army, terrain: Terrain, rng, battles: int = ODDS_BATTLES,
+                    attacker_bonus: float = 1.0, defender_bonus: float = 1.0) -> float:
+    """The attacker's chance of winning, from battles simulated all at once. The armies are untouched."""
+    a = _Side.tile(attacker.by_tier(), battles, attacker_bonus)
+    d = _Side.tile(defender.by_tier(), battles, defender_bonus * TERRAIN_DEFENSE[terrain])
+    won, _ = _fight(a, d, rng)
+    return float(won.mean())
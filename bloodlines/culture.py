@@ -1,20 +1,15 @@
 import json
-import sys
-import os
 from typing import Dict, List, Optional
+from .resources import resource_path
 
 class CultureManager:
     def __init__(self, config_path: str = "data/cultures.json"):
         self.data = self._load_data(self._resource_path(config_path))
+        self._titles: Dict[tuple, str] = {}  # (culture, title_type) -> title
 
     def _resource_path(self, relative_path: str) -> str:
         """Get absolute path to resource, works for dev and for PyInstaller"""
-        try:
-            # PyInstaller creates a temp folder and stores path in _MEIPASS
-            base_path = sys._MEIPASS
-        except Exception:
-            base_path = os.path.abspath(".")
-        return os.path.join(base_path, relative_path)
+        return resource_path(relative_path)
 
     def _load_data(self, path: str) -> Dict:
         try:
@@ -29,11 +24,16 @@ class CultureManager:
         Get the localized title for a specific culture.
         title_type: 'ruler', 'heir', 'noble'
         """
-        culture_data = self.data.get(culture, self.data.get("Generic"))
-        if not culture_data:
-            return title_type.capitalize()
-        
-        return culture_data.get("titles", {}).get(title_type, title_type.capitalize())
+        key = (culture, title_type)
+        title = self._titles.get(key)
+        if title is None:
+            culture_data = self.data.get(culture, self.data.get("Generic"))
+            if not culture_data:
+                title = title_type.capitalize()
+            else:
+                title = culture_data.get("titles", {}).get(title_type, title_type.capitalize())
+            self._titles[key] = title
+        return title
 
     def get_unit_name(self, culture: str, unit_tier: str) -> str:
         """
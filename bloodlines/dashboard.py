@@ -0,0 +1,245 @@
+"""The in-game dashboard as one persistent Rich Live display.
+
+The layout and its panels are built once. Each frame, every section
+(header, character stats, log / active event) compares a cheap signature
+of the state it shows with the one it last drew, and only rebuilds its
+renderable when that changed. The Live display then rewrites only the
+terminal lines that differ from the previous frame, so a month where only
+the date and a log line changed costs a few lines of output instead of a
+whole screen. Redraws are capped at max_fps.
+
+The line diffing replaces Live's private LiveRender (_DiffRender, _DiffLive),
+so Rich is pinned to the tested minor release in requirements.txt and
+tests/test_dashboard.py checks the internals it relies on.
+"""
+from typing import Dict, Hashable, List, Optional
+from rich.console import Console
+from rich.control import Control
+from rich.layout import Layout
+from rich.live import Live
+from rich.live_render import LiveRender
+from rich.panel import Panel
+from rich.segment import ControlType, Segment
+from rich.table import Table
+import sys
+import time
+
+MAX_FPS = 20
+LOG_LINES = 10
+BODY_HEIGHT = 14
+COMMANDS = "[ENTER] Next Month | [F] Fast Forward | [M] Move | [B] Build | [R] Relationships | [S] Save | [L] Load | [Q] Quit"
+
+class _DiffRender(LiveRender):
+    """LiveRender that rewrites only the lines that changed since the last frame.
+
+    A full redraw (what LiveRender always does) is still used when other
+    output was printed above the display.
+    """
+
+    def __init__(self, renderable, **kwargs):
+        super().__init__(renderable, **kwargs)
+        self.diff = False  # This frame is a plain refresh
+        self.below = 0  # Lines the cursor has moved past the display (prompt echo)
+        self._lines: Optional[List[List[Segment]]] = None  # What is on screen
+
+    def reset(self):
+        self._shape = None
+        self._lines = None
+        self.below = 0
+
+    def touch_last_line(self):
+        """The last line was written over (by a prompt); redraw it next frame."""
+        if self._lines:
+            self._lines[-1] = None
+
+    def position_cursor(self) -> Control:
+        if self._shape is None:
+            return Control()
+        up = self._shape[1] - 1 + self.below
+        self.below = 0
+        if self.diff and self._lines is not None:
+            return Control(ControlType.CARRIAGE_RETURN, *([(ControlType.CURSOR_UP, up)] if up else []))
+        self._lines = None
+        return Control(ControlType.CARRIAGE_RETURN, (ControlType.ERASE_IN_LINE, 2),
+                       *((ControlType.CURSOR_UP, 1), (ControlType.ERASE_IN_LINE, 2)) * up)
+
+    def __rich_console__(self, console, options):
+        lines = console.render_lines(self.renderable, options, style=console.get_style(self.style), pad=False)
+        previous = self._lines
+        self._shape = Segment.get_shape(lines)
+        self._lines = lines
+        erase = Control((ControlType.ERASE_IN_LINE, 2)).segment
+        new_line = Segment.line()
+        last = len(lines) - 1
+        for i, line in enumerate(lines):
+            if previous is None or i >= len(previous) or previous[i] != line:
+                if previous is not None:
+                    yield erase
+                yield from line
+            if i < last:
+                yield new_line
+        if previous is not None and len(previous) > len(lines):
+            # The display got shorter: blank what is left of the old one
+            extra = len(previous) - len(lines)
+            for _ in range(extra):
+                yield new_line
+                yield erase
+            yield Control((ControlType.CURSOR_UP, extra)).segment
+
+class _DiffLive(Live):
+    def __init__(self, renderable, **kwargs):
+        super().__init__(renderable, **kwargs)
+        self._live_render = _DiffRender(renderable, vertical_overflow=self.vertical_overflow)
+
+    def process_renderables(self, renderables):
+        # Live.refresh prints a bare Control; anything else is output going above the display
+        self._live_render.diff = all(isinstance(r, Control) for r in renderables)
+        return super().process_renderables(renderables)
+
+class _Sized:
+    """Renders a layout at a fixed height instead of the full terminal."""
+
+    def __init__(self, layout: Layout, height: int):
+        self.layout = layout
+        self.height = height
+
+    def __rich_console__(self, console, options):
+        yield from console.render(self.layout, options.update(height=self.height))
+        yield Segment.line()  # The prompt line
+
+class Dashboard:
+    def __init__(self, engine, console: Optional[Console] = None, max_fps: float = MAX_FPS):
+        self.engine = engine
+        self.console = console or Console()
+        self.min_interval = 1.0 / max_fps if max_fps else 0.0
+        self.layout = Layout()
+        self.layout.split_column(
+            Layout(name="header", size=3),
+            Layout(name="body", size=BODY_HEIGHT),
+            Layout(name="footer", size=3)
+        )
+        self.layout["body"].split_row(Layout(name="left"), Layout(name="right"))
+        self.layout["footer"].update(Panel(COMMANDS, title="Commands"))
+        self.live = _DiffLive(_Sized(self.layout, 6 + BODY_HEIGHT), console=self.console, auto_refresh=False,
+                              redirect_stdout=True, redirect_stderr=True, vertical_overflow="visible")
+        self._signatures: Dict[str, Hashable] = {}
+        self._neighbors: Dict[int, str] = {}  # region id -> neighbour names, for _neighbors_graph
+        self._neighbors_graph = None
+        self._last_frame = 0.0
+        self._pending = False
+        self.rebuilds = 0  # Section rebuilds, for tests and benchmarks
+
+    def __enter__(self):
+        self.resume()
+        return self
+
+    def __exit__(self, *exc):
+        self.live.stop()
+
+    def _neighbor_graph(self):
+        """The world's adjacency graph; a new one (new map, invalidate_graph, load) empties the name cache."""
+        graph = self.engine.world_manager.graph
+        if graph is not self._neighbors_graph:
+            self._neighbors = {}
+            self._neighbors_graph = graph
+        return graph
+
+    def _neighbor_names(self, region) -> str:
+        names = self._neighbors.get(region.id)
+        if names is None:
+            names = self._neighbors[region.id] = ", ".join(self.engine.regions[n].name for n in region.neighbors)
+        return names
+
+    def _section(self, name: str, signature: Hashable, build):
+        if self._signatures.get(name) == signature:
+            return False
+        self._signatures[name] = signature
+        self.layout[name].update(build())
+        self.rebuilds += 1
+        return True
+
+    def _refresh_sections(self) -> bool:
+        engine = self.engine
+        player = engine.characters[engine.player_character_id]
+        title = engine.get_character_title(player.id)
+        region = engine.regions.get(player.location_id) if player.location_id else None
+        dynasty = engine.dynasties.get(player.dynasty_id)
+        changed = self._section(
+            "header",
+            (engine.month, engine.year, engine.is_bc, player.id, title, player.location_id),
+            lambda: Panel(f"DATE: {engine.get_date_string()} | DYNASTY: {dynasty.name if dynasty else 'None'} | "
+                          f"HEAD: {player.name} ({title}) | LOC: {region.name if region else 'Unknown'}",
+                          style="bold white on blue"))
+        buildings = tuple(region.buildings.items()) if region is not None else ()
+        graph = self._neighbor_graph()
+        changed |= self._section(
+            "left",
+            (player.id, title, player.culture, player.age, player.wealth, round(player.health, 1),
+             player.martial, player.diplomacy, player.location_id, buildings, id(graph)),
+            lambda: Panel(self._stats_table(player, title, region), title="Current Character"))
+        event = engine.current_event
+        if event is not None:
+            changed |= self._section("right", ("event", id(event)), lambda: Panel(
+                _event_text(event), title="Active Event", style="bold red"))
+        else:
+            changed |= self._section("right", ("log", engine.logbook.version), lambda: Panel(
+                "\n".join(engine.logbook.tail(LOG_LINES)), title="Events Log", style="green"))
+        return changed
+
+    def _stats_table(self, player, title: str, region) -> Table:
+        table = Table(title=f"Character Stats ({player.culture})")
+        table.add_column("Stat", style="cyan")
+        table.add_column("Value", style="magenta")
+        table.add_row("Title", title)
+        table.add_row("Age", str(player.age))
+        table.add_row("Wealth", str(player.wealth))
+        table.add_row("Health", f"{player.health:.1f}")
+        table.add_row("Martial", str(player.martial))
+        table.add_row("Diplomacy", str(player.diplomacy))
+        if region is not None:
+            table.add_row("Neighbors", self._neighbor_names(region))
+            if region.buildings:
+                table.add_row("Buildings", ", ".join(f"{k.title()}: {v}" for k, v in region.buildings.items()))
+        return table
+
+    def update(self, force: bool = False) -> bool:
+        """Redraw what changed, at most max_fps times a second unless forced. Returns whether it drew."""
+        if self._refresh_sections():
+            self._pending = True
+        if not self._pending:
+            return False
+        now = time.monotonic()
+        if not force and now - self._last_frame < self.min_interval:
+            return False
+        self.live.refresh()
+        self._last_frame = now
+        self._pending = False
+        return True
+
+    def prompt(self, text: str = "> ") -> str:
+        """Draw the latest state, then read a command on the display's last line."""
+        self.update(force=True)
+        out = self.console.file
+        out.write(text)
+        out.flush()
+        line = sys.stdin.readline()
+        if not line:
+            raise EOFError
+        self.live._live_render.below += 1
+        self.live._live_render.touch_last_line()
+        self._pending = True
+        return line.rstrip("\n")
+
+    def suspend(self):
+        """Stop the live display (e.g. for a menu that prints and reads freely); resume() redraws it below."""
+        self.live.stop()
+
+    def resume(self):
+        self.live._live_render.reset()
+        self.live.start(refresh=True)
+
+def _event_text(event) -> str:
+    text = f"[bold yellow]{event.title}[/bold yellow]\n\n{event.description}\n"
+    for i, option in enumerate(event.options):
+        text += f"\n[{i+1}] {option.text} ({option.tooltip})"
+    return text
@@ -0,0 +1,205 @@
+"""Optional vectorized model of every region's people, food and wealth.
+
+When enabled (GameEngine.enable_demography), each region's population is
+split into children, adults and elders. Those cohorts, the region's food
+and its wealth live in NumPy arrays with one slot per region, and
+advance_month moves them all forward in one vectorized pass:
+
+- Adults farm. Their yield depends on terrain and falls as the land
+  fills up; each farm adds a fixed harvest.
+- Births follow the adults and are cut by hunger. Deaths rise with it.
+- The adults' output, and any food to spare, adds to the region's wealth,
+  which slowly wears away. The owner's ruler takes TAX_RATE of the output;
+  taxes are paid with the buildings' income in process_economy.
+
+The model draws no random numbers. Region.population and Region.wealth are
+written back before every save, and the arrays themselves are saved too
+(to_dict), so a loaded game carries on exactly where it was saved. Regions
+added later start from their total split by COHORT_SHARES. Requires numpy.
+"""
+from typing import Dict, Iterable, List
+from .ids import export_id, intern_id
+from .models import Region, Terrain
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional
+    np = None
+
+COHORT_SHARES = (0.35, 0.5, 0.15)  # Children, adults, elders in a settled region
+
+CHILDHOOD_MONTHS = 15 * 12
+ADULTHOOD_MONTHS = 35 * 12
+BIRTH_RATE = 0.08 / 12  # Births per adult per month when fed
+DEATH_RATES = (0.03 / 12, 0.01 / 12, 0.07 / 12)  # Per cohort per month
+FAMINE_MORTALITY = 4.0  # Extra deaths per unit of food shortfall, as a multiple of the usual rate
+RATIONS = (0.6, 1.0, 0.8)  # Food eaten per person per month by cohort
+
+# Terrain -> (food per adult per month on empty land, adults the land feeds before yields halve, trade per adult)
+TERRAIN_YIELDS = {
+    Terrain.PLAINS: (2.4, 3000.0, 0.005),
+    Terrain.COASTAL: (2.2, 2500.0, 0.01),
+    Terrain.HILLS: (2.0, 1500.0, 0.005),
+    Terrain.DESERT: (1.8, 300.0, 0.008),
+    Terrain.MOUNTAINS: (1.8, 400.0, 0.004),
+}
+FARM_HARVEST = 150.0  # Food per farm per month
+FOOD_PRICE = 0.01  # Wealth per unit of spare food
+WEALTH_DECAY = 0.01  # Share of a region's wealth spent each month
+TAX_RATE = 0.1  # Share of a region's output owed to its ruler
+
+def numpy_available() -> bool:
+    return np is not None
+
+class RegionalEconomy:
+    """Cohorts, food and wealth of every region as arrays, stepped once a month."""
+
+    def __init__(self, engine):
+        if np is None:
+            raise ImportError("The regional economy requires numpy (pip install numpy)")
+        self.engine = engine
+        self.rebuild()
+
+    def rebuild(self):
+        """Take every region's totals, terrain, farms and owner from the Region objects."""
+        self.ids: List[int] = []  # slot -> region id
+        self.slots: Dict[int, int] = {}
+        self.cohorts = np.zeros((3, 0))  # (3, regions): one contiguous row per cohort
+        self.wealth = np.zeros(0)
+        self.food_yield, self.land, self.trade = np.zeros(0), np.zeros(0), np.zeros(0)
+        self.farms = np.zeros(0)
+        self.owner = np.zeros(0, dtype=np.int64)  # Polity code, -1 for none
+        self.food = np.zeros(0)  # Last month's harvest over what was eaten (1 = just enough)
+        self.output = np.zeros(0)
+        self._polities: List[int] = []  # code -> polity id
+        self._codes: Dict[int, int] = {}
+        self._tax_owed = np.zeros(0)  # Per polity code, carried until whole coins are due
+        self.add_regions(self.engine.regions.values())
+
+    def add_regions(self, regions: Iterable[Region]):
+        """Give new regions a slot each; their totals are split by COHORT_SHARES. Known regions are skipped."""
+        regions = [region for region in regions if region.id not in self.slots]
+        if not regions:
+            return
+        n = len(regions)
+        for region in regions:
+            self.slots[region.id] = len(self.ids)
+            self.ids.append(region.id)
+        totals = np.array([region.population for region in regions], dtype=np.float64)
+        self.cohorts = np.hstack([self.cohorts, np.outer(COHORT_SHARES, totals)])
+        self.wealth = np.concatenate([self.wealth, [region.wealth for region in regions]])
+        yields = np.array([TERRAIN_YIELDS[region.terrain] for region in regions], dtype=np.float64).reshape(n, 3)
+        self.food_yield = np.concatenate([self.food_yield, yields[:, 0]])
+        self.land = np.concatenate([self.land, yields[:, 1]])
+        self.trade = np.concatenate([self.trade, yields[:, 2]])
+        self.farms = np.concatenate([self.farms, np.zeros(n)])
+        self.owner = np.concatenate([self.owner, np.full(n, -1, dtype=np.int64)])
+        self.food = np.concatenate([self.food, np.zeros(n)])
+        self.output = np.concatenate([self.output, np.zeros(n)])
+        for region in regions:
+            self.region_changed(region.id)
+
+    def region_changed(self, region_id: int):
+        """Re-read a region's farms and owner (after construction or a change of owner)."""
+        slot = self.slots.get(region_id)
+        if slot is None:
+            return  # New regions are picked up by add_regions
+        region = self.engine.regions[region_id]
+        self.farms[slot] = region.buildings.get("farm", 0)
+        polity_id = region.owner_polity_id
+        if polity_id is None:
+            self.owner[slot] = -1
+        else:
+            self.owner[slot] = self._code(polity_id)
+
+    def _code(self, polity_id: int) -> int:
+        code = self._codes.get(polity_id)
+        if code is None:
+            code = self._codes[polity_id] = len(self._polities)
+            self._polities.append(polity_id)
+        return code
+
+    def step(self):
+        """One month for every region."""
+        if len(self.ids) != len(self.engine.regions):
+            self.add_regions(self.engine.regions.values())
+        children, adults, elders = self.cohorts
+        harvest = self.food_yield * adults / (1.0 + adults / self.land) + self.farms * FARM_HARVEST
+        eaten = np.array(RATIONS) @ self.cohorts
+        fed = np.divide(harvest, eaten, out=np.ones_like(harvest), where=eaten > 0)
+        hunger = np.clip(1.0 - fed, 0.0, 1.0)
+
+        # Output is read off this month's adults, before the cohorts move
+        self.output = adults * self.trade + np.maximum(harvest - eaten, 0.0) * FOOD_PRICE
+        self.wealth += self.output * (1.0 - TAX_RATE) - self.wealth * WEALTH_DECAY
+        self.food = fed
+
+        births = adults * BIRTH_RATE * (1.0 - hunger)
+        grown, aged = children / CHILDHOOD_MONTHS, adults / ADULTHOOD_MONTHS
+        self.cohorts -= self.cohorts * np.outer(DEATH_RATES, 1.0 + FAMINE_MORTALITY * hunger)
+        children += births - grown
+        adults += grown - aged
+        elders += aged
+        np.maximum(self.cohorts, 0.0, out=self.cohorts)
+
+    def ruler_taxes(self) -> Dict[int, int]:
+        """Whole coins each ruler is owed for the month just stepped; fractions carry over."""
+        owned = self.owner >= 0
+        due = np.bincount(self.owner[owned], weights=self.output[owned] * TAX_RATE,
+                          minlength=len(self._polities))
+        if len(self._tax_owed) < len(due):
+            self._tax_owed = np.concatenate([self._tax_owed, np.zeros(len(due) - len(self._tax_owed))])
+        self._tax_owed += due
+        coins = np.floor(self._tax_owed)
+        self._tax_owed -= coins
+        taxes: Dict[int, int] = {}
+        polities = self.engine.polities
+        for code in np.flatnonzero(coins):
+            polity = polities.get(self._polities[code])
+            if polity is not None and polity.ruler_id is not None:
+                taxes[polity.ruler_id] = taxes.get(polity.ruler_id, 0) + int(coins[code])
+        return taxes
+
+    def population_of(self, region_id: int) -> int:
+        return int(self.cohorts[:, self.slots[region_id]].sum())
+
+    def write_back(self):
+        """Copy the arrays' totals into Region.population and Region.wealth (only those that changed)."""
+        regions = self.engine.regions
+        populations = self.cohorts.sum(axis=0).astype(np.int64).tolist()
+        wealth = self.wealth.astype(np.int64).tolist()
+        for region_id, population, riches in zip(self.ids, populations, wealth):
+            region = regions.get(region_id)
+            if region is None:
+                continue
+            if region.population != population:
+                region.population = population
+            if region.wealth != riches:
+                region.wealth = riches
+
+    def to_dict(self) -> Dict:
+        """The arrays' state for a save: each region's cohorts, wealth and food, and the rulers' unpaid fractions."""
+        rows = np.vstack([self.cohorts, self.wealth, self.food]).T.tolist()
+        return {
+            "regions": {export_id(region_id): row for region_id, row in zip(self.ids, rows)},
+            "tax_owed": {export_id(polity_id): owed
+                         for polity_id, owed in zip(self._polities, self._tax_owed.tolist()) if owed},
+        }
+
+    def load_dict(self, state: Dict):
+        """Restore a to_dict(); regions it doesn't cover keep the totals they were built from."""
+        slots, rows = [], []
+        for key, row in state.get("regions", {}).items():
+            slot = self.slots.get(intern_id(key))
+            if slot is not None:
+                slots.append(slot)
+                rows.append(row)
+        if rows:
+            rows = np.array(rows, dtype=np.float64)
+            self.cohorts[:, slots] = rows[:, :3].T
+            self.wealth[slots] = rows[:, 3]
+            self.food[slots] = rows[:, 4]
+        owed = {self._code(intern_id(key)): value for key, value in state.get("tax_owed", {}).items()}
+        self._tax_owed = np.zeros(len(self._polities))
+        for code, value in owed.items():
+            self._tax_owed[code] = value
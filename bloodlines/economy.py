@@ -0,0 +1,120 @@
+import json
+from typing import Dict, List, Optional
+from .resources import resource_path
+
+class BuildingCatalogue:
+    """Building definitions (cost, monthly income) loaded from data/buildings.json."""
+
+    def __init__(self, config_path: str = "data/buildings.json"):
+        self.data = self._load_data(resource_path(config_path))
+
+    def _load_data(self, path: str) -> Dict:
+        try:
+            with open(path, 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            print(f"Error: Building config file '{path}' not found.")
+            return {}
+
+    def types(self) -> List[str]:
+        return list(self.data.keys())
+
+    def get_name(self, building_type: str) -> str:
+        return self.data.get(building_type, {}).get("name", building_type.title())
+
+    def get_cost(self, building_type: str) -> Optional[int]:
+        """Construction cost, or None if the building type is unknown."""
+        if building_type not in self.data:
+            return None
+        return self.data[building_type].get("cost", 0)
+
+    def get_income(self, building_type: str) -> int:
+        return self.data.get(building_type, {}).get("income", 0)
+
+class IncomeLedger:
+    """Cached monthly income per region, per polity and per ruler.
+
+    Region yields are recomputed only when a region is invalidated (new
+    building, change of owner). Ruler totals are rebuilt only when a
+    polity's ruler changes, so the monthly tick is one wealth update per
+    ruler instead of a pass over every region.
+    """
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.region_income: Dict[int, int] = {}
+        self.region_owner: Dict[int, Optional[int]] = {}  # Polity each region's income is credited to
+        self.polity_income: Dict[int, int] = {}
+        self.ruler_income: Dict[int, int] = {}
+        self._rulers: Dict[int, Optional[int]] = {}  # polity_id -> ruler_id behind ruler_income
+        self._dirty = True
+
+    def rebuild(self):
+        """Recompute every region from scratch (after a load or bulk map changes)."""
+        self.region_income = {}
+        self.region_owner = {}
+        self.polity_income = {}
+        for region_id in self.engine.regions:
+            self._credit_region(region_id)
+        self._rebuild_rulers()
+        self._dirty = False
+
+    def invalidate_region(self, region_id: int):
+        """Recompute one region's yield, e.g. after construction or a change of owner."""
+        if self._dirty:
+            return  # The next tick rebuilds everything anyway
+        owner_id = self.region_owner.pop(region_id, None)
+        income = self.region_income.pop(region_id, 0)
+        if owner_id:
+            self.polity_income[owner_id] -= income
+        self._credit_region(region_id)
+        self._rulers = {}  # Force ruler totals to be rebuilt
+
+    def _credit_region(self, region_id: int):
+        region = self.engine.regions[region_id]
+        catalogue = self.engine.building_catalogue
+        income = sum(catalogue.get_income(b_type) * count for b_type, count in region.buildings.items())
+        self.region_income[region_id] = income
+        self.region_owner[region_id] = region.owner_polity_id
+        if region.owner_polity_id:
+            self.polity_income[region.owner_polity_id] = self.polity_income.get(region.owner_polity_id, 0) + income
+
+    def _rebuild_rulers(self):
+        self._rulers = {pid: p.ruler_id for pid, p in self.engine.polities.items()}
+        self.ruler_income = {}
+        for polity_id, income in self.polity_income.items():
+            ruler_id = self._rulers.get(polity_id)
+            if ruler_id and income:
+                self.ruler_income[ruler_id] = self.ruler_income.get(ruler_id, 0) + income
+
+    def _rulers_changed(self) -> bool:
+        polities = self.engine.polities
+        if len(polities) != len(self._rulers):
+            return True
+        for polity_id, ruler_id in self._rulers.items():
+            polity = polities.get(polity_id)
+            if polity is None or polity.ruler_id != ruler_id:
+                return True
+        return False
+
+    def get_monthly_income(self, ruler_id: int) -> int:
+        self.refresh()
+        return self.ruler_income.get(ruler_id, 0)
+
+    def refresh(self):
+        if self._dirty:
+            self.rebuild()
+        elif self._rulers_changed():
+            self._rebuild_rulers()
+
+    def pay_out(self, taxes: Optional[Dict[int, int]] = None):
+        """Credit every ruler with their cached monthly income, plus any taxes (ruler id -> coins)."""
+        self.refresh()
+        income = self.ruler_income
+        if taxes:
+            income = dict(income)
+            for ruler_id, amount in taxes.items():
+                income[ruler_id] = income.get(ruler_id, 0) + amount
+        for ruler_id, amount in income.items():
+            if amount > 0:
+                self.engine.modify_wealth(ruler_id, amount)
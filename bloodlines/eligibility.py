@@ -0,0 +1,164 @@
+"""Cached event eligibility and O(log n) weighted event draws.
+
+Events declare the pieces of game state their trigger condition reads
+(Event.depends_on). For every character events are rolled for, an
+EligibilityIndex remembers a cheap fingerprint of each such input and only
+re-runs the conditions of events whose inputs changed since the last roll.
+Eligible events carry their weight in a Fenwick tree, so a draw is one
+random number and a log-time descent. Events that declare nothing
+(depends_on=None) are checked on every roll, as before.
+"""
+from typing import Callable, Dict, Hashable
+import random
+
+def _character_field(name: str):
+    def fingerprint(engine, char_id):
+        return getattr(engine.characters.get(char_id), name, None)
+    return fingerprint
+
+def _child_count(engine, char_id):
+    char = engine.characters.get(char_id)
+    return len(char.children_ids) if char is not None else 0
+
+def _polity_governments(engine, char_id):
+    polities = engine.polities
+    return tuple(polities[polity_id].government_type for polity_id in engine.titles.polities_of(char_id))
+
+# Dependency name -> fingerprint of that input for a character
+DEPENDENCIES: Dict[str, Callable[['GameEngine', int], Hashable]] = {
+    "wealth": _character_field("wealth"),
+    "health": _character_field("health"),
+    "age": _character_field("age"),
+    "alive": _character_field("is_alive"),
+    "culture": _character_field("culture"),
+    "spouse": _character_field("spouse_id"),
+    "location": _character_field("location_id"),
+    "children": _child_count,
+    "character_count": lambda engine, char_id: len(engine.characters),
+    "government": _polity_governments,
+    "date": lambda engine, char_id: (engine.month, engine.year, engine.is_bc),
+}
+
+def register_dependency(name: str, fingerprint: Callable[['GameEngine', int], Hashable]):
+    """Make a new kind of input available to Event.depends_on."""
+    DEPENDENCIES[name] = fingerprint
+
+class FenwickTree:
+    """Prefix sums over non-negative integer weights with point updates."""
+
+    def __init__(self, size: int):
+        self.size = size
+        self.tree = [0] * (size + 1)
+        self.total = 0
+
+    @classmethod
+    def from_weights(cls, weights) -> 'FenwickTree':
+        """Build in O(n) instead of n add() calls."""
+        tree = cls(len(weights))
+        values = tree.tree
+        values[1:] = weights
+        for i in range(1, tree.size + 1):
+            parent = i + (i & -i)
+            if parent <= tree.size:
+                values[parent] += values[i]
+        tree.total = sum(weights)
+        return tree
+
+    def add(self, index: int, delta: int):
+        self.total += delta
+        i = index + 1
+        while i <= self.size:
+            self.tree[i] += delta
+            i += i & -i
+
+    def find(self, value: int) -> int:
+        """Smallest index whose prefix sum exceeds value (0 <= value < total)."""
+        pos = 0
+        step = 1 << self.size.bit_length()
+        while step:
+            nxt = pos + step
+            if nxt <= self.size and self.tree[nxt] <= value:
+                pos = nxt
+                value -= self.tree[nxt]
+            step >>= 1
+        return pos
+
+class EligibilityIndex:
+    """Which events can fire for one character, kept current incrementally."""
+
+    def __init__(self, manager, char_id: int):
+        self.manager = manager
+        self.char_id = char_id
+        count = len(manager.events)
+        self.eligible = [False] * count
+        self.tree = FenwickTree(count)
+        self.fingerprints: Dict[str, Hashable] = {}
+        self.rolls = 0
+        self.since = [0] * count  # Roll number at which each eligible event became eligible
+        self.primed = False
+
+    def _set(self, index: int, value: bool):
+        if self.eligible[index] == value:
+            return
+        self.eligible[index] = value
+        weight = self.manager.events[index].weight
+        stats = self.manager.stats[index]
+        if value:
+            self.tree.add(index, weight)
+            self.since[index] = self.rolls
+        else:
+            self.tree.add(index, -weight)
+            stats.eligible_rolls += self.rolls - self.since[index]
+
+    def _evaluate(self, engine, indices):
+        events = self.manager.events
+        for i in indices:
+            self._set(i, bool(events[i].trigger_condition(engine, self.char_id)))
+
+    def refresh(self, engine):
+        manager = self.manager
+        if not self.primed:
+            self._evaluate(engine, range(len(manager.events)))
+            for name in manager.by_dependency:
+                self.fingerprints[name] = DEPENDENCIES[name](engine, self.char_id)
+            self.primed = True
+            return
+        for name, indices in manager.by_dependency.items():
+            value = DEPENDENCIES[name](engine, self.char_id)
+            if self.fingerprints.get(name) != value:
+                self.fingerprints[name] = value
+                self._evaluate(engine, indices)
+        self._evaluate(engine, manager.volatile)
+
+    def draw(self, rng=random):
+        """Roll one event among the eligible ones (None if there are none)."""
+        self.rolls += 1
+        if self.tree.total <= 0:
+            return None
+        return self._fire(self.tree.find(rng.randrange(self.tree.total)))
+
+    def draw_uniform(self, u: float):
+        """As draw, with the random number u in [0, 1) supplied by the caller."""
+        self.rolls += 1
+        total = self.tree.total
+        if total <= 0:
+            return None
+        return self._fire(self.tree.find(min(int(u * total), total - 1)))
+
+    def _fire(self, index: int):
+        self.manager.stats[index].fired += 1
+        return self.manager.events[index]
+
+    def close(self):
+        """Fold open eligibility intervals into the manager's statistics."""
+        for i, eligible in enumerate(self.eligible):
+            if eligible:
+                self.manager.stats[i].eligible_rolls += self.rolls - self.since[i]
+                self.since[i] = self.rolls
+
+class EventStats:
+    __slots__ = ("fired", "eligible_rolls")
+
+    def __init__(self):
+        self.fired = 0
+        self.eligible_rolls = 0
@@ -1,107 +1,255 @@
 from typing import List, Dict, Optional
 from .models import Character, Dynasty, Polity, Region, GovernmentType, Terrain
 from .culture import CultureManager
-from .events import EventManager, Event
+from .events import EventManager, Event, AIPolicy, random_ai_policy
 from .government import GovernmentManager
 from .world import WorldManager
-import random
+from .pathfinding import Journey
+from .lineage import LineageIndex
+from .logbook import LogBook, LogLevel, format_date, month_index
+from .economy import BuildingCatalogue, IncomeLedger
+from .fertility import FertilityTracker
+from .relations import RelationIndex
+from .matchmaking import Matchmaker
+from .titles import TitleService
+from .population import PopulationStore
+from .demography import RegionalEconomy
+from .opinions import new_opinion_store
+from .mortality import DeathScheduler, MORTALITY_AGE, MORTALITY_PER_YEAR
+from .ids import intern_id, export_id
+from .autosave import Autosaver, discard_journal, replay_journal
+from .rng import RNGService
+from . import savefile
 import json
 import gzip
 import os
 
+# Formatted log lines written into save files
+SAVED_LOG_LINES = 100
+
+# Opinion points every relationship drifts back toward 0 each month
+OPINION_DECAY = 1
+
+# Monthly chance of an event for the player and for each AI ruler
+EVENT_CHANCE = 0.3
+
+# Monthly chance of birth for each fertile married woman (~24% per year)
+BIRTH_CHANCE = 0.02
+
 class GameEngine:
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None):
+        self.rng = RNGService(seed)  # Per-subsystem random streams; see rng.py
         self.culture_manager = CultureManager()
         self.event_manager = EventManager()
+        self.building_catalogue = BuildingCatalogue()
         self.government_manager = GovernmentManager(self)
         self.world_manager = WorldManager(self)
+        self.lineage = LineageIndex()
+        self.income_ledger = IncomeLedger(self)
+        self.fertility = FertilityTracker(self)
+        self.relations = RelationIndex(self)  # Built on first use by the relationships screen
+        self.matchmaker = Matchmaker(self)
+        self.titles = TitleService(self)
+        self.population: Optional[PopulationStore] = None  # See enable_population_store
+        self.demography: Optional[RegionalEconomy] = None  # See enable_demography
+        self.death_scheduler: Optional[DeathScheduler] = None  # See enable_death_scheduler
+        self.opinions = new_opinion_store()
         self.current_event: Optional[Event] = None
+        self.ai_events = True  # Roll events for rulers other than the player
+        self.ai_marriages = True  # Pair off unmarried AI characters each month
+        self.ai_event_policy: AIPolicy = random_ai_policy
         self.year = 753
         self.month = 1  # 1-12
         self.is_bc = True
         
         # Global State
-        self.characters: Dict[str, Character] = {}
-        self.dynasties: Dict[str, Dynasty] = {}
-        self.polities: Dict[str, Polity] = {}
-        self.regions: Dict[str, Region] = {}
+        self.characters: Dict[int, Character] = {}
+        self.dynasties: Dict[int, Dynasty] = {}
+        self.polities: Dict[int, Polity] = {}
+        self.regions: Dict[int, Region] = {}
         
-        self.player_character_id: Optional[str] = None
+        self.player_character_id: Optional[int] = None
         self.game_over = False
-        self.logs: List[str] = []
-
-    def save_game(self, filename: str):
-        """Save the current game state to a compressed JSON file."""
-        if not filename.endswith(".sav"):
-            filename += ".sav"
-            
+        self.logbook = LogBook()
+        self.save_format = "binary"  # or "json" for the original gzip-JSON saves
+        self.save_codec = "zlib"  # See savefile.available_codecs()
+        self.autosaver: Optional[Autosaver] = None  # See enable_autosave
+
+    def save_meta(self, save_format: str) -> Dict:
+        """Everything in a save besides the entity tables."""
+        if self.demography is not None:
+            self.demography.write_back()  # Region totals live in the arrays between saves
         data = {
             "version": "0.1.0",
             "year": self.year,
             "month": self.month,
             "is_bc": self.is_bc,
-            "player_character_id": self.player_character_id,
-            "logs": self.logs,
-            "characters": {k: v.to_dict() for k, v in self.characters.items()},
-            "dynasties": {k: v.to_dict() for k, v in self.dynasties.items()},
-            "polities": {k: v.to_dict() for k, v in self.polities.items()},
-            "regions": {k: v.to_dict() for k, v in self.regions.items()}
+            "player_character_id": export_id(self.player_character_id),
+            "logs": self.logbook.tail(SAVED_LOG_LINES),
+            "rng": self.rng.get_state(),
         }
+        if self.demography is not None:
+            data["demography"] = self.demography.to_dict()
+        if self.world_manager.journeys:
+            data["journeys"] = {export_id(k): v.to_dict() for k, v in self.world_manager.journeys.items()}
+        if self.death_scheduler is not None:
+            if save_format == "binary":
+                # Due months are streamed as their own section
+                data["death_schedule"] = {"modifiers": self.death_scheduler.to_dict()["modifiers"]}
+            else:
+                data["death_schedule"] = self.death_scheduler.to_dict()
+        return data
+
+    def save_game(self, filename: str, save_format: Optional[str] = None, codec: Optional[str] = None) -> bool:
+        """Save the current game state.
+
+        save_format is "binary" (streamed, see savefile.py) or "json" (the
+        original gzip-compressed JSON); defaults to self.save_format.
+        """
+        if not filename.endswith(".sav"):
+            filename += ".sav"
+        save_format = save_format or self.save_format
+        data = self.save_meta(save_format)
+        self.absorb_opinions()
         
         try:
-            with gzip.open(filename, 'wt', encoding='utf-8') as f:
-                json.dump(data, f)
-            self.log(f"Game saved to {filename}")
+            if save_format == "binary":
+                savefile.write_binary(self, filename, data, codec or self.save_codec)
+            else:
+                data.update({
+                    "characters": {export_id(k): self._character_dict(v) for k, v in self.characters.items()},
+                    "dynasties": {export_id(k): v.to_dict() for k, v in self.dynasties.items()},
+                    "polities": {export_id(k): v.to_dict() for k, v in self.polities.items()},
+                    "regions": {export_id(k): v.to_dict() for k, v in self.regions.items()}
+                })
+                with gzip.open(filename, 'wt', encoding='utf-8') as f:
+                    json.dump(data, f)
+            # An autosave journal left next to this file no longer applies to it
+            discard_journal(filename)
+            if self.autosaver is not None and self.autosaver.filename == filename:
+                self.autosaver.reset()
+            self.log("Game saved to {}", filename, kind="system")
+            return True
+        except Exception as e:
+            self.log("Error saving game: {}", e, kind="system", level=LogLevel.WARNING)
+            return False
+
+    def enable_autosave(self, filename: str, compact_every: int = 10):
+        """Autosave incrementally: a snapshot, then journalled deltas of what changed.
+
+        See autosave.py. Every compact_every deltas a fresh snapshot is written.
+        """
+        self.disable_autosave()
+        self.autosaver = Autosaver(self, filename, compact_every)
+
+    def disable_autosave(self):
+        """Stop autosaving and tracking changes to this engine's models."""
+        if self.autosaver is not None:
+            self.autosaver.close()
+            self.autosaver = None
+
+    def autosave(self) -> bool:
+        if self.autosaver is None:
+            return False
+        try:
+            self.autosaver.save()
+            return True
         except Exception as e:
-            self.log(f"Error saving game: {e}")
+            self.autosaver.reset()
+            self.log("Error autosaving: {}", e, kind="system", level=LogLevel.WARNING)
+            return False
 
     def load_game(self, filename: str) -> bool:
-        """Load game state from a compressed JSON file."""
+        """Load game state from a binary or legacy gzip-JSON save (detected automatically)."""
         if not filename.endswith(".sav"):
             filename += ".sav"
             
         if not os.path.exists(filename):
-            self.log(f"Save file {filename} not found.")
+            self.log("Save file {} not found.", filename, kind="system", level=LogLevel.WARNING)
             return False
             
         try:
-            with gzip.open(filename, 'rt', encoding='utf-8') as f:
-                data = json.load(f)
+            if savefile.detect_format(filename) == "binary":
+                data = savefile.read_binary(filename)
+            else:
+                with gzip.open(filename, 'rt', encoding='utf-8') as f:
+                    data = json.load(f)
+                # Reconstruct objects (ids are interned, so keys come from the objects)
+                data["characters"] = {e.id: e for e in map(Character.from_dict, data["characters"].values())}
+                data["dynasties"] = {e.id: e for e in map(Dynasty.from_dict, data["dynasties"].values())}
+                data["polities"] = {e.id: e for e in map(Polity.from_dict, data["polities"].values())}
+                data["regions"] = {e.id: e for e in map(Region.from_dict, data["regions"].values())}
+            replay_journal(filename, data)
                 
             self.year = data["year"]
             self.month = data["month"]
             self.is_bc = data["is_bc"]
-            self.player_character_id = data["player_character_id"]
-            self.logs = data["logs"]
+            self.player_character_id = intern_id(data["player_character_id"])
+            self.logbook.load_lines(data["logs"])
+            if "rng" in data:
+                self.rng.set_state(data["rng"])
             
-            # Reconstruct objects
-            self.characters = {k: Character.from_dict(v) for k, v in data["characters"].items()}
-            self.dynasties = {k: Dynasty.from_dict(v) for k, v in data["dynasties"].items()}
-            self.polities = {k: Polity.from_dict(v) for k, v in data["polities"].items()}
-            self.regions = {k: Region.from_dict(v) for k, v in data["regions"].items()}
+            self.characters = data["characters"]
+            self.dynasties = data["dynasties"]
+            self.polities = data["polities"]
+            self.regions = data["regions"]
+            self.lineage.rebuild(self.characters)
+            self.opinions.clear()
+            self.absorb_opinions()
+            self.event_manager.reset()
+            self.fertility.rebuild()
+            self.relations.invalidate()
+            self.matchmaker.invalidate()
+            self.titles.invalidate()
+            if self.population is not None:
+                self.enable_population_store()
+            if self.demography is not None:
+                self.enable_demography()
+                if "demography" in data:
+                    self.demography.load_dict(data["demography"])
+            if "death_schedule" in data:
+                self.death_scheduler = DeathScheduler(self)
+                self.death_scheduler.load_dict(data["death_schedule"])
+            elif self.death_scheduler is not None:
+                self.enable_death_scheduler()
             
             # Re-link managers
             self.government_manager = GovernmentManager(self)
             self.world_manager = WorldManager(self)
+            self.world_manager.journeys = {intern_id(k): Journey.from_dict(v)
+                                           for k, v in data.get("journeys", {}).items()}
+            self.income_ledger = IncomeLedger(self)
+            self.income_ledger.rebuild()
+            if self.autosaver is not None:
+                self.autosaver.reset()
             # Note: We don't need to reload static data like cultures/events as they are initialized in __init__
             
-            self.log(f"Game loaded from {filename}")
+            self.log("Game loaded from {}", filename, kind="system")
             return True
         except Exception as e:
-            self.log(f"Error loading game: {e}")
+            self.log("Error loading game: {}", e, kind="system", level=LogLevel.WARNING)
             return False
 
-    def log(self, message: str):
-        """Add a message to the game log."""
-        date_str = self.get_date_string()
-        self.logs.append(f"[{date_str}] {message}")
-        # Keep log size manageable
-        if len(self.logs) > 100:
-            self.logs.pop(0)
+    def log(self, message: str, *args, kind: str = "general", actors: tuple = (),
+            level: LogLevel = LogLevel.INFO):
+        """Add a message to the game log.
+
+        When args are given, message is a str.format template that is only
+        filled in when the log is read.
+        """
+        self.logbook.record((self.month, self.year, self.is_bc), kind, message, args, actors, level)
+
+    @property
+    def logs(self) -> List[str]:
+        """The formatted log, oldest first."""
+        return self.logbook.lines()
 
     def get_date_string(self) -> str:
-        era = "BC" if self.is_bc else "AD"
-        return f"{self.month}/{self.year} {era}"
+        return format_date(self.month, self.year, self.is_bc)
+
+    def get_month_index(self) -> int:
+        """Months since January 1 AD (negative in BC); consecutive months differ by one."""
+        return month_index(self.month, self.year, self.is_bc)
 
     def advance_month(self):
         """The core game loop tick."""
@@ -117,12 +265,16 @@ class GameEngine:
                 self.year += 1
         
         self.process_characters()
+        self.world_manager.process_travel()
+        self.process_opinions()
         self.process_births()
+        self.process_marriages()
         self.process_polities()
+        self.process_regions()
         self.process_economy()
         self.process_events()
 
-    def construct_building(self, region_id: str, building_type: str) -> bool:
+    def construct_building(self, region_id: int, building_type: str) -> bool:
         """Construct a building in a region."""
         if region_id not in self.regions:
             return False
@@ -130,16 +282,9 @@ class GameEngine:
         region = self.regions[region_id]
         player = self.characters[self.player_character_id]
         
-        # Costs and Effects
-        costs = {
-            "farm": 50,
-            "estate": 200
-        }
-        
-        if building_type not in costs:
+        cost = self.building_catalogue.get_cost(building_type)
+        if cost is None:
             return False
-            
-        cost = costs[building_type]
         
         if player.wealth >= cost:
             self.modify_wealth(player.id, -cost)
@@ -147,92 +292,157 @@ class GameEngine:
                 region.buildings[building_type] += 1
             else:
                 region.buildings[building_type] = 1
-            self.log(f"Constructed {building_type} in {region.name}.")
+            region.mark_dirty()
+            self.income_ledger.invalidate_region(region_id)
+            if self.demography is not None:
+                self.demography.region_changed(region_id)
+            self.log("Constructed {} in {}.", building_type, region.name, kind="economy", actors=(player.id,))
             return True
         else:
-            self.log(f"Not enough wealth to build {building_type} (Cost: {cost}).")
+            self.log("Not enough wealth to build {} (Cost: {}).", building_type, cost,
+                     kind="economy", actors=(player.id,), level=LogLevel.WARNING)
             return False
 
+    def process_regions(self):
+        """Step every region's people, food and wealth (see demography.py), when enabled."""
+        if self.demography is not None:
+            self.demography.step()
+
     def process_economy(self):
-        """Process monthly income from buildings."""
-        # Building Income
-        income_map = {
-            "farm": 1,
-            "estate": 5
-        }
-        
-        for region in self.regions.values():
-            # Find owner of region (Polity -> Ruler)
-            if region.owner_polity_id:
-                polity = self.polities[region.owner_polity_id]
-                if polity.ruler_id:
-                    ruler_id = polity.ruler_id
-                    
-                    total_income = 0
-                    for b_type, count in region.buildings.items():
-                        if b_type in income_map:
-                            total_income += income_map[b_type] * count
-                    
-                    if total_income > 0:
-                        self.modify_wealth(ruler_id, total_income)
-
-    def get_opinion(self, char1_id: str, char2_id: str) -> int:
+        """Process monthly income from buildings, and regional taxes when demography is enabled."""
+        taxes = self.demography.ruler_taxes() if self.demography is not None else None
+        # One payout per ruler from the cached ledger
+        self.income_ledger.pay_out(taxes)
+
+    def get_opinion(self, char1_id: int, char2_id: int) -> int:
         """Get char1's opinion of char2."""
         if char1_id not in self.characters or char2_id not in self.characters:
             return 0
-        return self.characters[char1_id].opinions.get(char2_id, 0)
+        return self.opinions.get(char1_id, char2_id)
 
-    def modify_opinion(self, char1_id: str, char2_id: str, change: int):
+    def modify_opinion(self, char1_id: int, char2_id: int, change: int):
         """Modify char1's opinion of char2 by change amount."""
         if char1_id not in self.characters or char2_id not in self.characters:
             return
         
         char1 = self.characters[char1_id]
-        current = char1.opinions.get(char2_id, 0)
-        new_opinion = max(-100, min(100, current + change))
-        char1.opinions[char2_id] = new_opinion
+        new_opinion = self.opinions.add(char1_id, char2_id, change)
+        char1.mark_dirty()
         
         if change != 0:
-            char2_name = self.characters[char2_id].name
-            self.log(f"{char1.name} opinion of {char2_name}: {change:+d} (now {new_opinion})")
+            self.log("{} opinion of {}: {:+d} (now {})", char1.name, self.characters[char2_id].name,
+                     change, new_opinion, kind="opinion", actors=(char1_id, char2_id))
 
-    def arrange_marriage(self, char1_id: str, char2_id: str) -> bool:
-        """Arrange marriage between two characters."""
-        if char1_id not in self.characters or char2_id not in self.characters:
-            return False
-        
-        char1 = self.characters[char1_id]
-        char2 = self.characters[char2_id]
-        
-        # Check requirements
+    def modify_opinion_toward(self, target_id: int, holder_ids, change: int):
+        """Change every holder's opinion of target at once (e.g. the guests of a feast)."""
+        if target_id not in self.characters:
+            return
+        holder_ids = [cid for cid in holder_ids if cid != target_id]
+        self.opinions.add_toward(target_id, holder_ids, change)
+        for cid in holder_ids:
+            self.characters[cid].mark_dirty()
+        if change != 0 and holder_ids:
+            self.log("{} characters' opinion of {}: {:+d}", len(holder_ids), self.characters[target_id].name,
+                     change, kind="opinion", actors=(target_id,))
+
+    def get_top_opinions(self, char_id: int, k: int = 5, rivals: bool = False) -> List[tuple]:
+        """The k characters char likes most (or, with rivals, least) as (id, opinion)."""
+        return self.opinions.top(char_id, k, rivals)
+
+    def get_admirers(self, char_id: int, k: int = 5, rivals: bool = False) -> List[tuple]:
+        """The k characters who like char most (or, with rivals, least) as (id, opinion)."""
+        return self.opinions.top_toward(char_id, k, rivals)
+
+    def get_relationships(self, char_id: int, k: int = 10) -> List[int]:
+        """Living characters worth listing for char: family, then friends, admirers and rivals."""
+        char = self.characters[char_id]
+        candidates = [char.spouse_id, char.father_id, char.mother_id]
+        candidates += self.lineage.get_children(char_id) + self.lineage.get_siblings(char_id)
+        for ranked in (self.get_top_opinions(char_id, k), self.get_admirers(char_id, k),
+                       self.get_top_opinions(char_id, k, rivals=True)):
+            candidates += [cid for cid, _ in ranked]
+        related = []
+        for cid in candidates:
+            other = self.characters.get(cid)
+            if other is not None and other.is_alive and cid != char_id and cid not in related:
+                related.append(cid)
+        return related
+
+    def process_opinions(self):
+        """Monthly drift of every opinion back toward neutral."""
+        changed = self.opinions.decay(OPINION_DECAY)
+        if self.autosaver is not None:
+            for cid in changed:
+                char = self.characters.get(cid)
+                if char is not None:
+                    char.mark_dirty()
+
+    def absorb_opinions(self):
+        """Move opinions held on Character objects (from a load or direct construction) into the store."""
+        for char in self.characters.values():
+            if char.opinions:
+                self.opinions.set_row(char.id, char.opinions)
+                char.opinions = None
+
+    def _character_dict(self, char: Character) -> Dict:
+        d = char.to_dict()
+        d["opinions"] = {export_id(k): v for k, v in self.opinions.row(char.id).items()}
+        return d
+
+    def marriage_blocker(self, char1_id: int, char2_id: int) -> Optional[str]:
+        """Why the two characters cannot marry, or None if they can."""
+        char1 = self.characters.get(char1_id)
+        char2 = self.characters.get(char2_id)
+        if char1 is None or char2 is None:
+            return "Unknown character."
         if not char1.is_alive or not char2.is_alive:
-            self.log("Both characters must be alive to marry.")
-            return False
-        
+            return "Both characters must be alive to marry."
         if char1.gender == char2.gender:
-            self.log("Marriage requires opposite genders.")
-            return False
-        
+            return "Marriage requires opposite genders."
         if char1.spouse_id or char2.spouse_id:
-            self.log("One or both characters are already married.")
+            return "One or both characters are already married."
+        if self.get_opinion(char1_id, char2_id) < 0 or self.get_opinion(char2_id, char1_id) < 0:
+            return "Marriage requires positive opinion between both parties."
+        return None
+
+    def arrange_marriage(self, char1_id: int, char2_id: int) -> bool:
+        """Arrange marriage between two characters."""
+        if char1_id not in self.characters or char2_id not in self.characters:
             return False
         
-        if self.get_opinion(char1_id, char2_id) < 0 or self.get_opinion(char2_id, char1_id) < 0:
-            self.log("Marriage requires positive opinion between both parties.")
+        # Check requirements
+        reason = self.marriage_blocker(char1_id, char2_id)
+        if reason is not None:
+            self.log(reason, kind="family", level=LogLevel.WARNING)
             return False
         
-        # Perform marriage
+        self.marry(char1_id, char2_id)
+        self.log("{} and {} have married!", self.characters[char1_id].name, self.characters[char2_id].name,
+                 kind="family", actors=(char1_id, char2_id))
+        return True
+
+    def marry(self, char1_id: int, char2_id: int):
+        """Wed two characters without checking marriage_blocker."""
+        char1 = self.characters[char1_id]
+        char2 = self.characters[char2_id]
         char1.spouse_id = char2_id
         char2.spouse_id = char1_id
+        self.fertility.update_couple(char1_id)
+        self.matchmaker.update_couple(char1_id)
         
         # Opinion boost
         self.modify_opinion(char1_id, char2_id, 25)
         self.modify_opinion(char2_id, char1_id, 25)
-        
-        self.log(f"{char1.name} and {char2.name} have married!")
-        return True
 
-    def get_family_tree(self, char_id: str) -> Dict:
+    def process_marriages(self):
+        """AI characters pair off (see matchmaking.py); the player's dynasty is left alone."""
+        if not self.ai_marriages:
+            return
+        for husband_id, wife_id in self.matchmaker.run():
+            self.log("{} and {} have married.", self.characters[husband_id].name, self.characters[wife_id].name,
+                     kind="family", actors=(husband_id, wife_id), level=LogLevel.DEBUG)
+
+    def get_family_tree(self, char_id: int) -> Dict:
         """Get structured family tree data for a character."""
         if char_id not in self.characters:
             return {}
@@ -243,24 +453,11 @@ class GameEngine:
             "father": self.characters.get(char.father_id) if char.father_id else None,
             "mother": self.characters.get(char.mother_id) if char.mother_id else None,
             "spouse": self.characters.get(char.spouse_id) if char.spouse_id else None,
-            "children": [],
-            "siblings": []
+            # Children and siblings come from the lineage index
+            "children": [self.characters[cid] for cid in self.lineage.get_children(char_id)],
+            "siblings": [self.characters[cid] for cid in self.lineage.get_siblings(char_id)]
         }
         
-        # Get children
-        for cid, c in self.characters.items():
-            if c.father_id == char_id or c.mother_id == char_id:
-                tree["children"].append(c)
-        
-        # Get siblings (same parents)
-        if char.father_id or char.mother_id:
-            for cid, c in self.characters.items():
-                if cid != char_id and (
-                    (char.father_id and c.father_id == char.father_id) or
-                    (char.mother_id and c.mother_id == char.mother_id)
-                ):
-                    tree["siblings"].append(c)
-        
         return tree
 
 
@@ -271,26 +468,15 @@ class GameEngine:
 
     def process_births(self):
         """Handle childbirth."""
-        # Simple check: Married couples, age 16-45
-        # We need to track spouses. For now, let's just iterate all characters.
-        # To avoid double counting, we only check for the mother.
-        
-        for char_id, char in list(self.characters.items()):
-            if not char.is_alive or char.gender != "Female":
-                continue
-            
-            if 16 <= char.age <= 45 and char.spouse_id:
-                spouse = self.characters.get(char.spouse_id)
-                if spouse and spouse.is_alive:
-                    # Chance of birth: 2% per month (~24% per year)
-                    if random.random() < 0.02:
-                        self.create_child(char.id, spouse.id)
-
-    def create_child(self, mother_id: str, father_id: str):
+        # Only fertile married women (age 16-45, living spouse) are candidates
+        for mother_id in self.fertility.pick_mothers(BIRTH_CHANCE):
+            self.create_child(mother_id, self.characters[mother_id].spouse_id)
+
+    def create_child(self, mother_id: int, father_id: int):
         mother = self.characters[mother_id]
         father = self.characters[father_id]
         
-        gender = "Male" if random.random() < 0.5 else "Female"
+        gender = "Male" if self.rng.births.random() < 0.5 else "Female"
         name = f"Child of {father.name}" # Placeholder name generator
         
         child = Character(
@@ -304,98 +490,183 @@ class GameEngine:
         )
         
         self.characters[child.id] = child
+        self.lineage.add(child)
+        self.relations.add(child.id)
+        self.matchmaker.add(child.id)
+        if self.population is not None:
+            self.population.attach(child)
+        if self.death_scheduler is not None:
+            self.death_scheduler.register(child.id)
         mother.children_ids.append(child.id)
         father.children_ids.append(child.id)
+        mother.mark_dirty()
+        father.mark_dirty()
+        
+        self.titles.on_birth(child.id)
         
         if child.dynasty_id in self.dynasties:
-            self.dynasties[child.dynasty_id].members.append(child.id)
+            dynasty = self.dynasties[child.dynasty_id]
+            dynasty.members.append(child.id)
+            dynasty.mark_dirty()
             
-        self.log(f"A {gender} child, {name}, was born to {father.name} and {mother.name}!")
-
-        self.log(f"A {gender} child, {name}, was born to {father.name} and {mother.name}!")
+        self.log("A {} child, {}, was born to {} and {}!", gender, name, father.name, mother.name,
+                 kind="family", actors=(child.id, father.id, mother.id))
 
-    def modify_wealth(self, char_id: str, amount: int):
+    def modify_wealth(self, char_id: int, amount: int):
         if char_id in self.characters:
-            self.characters[char_id].wealth += amount
-            self.log(f"{self.characters[char_id].name} wealth change: {amount}")
+            char = self.characters[char_id]
+            char.wealth += amount
+            self.log("{} wealth change: {}", char.name, amount, kind="economy", actors=(char_id,))
 
-    def modify_health(self, char_id: str, amount: float):
+    def modify_health(self, char_id: int, amount: float):
         if char_id in self.characters:
-            self.characters[char_id].health += amount
-            self.log(f"{self.characters[char_id].name} health change: {amount}")
+            char = self.characters[char_id]
+            char.health += amount
+            if self.death_scheduler is not None:
+                self.death_scheduler.reschedule(char_id)
+            self.log("{} health change: {}", char.name, amount, kind="health", actors=(char_id,))
 
-    def get_wealth(self, char_id: str) -> int:
+    def get_wealth(self, char_id: int) -> int:
         return self.characters[char_id].wealth if char_id in self.characters else 0
 
     def process_events(self):
         """Trigger random events."""
+        self.process_ai_events()
         if self.current_event:
             return # Don't trigger new event if one is pending
             
         # 30% chance of event per month
-        if random.random() < 0.3:
+        if self.rng.events.random() < EVENT_CHANCE:
             event = self.event_manager.get_random_event(self, self.player_character_id)
             if event:
                 self.current_event = event
-                self.log(f"EVENT: {event.title}")
+                self.log("EVENT: {}", event.title, kind="event")
+
+    def ai_rulers(self) -> List[int]:
+        """Living rulers of any polity, other than the player (each once)."""
+        rulers = {}
+        for polity in self.polities.values():
+            char = self.characters.get(polity.ruler_id)
+            if char is not None and char.is_alive and char.id != self.player_character_id:
+                rulers[char.id] = None
+        return list(rulers)
+
+    def process_ai_events(self):
+        """Roll events for every AI ruler in one batch, then apply the options ai_event_policy picks."""
+        if not self.ai_events:
+            return
+        rulers = self.ai_rulers()
+        if not rulers:
+            return
+        for char_id, event in self.event_manager.roll_batch(self, rulers, EVENT_CHANCE, self.rng.bulk("events")):
+            if self.characters[char_id].is_alive:
+                self.apply_event_option(char_id, event, self.ai_event_policy(self, event, char_id))
+
+    def apply_event_option(self, char_id: int, event: Event, option_index: int) -> bool:
+        """Take an option of an event for a character; False if there is no such option."""
+        if not 0 <= option_index < len(event.options):
+            return False
+        option = event.options[option_index]
+        if char_id == self.player_character_id:
+            self.log("Selected: {}", option.text, kind="event")
+        else:
+            self.log("{} chose {} ({})", self.characters[char_id].name, option.text, event.title,
+                     kind="event", actors=(char_id,), level=LogLevel.DEBUG)
+        option.effect(self, char_id)
+        return True
 
     def resolve_event(self, option_index: int):
         if not self.current_event:
             return
             
-        if 0 <= option_index < len(self.current_event.options):
-            option = self.current_event.options[option_index]
-            self.log(f"Selected: {option.text}")
-            option.effect(self, self.player_character_id)
+        if self.apply_event_option(self.player_character_id, self.current_event, option_index):
             self.current_event = None
 
-    def get_character_title(self, char_id: str) -> str:
+    def get_character_title(self, char_id: int) -> str:
+        """The character's title in their culture: ruler of a polity, heir to one, or noble."""
         char = self.characters[char_id]
-        # Simple logic: if head of dynasty, use 'Noble' equivalent.
-        # If ruler of polity, use 'Ruler' equivalent.
-        
-        # Check if ruler
-        for polity in self.polities.values():
-            if polity.ruler_id == char.id:
-                return self.culture_manager.get_title(char.culture, "ruler")
-        
-        # Check if heir (simple check: eldest son of ruler)
-        if char.father_id:
-            father = self.characters[char.father_id]
-            # If father is ruler
-            is_prince = False
-            for polity in self.polities.values():
-                if polity.ruler_id == father.id:
-                    is_prince = True
-                    break
-            
-            if is_prince and father.children_ids[0] == char.id:
-                 return self.culture_manager.get_title(char.culture, "heir")
+        return self.culture_manager.get_title(char.culture, self.titles.title_type(char_id))
 
-        return self.culture_manager.get_title(char.culture, "noble")
+    def set_ruler(self, polity_id: int, char_id: Optional[int]):
+        self.polities[polity_id].ruler_id = char_id
+        self.titles.ruler_changed(polity_id)
+
+    def enable_population_store(self, seed: Optional[int] = None):
+        """Keep character ages, health, wealth and stats in NumPy arrays (requires numpy).
+
+        Aging and mortality then run as one vectorized pass per month.
+        """
+        rng = self.rng.generator("mortality") if seed is None else None
+        self.population = PopulationStore(capacity=max(1024, len(self.characters)), seed=seed, rng=rng)
+        for char in self.characters.values():
+            self.population.attach(char)
+
+    def enable_demography(self):
+        """Simulate every region's cohorts, food and wealth as NumPy arrays (requires numpy).
+
+        Regions then grow or starve, and their rulers are paid taxes. See demography.py.
+        """
+        self.demography = RegionalEconomy(self)
+
+    def enable_death_scheduler(self):
+        """Draw each character's month of natural death once instead of rolling every month."""
+        self.death_scheduler = DeathScheduler(self)
+        self.death_scheduler.rebuild()
 
     def process_characters(self):
         """Handle aging, health, and death."""
-        for char_id, char in list(self.characters.items()):
-            if not char.is_alive:
-                continue
-            
-            # Simple aging (just for display, real age calculation can be more complex)
-            # In a real simulation, we'd track birthdate. 
-            # For now, let's just say they age every January.
+        if self.death_scheduler is not None:
             if self.month == 1:
+                self._age_characters()
+            self.death_scheduler.sync()
+            for char_id in self.death_scheduler.pop_due(self.get_month_index()):
+                self.kill_character(char_id, "Natural Causes")
+        elif self.population is not None:
+            self.population.sync(self.characters)
+            for char_id in self.population.age_and_mortality(self.month == 1):
+                self.kill_character(char_id, "Natural Causes")
+        else:
+            for char_id, char in list(self.characters.items()):
+                if not char.is_alive:
+                    continue
+                
+                # Simple aging (just for display, real age calculation can be more complex)
+                # In a real simulation, we'd track birthdate. 
+                # For now, let's just say they age every January.
+                if self.month == 1:
+                    char.age += 1
+                
+                # Death check (very basic)
+                if char.age > MORTALITY_AGE:
+                    death_chance = (char.age - MORTALITY_AGE) * MORTALITY_PER_YEAR
+                    if self.rng.mortality.random() < death_chance:
+                        self.kill_character(char_id, "Natural Causes")
+        
+        if self.month == 1:
+            self.fertility.on_new_year()
+            self.matchmaker.on_new_year()
+
+    def _age_characters(self):
+        """January birthday for every living character."""
+        if self.population is not None:
+            self.population.sync(self.characters)
+            self.population.age_all()
+            return
+        for char in self.characters.values():
+            if char.is_alive:
                 char.age += 1
-            
-            # Death check (very basic)
-            if char.age > 50:
-                death_chance = (char.age - 50) * 0.005
-                if random.random() < death_chance:
-                    self.kill_character(char_id, "Natural Causes")
 
-    def kill_character(self, char_id: str, reason: str):
+    def kill_character(self, char_id: int, reason: str):
         char = self.characters[char_id]
         char.is_alive = False
-        self.log(f"{char.name} has died of {reason} at age {char.age}.")
+        self.fertility.update_couple(char_id)
+        self.relations.update(char_id)
+        self.matchmaker.update(char_id)
+        self.titles.on_death(char_id)
+        self.event_manager.forget(char_id)
+        if self.death_scheduler is not None:
+            self.death_scheduler.cancel(char_id)
+        self.log("{} has died of {} at age {}.", char.name, reason, char.age, kind="death", actors=(char_id,))
         
         if char_id == self.player_character_id:
             self.handle_player_succession()
@@ -408,13 +679,15 @@ class GameEngine:
             # Find first living child
             for child_id in player.children_ids:
                 if self.characters[child_id].is_alive:
+                    for polity_id in list(self.titles.polities_of(player.id)):
+                        self.set_ruler(polity_id, child_id)
                     self.player_character_id = child_id
                     new_player = self.characters[child_id]
-                    self.log(f"Long live {new_player.name}! The bloodline endures.")
+                    self.log("Long live {}! The bloodline endures.", new_player.name, kind="death", actors=(child_id,))
                     return
         
         self.game_over = True
-        self.log("Your bloodline has ended. Game Over.")
+        self.log("Your bloodline has ended. Game Over.", kind="death")
 
 
 
@@ -470,9 +743,15 @@ class GameEngine:
         wife.children_ids.append(son.id)
         dynasty.members.append(son.id)
         
+        for char in (player, wife, son):
+            self.lineage.add(char)
+        self.fertility.rebuild()
+        self.relations.invalidate()
+        self.matchmaker.invalidate()
+        
         # Create Polity
         rome = Polity(name="Roman Kingdom", government_type=GovernmentType.MONARCHY, ruler_id=player.id)
         self.polities[rome.id] = rome
-        self.regions[latium_id].owner_polity_id = rome.id
+        self.world_manager.set_region_owner(latium_id, rome.id)
         
         self.log("Welcome to Project Aeterna. The year is 753 BC.")
@@ -0,0 +1,294 @@
+"""Data-driven event packs.
+
+A pack is a JSON file (see data/events.json) listing events, their options
+and weights. Triggers and effect conditions are small Python-syntax
+expressions over a fixed set of variables (``wealth >= 30 and
+character_count > 1``). They are validated against a whitelist of syntax,
+never handed to eval as raw text. Effects are a short vocabulary that maps
+onto engine calls:
+
+    {"wealth": 50}                 modify_wealth(char, 50)
+    {"health": -1.0}               modify_health(char, -1.0)
+    {"opinion_of_target": 15}      modify_opinion(char, target, 15)
+    {"target_opinion": -10}        modify_opinion(target, char, -10)
+    {"everyone_opinion": 10}       every living character's opinion of char
+    {"log": "text", "kind": "x"}   engine.log (DEBUG, unless char is the player)
+    {"chance": 0.5, "then": [...], "else": [...]}
+    {"if": "<expression>", "then": [...], "else": [...]}
+
+An option's "target" ("random_other" or "spouse") picks the character that
+target effects apply to. If no such character exists, the option does
+nothing. A trigger's dependencies (for the eligibility index) are worked
+out from the variables it reads.
+
+Parsed packs are cached as pickles of their validated form, with
+expressions as marshalled bytecode. The cache is keyed by a hash of the
+file, so editing a pack invalidates its cache entry.
+"""
+from typing import Dict, List, Optional, Tuple
+from .events import Event, EventOption
+from .logbook import LogLevel
+import ast
+import hashlib
+import json
+import marshal
+import os
+import pickle
+import sys
+
+PACK_FORMAT = 1
+
+class EventPackError(ValueError):
+    pass
+
+def _ruled_governments(engine, char_id):
+    polities = engine.polities
+    return [polities[polity_id].government_type.value for polity_id in engine.titles.polities_of(char_id)]
+
+def _signed_year(engine, char_id):
+    return -engine.year if engine.is_bc else engine.year
+
+def _field(name: str, default=None):
+    def get(engine, char_id):
+        return getattr(engine.characters.get(char_id), name, default)
+    return get
+
+# Expression variable -> (eligibility dependency, or None if it never changes; getter)
+VARIABLES = {
+    "wealth": ("wealth", lambda engine, char_id: engine.get_wealth(char_id)),
+    "health": ("health", _field("health", 0.0)),
+    "age": ("age", _field("age", 0)),
+    "culture": ("culture", _field("culture", "")),
+    "gender": (None, _field("gender", "")),
+    "married": ("spouse", lambda engine, char_id: _field("spouse_id")(engine, char_id) is not None),
+    "children": ("children", lambda engine, char_id: len(_field("children_ids", ())(engine, char_id))),
+    "character_count": ("character_count", lambda engine, char_id: len(engine.characters)),
+    "government": ("government", lambda engine, char_id: next(iter(_ruled_governments(engine, char_id)), "")),
+    "is_ruler": ("government", lambda engine, char_id: bool(_ruled_governments(engine, char_id))),
+    "year": ("date", _signed_year),
+    "month": ("date", lambda engine, char_id: engine.month),
+}
+
+_ALLOWED_NODES = (
+    ast.Expression, ast.BoolOp, ast.And, ast.Or, ast.UnaryOp, ast.Not, ast.USub,
+    ast.Compare, ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt, ast.GtE,
+    ast.BinOp, ast.Add, ast.Sub, ast.Mult, ast.Name, ast.Load, ast.Constant,
+)
+
+TARGETS = ("random_other", "spouse")
+_NUMERIC_EFFECTS = ("wealth", "health", "opinion_of_target", "target_opinion", "everyone_opinion")
+
+def compile_expression(source: str, where: str) -> Tuple[Optional[bytes], Tuple[str, ...]]:
+    """Validate an expression. Returns (marshalled bytecode or None if always true, dependencies)."""
+    if not isinstance(source, str):
+        raise EventPackError(f"{where}: expression must be a string, got {source!r}")
+    try:
+        tree = ast.parse(source, mode="eval")
+    except SyntaxError as e:
+        raise EventPackError(f"{where}: invalid expression {source!r} ({e.msg})") from None
+    dependencies = set()
+    for node in ast.walk(tree):
+        if not isinstance(node, _ALLOWED_NODES):
+            raise EventPackError(f"{where}: {type(node).__name__} is not allowed in {source!r}")
+        if isinstance(node, ast.Name):
+            if node.id not in VARIABLES:
+                raise EventPackError(f"{where}: unknown variable {node.id!r} in {source!r}")
+            dependency = VARIABLES[node.id][0]
+            if dependency is not None:
+                dependencies.add(dependency)
+        if isinstance(node, ast.Constant) and not isinstance(node.value, (bool, int, float, str)):
+            raise EventPackError(f"{where}: unsupported constant {node.value!r}")
+    if isinstance(tree.body, ast.Constant) and tree.body.value is True:
+        return None, ()
+    code = compile(tree, f"<{where}>", "eval")
+    return marshal.dumps(code), tuple(sorted(dependencies))
+
+def _number(value, where: str):
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise EventPackError(f"{where}: expected a number, got {value!r}")
+    return value
+
+def _compile_effects(effects, where: str) -> tuple:
+    if not isinstance(effects, list):
+        raise EventPackError(f"{where}: effects must be a list")
+    compiled = []
+    for i, effect in enumerate(effects):
+        at = f"{where}[{i}]"
+        if not isinstance(effect, dict):
+            raise EventPackError(f"{at}: effect must be an object")
+        if "chance" in effect:
+            chance = _number(effect["chance"], at)
+            compiled.append(("chance", chance, _compile_effects(effect.get("then", []), at + ".then"),
+                             _compile_effects(effect.get("else", []), at + ".else")))
+        elif "if" in effect:
+            code, _ = compile_expression(effect["if"], at + ".if")
+            compiled.append(("if", code, _compile_effects(effect.get("then", []), at + ".then"),
+                             _compile_effects(effect.get("else", []), at + ".else")))
+        elif "log" in effect:
+            compiled.append(("log", str(effect["log"]), str(effect.get("kind", "event"))))
+        elif len(effect) == 1 and next(iter(effect)) in _NUMERIC_EFFECTS:
+            name, value = next(iter(effect.items()))
+            compiled.append((name, _number(value, at)))
+        else:
+            raise EventPackError(f"{at}: unknown effect {effect!r}")
+    return tuple(compiled)
+
+def parse_pack(data: Dict, where: str) -> List[Dict]:
+    """Validate a decoded pack into its cacheable form."""
+    if not isinstance(data, dict) or not isinstance(data.get("events"), list):
+        raise EventPackError(f"{where}: a pack is an object with an \"events\" list")
+    parsed = []
+    seen = set()
+    for n, event in enumerate(data["events"]):
+        at = f"{where}:events[{n}]"
+        try:
+            event_id = event["id"]
+            if event_id in seen:
+                raise EventPackError(f"{at}: duplicate event id {event_id!r}")
+            seen.add(event_id)
+            trigger, depends_on = compile_expression(event.get("trigger", "True"), at + ".trigger")
+            options = []
+            for k, option in enumerate(event["options"]):
+                target = option.get("target")
+                if target is not None and target not in TARGETS:
+                    raise EventPackError(f"{at}.options[{k}]: unknown target {target!r}")
+                effects = _compile_effects(option.get("effects", []), f"{at}.options[{k}].effects")
+                options.append((option["text"], option.get("tooltip", ""), target, effects))
+            if not options:
+                raise EventPackError(f"{at}: an event needs at least one option")
+            weight = event.get("weight", 10)
+            if isinstance(weight, bool) or not isinstance(weight, int) or weight < 0:
+                raise EventPackError(f"{at}: weight must be a non-negative integer")
+            parsed.append({"id": event_id, "title": event["title"], "description": event.get("description", ""),
+                           "weight": weight, "trigger": trigger, "depends_on": depends_on, "options": options})
+        except KeyError as e:
+            raise EventPackError(f"{at}: missing field {e.args[0]!r}") from None
+        except TypeError:
+            raise EventPackError(f"{at}: malformed event") from None
+    return parsed
+
+def default_cache_dir() -> str:
+    return os.environ.get("AETERNA_CACHE_DIR") or os.path.join(os.path.expanduser("~"), ".cache", "aeterna")
+
+def _cache_key(raw: bytes) -> str:
+    # Bytecode is interpreter specific, so the interpreter is part of the key
+    tag = f"{PACK_FORMAT}:{sys.implementation.cache_tag}".encode()
+    return hashlib.sha256(tag + b"\0" + raw).hexdigest()
+
+def read_pack(path: str, cache_dir: Optional[str] = None) -> List[Dict]:
+    """The validated form of a pack, from the cache when the file is unchanged."""
+    with open(path, "rb") as f:
+        raw = f.read()
+    cache_dir = cache_dir or default_cache_dir()
+    cache_file = os.path.join(cache_dir, f"events-{_cache_key(raw)}.pickle")
+    try:
+        with open(cache_file, "rb") as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass
+    try:
+        data = json.loads(raw.decode("utf-8"))
+    except ValueError as e:
+        raise EventPackError(f"{path}: not valid JSON ({e})") from None
+    parsed = parse_pack(data, path)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        temp = f"{cache_file}.{os.getpid()}.tmp"
+        with open(temp, "wb") as f:
+            pickle.dump(parsed, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp, cache_file)
+    except OSError:
+        pass  # Caching is best effort (read-only installs)
+    return parsed
+
+class _Scope:
+    """Variable lookups for one evaluation of a pack expression."""
+    __slots__ = ("engine", "char_id")
+
+    def __init__(self, engine, char_id):
+        self.engine = engine
+        self.char_id = char_id
+
+    def __getitem__(self, name):
+        return VARIABLES[name][1](self.engine, self.char_id)
+
+_GLOBALS = {"__builtins__": {}}
+
+def _predicate(code: Optional[bytes]):
+    if code is None:
+        return lambda engine, char_id: True
+    code = marshal.loads(code)
+    return lambda engine, char_id: eval(code, _GLOBALS, _Scope(engine, char_id))
+
+def _log_effect(engine, char_id, text: str, kind: str):
+    # Pack texts address the player ("You cannot afford..."); an AI ruler's are kept out of the player's log
+    if char_id == engine.player_character_id:
+        engine.log(text, kind=kind)
+    else:
+        engine.log(text, kind=kind, actors=(char_id,), level=LogLevel.DEBUG)
+
+def _pick_target(kind: Optional[str], engine, char_id):
+    if kind == "random_other":
+        others = [cid for cid, char in engine.characters.items() if cid != char_id and char.is_alive]
+        return engine.rng.events.choice(others) if others else None
+    if kind == "spouse":
+        char = engine.characters.get(char_id)
+        spouse = engine.characters.get(char.spouse_id) if char is not None else None
+        return spouse.id if spouse is not None and spouse.is_alive else None
+    return None
+
+def _build_effects(effects: tuple):
+    """Turn compiled effects into one function (engine, char_id, target)."""
+    steps = []
+    for effect in effects:
+        kind = effect[0]
+        if kind == "wealth":
+            steps.append(lambda e, c, t, v=effect[1]: e.modify_wealth(c, v))
+        elif kind == "health":
+            steps.append(lambda e, c, t, v=effect[1]: e.modify_health(c, v))
+        elif kind == "opinion_of_target":
+            steps.append(lambda e, c, t, v=effect[1]: e.modify_opinion(c, t, v))
+        elif kind == "target_opinion":
+            steps.append(lambda e, c, t, v=effect[1]: e.modify_opinion(t, c, v))
+        elif kind == "everyone_opinion":
+            steps.append(lambda e, c, t, v=effect[1]: e.modify_opinion_toward(
+                c, [cid for cid, char in e.characters.items() if char.is_alive], v))
+        elif kind == "log":
+            steps.append(lambda e, c, t, text=effect[1], k=effect[2]: _log_effect(e, c, text, k))
+        elif kind == "chance":
+            then, otherwise = _build_effects(effect[2]), _build_effects(effect[3])
+            steps.append(lambda e, c, t, p=effect[1], a=then, b=otherwise: (a if e.rng.events.random() < p else b)(e, c, t))
+        elif kind == "if":
+            test, then, otherwise = _predicate(effect[1]), _build_effects(effect[2]), _build_effects(effect[3])
+            steps.append(lambda e, c, t, q=test, a=then, b=otherwise: (a if q(e, c) else b)(e, c, t))
+
+    def run(engine, char_id, target):
+        for step in steps:
+            step(engine, char_id, target)
+    return run
+
+def _build_option(text: str, tooltip: str, target_kind: Optional[str], effects: tuple) -> EventOption:
+    run = None  # Built on first use; most options of a large pack never fire
+
+    def effect(engine, char_id):
+        nonlocal run
+        if run is None:
+            run = _build_effects(effects)
+        target = None
+        if target_kind is not None:
+            target = _pick_target(target_kind, engine, char_id)
+            if target is None:
+                return
+        run(engine, char_id, target)
+    return EventOption(text=text, effect=effect, tooltip=tooltip)
+
+def build_events(parsed: List[Dict]) -> List[Event]:
+    return [Event(id=e["id"], title=e["title"], description=e["description"],
+                  options=[_build_option(*option) for option in e["options"]],
+                  trigger_condition=_predicate(e["trigger"]), weight=e["weight"],
+                  depends_on=e["depends_on"])
+            for e in parsed]
+
+def load_pack(path: str, cache_dir: Optional[str] = None) -> List[Event]:
+    """Events from a pack file, ready to hand to EventManager.add_events."""
+    return build_events(read_pack(path, cache_dir))
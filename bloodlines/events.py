@@ -1,11 +1,18 @@
 from dataclasses import dataclass, field
-from typing import List, Callable, Optional, Dict
+from typing import List, Callable, Optional, Dict, Iterable, Sequence, Tuple
+from .eligibility import DEPENDENCIES, EligibilityIndex, EventStats
+from .resources import resource_path
 import random
 
+try:
+    import numpy as np
+except ImportError:  # numpy is optional
+    np = None
+
 @dataclass
 class EventOption:
     text: str
-    effect: Callable[['GameEngine', str], None]  # Takes engine and char_id
+    effect: Callable[['GameEngine', int], None]  # Takes engine and char_id
     tooltip: str = ""
 
 @dataclass
@@ -14,149 +21,137 @@ class Event:
     title: str
     description: str
     options: List[EventOption]
-    trigger_condition: Callable[['GameEngine', str], bool]
+    trigger_condition: Callable[['GameEngine', int], bool]
     weight: int = 10  # Higher weight = more likely
+    # State the trigger condition reads (names from eligibility.DEPENDENCIES);
+    # () = never changes, None = unknown, so it is re-checked on every roll
+    depends_on: Optional[Tuple[str, ...]] = None
+
+# Picks the option an AI-controlled character takes: (engine, event, char_id) -> option index
+AIPolicy = Callable[['GameEngine', Event, int], int]
+
+def random_ai_policy(engine, event: Event, char_id: int) -> int:
+    return engine.rng.events.randrange(len(event.options))
 
 class EventManager:
-    def __init__(self):
-        self.events: List[Event] = []
-        self._register_generic_events()
-
-    def _register_generic_events(self):
-        # Example Event: Good Harvest
-        self.events.append(Event(
-            id="good_harvest",
-            title="Good Harvest",
-            description="The season has been kind. Our granaries are full.",
-            options=[
-                EventOption(
-                    text="Excellent!",
-                    effect=lambda engine, char_id: engine.modify_wealth(char_id, 50),
-                    tooltip="Gain 50 Wealth"
-                )
-            ],
-            trigger_condition=lambda engine, char_id: True, # Always possible
-            weight=20
-        ))
-        
-        # Example Event: Minor Sickness
-        self.events.append(Event(
-            id="minor_sickness",
-            title="Feeling Unwell",
-            description="You have developed a nasty cough.",
-            options=[
-                EventOption(
-                    text="Rest and recover.",
-                    effect=lambda engine, char_id: engine.modify_health(char_id, -1.0),
-                    tooltip="Lose 1.0 Health"
-                ),
-                EventOption(
-                    text="Consult a physician (Cost: 10)",
-                    effect=lambda engine, char_id: self._physician_effect(engine, char_id),
-                    tooltip="Cost 10 Wealth, maybe save health"
-                )
-            ],
-            trigger_condition=lambda engine, char_id: True,
-            weight=10
-        ))
-        
-        # Relationship Event: Diplomatic Insult
-        self.events.append(Event(
-            id="diplomatic_insult",
-            title="Diplomatic Insult",
-            description="A foreign dignitary has insulted your honor at a gathering.",
-            options=[
-                EventOption(
-                    text="Demand an apology!",
-                    effect=lambda engine, char_id: self._insult_effect(engine, char_id),
-                    tooltip="Lose opinion with a character"
-                )
-            ],
-            trigger_condition=lambda engine, char_id: len(engine.characters) > 1,
-            weight=5
-        ))
-        
-        # Relationship Event: Gift Received
-        self.events.append(Event(
-            id="gift_received",
-            title="Generous Gift",
-            description="A neighboring ruler has sent you a valuable gift as a token of friendship.",
-            options=[
-                EventOption(
-                    text="Accept graciously.",
-                    effect=lambda engine, char_id: self._gift_effect(engine, char_id),
-                    tooltip="Gain opinion with a character and wealth"
-                )
-            ],
-            trigger_condition=lambda engine, char_id: len(engine.characters) > 1,
-            weight=8
-        ))
-        
-        # Relationship Event: Successful Feast
-        self.events.append(Event(
-            id="successful_feast",
-            title="Magnificent Feast",
-            description="Your grand feast was a tremendous success! Guests leave impressed.",
-            options=[
-                EventOption(
-                    text="Excellent!",
-                    effect=lambda engine, char_id: self._feast_effect(engine, char_id),
-                    tooltip="Cost 30 Wealth, gain opinion with multiple characters"
-                )
-            ],
-            trigger_condition=lambda engine, char_id: engine.get_wealth(char_id) >= 30 and len(engine.characters) > 1,
-            weight=6
-        ))
-
-    def _insult_effect(self, engine, char_id):
-        # Pick a random other character
-        other_chars = [cid for cid in engine.characters.keys() if cid != char_id and engine.characters[cid].is_alive]
-        if other_chars:
-            target_id = random.choice(other_chars)
-            engine.modify_opinion(char_id, target_id, -15)
-            engine.modify_opinion(target_id, char_id, -10)
-
-    def _gift_effect(self, engine, char_id):
-        # Pick a random other character
-        other_chars = [cid for cid in engine.characters.keys() if cid != char_id and engine.characters[cid].is_alive]
-        if other_chars:
-            target_id = random.choice(other_chars)
-            engine.modify_opinion(char_id, target_id, 15)
-            engine.modify_wealth(char_id, 20)
-
-    def _feast_effect(self, engine, char_id):
-        engine.modify_wealth(char_id, -30)
-        # Boost opinion with all other characters
-        for cid in engine.characters.keys():
-            if cid != char_id and engine.characters[cid].is_alive:
-                engine.modify_opinion(cid, char_id, 10)
-
-
-    def _physician_effect(self, engine, char_id):
-        if engine.get_wealth(char_id) >= 10:
-            engine.modify_wealth(char_id, -10)
-            # 50% chance to save health
-            if random.random() > 0.5:
-                engine.log("The physician's treatment worked!")
-            else:
-                engine.log("The treatment failed.")
-                engine.modify_health(char_id, -1.0)
+    def __init__(self, packs: Sequence[str] = ("data/events.json",), cache_dir: Optional[str] = None):
+        self._indexes: Dict[int, EligibilityIndex] = {}  # char_id -> cached eligibility
+        self.events = []
+        for path in packs:
+            self.load_pack(path, cache_dir)
+
+    @property
+    def events(self) -> List[Event]:
+        return self._events
+
+    @events.setter
+    def events(self, events: List[Event]):
+        """Replace every event; statistics start over with the new list."""
+        self.reset()
+        self._events = events
+        self.stats: List[EventStats] = []
+        self.rolls = 0
+        self._compile()
+
+    def add_event(self, event: Event):
+        self.events.append(event)
+        self._compile()
+
+    def add_events(self, events: Iterable[Event]):
+        self.events.extend(events)
+        self._compile()
+
+    def _compile(self):
+        """Group events by the inputs they depend on; drops every cached eligibility."""
+        for index in self._indexes.values():
+            index.close()
+        self.by_dependency: Dict[str, List[int]] = {}  # dependency -> indices of events reading it
+        self.volatile: List[int] = []  # Events without declared dependencies
+        for i, event in enumerate(self.events):
+            if event.depends_on is None:
+                self.volatile.append(i)
+                continue
+            for name in event.depends_on:
+                if name not in DEPENDENCIES:
+                    raise ValueError(f"Event {event.id} depends on unknown input {name!r}")
+                self.by_dependency.setdefault(name, []).append(i)
+        del self.stats[len(self.events):]
+        self.stats += [EventStats() for _ in range(len(self.events) - len(self.stats))]
+        self._indexes = {}
+        self._compiled = len(self.events)
+
+    def reset(self):
+        """Forget cached eligibility (e.g. after loading a different world)."""
+        for index in self._indexes.values():
+            index.close()
+        self._indexes = {}
+
+    def forget(self, char_id: int):
+        """Drop a character's cached eligibility (e.g. on death)."""
+        index = self._indexes.pop(char_id, None)
+        if index is not None:
+            index.close()
+
+    def load_pack(self, path: str, cache_dir: Optional[str] = None) -> int:
+        """Add the events of a JSON event pack; returns how many were added."""
+        from .eventpacks import load_pack
+        try:
+            events = load_pack(resource_path(path), cache_dir)
+        except FileNotFoundError:
+            print(f"Error: Event pack '{path}' not found.")
+            return 0
+        self.add_events(events)
+        return len(events)
+
+    def _index(self, char_id: int) -> EligibilityIndex:
+        index = self._indexes.get(char_id)
+        if index is None:
+            index = self._indexes[char_id] = EligibilityIndex(self, char_id)
+        return index
+
+    def get_random_event(self, engine, char_id: int) -> Optional[Event]:
+        """Weighted pick among the events whose trigger condition holds for char_id."""
+        if self._compiled != len(self.events):
+            self._compile()  # Events were appended to self.events directly
+        index = self._index(char_id)
+        index.refresh(engine)
+        self.rolls += 1
+        return index.draw(engine.rng.events)
+
+    def roll_batch(self, engine, char_ids: Sequence[int], chance: float, rng=None) -> List[Tuple[int, Event]]:
+        """One event roll for each character, drawn together.
+
+        Each character gets an event with probability `chance`, picked by
+        weight among its eligible events. All random numbers come from one
+        draw (rng: a numpy Generator or a random.Random; default the random module), and
+        every eligibility refresh happens before any event is picked, so the
+        caller applies the effects afterwards. Returns (char_id, event) pairs.
+        """
+        if self._compiled != len(self.events):
+            self._compile()
+        count = len(char_ids)
+        if np is not None and isinstance(rng, np.random.Generator):
+            draws = rng.random(2 * count).tolist()
         else:
-            engine.log("You cannot afford a physician!")
-            engine.modify_health(char_id, -1.0)
-
-    def get_random_event(self, engine, char_id: str) -> Optional[Event]:
-        # Filter valid events
-        valid_events = [e for e in self.events if e.trigger_condition(engine, char_id)]
-        if not valid_events:
-            return None
-            
-        # Weighted random choice
-        total_weight = sum(e.weight for e in valid_events)
-        pick = random.uniform(0, total_weight)
-        current = 0
-        for event in valid_events:
-            current += event.weight
-            if pick <= current:
-                return event
-        return None
+            uniform = (rng or random).random
+            draws = [uniform() for _ in range(2 * count)]
+        rolling = [(char_id, draws[count + i]) for i, char_id in enumerate(char_ids) if draws[i] < chance]
+        indexes = [self._index(char_id) for char_id, _ in rolling]
+        for index in indexes:
+            index.refresh(engine)
+        fired = []
+        for index, (char_id, u) in zip(indexes, rolling):
+            event = index.draw_uniform(u)
+            if event is not None:
+                fired.append((char_id, event))
+        self.rolls += len(rolling)
+        return fired
+
+    def get_stats(self) -> Dict[str, Dict[str, int]]:
+        """Per event: rolls it won ("fired") and rolls it could not take part in ("blocked")."""
+        for index in self._indexes.values():
+            index.close()
+        stats = {}
+        for event, counts in zip(self.events, self.stats):
+            stats[event.id] = {"fired": counts.fired, "blocked": self.rolls - counts.eligible_rolls}
+        return stats
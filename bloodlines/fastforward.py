@@ -0,0 +1,95 @@
+"""Advance many months in a tight loop, without rendering.
+
+fast_forward stops at the first of: a pending player event, game over, the
+month limit or target date, or a watch firing. A watch is any callable
+(engine) -> Optional[str] that returns a reason to stop; it is checked
+after every month. Factories for the usual ones are below.
+"""
+from dataclasses import dataclass
+from typing import Callable, Iterable, Optional
+import time
+
+Watch = Callable[['GameEngine'], Optional[str]]
+
+# Upper bound when fast-forwarding "until something happens"
+FAST_FORWARD_LIMIT = 1200
+
+@dataclass
+class FastForwardResult:
+    months_run: int
+    stopped_by: str  # "event", "game_over", "months" (limit reached), "date" or a watch's reason
+    elapsed: float
+
+    @property
+    def months_per_sec(self) -> float:
+        return self.months_run / self.elapsed if self.elapsed > 0 else 0.0
+
+def wealth_crosses(threshold: int, char_id: Optional[int] = None) -> Watch:
+    """Fires when a character's wealth (default: the player's) crosses threshold in either direction."""
+    state = {}
+
+    def watch(engine):
+        cid = char_id if char_id is not None else engine.player_character_id
+        above = engine.get_wealth(cid) >= threshold
+        was_above = state.get(cid)
+        state[cid] = above
+        if was_above is not None and above != was_above:
+            return f"wealth {'reached' if above else 'fell below'} {threshold}"
+        return None
+    return watch
+
+def dynasty_birth() -> Watch:
+    """Fires when a child is born into the player's dynasty."""
+    state = {}
+
+    def watch(engine):
+        player = engine.characters.get(engine.player_character_id)
+        dynasty = engine.dynasties.get(player.dynasty_id) if player is not None else None
+        if dynasty is None:
+            return None
+        members = len(dynasty.members)
+        before = state.get(dynasty.id)
+        state[dynasty.id] = members
+        if before is not None and members > before:
+            return "birth"
+        return None
+    return watch
+
+def condition(reason: str, predicate: Callable[['GameEngine'], bool]) -> Watch:
+    """Fires when predicate(engine) is true."""
+    return lambda engine: reason if predicate(engine) else None
+
+def fast_forward(engine, months: Optional[int] = None, until: Optional[int] = None,
+                 watches: Iterable[Watch] = (),
+                 on_month: Optional[Callable[[int], None]] = None) -> FastForwardResult:
+    """Advance up to `months` months, or until the month index `until` (see engine.get_month_index).
+
+    With neither, runs until something stops it (at most FAST_FORWARD_LIMIT
+    months). on_month(months_run) is called after every month, e.g. to move
+    a progress bar.
+    """
+    watches = list(watches)
+    for watch in watches:
+        watch(engine)  # Record the starting state
+    limit = months if months is not None else FAST_FORWARD_LIMIT
+    months_run = 0
+    start = time.perf_counter()
+    while True:
+        if engine.current_event is not None:
+            stopped_by = "event"
+        elif engine.game_over:
+            stopped_by = "game_over"
+        elif until is not None and engine.get_month_index() >= until:
+            stopped_by = "date"
+        elif months_run >= limit:
+            stopped_by = "months"
+        else:
+            engine.advance_month()
+            months_run += 1
+            if on_month is not None:
+                on_month(months_run)
+            stopped_by = next((r for r in (watch(engine) for watch in watches) if r), None)
+            if stopped_by is None:
+                continue
+        break
+    return FastForwardResult(months_run, stopped_by, time.perf_counter() - start)
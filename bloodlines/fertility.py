@@ -0,0 +1,139 @@
+from typing import Dict, List
+import math
+import random
+
+MIN_FERTILE_AGE = 16
+MAX_FERTILE_AGE = 45
+
+def sample_binomial(n: int, p: float, rng=random) -> int:
+    """Binomial(n, p) draw in time proportional to the result.
+
+    Walks the candidates by geometric skips between successes, which is
+    equivalent to n independent Bernoulli(p) rolls.
+    """
+    if n <= 0 or p <= 0.0:
+        return 0
+    if p >= 1.0:
+        return n
+    log_q = math.log(1.0 - p)
+    count = 0
+    pos = -1
+    while True:
+        pos += 1 + int(math.log(1.0 - rng.random()) / log_q)
+        if pos >= n:
+            return count
+        count += 1
+
+class FertilityTracker:
+    """Incrementally maintained set of fertile married women.
+
+    A woman is tracked while she is alive and married to a living spouse.
+    Because every character ages in the same January tick, a woman's
+    cohort (year index minus age) never changes, so the fertile window is
+    a sliding range of cohorts: each new year one cohort enters and one
+    leaves, and nobody else needs to be looked at.
+    """
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.mode = "per_candidate"  # or "binomial"
+        self._year = 0
+        self._cohort: Dict[int, int] = {}  # woman id -> cohort
+        self._by_cohort: Dict[int, Dict[str, None]] = {}  # cohort -> ids (ordered)
+        self._fertile: List[int] = []
+        self._pos: Dict[int, int] = {}  # id -> index in _fertile
+        self._ordered = True  # _fertile is sorted by id
+
+    def rebuild(self):
+        self._year = 0
+        self._cohort = {}
+        self._by_cohort = {}
+        self._fertile = []
+        self._pos = {}
+        self._ordered = True
+        for char in self.engine.characters.values():
+            if char.gender == "Female":
+                self.update(char.id)
+
+    def __len__(self) -> int:
+        return len(self._fertile)
+
+    def __contains__(self, char_id: int) -> bool:
+        return char_id in self._pos
+
+    def candidates(self) -> List[int]:
+        return list(self._fertile)
+
+    def _is_married(self, char) -> bool:
+        if not char.is_alive or char.gender != "Female" or not char.spouse_id:
+            return False
+        spouse = self.engine.characters.get(char.spouse_id)
+        return spouse is not None and spouse.is_alive
+
+    def update(self, char_id: int):
+        """Re-evaluate one woman after marriage, death or a spouse's death."""
+        self._discard(char_id)
+        char = self.engine.characters.get(char_id)
+        if char is None or not self._is_married(char):
+            return
+        if char.age > MAX_FERTILE_AGE:
+            return  # Will never be fertile again
+        cohort = self._year - char.age
+        self._cohort[char_id] = cohort
+        self._by_cohort.setdefault(cohort, {})[char_id] = None
+        if char.age >= MIN_FERTILE_AGE:
+            self._add_fertile(char_id)
+
+    def update_couple(self, char_id: int):
+        """Re-evaluate whichever of a character and their spouse is the wife."""
+        char = self.engine.characters.get(char_id)
+        if char is None:
+            return
+        self.update(char_id)
+        if char.spouse_id:
+            self.update(char.spouse_id)
+
+    def on_new_year(self):
+        """Slide the fertile window after everyone has aged a year."""
+        self._year += 1
+        for char_id in self._by_cohort.get(self._year - MIN_FERTILE_AGE, ()):
+            self._add_fertile(char_id)
+        for char_id in self._by_cohort.pop(self._year - MAX_FERTILE_AGE - 1, ()):
+            self._remove_fertile(char_id)
+            del self._cohort[char_id]
+
+    def pick_mothers(self, chance: float) -> List[int]:
+        """Mothers giving birth this month, each candidate having `chance`."""
+        if not self._ordered:
+            # Draw in id order, so a rebuilt tracker (e.g. after loading) picks the same mothers
+            self._fertile.sort()
+            self._pos = dict(zip(self._fertile, range(len(self._fertile))))
+            self._ordered = True
+        rng = self.engine.rng.births
+        if self.mode == "binomial":
+            count = sample_binomial(len(self._fertile), chance, rng)
+            return rng.sample(self._fertile, count) if count else []
+        return [cid for cid in self._fertile if rng.random() < chance]
+
+    def _discard(self, char_id: int):
+        cohort = self._cohort.pop(char_id, None)
+        if cohort is not None:
+            self._by_cohort[cohort].pop(char_id, None)
+        self._remove_fertile(char_id)
+
+    def _add_fertile(self, char_id: int):
+        if char_id not in self._pos:
+            self._pos[char_id] = len(self._fertile)
+            if self._fertile and char_id < self._fertile[-1]:
+                self._ordered = False
+            self._fertile.append(char_id)
+
+    def _remove_fertile(self, char_id: int):
+        pos = self._pos.pop(char_id, None)
+        if pos is None:
+            return
+        last = self._fertile.pop()
+        if pos < len(self._fertile):
+            self._fertile[pos] = last
+            self._pos[last] = pos
+            self._ordered = False
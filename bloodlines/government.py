@@ -1,5 +1,4 @@
 from .models import Polity, GovernmentType, Character
-import random
 
 class GovernmentManager:
     def __init__(self, engine):
@@ -19,7 +18,7 @@ class GovernmentManager:
             self._hold_election(polity)
 
     def _hold_election(self, polity: Polity):
-        self.engine.log(f"Elections are held in {polity.name}!")
+        self.engine.log("Elections are held in {}!", polity.name, kind="government")
         
         # Simple election logic: Random candidate wins for now
         # In a real game, this would weigh influence/bribery
@@ -27,12 +26,13 @@ class GovernmentManager:
                      if c.is_alive and c.age >= 30 and c.gender == "Male"] # Basic eligibility
         
         if candidates:
-            winner = random.choice(candidates)
-            polity.ruler_id = winner.id
+            winner = self.engine.rng.elections.choice(candidates)
+            self.engine.set_ruler(polity.id, winner.id)
             polity.term_end_date = self.engine.year + 1 # 1 Year term
-            self.engine.log(f"{winner.name} has been elected as Ruler of {polity.name}!")
+            self.engine.log("{} has been elected as Ruler of {}!", winner.name, polity.name,
+                            kind="government", actors=(winner.id,))
         else:
-            self.engine.log(f"No eligible candidates found for {polity.name}.")
+            self.engine.log("No eligible candidates found for {}.", polity.name, kind="government")
 
     def _process_monarchy(self, polity: Polity):
         # Legitimacy decay/gain
@@ -52,4 +52,5 @@ class GovernmentManager:
         # If a strong warrior exists, they might challenge a weak chief
         ruler = self.engine.characters.get(polity.ruler_id)
         if ruler and ruler.martial < 5:
-            self.engine.log(f"Rumors of a challenge to {ruler.name}'s leadership spread...")
+            self.engine.log("Rumors of a challenge to {}'s leadership spread...", ruler.name,
+                            kind="government", actors=(ruler.id,))
@@ -0,0 +1,61 @@
+"""Dense integer entity ids.
+
+Every Character, Dynasty, Polity and Region gets a small int from one shared
+counter instead of a uuid4 string: cheaper to create, hash and compare, and
+smaller as dict keys and in id lists. Ids only become strings at the save
+boundary (models' to_dict/from_dict). Saves from before this change use uuid
+strings; those are interned on load and written back out unchanged.
+"""
+from typing import Dict, Optional, Union
+
+class IdRegistry:
+    def __init__(self):
+        self._next = 1  # 0 is never handed out so ids are always truthy
+        self._by_key: Dict[str, int] = {}  # legacy uuid -> id
+        self._keys: Dict[int, str] = {}  # id -> legacy uuid
+
+    def new_id(self) -> int:
+        entity_id = self._next
+        self._next += 1
+        return entity_id
+
+    def reserve(self, entity_id: int):
+        """Make sure ids handed out later never collide with a loaded one."""
+        if entity_id >= self._next:
+            self._next = entity_id + 1
+
+    def intern(self, key: Union[int, str, None]) -> Optional[int]:
+        """The id for a saved key: a decimal id from a current save or a legacy uuid."""
+        if key is None:
+            return None
+        if isinstance(key, int):
+            self.reserve(key)
+            return key
+        if key.isdigit():
+            entity_id = int(key)
+            self.reserve(entity_id)
+            return entity_id
+        entity_id = self._by_key.get(key)
+        if entity_id is None:
+            entity_id = self.new_id()
+            self._by_key[key] = entity_id
+            self._keys[entity_id] = key
+        return entity_id
+
+    def external(self, entity_id: Optional[int]) -> Optional[str]:
+        """The key an id is saved under."""
+        if entity_id is None:
+            return None
+        key = self._keys.get(entity_id)
+        return key if key is not None else str(entity_id)
+
+REGISTRY = IdRegistry()
+
+def new_id() -> int:
+    return REGISTRY.new_id()
+
+def intern_id(key: Union[int, str, None]) -> Optional[int]:
+    return REGISTRY.intern(key)
+
+def export_id(entity_id: Optional[int]) -> Optional[str]:
+    return REGISTRY.external(entity_id)
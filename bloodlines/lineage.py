@@ -0,0 +1,114 @@
+from .models import Character
+from typing import Dict, List, Optional
+
+class LineageIndex:
+    """Parent -> children index so family queries don't scan every character.
+
+    The engine registers each character once (on birth, scenario setup and
+    load). All queries then cost time proportional to the size of the answer.
+    """
+
+    def __init__(self):
+        self.children: Dict[int, List[int]] = {}  # parent_id -> child ids, birth order
+        self.father: Dict[int, Optional[int]] = {}
+        self.mother: Dict[int, Optional[int]] = {}
+
+    def rebuild(self, characters: Dict[int, Character]):
+        """Rebuild the whole index from the character table (e.g. after a load)."""
+        self.children = {}
+        self.father = {}
+        self.mother = {}
+        for char in characters.values():
+            self.add(char)
+
+    def add(self, char: Character):
+        """Register a character and link them under their parents."""
+        if char.id in self.father:
+            return
+        self.father[char.id] = char.father_id
+        self.mother[char.id] = char.mother_id
+        for parent_id in (char.father_id, char.mother_id):
+            if parent_id:
+                self.children.setdefault(parent_id, []).append(char.id)
+
+    def get_children(self, char_id: int) -> List[int]:
+        return list(self.children.get(char_id, ()))
+
+    def get_siblings(self, char_id: int) -> List[int]:
+        """Full and half siblings, father's side first."""
+        seen = {char_id}
+        siblings = []
+        for parent_id in (self.father.get(char_id), self.mother.get(char_id)):
+            if not parent_id:
+                continue
+            for sib_id in self.children.get(parent_id, ()):
+                if sib_id not in seen:
+                    seen.add(sib_id)
+                    siblings.append(sib_id)
+        return siblings
+
+    def get_full_siblings(self, char_id: int) -> List[int]:
+        father_id = self.father.get(char_id)
+        mother_id = self.mother.get(char_id)
+        if not father_id or not mother_id:
+            return []
+        return [sid for sid in self.children.get(father_id, ())
+                if sid != char_id and self.mother.get(sid) == mother_id]
+
+    def get_half_siblings(self, char_id: int) -> List[int]:
+        full = set(self.get_full_siblings(char_id))
+        return [sid for sid in self.get_siblings(char_id) if sid not in full]
+
+    def get_ancestors(self, char_id: int, max_depth: int = 3) -> List[int]:
+        """Ancestors up to max_depth generations, nearest generation first."""
+        result = []
+        seen = {char_id}
+        frontier = [char_id]
+        for _ in range(max_depth):
+            next_frontier = []
+            for cid in frontier:
+                for parent_id in (self.father.get(cid), self.mother.get(cid)):
+                    if parent_id and parent_id not in seen:
+                        seen.add(parent_id)
+                        result.append(parent_id)
+                        next_frontier.append(parent_id)
+            if not next_frontier:
+                break
+            frontier = next_frontier
+        return result
+
+    def get_descendants(self, char_id: int, max_depth: int = 3) -> List[int]:
+        """Descendants up to max_depth generations, nearest generation first."""
+        result = []
+        seen = {char_id}
+        frontier = [char_id]
+        for _ in range(max_depth):
+            next_frontier = []
+            for cid in frontier:
+                for child_id in self.children.get(cid, ()):
+                    if child_id not in seen:
+                        seen.add(child_id)
+                        result.append(child_id)
+                        next_frontier.append(child_id)
+            if not next_frontier:
+                break
+            frontier = next_frontier
+        return result
+
+    def check_consistency(self, characters: Dict[int, Character]) -> List[str]:
+        """Compare the index against a full scan. Returns a list of problems (empty if consistent)."""
+        problems = []
+        expected: Dict[int, List[int]] = {}
+        for char in characters.values():
+            if char.id not in self.father:
+                problems.append(f"{char.id} ({char.name}) is not indexed")
+            elif self.father[char.id] != char.father_id or self.mother[char.id] != char.mother_id:
+                problems.append(f"{char.id} ({char.name}) has stale parent links")
+            for parent_id in (char.father_id, char.mother_id):
+                if parent_id:
+                    expected.setdefault(parent_id, []).append(char.id)
+
+        for parent_id in set(expected) | set(self.children):
+            if sorted(expected.get(parent_id, [])) != sorted(self.children.get(parent_id, [])):
+                problems.append(f"children of {parent_id} do not match")
+        return problems
@@ -0,0 +1,105 @@
+from collections import deque
+from enum import IntEnum
+from typing import Deque, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+class LogLevel(IntEnum):
+    DEBUG = 10
+    INFO = 20
+    WARNING = 30
+    OFF = 100  # As a category level: drop everything
+
+def format_date(month: int, year: int, is_bc: bool) -> str:
+    era = "BC" if is_bc else "AD"
+    return f"{month}/{year} {era}"
+
+def parse_date(text: str) -> Tuple[int, int, bool]:
+    """Inverse of format_date: "3/700 BC" -> (3, 700, True). The era defaults to AD, the month to 1."""
+    parts = text.strip().upper().split()
+    if not parts or len(parts) > 2 or (len(parts) == 2 and parts[1] not in ("BC", "AD")):
+        raise ValueError(f"Not a date: {text!r}")
+    is_bc = len(parts) == 2 and parts[1] == "BC"
+    month, _, year = parts[0].rpartition("/")
+    month = int(month) if month else 1
+    year = int(year)
+    if not 1 <= month <= 12 or year < 1:
+        raise ValueError(f"Not a date: {text!r}")
+    return month, year, is_bc
+
+def month_index(month: int, year: int, is_bc: bool) -> int:
+    """Months since January 1 AD (negative in BC); consecutive months differ by one."""
+    return (-year if is_bc else year - 1) * 12 + month - 1
+
+def date_of(index: int) -> Tuple[int, int, bool]:
+    """Inverse of month_index: (month, year, is_bc)."""
+    years, month = divmod(index, 12)
+    if years >= 0:
+        return month + 1, years + 1, False
+    return month + 1, -years, True
+
+class LogRecord(NamedTuple):
+    date: Optional[Tuple[int, int, bool]]  # (month, year, is_bc); None for lines restored from a save
+    kind: str
+    actors: Tuple
+    template: str
+    args: Tuple
+
+    @property
+    def message(self) -> str:
+        return self.template.format(*self.args) if self.args else self.template
+
+    @property
+    def text(self) -> str:
+        if self.date is None:
+            return self.message
+        return f"[{format_date(*self.date)}] {self.message}"
+
+class LogBook:
+    """Fixed-capacity ring buffer of structured log records.
+
+    Records keep their template and arguments and are only turned into
+    strings when something reads them (the dashboard, a save). Each kind of
+    message has its own verbosity level so batch runs can silence chatter
+    such as per-building income entirely.
+    """
+
+    def __init__(self, capacity: int = 100, default_level: LogLevel = LogLevel.INFO):
+        self.records: Deque[LogRecord] = deque(maxlen=capacity)
+        self.default_level = default_level
+        self.levels: Dict[str, LogLevel] = {}
+        self.version = 0  # Bumped on every change, so readers can tell when to re-read
+
+    def set_level(self, kind: str, level: LogLevel):
+        self.levels[kind] = level
+
+    def is_enabled(self, kind: str, level: LogLevel = LogLevel.INFO) -> bool:
+        return level >= self.levels.get(kind, self.default_level)
+
+    def record(self, date, kind: str, template: str, args: Tuple = (), actors: Tuple = (),
+               level: LogLevel = LogLevel.INFO):
+        if level < self.levels.get(kind, self.default_level):
+            return
+        self.records.append(LogRecord(date, kind, actors, template, args))
+        self.version += 1
+
+    def tail(self, count: int) -> List[str]:
+        """The last `count` entries, formatted."""
+        start = max(0, len(self.records) - count)
+        return [self.records[i].text for i in range(start, len(self.records))]
+
+    def lines(self) -> List[str]:
+        return [r.text for r in self.records]
+
+    def filter(self, kind: Optional[str] = None, actor=None) -> List[LogRecord]:
+        return [r for r in self.records
+                if (kind is None or r.kind == kind) and (actor is None or actor in r.actors)]
+
+    def load_lines(self, lines: Iterable[str]):
+        """Restore already-formatted lines (as stored in save files)."""
+        self.records.clear()
+        for line in lines:
+            self.records.append(LogRecord(None, "general", (), line, ()))
+        self.version += 1
+
+    def clear(self):
+        self.records.clear()
+        self.version += 1
@@ -0,0 +1,232 @@
+"""Eligible-spouse index and the monthly AI marriage pass.
+
+Unmarried living adults are kept in buckets by gender and culture, plus one
+bucket per gender. A bucket is an IdSet: a Fenwick tree over the id space,
+so adding, removing and drawing its k-th member are all O(log n), and the
+members are in id order however the set was built. A loaded game therefore
+draws the same matches as the game that was saved. As in FertilityTracker,
+unmarried minors are held by birth cohort and join the buckets in the
+January they come of age.
+
+Each month every eligible man proposes with MARRIAGE_CHANCE. The proposers
+are drawn with sample_binomial, so the pass costs O(matches) rather than
+O(n²). A proposer looks at MATCH_TRIES random women of his culture (of any
+culture if there are none). He drops those that arrange_marriage's rules
+(see marriage_blocker) or a shared dynasty rule out, and marries the best
+of the rest by mutual opinion and stats. The player's dynasty is left to
+the player.
+"""
+from typing import Dict, List, Optional, Tuple
+from .eligibility import FenwickTree
+from .fertility import sample_binomial
+
+MARRIAGE_AGE = 16
+MARRIAGE_CHANCE = 0.02  # Monthly chance that an unmarried man seeks a wife (~22% a year)
+MATCH_TRIES = 5  # Women a proposer considers
+
+class IdSet:
+    """Ids in ascending order, with O(log n) add, discard and k-th member."""
+
+    def __init__(self):
+        self._present = bytearray()
+        self._tree = FenwickTree(0)
+
+    def __len__(self) -> int:
+        return self._tree.total
+
+    def __contains__(self, char_id: int) -> bool:
+        return char_id < len(self._present) and self._present[char_id] == 1
+
+    def __getitem__(self, k: int) -> int:
+        if not 0 <= k < len(self):
+            raise IndexError(k)
+        return self._tree.find(k)
+
+    def __iter__(self):
+        for k in range(len(self)):
+            yield self._tree.find(k)
+
+    @classmethod
+    def from_ids(cls, ids: List[int]) -> 'IdSet':
+        """Build in O(max id) instead of len(ids) add() calls."""
+        id_set = cls()
+        id_set._present = bytearray(max(64, max(ids, default=0) + 1))
+        for char_id in ids:
+            id_set._present[char_id] = 1
+        id_set._tree = FenwickTree.from_weights(id_set._present)
+        return id_set
+
+    def add(self, char_id: int):
+        if char_id >= len(self._present):
+            self._grow(char_id)
+        if not self._present[char_id]:
+            self._present[char_id] = 1
+            self._tree.add(char_id, 1)
+
+    def discard(self, char_id: int):
+        if char_id in self:
+            self._present[char_id] = 0
+            self._tree.add(char_id, -1)
+
+    def _grow(self, char_id: int):
+        size = max(64, 2 * len(self._present), char_id + 1)
+        self._present.extend(bytes(size - len(self._present)))
+        self._tree = FenwickTree.from_weights(self._present)
+
+class Matchmaker:
+    """Unmarried adults by gender and culture, and the AI marriage pass.
+
+    Built on first use, then kept current by the engine: add() for a
+    newborn, update() after a death or marriage, on_new_year() after the
+    January birthdays, and invalidate() when the world is replaced.
+    """
+
+    def __init__(self, engine):
+        self.engine = engine
+        self._built = False
+
+    def invalidate(self):
+        self._built = False
+
+    def rebuild(self):
+        self._year = 0
+        self._buckets: Dict[Tuple[str, str], IdSet] = {}  # (gender, culture) -> unmarried adults
+        self._by_gender: Dict[str, IdSet] = {}
+        self._bucket_of: Dict[int, Tuple[str, str]] = {}
+        self._minors: Dict[int, Dict[int, None]] = {}  # cohort -> unmarried minors
+        self._cohort: Dict[int, int] = {}
+        self._built = True
+        adults: Dict[Tuple[str, str], List[int]] = {}
+        for char in self.engine.characters.values():
+            if char.is_alive and not char.spouse_id and char.age >= MARRIAGE_AGE:
+                key = (char.gender, char.culture)
+                self._bucket_of[char.id] = key
+                adults.setdefault(key, []).append(char.id)
+            else:
+                self._add(char)
+        self._buckets = {key: IdSet.from_ids(ids) for key, ids in adults.items()}
+        for gender in {gender for gender, _ in adults}:
+            self._by_gender[gender] = IdSet.from_ids(
+                [char_id for (g, _), ids in adults.items() if g == gender for char_id in ids])
+
+    def _ensure(self):
+        if not self._built:
+            self.rebuild()
+
+    def _add(self, char):
+        if not char.is_alive or char.spouse_id:
+            return
+        if char.age >= MARRIAGE_AGE:
+            self._add_adult(char)
+        else:
+            cohort = self._year - char.age
+            self._cohort[char.id] = cohort
+            self._minors.setdefault(cohort, {})[char.id] = None
+
+    def _add_adult(self, char):
+        key = (char.gender, char.culture)
+        self._bucket_of[char.id] = key
+        self._buckets.setdefault(key, IdSet()).add(char.id)
+        self._by_gender.setdefault(char.gender, IdSet()).add(char.id)
+
+    def _remove(self, char_id: int):
+        key = self._bucket_of.pop(char_id, None)
+        if key is not None:
+            self._buckets[key].discard(char_id)
+            self._by_gender[key[0]].discard(char_id)
+        cohort = self._cohort.pop(char_id, None)
+        if cohort is not None:
+            self._minors[cohort].pop(char_id, None)
+
+    def add(self, char_id: int):
+        if self._built:
+            self._add(self.engine.characters[char_id])
+
+    def update(self, char_id: int):
+        """Re-evaluate one character after a death or marriage."""
+        if not self._built:
+            return
+        self._remove(char_id)
+        char = self.engine.characters.get(char_id)
+        if char is not None:
+            self._add(char)
+
+    def update_couple(self, char_id: int):
+        self.update(char_id)
+        char = self.engine.characters.get(char_id)
+        if char is not None and char.spouse_id:
+            self.update(char.spouse_id)
+
+    def on_new_year(self):
+        """Move the cohort that just came of age into the buckets."""
+        if not self._built:
+            return
+        self._year += 1
+        for char_id in self._minors.pop(self._year - MARRIAGE_AGE, ()):
+            del self._cohort[char_id]
+            self._add_adult(self.engine.characters[char_id])
+
+    def singles(self, gender: str) -> IdSet:
+        """Unmarried living adults of one gender."""
+        self._ensure()
+        return self._by_gender.setdefault(gender, IdSet())
+
+    def spouse_candidates(self, char_id: int) -> IdSet:
+        """Unmarried adults of the other gender (arrange_marriage still checks opinions)."""
+        char = self.engine.characters[char_id]
+        return self.singles("Female" if char.gender == "Male" else "Male")
+
+    def _reserved(self, char) -> bool:
+        """The player and the player's dynasty only marry when the player arranges it."""
+        player = self.engine.characters.get(self.engine.player_character_id)
+        return player is not None and (char.id == player.id or
+                                       (player.dynasty_id is not None and char.dynasty_id == player.dynasty_id))
+
+    def score(self, man, woman, mutual: Optional[int] = None) -> int:
+        """How good a match woman is for man: mutual opinion (the sum both ways) and her stats, less the age gap."""
+        if mutual is None:
+            mutual = self.engine.get_opinion(man.id, woman.id) + self.engine.get_opinion(woman.id, man.id)
+        return (mutual + woman.martial + woman.diplomacy + woman.stewardship + woman.intrigue + woman.learning
+                - abs(man.age - woman.age))
+
+    def _best_match(self, man, rng) -> Optional[int]:
+        engine = self.engine
+        pool = self._buckets.get(("Female", man.culture)) or self._by_gender.get("Female")
+        if not pool:
+            return None
+        best, best_score = None, None
+        for _ in range(min(MATCH_TRIES, len(pool))):
+            woman = engine.characters[pool[rng.randrange(len(pool))]]
+            if self._reserved(woman) or (man.dynasty_id is not None and woman.dynasty_id == man.dynasty_id):
+                continue
+            # Bucket members are living, unmarried and of the other gender, so of
+            # arrange_marriage's rules only the opinion one is left to check
+            opinion, back = engine.get_opinion(man.id, woman.id), engine.get_opinion(woman.id, man.id)
+            if opinion < 0 or back < 0:
+                continue
+            score = self.score(man, woman, opinion + back)
+            if best_score is None or score > best_score:
+                best, best_score = woman.id, score
+        return best
+
+    def run(self, chance: float = MARRIAGE_CHANCE, rng=None) -> List[Tuple[int, int]]:
+        """One month of AI marriages. Returns the (husband, wife) pairs married."""
+        self._ensure()
+        engine = self.engine
+        men = self._by_gender.get("Male")
+        if not men:
+            return []
+        rng = rng or engine.rng.marriages
+        count = sample_binomial(len(men), chance, rng)
+        # Draw every proposer up front: the set shrinks as they marry
+        proposers = [men[rng.randrange(len(men))] for _ in range(count)]
+        couples = []
+        for man_id in proposers:
+            man = engine.characters[man_id]
+            if man.spouse_id or self._reserved(man):
+                continue  # Drawn twice, or taken this month
+            woman_id = self._best_match(man, rng)
+            if woman_id is not None:
+                engine.marry(man_id, woman_id)
+                couples.append((man_id, woman_id))
+        return couples
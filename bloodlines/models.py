@@ -1,7 +1,8 @@
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict
+from collections.abc import Sequence
 from enum import Enum
-import uuid
+from .ids import new_id, intern_id, export_id
 
 class GovernmentType(Enum):
     REPUBLIC = "Republic"
@@ -15,97 +16,341 @@ class Terrain(Enum):
     MOUNTAINS = "Mountains"
     COASTAL = "Coastal"
 
+# Attributes whose writes are not reported to a ChangeTracker. Ages change for
+# everyone each January, so delta saves replay them from the calendar instead.
+UNTRACKED_FIELDS = frozenset(["age"])
+
+class Tracked:
+    """Base for models that can report changes to a ChangeTracker (see autosave.py).
+
+    Public attribute writes mark the model dirty while a tracker is
+    attached (by an Autosaver); otherwise they cost one extra attribute
+    check. In-place container changes (appending to a list, updating a
+    dict) must be reported with mark_dirty().
+    """
+    __slots__ = ()
+    _tracker = None
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        tracker = self._tracker
+        if tracker is not None and name[0] != "_" and name not in UNTRACKED_FIELDS:
+            tracker.mark(self)
+
+    def mark_dirty(self):
+        if self._tracker is not None:
+            self._tracker.mark(self)
+
 @dataclass
-class Dynasty:
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+class Dynasty(Tracked):
+    id: int = field(default_factory=new_id)
     name: str = "Unknown"
     prestige: int = 0
-    members: List[str] = field(default_factory=list)  # List of Character IDs
+    members: List[int] = field(default_factory=list)  # List of Character IDs
 
     def to_dict(self) -> Dict:
         return {
-            "id": self.id,
+            "id": export_id(self.id),
             "name": self.name,
             "prestige": self.prestige,
-            "members": self.members
+            "members": [export_id(i) for i in self.members]
         }
 
     @classmethod
     def from_dict(cls, data: Dict) -> 'Dynasty':
+        data["id"] = intern_id(data["id"])
+        data["members"] = [intern_id(i) for i in data["members"]]
         return cls(**data)
 
-@dataclass
-class Character:
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
-    name: str = "Unnamed"
-    age: int = 16
-    is_alive: bool = True
-    dynasty_id: Optional[str] = None
-    culture: str = "Generic"
-    gender: str = "Male"  # "Male" or "Female"
-    
-    # Family
-    father_id: Optional[str] = None
-    mother_id: Optional[str] = None
-    spouse_id: Optional[str] = None
-    children_ids: List[str] = field(default_factory=list)
-    
-    # Stats (0-20 scale)
-    martial: int = 5
-    diplomacy: int = 5
-    stewardship: int = 5
-    intrigue: int = 5
-    learning: int = 5
-    
-    # Traits
-    traits: List[str] = field(default_factory=list)
-    
-    # State
-    health: float = 10.0
-    stress: float = 0.0
-    wealth: int = 100
-    location_id: Optional[str] = None
-    
-    # Relationships
-    opinions: Dict[str, int] = field(default_factory=dict)  # char_id -> opinion (-100 to +100)
+def _claiming(base, name: str):
+    method = getattr(base, name)
+
+    def claim_and_call(self, *args, **kwargs):
+        return method(self._claim(), *args, **kwargs)
+
+    claim_and_call.__name__ = name
+    return claim_and_call
+
+class _VacantList(list):
+    """Stand-in returned for an unallocated list attribute.
+
+    The first change of any kind stores the stand-in itself as the attribute,
+    so from then on it is the character's real list.
+    """
+    __slots__ = ("_owner", "_slot")
+
+    def __init__(self, owner, slot: str):
+        self._owner = owner
+        self._slot = slot
+
+    def _claim(self) -> list:
+        owner = self._owner
+        if owner is None:
+            return self  # Already the real list
+        current = getattr(owner, self._slot)
+        if current is not None:
+            return current  # Another stand-in was written first; write to that one
+        object.__setattr__(owner, self._slot, self)
+        self._owner = None
+        return self
+
+for _name in ("__setitem__", "__delitem__", "__iadd__", "__imul__", "append", "extend", "insert",
+              "pop", "remove", "clear", "sort", "reverse"):
+    setattr(_VacantList, _name, _claiming(list, _name))
+
+class _VacantDict(dict):
+    """Stand-in returned for an unallocated dict attribute; like _VacantList, the first change makes it the real one."""
+    __slots__ = ("_owner", "_slot")
+
+    def __init__(self, owner, slot: str):
+        self._owner = owner
+        self._slot = slot
+
+    _claim = _VacantList._claim
+
+for _name in ("__setitem__", "__delitem__", "__ior__", "setdefault", "update", "pop", "popitem", "clear"):
+    setattr(_VacantDict, _name, _claiming(dict, _name))
+
+# Trait names are interned to bit positions shared by every character
+_TRAIT_BITS: Dict[str, int] = {}
+_TRAIT_NAMES: List[str] = []
+
+def _trait_bit(trait: str) -> int:
+    bit = _TRAIT_BITS.get(trait)
+    if bit is None:
+        bit = _TRAIT_BITS[trait] = 1 << len(_TRAIT_NAMES)
+        _TRAIT_NAMES.append(trait)
+    return bit
+
+class TraitList(Sequence):
+    """List-like view of a character's trait bitset.
+
+    Traits come back in the order they were first seen by the game rather
+    than the order they were added, and a trait can only be held once.
+    """
+    __slots__ = ("_owner",)
+
+    def __init__(self, owner: 'Character'):
+        self._owner = owner
+
+    def _names(self) -> List[str]:
+        bits = self._owner._traits
+        return [name for i, name in enumerate(_TRAIT_NAMES) if bits >> i & 1]
+
+    def __getitem__(self, index):
+        return self._names()[index]
+
+    def __len__(self) -> int:
+        return bin(self._owner._traits).count("1")
+
+    def __contains__(self, trait) -> bool:
+        bit = _TRAIT_BITS.get(trait)
+        return bit is not None and self._owner._traits & bit != 0
+
+    def __iter__(self):
+        return iter(self._names())
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (TraitList, list, tuple)):
+            return self._names() == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(self._names())
+
+    def __add__(self, other) -> List[str]:
+        return self._names() + list(other)
+
+    def __radd__(self, other) -> List[str]:
+        return list(other) + self._names()
+
+    def __iadd__(self, traits):
+        self._owner.traits = [*self._names(), *traits]
+        self._owner.mark_dirty()
+        return self
+
+    def append(self, trait: str):
+        self._owner._traits |= _trait_bit(trait)
+        self._owner.mark_dirty()
+
+    def extend(self, traits):
+        for trait in traits:
+            self.append(trait)
+
+    def remove(self, trait: str):
+        if trait not in self:
+            raise ValueError(f"{trait!r} not in traits")
+        self.discard(trait)
+
+    def discard(self, trait: str):
+        bit = _TRAIT_BITS.get(trait)
+        if bit is not None:
+            self._owner._traits &= ~bit
+            self._owner.mark_dirty()
+
+    def clear(self):
+        self._owner._traits = 0
+        self._owner.mark_dirty()
+
+# Stats (0-20 scale) packed 16 bits each into Character._stats. They are stored
+# biased by STAT_LIMIT, so any value a save can hold (-32768 to 32767) fits.
+STATS = ("martial", "diplomacy", "stewardship", "intrigue", "learning")
+STAT_BITS = 16
+STAT_LIMIT = 1 << (STAT_BITS - 1)
+
+def _stat_property(index: int):
+    shift = STAT_BITS * index
+    field_mask = (1 << STAT_BITS) - 1
+    mask = field_mask << shift
+
+    def fget(self) -> int:
+        return ((self._stats >> shift) & field_mask) - STAT_LIMIT
+
+    def fset(self, value: int):
+        if not -STAT_LIMIT <= value < STAT_LIMIT:
+            raise ValueError(f"{STATS[index]} must be between {-STAT_LIMIT} and {STAT_LIMIT - 1}, got {value}")
+        self._stats = (self._stats & ~mask) | ((int(value) + STAT_LIMIT) << shift)
+
+    return property(fget, fset)
+
+_DEFAULT_STATS = sum((5 + STAT_LIMIT) << (STAT_BITS * i) for i in range(len(STATS)))
+
+def _lazy_property(slot: str, vacant):
+    def fget(self):
+        value = getattr(self, slot)
+        return vacant(self, slot) if value is None else value
+
+    def fset(self, value):
+        object.__setattr__(self, slot, value)
+
+    return property(fget, fset)
+
+class Character(Tracked):
+    """A person in the world.
+
+    Characters are the bulk of a large world, so they are kept compact:
+    fixed __slots__, the five stats packed into one int, traits held as a
+    bitset and children/opinions allocated only when first written. The
+    attributes and to_dict/from_dict behave as they did for the dataclass,
+    except that traits are a set: each is held once, and they are listed in
+    the order the game first saw them (see TraitList). Stats must fit the
+    save format's 16 bits (STAT_LIMIT).
+    In a running game opinions live in the engine's opinion store (see
+    opinions.py); the attribute only carries them into and out of it.
+    """
+    __slots__ = ("id", "name", "age", "is_alive", "dynasty_id", "culture", "gender",
+                 "father_id", "mother_id", "spouse_id", "_children", "_stats", "_traits",
+                 "health", "stress", "wealth", "location_id", "_opinions", "_tracker")
+
+    def __init__(self, id: Optional[int] = None, name: str = "Unnamed", age: int = 16,
+                 is_alive: bool = True, dynasty_id: Optional[int] = None, culture: str = "Generic",
+                 gender: str = "Male", father_id: Optional[int] = None, mother_id: Optional[int] = None,
+                 spouse_id: Optional[int] = None, children_ids: Optional[List[int]] = None,
+                 martial: int = 5, diplomacy: int = 5, stewardship: int = 5, intrigue: int = 5,
+                 learning: int = 5, traits: Optional[List[str]] = None, health: float = 10.0,
+                 stress: float = 0.0, wealth: int = 100, location_id: Optional[int] = None,
+                 opinions: Optional[Dict[int, int]] = None):
+        object.__setattr__(self, "_tracker", None)  # First, so tracked writes below find no tracker
+        self.id = new_id() if id is None else id
+        self.name = name
+        self.age = age
+        self.is_alive = is_alive
+        self.dynasty_id = dynasty_id
+        self.culture = culture
+        self.gender = gender  # "Male" or "Female"
+        self.father_id = father_id
+        self.mother_id = mother_id
+        self.spouse_id = spouse_id
+        self._children = children_ids or None
+        if (martial, diplomacy, stewardship, intrigue, learning) == (5, 5, 5, 5, 5):
+            self._stats = _DEFAULT_STATS
+        else:
+            self._stats = 0
+            self.martial, self.diplomacy, self.stewardship = martial, diplomacy, stewardship
+            self.intrigue, self.learning = intrigue, learning
+        self._traits = 0
+        if traits:
+            self.traits = traits
+        self.health = health
+        self.stress = stress
+        self.wealth = wealth
+        self.location_id = location_id
+        self._opinions = opinions or None  # char_id -> opinion (-100 to +100)
+
+    children_ids = _lazy_property("_children", _VacantList)
+    opinions = _lazy_property("_opinions", _VacantDict)
+
+    @property
+    def traits(self) -> TraitList:
+        return TraitList(self)
+
+    @traits.setter
+    def traits(self, traits):
+        bits = 0
+        for trait in traits:
+            bits |= _trait_bit(trait)
+        self._traits = bits
+
+    def _fields(self) -> tuple:
+        return (self.id, self.name, self.age, self.is_alive, self.dynasty_id, self.culture, self.gender,
+                self.father_id, self.mother_id, self.spouse_id, list(self.children_ids),
+                *(getattr(self, stat) for stat in STATS), self._traits, self.health, self.stress,
+                self.wealth, self.location_id, dict(self.opinions))
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Character):
+            return NotImplemented
+        return self._fields() == other._fields()
+
+    __hash__ = None  # Mutable, like the dataclass it replaced
+
+    def __repr__(self) -> str:
+        return f"Character(id={self.id!r}, name={self.name!r}, age={self.age!r}, is_alive={self.is_alive!r})"
 
     def to_dict(self) -> Dict:
         return {
-            "id": self.id,
+            "id": export_id(self.id),
             "name": self.name,
             "age": self.age,
             "is_alive": self.is_alive,
-            "dynasty_id": self.dynasty_id,
+            "dynasty_id": export_id(self.dynasty_id),
             "culture": self.culture,
             "gender": self.gender,
-            "father_id": self.father_id,
-            "mother_id": self.mother_id,
-            "spouse_id": self.spouse_id,
-            "children_ids": self.children_ids,
+            "father_id": export_id(self.father_id),
+            "mother_id": export_id(self.mother_id),
+            "spouse_id": export_id(self.spouse_id),
+            "children_ids": [export_id(i) for i in self.children_ids],
             "martial": self.martial,
             "diplomacy": self.diplomacy,
             "stewardship": self.stewardship,
             "intrigue": self.intrigue,
             "learning": self.learning,
-            "traits": self.traits,
+            "traits": list(self.traits),
             "health": self.health,
             "stress": self.stress,
             "wealth": self.wealth,
-            "location_id": self.location_id,
-            "opinions": self.opinions
+            "location_id": export_id(self.location_id),
+            "opinions": {export_id(k): v for k, v in self.opinions.items()}
         }
 
     @classmethod
     def from_dict(cls, data: Dict) -> 'Character':
+        for key in ("id", "dynasty_id", "father_id", "mother_id", "spouse_id", "location_id"):
+            data[key] = intern_id(data.get(key))
+        data["children_ids"] = [intern_id(i) for i in data.get("children_ids", [])]
+        data["opinions"] = {intern_id(k): v for k, v in data.get("opinions", {}).items()}
         return cls(**data)
 
+for _index, _stat in enumerate(STATS):
+    setattr(Character, _stat, _stat_property(_index))
+
 @dataclass
-class Polity:
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+class Polity(Tracked):
+    id: int = field(default_factory=new_id)
     name: str = "Unnamed Polity"
     government_type: GovernmentType = GovernmentType.TRIBE
-    ruler_id: Optional[str] = None
-    capital_id: Optional[str] = None
+    ruler_id: Optional[int] = None
+    capital_id: Optional[int] = None
     laws: Dict[str, str] = field(default_factory=dict)
     
     # Government Specifics
@@ -115,11 +360,11 @@ class Polity:
 
     def to_dict(self) -> Dict:
         return {
-            "id": self.id,
+            "id": export_id(self.id),
             "name": self.name,
             "government_type": self.government_type.value,
-            "ruler_id": self.ruler_id,
-            "capital_id": self.capital_id,
+            "ruler_id": export_id(self.ruler_id),
+            "capital_id": export_id(self.capital_id),
             "laws": self.laws,
             "term_end_date": self.term_end_date,
             "legitimacy": self.legitimacy,
@@ -128,36 +373,41 @@ class Polity:
 
     @classmethod
     def from_dict(cls, data: Dict) -> 'Polity':
+        for key in ("id", "ruler_id", "capital_id"):
+            data[key] = intern_id(data.get(key))
         # Convert string back to Enum
         if "government_type" in data:
             data["government_type"] = GovernmentType(data["government_type"])
         return cls(**data)
 
 @dataclass
-class Region:
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+class Region(Tracked):
+    id: int = field(default_factory=new_id)
     name: str = "Unnamed Region"
     terrain: Terrain = Terrain.PLAINS
-    owner_polity_id: Optional[str] = None
+    owner_polity_id: Optional[int] = None
     population: int = 1000
     wealth: int = 100
-    neighbors: List[str] = field(default_factory=list) # List of Region IDs
+    neighbors: List[int] = field(default_factory=list) # List of Region IDs
     buildings: Dict[str, int] = field(default_factory=dict) # Building Type -> Count
 
     def to_dict(self) -> Dict:
         return {
-            "id": self.id,
+            "id": export_id(self.id),
             "name": self.name,
             "terrain": self.terrain.value,
-            "owner_polity_id": self.owner_polity_id,
+            "owner_polity_id": export_id(self.owner_polity_id),
             "population": self.population,
             "wealth": self.wealth,
-            "neighbors": self.neighbors,
+            "neighbors": [export_id(i) for i in self.neighbors],
             "buildings": self.buildings
         }
 
     @classmethod
     def from_dict(cls, data: Dict) -> 'Region':
+        for key in ("id", "owner_polity_id"):
+            data[key] = intern_id(data.get(key))
+        data["neighbors"] = [intern_id(i) for i in data.get("neighbors", [])]
         # Convert string back to Enum
         if "terrain" in data:
             data["terrain"] = Terrain(data["terrain"])
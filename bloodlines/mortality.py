@@ -0,0 +1,151 @@
+from typing import Dict, List, Optional
+from .ids import intern_id, export_id
+import heapq
+import math
+
+# Natural mortality: (age - 50) * 0.5% chance per month past 50
+MORTALITY_AGE = 50
+MORTALITY_PER_YEAR = 0.005
+
+def monthly_death_chance(age: int) -> float:
+    if age <= MORTALITY_AGE:
+        return 0.0
+    return (age - MORTALITY_AGE) * MORTALITY_PER_YEAR
+
+class DeathScheduler:
+    """Samples each character's month of natural death once instead of rolling every month.
+
+    The hazard is constant within a year of age, so the number of months
+    survived at that age is geometric. A character's death month is drawn
+    when they are registered and redrawn whenever their hazard may have
+    changed (health changes, mortality modifiers); since the hazard is
+    memoryless within a year, a redraw from the current month keeps the
+    distribution identical to monthly rolls. Due characters are kept in a
+    heap keyed by absolute game month; redraws leave the old entry behind,
+    and the heap is compacted once those stale entries are the majority.
+    """
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.due: Dict[int, int] = {}  # char_id -> month index of death
+        self.modifiers: Dict[int, float] = {}  # char_id -> hazard multiplier
+        self._heap: List = []  # (month index, sequence, char_id); stale entries skipped on pop
+        self._seq = 0
+        self._registered = 0
+
+    def hazard(self, char_id: int, age: int) -> float:
+        return monthly_death_chance(age) * self.modifiers.get(char_id, 1.0)
+
+    def draw(self, char) -> Optional[int]:
+        """Month index at which the character dies, given they are alive now (None = never)."""
+        if self.modifiers.get(char.id, 1.0) <= 0.0:
+            return None
+        t = self.engine.get_month_index()
+        age = char.age
+        span = 12 - self.engine.month  # Ticks left before the next January aging
+        if age <= MORTALITY_AGE:
+            # No risk until the January they turn MORTALITY_AGE + 1
+            t += span + 12 * (MORTALITY_AGE - age)
+            age = MORTALITY_AGE + 1
+            span = 12
+        while True:
+            h = self.hazard(char.id, age)
+            if h <= 0.0:
+                return None
+            if h >= 1.0:
+                return t + 1
+            survived = int(math.log(1.0 - self.engine.rng.mortality.random()) / math.log(1.0 - h))
+            if survived < span:
+                return t + 1 + survived
+            t += span
+            age += 1
+            span = 12
+
+    def register(self, char_id: int):
+        """Schedule a newly created character."""
+        self._registered += 1
+        self.schedule(char_id)
+
+    def schedule(self, char_id: int):
+        char = self.engine.characters[char_id]
+        month = self.draw(char) if char.is_alive else None
+        if month is None:
+            self.cancel(char_id)
+        else:
+            self._push(char_id, month)
+
+    def _push(self, char_id: int, month: int):
+        self.due[char_id] = month
+        self._seq += 1
+        heapq.heappush(self._heap, (month, self._seq, char_id))
+        self._compact()
+
+    def _compact(self):
+        """Drop superseded entries once they outnumber live ones (each due character has one live entry)."""
+        heap = self._heap
+        if len(heap) - len(self.due) > len(heap) // 2:
+            due = self.due
+            self._heap = [entry for entry in heap if due.get(entry[2]) == entry[0]]
+            heapq.heapify(self._heap)
+
+    def reschedule(self, char_id: int):
+        """Redraw after the character's hazard may have changed."""
+        char = self.engine.characters.get(char_id)
+        if char is not None and char.is_alive:
+            self.schedule(char_id)
+
+    def set_modifier(self, char_id: int, factor: float):
+        """Scale a character's natural mortality (1.0 = normal) and redraw their death."""
+        if factor == 1.0:
+            self.modifiers.pop(char_id, None)
+        else:
+            self.modifiers[char_id] = factor
+        self.schedule(char_id)
+        self.engine.characters[char_id].mark_dirty()  # Its due month changed
+
+    def cancel(self, char_id: int):
+        if self.due.pop(char_id, None) is not None:
+            self._compact()
+
+    def rebuild(self):
+        self.due = {}
+        self._heap = []
+        for char_id in self.engine.characters:
+            self.schedule(char_id)
+        self._registered = len(self.engine.characters)
+
+    def sync(self):
+        """Schedule characters that were added without going through the engine."""
+        if self._registered < len(self.engine.characters):
+            for char_id, char in self.engine.characters.items():
+                if char.is_alive and char_id not in self.due:
+                    self.schedule(char_id)
+            self._registered = len(self.engine.characters)
+
+    def pop_due(self, now: int) -> List[int]:
+        """Ids of characters whose death month has arrived."""
+        dying = []
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            month, _, char_id = heapq.heappop(heap)
+            if self.due.get(char_id) == month:
+                del self.due[char_id]
+                dying.append(char_id)
+        return dying
+
+    def to_dict(self) -> Dict:
+        return {"due": {export_id(k): v for k, v in self.due.items()},
+                "modifiers": {export_id(k): v for k, v in self.modifiers.items()}}
+
+    def load_dict(self, data: Dict):
+        """Restore a saved schedule; characters missing from it get a fresh draw."""
+        self.due = {}
+        self._heap = []
+        self.modifiers = {intern_id(k): v for k, v in data.get("modifiers", {}).items()}
+        for key, month in data.get("due", {}).items():
+            char_id = intern_id(key)
+            char = self.engine.characters.get(char_id)
+            if char is not None and char.is_alive:
+                self._push(char_id, month)
+        self._registered = 0
+        self.sync()
@@ -0,0 +1,228 @@
+"""Sparse store for what characters think of each other.
+
+Opinions are a sparse matrix (holder -> target -> -100..100). With NumPy the
+matrix is kept as sorted COO arrays (one int64 key per entry, holder in the
+high 32 bits) plus a small dict of pending writes that is merged in batches;
+bulk updates, decay and column queries are then vectorized. Without NumPy
+the same interface is backed by nested dicts. Entries that reach 0 are
+dropped, so with decay running the matrix only holds live relationships.
+"""
+from typing import Dict, Iterable, List, Tuple
+import heapq
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional
+    np = None
+
+OPINION_MIN = -100
+OPINION_MAX = 100
+FLUSH_AT = 4096  # Pending writes merged into the arrays at once
+
+def _clamp(value: int) -> int:
+    return max(OPINION_MIN, min(OPINION_MAX, value))
+
+def new_opinion_store():
+    """The array-backed store when numpy is installed, the dict-backed one otherwise."""
+    return OpinionStore() if np is not None else DictOpinionStore()
+
+class OpinionStore:
+    def __init__(self):
+        if np is None:
+            raise ImportError("OpinionStore requires numpy (pip install numpy); use DictOpinionStore")
+        self.keys = np.zeros(0, dtype=np.int64)  # holder << 32 | target, sorted
+        self.values = np.zeros(0, dtype=np.int8)
+        self.pending: Dict[int, int] = {}  # key -> new value (0 deletes)
+
+    def __len__(self) -> int:
+        self.flush()
+        return len(self.keys)
+
+    def _stored(self, key: int) -> int:
+        i = int(np.searchsorted(self.keys, key))
+        if i < len(self.keys) and self.keys[i] == key:
+            return int(self.values[i])
+        return 0
+
+    def get(self, holder: int, target: int) -> int:
+        key = holder << 32 | target
+        value = self.pending.get(key)
+        return value if value is not None else self._stored(key)
+
+    def set(self, holder: int, target: int, value: int):
+        self.pending[holder << 32 | target] = _clamp(value)
+        if len(self.pending) >= FLUSH_AT:
+            self.flush()
+
+    def add(self, holder: int, target: int, change: int) -> int:
+        """Shift one opinion by change (clamped) and return the new value."""
+        value = _clamp(self.get(holder, target) + change)
+        self.set(holder, target, value)
+        return value
+
+    def flush(self):
+        """Merge pending writes into the sorted arrays."""
+        if not self.pending:
+            return
+        keys = np.fromiter(self.pending.keys(), dtype=np.int64, count=len(self.pending))
+        values = np.fromiter(self.pending.values(), dtype=np.int8, count=len(self.pending))
+        self.pending = {}
+        order = np.argsort(keys)
+        self._merge(keys[order], values[order])
+
+    def _merge(self, keys, values):
+        """Overwrite or insert sorted, unique keys; zero values delete."""
+        pos = np.searchsorted(self.keys, keys)
+        hit = pos < len(self.keys)
+        hit[hit] = self.keys[pos[hit]] == keys[hit]
+        self.values[pos[hit]] = values[hit]
+        new = ~hit & (values != 0)
+        if new.any():
+            self.keys = np.insert(self.keys, pos[new], keys[new])
+            self.values = np.insert(self.values, pos[new], values[new])
+        if not values[hit].all():
+            self._prune()
+
+    def _prune(self):
+        live = self.values != 0
+        self.keys = self.keys[live]
+        self.values = self.values[live]
+
+    def add_toward(self, target: int, holders: Iterable[int], change: int):
+        """Shift every holder's opinion of target by change in one pass."""
+        self.flush()
+        holders = np.unique(np.fromiter(holders, dtype=np.int64))
+        if len(holders) == 0:
+            return
+        keys = holders << 32 | target
+        pos = np.searchsorted(self.keys, keys)
+        hit = pos < len(self.keys)
+        hit[hit] = self.keys[pos[hit]] == keys[hit]
+        current = np.zeros(len(keys), dtype=np.int16)
+        current[hit] = self.values[pos[hit]]
+        updated = np.clip(current + change, OPINION_MIN, OPINION_MAX).astype(np.int8)
+        self._merge(keys, updated)
+
+    def decay(self, step: int = 1) -> List[int]:
+        """Move every opinion step points toward 0. Returns the holders whose opinions changed."""
+        self.flush()
+        if len(self.keys) == 0:
+            return []
+        holders = self.keys >> 32
+        # Keys are sorted, so each holder's entries are contiguous
+        first = np.empty(len(holders), dtype=bool)
+        first[0] = True
+        np.not_equal(holders[1:], holders[:-1], out=first[1:])
+        changed = holders[first].tolist()
+        self.values -= np.clip(self.values, -step, step)
+        self._prune()
+        return changed
+
+    def row(self, holder: int) -> Dict[int, int]:
+        """Everything holder has an opinion about."""
+        self.flush()
+        lo, hi = np.searchsorted(self.keys, [holder << 32, (holder + 1) << 32])
+        targets = (self.keys[lo:hi] & 0xFFFFFFFF).tolist()
+        return dict(zip(targets, self.values[lo:hi].tolist()))
+
+    def set_row(self, holder: int, opinions: Dict[int, int]):
+        for target, value in opinions.items():
+            self.set(holder, target, value)
+
+    def _top(self, targets, values, k: int, rivals: bool) -> List[Tuple[int, int]]:
+        if rivals:
+            picked = np.flatnonzero(values < 0)
+            order = picked[np.argsort(values[picked], kind="stable")[:k]]
+        else:
+            picked = np.flatnonzero(values > 0)
+            order = picked[np.argsort(-values[picked].astype(np.int16), kind="stable")[:k]]
+        return list(zip(targets[order].tolist(), values[order].tolist()))
+
+    def top(self, holder: int, k: int = 5, rivals: bool = False) -> List[Tuple[int, int]]:
+        """holder's k favourite (or, with rivals, most hated) characters as (id, opinion)."""
+        self.flush()
+        lo, hi = np.searchsorted(self.keys, [holder << 32, (holder + 1) << 32])
+        return self._top(self.keys[lo:hi] & 0xFFFFFFFF, self.values[lo:hi], k, rivals)
+
+    def top_toward(self, target: int, k: int = 5, rivals: bool = False) -> List[Tuple[int, int]]:
+        """The k characters who like (or, with rivals, hate) target most, as (id, opinion)."""
+        self.flush()
+        column = np.flatnonzero((self.keys & 0xFFFFFFFF) == target)
+        return self._top(self.keys[column] >> 32, self.values[column], k, rivals)
+
+    def clear(self):
+        self.keys = np.zeros(0, dtype=np.int64)
+        self.values = np.zeros(0, dtype=np.int8)
+        self.pending = {}
+
+class DictOpinionStore:
+    """Dict-of-dicts fallback with the same interface as OpinionStore."""
+
+    def __init__(self):
+        self.rows: Dict[int, Dict[int, int]] = {}
+
+    def __len__(self) -> int:
+        return sum(len(row) for row in self.rows.values())
+
+    def get(self, holder: int, target: int) -> int:
+        row = self.rows.get(holder)
+        return row.get(target, 0) if row else 0
+
+    def set(self, holder: int, target: int, value: int):
+        value = _clamp(value)
+        if value:
+            self.rows.setdefault(holder, {})[target] = value
+        else:
+            row = self.rows.get(holder)
+            if row:
+                row.pop(target, None)
+                if not row:
+                    del self.rows[holder]
+
+    def add(self, holder: int, target: int, change: int) -> int:
+        value = _clamp(self.get(holder, target) + change)
+        self.set(holder, target, value)
+        return value
+
+    def flush(self):
+        pass
+
+    def add_toward(self, target: int, holders: Iterable[int], change: int):
+        for holder in set(holders):
+            self.add(holder, target, change)
+
+    def decay(self, step: int = 1) -> List[int]:
+        holders = list(self.rows)
+        for holder in holders:
+            row = self.rows[holder]
+            for target, value in list(row.items()):
+                value -= max(-step, min(step, value))
+                if value:
+                    row[target] = value
+                else:
+                    del row[target]
+            if not row:
+                del self.rows[holder]
+        return holders
+
+    def row(self, holder: int) -> Dict[int, int]:
+        return dict(self.rows.get(holder, {}))
+
+    def set_row(self, holder: int, opinions: Dict[int, int]):
+        for target, value in opinions.items():
+            self.set(holder, target, value)
+
+    def _top(self, pairs, k: int, rivals: bool) -> List[Tuple[int, int]]:
+        if rivals:
+            return heapq.nsmallest(k, ((c, v) for c, v in pairs if v < 0), key=lambda p: p[1])
+        return heapq.nlargest(k, ((c, v) for c, v in pairs if v > 0), key=lambda p: p[1])
+
+    def top(self, holder: int, k: int = 5, rivals: bool = False) -> List[Tuple[int, int]]:
+        return self._top(self.rows.get(holder, {}).items(), k, rivals)
+
+    def top_toward(self, target: int, k: int = 5, rivals: bool = False) -> List[Tuple[int, int]]:
+        pairs = ((holder, row[target]) for holder, row in self.rows.items() if target in row)
+        return self._top(pairs, k, rivals)
+
+    def clear(self):
+        self.rows = {}
@@ -0,0 +1,209 @@
+"""Routes across the region graph, and journeys that follow them a leg at a time.
+
+Crossing a border takes the months of the rougher of its two regions'
+terrains (TERRAIN_COST), so a border is as slow in both directions.
+Router.route finds the quickest route with A* using ALT heuristics: a few
+landmark regions, spread out by farthest-point selection, with their
+travel times to every region. By the triangle inequality,
+|d(L, target) - d(L, v)| never overestimates the time from v to the
+target. That steers the search straight at the target where plain
+Dijkstra would search a disc around the start.
+
+Routes are kept in a bounded LRU cache. Landmarks, components and the
+cache are dropped whenever WorldManager.graph is replaced, which happens
+whenever the map changes. Travellers heading for the same place share the
+search.
+"""
+from collections import OrderedDict
+from dataclasses import dataclass
+from operator import sub
+from typing import Dict, List, Optional, Tuple
+import heapq
+from .ids import export_id, intern_id
+from .models import Terrain
+
+# Months to cross into or out of a region of each terrain
+TERRAIN_COST = {
+    Terrain.PLAINS: 1,
+    Terrain.COASTAL: 1,
+    Terrain.DESERT: 2,
+    Terrain.HILLS: 2,
+    Terrain.MOUNTAINS: 3,
+}
+
+LANDMARK_COUNT = 8
+ROUTE_CACHE_SIZE = 4096
+UNREACHABLE = 1 << 40  # Distance to a region on another island
+
+@dataclass
+class Route:
+    regions: List[int]  # Region ids, start first
+    cost: int  # Months from start to end
+
+    @property
+    def legs(self) -> int:
+        return len(self.regions) - 1
+
+@dataclass
+class Journey:
+    """A character on the road: the regions still ahead and the month the next one is reached."""
+    route: List[int]
+    next_month: int
+    arrival_month: int
+
+    def to_dict(self) -> Dict:
+        return {"route": [export_id(r) for r in self.route], "next_month": self.next_month,
+                "arrival_month": self.arrival_month}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'Journey':
+        return cls([intern_id(r) for r in data["route"]], data["next_month"], data["arrival_month"])
+
+class Router:
+    """Quickest routes over WorldManager.graph, cached."""
+
+    def __init__(self, engine, cache_size: int = ROUTE_CACHE_SIZE, landmarks: int = LANDMARK_COUNT):
+        self.engine = engine
+        self.cache_size = cache_size
+        self.landmark_count = landmarks
+        self._graph = None
+        self.hits = 0
+        self.misses = 0
+
+    def invalidate(self):
+        """Forget everything derived from the map (terrain changes do not replace the graph)."""
+        self._graph = None
+
+    def _sync(self):
+        graph = self.engine.world_manager.graph
+        if graph is self._graph:
+            return graph
+        self._graph = graph
+        regions = self.engine.regions
+        self._terrain = [TERRAIN_COST[regions[region_id].terrain] for region_id in graph.ids]
+        self._cache: 'OrderedDict[Tuple[int, int], Optional[Tuple[List[int], int]]]' = OrderedDict()
+        self._landmarks: Optional[List[Tuple[int, ...]]] = None  # region index -> distance to each landmark
+        self._component = self._components(graph)
+        return graph
+
+    def _components(self, graph) -> List[int]:
+        component = [-1] * len(graph)
+        offsets, targets = graph.offsets, graph.targets
+        for start in range(len(graph)):
+            if component[start] >= 0:
+                continue
+            component[start] = start
+            stack = [start]
+            while stack:
+                u = stack.pop()
+                for k in range(offsets[u], offsets[u + 1]):
+                    v = targets[k]
+                    if component[v] < 0:
+                        component[v] = start
+                        stack.append(v)
+        return component
+
+    def _dijkstra(self, source: int) -> List[int]:
+        """Travel time from source to every region (UNREACHABLE on other islands)."""
+        graph, terrain = self._graph, self._terrain
+        offsets, targets = graph.offsets, graph.targets
+        dist = [UNREACHABLE] * len(graph)
+        dist[source] = 0
+        heap = [(0, source)]
+        while heap:
+            d, u = heapq.heappop(heap)
+            if d > dist[u]:
+                continue
+            cost_u = terrain[u]
+            for k in range(offsets[u], offsets[u + 1]):
+                v = targets[k]
+                nd = d + max(cost_u, terrain[v])
+                if nd < dist[v]:
+                    dist[v] = nd
+                    heapq.heappush(heap, (nd, v))
+        return dist
+
+    def _ensure_landmarks(self) -> List[Tuple[int, ...]]:
+        """Farthest-point landmarks: each next one is the region farthest from all chosen so far."""
+        if self._landmarks is None:
+            n = len(self._graph)
+            columns: List[List[int]] = []
+            nearest = self._dijkstra(0) if n else []
+            for _ in range(min(self.landmark_count, n)):
+                # Regions on another island are the farthest of all
+                landmark = max(range(n), key=nearest.__getitem__)
+                if nearest[landmark] == 0 and columns:
+                    break  # Every region is a landmark already
+                dist = self._dijkstra(landmark)
+                columns.append(dist)
+                nearest = list(map(min, nearest, dist)) if len(columns) > 1 else dist
+            # One row per region, so a heuristic is a single pass over a tuple
+            self._landmarks = list(zip(*columns)) if columns else [()] * n
+        return self._landmarks
+
+    def route(self, start_id: int, end_id: int) -> Optional[Route]:
+        """The quickest route from one region to another, or None if there is none."""
+        graph = self._sync()
+        try:
+            start, end = graph.index_of(start_id), graph.index_of(end_id)
+        except KeyError:
+            return None
+        key = (start, end)
+        cache = self._cache
+        if key in cache:
+            self.hits += 1
+            cache.move_to_end(key)
+            found = cache[key]
+        else:
+            self.misses += 1
+            found = self._search(start, end) if self._component[start] == self._component[end] else None
+            cache[key] = found
+            if len(cache) > self.cache_size:
+                cache.popitem(last=False)
+        if found is None:
+            return None
+        path, cost = found
+        ids = graph.ids
+        return Route([ids[i] for i in path], cost)
+
+    def _search(self, start: int, end: int) -> Optional[Tuple[List[int], int]]:
+        graph, terrain = self._graph, self._terrain
+        offsets, targets = graph.offsets, graph.targets
+        # A landmark on another island is UNREACHABLE from both v and the
+        # target, so its bound is zero; landmarks that reach the target bound d(v, target)
+        rows = self._ensure_landmarks()
+        to_end = rows[end]
+
+        def h(v: int) -> int:
+            return max(map(abs, map(sub, rows[v], to_end)), default=0)
+
+        g = {start: 0}
+        parent = {start: -1}
+        # Ties in f go to the entry farthest along, which cuts expansions on a map of whole months
+        heap = [(h(start), 0, start)]
+        while heap:
+            _, d, u = heapq.heappop(heap)
+            d = -d
+            if u == end:
+                path = [u]
+                while parent[u] >= 0:
+                    u = parent[u]
+                    path.append(u)
+                path.reverse()
+                return path, d
+            if d > g[u]:
+                continue
+            cost_u = terrain[u]
+            for k in range(offsets[u], offsets[u + 1]):
+                v = targets[k]
+                nd = d + max(cost_u, terrain[v])
+                if nd < g.get(v, UNREACHABLE):
+                    g[v] = nd
+                    parent[v] = u
+                    heapq.heappush(heap, (nd + h(v), -nd, v))
+        return None
+
+    def leg_cost(self, from_id: int, to_id: int) -> int:
+        """Months to cross from one region into a neighbouring one."""
+        regions = self.engine.regions
+        return max(TERRAIN_COST[regions[from_id].terrain], TERRAIN_COST[regions[to_id].terrain])
@@ -0,0 +1,119 @@
+"""Optional structure-of-arrays store for the hot numeric character fields.
+
+When enabled, each character's age, alive flag, health, wealth and stats live
+in NumPy arrays indexed by a dense slot, and the Character object becomes a
+view over its slot. Aging and mortality then run as one vectorized pass.
+Requires numpy (``pip install numpy``).
+"""
+from typing import Dict, List, Optional
+from .models import Character
+from .mortality import MORTALITY_AGE, MORTALITY_PER_YEAR
+import random
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional
+    np = None
+
+# Field -> (dtype, Python type handed back to callers)
+STORED_FIELDS = {
+    "age": ("int32", int),
+    "is_alive": ("bool", bool),
+    "health": ("float64", float),
+    "wealth": ("int64", int),
+    "martial": ("int16", int),
+    "diplomacy": ("int16", int),
+    "stewardship": ("int16", int),
+    "intrigue": ("int16", int),
+    "learning": ("int16", int),
+}
+
+def numpy_available() -> bool:
+    return np is not None
+
+def _stored_property(name: str, cast):
+    def fget(self):
+        return cast(self._store.arrays[name][self._slot])
+
+    def fset(self, value):
+        self._store.arrays[name][self._slot] = value
+
+    return property(fget, fset)
+
+class StoredCharacter(Character):
+    """A Character whose numeric fields are read from and written to a PopulationStore."""
+    __slots__ = ()
+    # Health and wealth now live in the arrays, so their slots hold the way back to them
+    _store = Character.__dict__["health"]
+    _slot = Character.__dict__["wealth"]
+
+for _name, (_dtype, _cast) in STORED_FIELDS.items():
+    setattr(StoredCharacter, _name, _stored_property(_name, _cast))
+
+class PopulationStore:
+    def __init__(self, capacity: int = 1024, seed: Optional[int] = None, rng=None):
+        if np is None:
+            raise ImportError("The population store requires numpy (pip install numpy)")
+        self.arrays: Dict[str, "np.ndarray"] = {
+            name: np.zeros(capacity, dtype=dtype) for name, (dtype, _) in STORED_FIELDS.items()
+        }
+        self.ids: List[int] = []  # slot -> character id
+        self.count = 0
+        if rng is None:
+            rng = np.random.default_rng(seed if seed is not None else random.getrandbits(64))
+        self.rng = rng
+
+    def _grow(self, minimum: int):
+        capacity = len(self.arrays["age"])
+        while capacity < minimum:
+            capacity *= 2
+        for name, array in self.arrays.items():
+            grown = np.zeros(capacity, dtype=array.dtype)
+            grown[:self.count] = array[:self.count]
+            self.arrays[name] = grown
+
+    def attach(self, char: Character):
+        """Move a character's numeric fields into the store and turn it into a view.
+
+        A character already viewing another store (after a repeated
+        enable_population_store) is copied out of that one.
+        """
+        if isinstance(char, StoredCharacter) and char._store is self:
+            return
+        if self.count >= len(self.arrays["age"]):
+            self._grow(self.count + 1)
+        slot = self.count
+        for name in STORED_FIELDS:
+            self.arrays[name][slot] = getattr(char, name)
+        char.__class__ = StoredCharacter
+        char._store = self
+        char._slot = slot
+        self.ids.append(char.id)
+        self.count += 1
+
+    def sync(self, characters: Dict[int, Character]):
+        """Attach characters that were added without going through the engine."""
+        if self.count < len(characters):
+            for char in characters.values():
+                self.attach(char)
+
+    def age_all(self):
+        """January birthday for every living character."""
+        n = self.count
+        age = self.arrays["age"][:n]
+        np.add(age, 1, out=age, where=self.arrays["is_alive"][:n])
+
+    def age_and_mortality(self, new_year: bool) -> List[int]:
+        """Age everyone on a new year, roll natural mortality and return the ids of those who die."""
+        if new_year:
+            self.age_all()
+        n = self.count
+        alive = self.arrays["is_alive"][:n]
+        age = self.arrays["age"][:n]
+
+        at_risk = np.flatnonzero(alive & (age > MORTALITY_AGE))
+        if len(at_risk) == 0:
+            return []
+        chance = (age[at_risk] - MORTALITY_AGE) * MORTALITY_PER_YEAR
+        dying = at_risk[self.rng.random(len(at_risk)) < chance]
+        return [self.ids[slot] for slot in dying]
@@ -0,0 +1,220 @@
+"""Indexes behind the relationships screen, so it can page through thousands of characters.
+
+Living characters are indexed by dynasty, by location and by name (a sorted
+list, so a name prefix is a bisect). Spouse candidates come from the
+eligible-spouse index in matchmaking.py.
+
+RelationView combines these into one filtered listing that is read a page
+at a time. Its candidates come from the most selective index among its
+filters; the other filters are checked per candidate. A page therefore
+costs O(page size) plus whatever those checks reject.
+"""
+from bisect import bisect_left, insort
+from itertools import chain, islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+PAGE_SIZE = 20
+
+# Opinion bands of the relationships screen, highest first: (label, lowest opinion)
+OPINION_BANDS = (
+    ("Allied", 50),
+    ("Friendly", 10),
+    ("Neutral", -9),
+    ("Unfriendly", -49),
+    ("Hostile", -100),
+)
+
+# Filters on who the character is to the viewer
+RELATIONS = ("known", "family", "spouse", "polity", "all")
+
+def opinion_band(opinion: int) -> str:
+    return next(label for label, lowest in OPINION_BANDS if opinion >= lowest)
+
+def _band_range(label: str) -> Tuple[int, int]:
+    for i, (name, lowest) in enumerate(OPINION_BANDS):
+        if name == label:
+            return lowest, OPINION_BANDS[i - 1][1] - 1 if i else 100
+    raise ValueError(f"Unknown opinion band: {label}")
+
+class RelationIndex:
+    """Living characters by dynasty, location and name.
+
+    Built on first use, then kept current by the engine: add() for a new
+    character, update() after a death or move, and invalidate() when the
+    world is replaced.
+    """
+
+    def __init__(self, engine):
+        self.engine = engine
+        self._built = False
+
+    def invalidate(self):
+        self._built = False
+
+    def rebuild(self):
+        self._names: List[Tuple[str, int]] = []  # (casefolded name, id), sorted
+        self._by_dynasty: Dict[int, Dict[int, None]] = {}
+        self._by_location: Dict[int, Dict[int, None]] = {}
+        self._entries: Dict[int, Tuple] = {}  # id -> (name key, dynasty, location) as indexed
+        self._built = True
+        for char in self.engine.characters.values():
+            self._add(char, keep_sorted=False)
+        self._names.sort()
+
+    def _ensure(self):
+        if not self._built:
+            self.rebuild()
+
+    def _add(self, char, keep_sorted: bool = True):
+        if not char.is_alive:
+            return
+        key = (char.name.casefold(), char.id)
+        if keep_sorted:
+            insort(self._names, key)
+        else:
+            self._names.append(key)
+        if char.dynasty_id:
+            self._by_dynasty.setdefault(char.dynasty_id, {})[char.id] = None
+        if char.location_id:
+            self._by_location.setdefault(char.location_id, {})[char.id] = None
+        self._entries[char.id] = (key, char.dynasty_id, char.location_id)
+
+    def _remove(self, char_id: int):
+        entry = self._entries.pop(char_id, None)
+        if entry is None:
+            return
+        key, dynasty_id, location_id = entry
+        del self._names[bisect_left(self._names, key)]
+        for index, bucket in ((self._by_dynasty, dynasty_id), (self._by_location, location_id)):
+            ids = index.get(bucket)
+            if ids is not None:
+                ids.pop(char_id, None)
+                if not ids:
+                    del index[bucket]
+
+    def add(self, char_id: int):
+        if self._built:
+            self._add(self.engine.characters[char_id])
+
+    def update(self, char_id: int):
+        """Re-index one character after a death or move."""
+        if not self._built:
+            return
+        self._remove(char_id)
+        char = self.engine.characters.get(char_id)
+        if char is not None:
+            self._add(char)
+
+    def named(self, prefix: str = "") -> Iterator[int]:
+        """Living characters whose name starts with prefix (case-insensitive), alphabetically."""
+        self._ensure()
+        prefix = prefix.casefold()
+        names = self._names
+        i = bisect_left(names, (prefix,))
+        while i < len(names) and names[i][0].startswith(prefix):
+            yield names[i][1]
+            i += 1
+
+    def dynasty_members(self, dynasty_id: int) -> Iterable[int]:
+        self._ensure()
+        return self._by_dynasty.get(dynasty_id, {}).keys()
+
+    def located_in(self, region_id: int) -> Iterable[int]:
+        self._ensure()
+        return self._by_location.get(region_id, {}).keys()
+
+    def polity_members(self, polity_id: int) -> Iterator[int]:
+        """Living characters in the regions the polity owns."""
+        regions = [r.id for r in self.engine.regions.values() if r.owner_polity_id == polity_id]
+        return chain.from_iterable(self.located_in(region_id) for region_id in regions)
+
+class RelationView:
+    """One filtered listing of characters as seen by char_id, read a page at a time.
+
+    relation is one of RELATIONS ("known" is the curated get_relationships
+    list), band one of the OPINION_BANDS labels. Pages are produced lazily
+    and kept, so paging back is free; make a new view after the world
+    changes.
+    """
+
+    def __init__(self, engine, char_id: int, relation: str = "known", dynasty_id: Optional[int] = None,
+                 band: Optional[str] = None, prefix: str = "", page_size: int = PAGE_SIZE):
+        if relation not in RELATIONS:
+            raise ValueError(f"Unknown relation: {relation}")
+        self.engine = engine
+        self.char_id = char_id
+        self.page_size = page_size
+        index = engine.relations
+        checks: List[Callable[[int], bool]] = []
+        sources: List[Iterable[int]] = []
+        if relation == "known":
+            sources.append(engine.get_relationships(char_id))
+        elif relation == "family":
+            sources.append(self._family())
+        if band is not None:
+            low, high = _band_range(band)
+            checks.append(lambda cid: low <= engine.get_opinion(char_id, cid) <= high)
+            if low > 0 or high < 0:  # Only stored opinions can be outside the neutral band
+                row = engine.opinions.row(char_id)
+                sources.append(sorted((cid for cid, value in row.items() if low <= value <= high),
+                                      key=lambda cid: -row[cid]))
+        if dynasty_id is not None:
+            members = index.dynasty_members(dynasty_id)
+            sources.append(members)
+            checks.append(members.__contains__)
+        if relation == "spouse":
+            candidates = engine.matchmaker.spouse_candidates(char_id)
+            sources.append(candidates)
+            checks.append(candidates.__contains__)
+        elif relation == "polity":
+            polity_id = self._polity_id()
+            sources.append(index.polity_members(polity_id) if polity_id is not None else ())
+            checks.append(lambda cid: polity_id is not None and self._in_polity(cid, polity_id))
+        if prefix:
+            folded = prefix.casefold()
+            sources.append(index.named(prefix))
+            checks.append(lambda cid: engine.characters[cid].name.casefold().startswith(folded))
+        if not sources:
+            sources.append(index.named())
+        # The first source is the most selective; the remaining checks filter it
+        self._candidates = (cid for cid in sources[0] if cid != char_id and all(check(cid) for check in checks))
+        self._pages: List[List[int]] = []
+        self._exhausted = False
+
+    def _family(self) -> List[int]:
+        engine = self.engine
+        char = engine.characters[self.char_id]
+        ids = [char.spouse_id, char.father_id, char.mother_id]
+        ids += engine.lineage.get_children(self.char_id) + engine.lineage.get_siblings(self.char_id)
+        family = {}
+        for cid in ids:
+            other = engine.characters.get(cid)
+            if other is not None and other.is_alive:
+                family[cid] = None
+        return list(family)
+
+    def _polity_id(self) -> Optional[int]:
+        """The polity char rules, or else the owner of where they are."""
+        engine = self.engine
+        ruled = engine.titles.polities_of(self.char_id)
+        if ruled:
+            return ruled[0]
+        region = engine.regions.get(engine.characters[self.char_id].location_id)
+        return region.owner_polity_id if region is not None else None
+
+    def _in_polity(self, char_id: int, polity_id: int) -> bool:
+        region = self.engine.regions.get(self.engine.characters[char_id].location_id)
+        return region is not None and region.owner_polity_id == polity_id
+
+    def page(self, number: int) -> List[int]:
+        """Character ids on page `number` (from 0); empty past the end."""
+        while len(self._pages) <= number and not self._exhausted:
+            page = list(islice(self._candidates, self.page_size))
+            if page:
+                self._pages.append(page)
+            if len(page) < self.page_size:
+                self._exhausted = True
+        return self._pages[number] if number < len(self._pages) else []
+
+    def has_page(self, number: int) -> bool:
+        return bool(self.page(number))
@@ -0,0 +1,400 @@
+"""Compact binary save format.
+
+Layout: ``MAGIC`` + format version (u16) + codec id (u8), followed by a
+(optionally compressed) stream of length-prefixed records:
+
+- STRING records build the string table as the file goes: the first time an
+  id or name is used it is defined, after that records refer to it by index.
+- META holds small global state as JSON (date, player, log tail).
+- One section per entity type (characters, dynasties, polities, regions,
+  death schedule), each a run of fixed-width numeric fields plus string
+  references and counted lists.
+
+Both writing and reading stream through a small buffer, so apart from the
+entities themselves and the string table no extra copy of the world is
+ever held in memory. The gzip-JSON saves written by earlier versions are
+detected by their magic bytes and still load.
+"""
+from typing import Dict, Optional
+from .models import Character, Dynasty, Polity, Region
+from .ids import intern_id, export_id
+import json
+import struct
+import zlib
+
+try:
+    import zstandard
+except ImportError:  # Optional fast codec
+    zstandard = None
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:  # Optional fast codec
+    lz4_frame = None
+
+MAGIC = b"AETB"
+GZIP_MAGIC = b"\x1f\x8b"
+FORMAT_VERSION = 1
+
+CODECS = {"none": 0, "zlib": 1, "zstd": 2, "lz4": 3}
+
+TAG_STRING = 0x01
+TAG_META = 0x02
+TAG_SECTION = 0x03
+TAG_END = 0x04
+TAG_CHARACTER = 0x10
+TAG_DYNASTY = 0x11
+TAG_POLITY = 0x12
+TAG_REGION = 0x13
+TAG_SCHEDULE = 0x14
+
+NO_REF = 0xFFFFFFFF
+NO_MONTH = -(1 << 63)  # Schedule entry meaning "not scheduled" (used by delta segments)
+CHUNK_SIZE = 1 << 16
+
+_HEADER = struct.Struct("<4sHB")
+_RECORD = struct.Struct("<BI")  # tag, body length
+_U32 = struct.Struct("<I")
+_REF_COUNT = struct.Struct("<I")
+_CHARACTER = struct.Struct("<iB5hddq9I")  # age, flags, 5 stats, health, stress, wealth, 9 refs
+_DYNASTY = struct.Struct("<2Iq")  # id, name, prestige
+_POLITY = struct.Struct("<6Iqqq")  # id, name, government, ruler, capital, law count, term end, legitimacy, prestige
+_REGION = struct.Struct("<4Iqq")  # id, name, terrain, owner, population, wealth
+_OPINION = struct.Struct("<Ih")
+_BUILDING = struct.Struct("<Iq")
+_SCHEDULE = struct.Struct("<Iq")
+
+_STATS = ("martial", "diplomacy", "stewardship", "intrigue", "learning")
+
+def available_codecs():
+    codecs = ["none", "zlib"]
+    if zstandard is not None:
+        codecs.append("zstd")
+    if lz4_frame is not None:
+        codecs.append("lz4")
+    return codecs
+
+def detect_format(filename: str) -> Optional[str]:
+    """'binary', 'json' (legacy gzip-JSON) or None if unrecognized."""
+    with open(filename, "rb") as f:
+        head = f.read(len(MAGIC))
+    if head == MAGIC:
+        return "binary"
+    if head.startswith(GZIP_MAGIC):
+        return "json"
+    return None
+
+class _Passthrough:
+    def compress(self, data):
+        return data
+
+    def decompress(self, data):
+        return data
+
+    def flush(self):
+        return b""
+
+class _Lz4Compressor:
+    def __init__(self):
+        self._ctx = lz4_frame.LZ4FrameCompressor()
+        self._started = False
+
+    def compress(self, data):
+        prefix = b""
+        if not self._started:
+            prefix = self._ctx.begin()
+            self._started = True
+        return prefix + self._ctx.compress(data)
+
+    def flush(self):
+        prefix = b"" if self._started else self._ctx.begin()
+        return prefix + self._ctx.flush()
+
+def _compressor(codec: str):
+    if codec == "none":
+        return _Passthrough()
+    if codec == "zlib":
+        return zlib.compressobj(1)
+    if codec == "zstd" and zstandard is not None:
+        return zstandard.ZstdCompressor(level=1).compressobj()
+    if codec == "lz4" and lz4_frame is not None:
+        return _Lz4Compressor()
+    raise ValueError(f"Compression codec '{codec}' is not available")
+
+def _decompressor(codec_id: int):
+    if codec_id == CODECS["none"]:
+        return _Passthrough()
+    if codec_id == CODECS["zlib"]:
+        return zlib.decompressobj()
+    if codec_id == CODECS["zstd"] and zstandard is not None:
+        return zstandard.ZstdDecompressor().decompressobj()
+    if codec_id == CODECS["lz4"] and lz4_frame is not None:
+        return lz4_frame.LZ4FrameDecompressor()
+    raise ValueError(f"Save uses compression codec {codec_id}, which is not installed")
+
+class SaveWriter:
+    def __init__(self, f, codec: str = "zlib"):
+        self.f = f
+        self.strings: Dict[str, int] = {}
+        self.buffer = bytearray()
+        self.compressor = _compressor(codec)
+        f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, CODECS[codec]))
+
+    def ref(self, value: Optional[str]) -> int:
+        """String table index for value, defining it in the stream on first use."""
+        if value is None:
+            return NO_REF
+        index = self.strings.get(value)
+        if index is None:
+            index = len(self.strings)
+            self.strings[value] = index
+            self._record(TAG_STRING, str(value).encode("utf-8"))
+        return index
+
+    def _refs(self, values) -> bytes:
+        return _REF_COUNT.pack(len(values)) + b"".join(_U32.pack(self.ref(v)) for v in values)
+
+    def _record(self, tag: int, body: bytes):
+        self.buffer += _RECORD.pack(tag, len(body))
+        self.buffer += body
+        if len(self.buffer) >= CHUNK_SIZE:
+            self._drain()
+
+    def _drain(self):
+        self.f.write(self.compressor.compress(bytes(self.buffer)))
+        self.buffer.clear()
+
+    def write_meta(self, meta: Dict):
+        self._record(TAG_META, json.dumps(meta).encode("utf-8"))
+
+    def begin_section(self, tag: int, count: int):
+        self._record(TAG_SECTION, struct.pack("<BI", tag, count))
+
+    def write_character(self, d: Dict):
+        refs = [self.ref(d[k]) for k in ("id", "name", "dynasty_id", "culture", "gender",
+                                         "father_id", "mother_id", "spouse_id", "location_id")]
+        body = _CHARACTER.pack(d["age"], 1 if d["is_alive"] else 0, *(d[s] for s in _STATS),
+                               d["health"], d["stress"], d["wealth"], *refs)
+        body += self._refs(d["children_ids"]) + self._refs(d["traits"])
+        opinions = d["opinions"]
+        body += _REF_COUNT.pack(len(opinions))
+        body += b"".join(_OPINION.pack(self.ref(k), v) for k, v in opinions.items())
+        self._record(TAG_CHARACTER, body)
+
+    def write_dynasty(self, d: Dict):
+        body = _DYNASTY.pack(self.ref(d["id"]), self.ref(d["name"]), d["prestige"])
+        body += self._refs(d["members"])
+        self._record(TAG_DYNASTY, body)
+
+    def write_polity(self, d: Dict):
+        laws = d["laws"]
+        body = _POLITY.pack(self.ref(d["id"]), self.ref(d["name"]), self.ref(d["government_type"]),
+                            self.ref(d["ruler_id"]), self.ref(d["capital_id"]), len(laws),
+                            d["term_end_date"], d["legitimacy"], d["prestige"])
+        body += b"".join(_U32.pack(self.ref(k)) + _U32.pack(self.ref(v)) for k, v in laws.items())
+        self._record(TAG_POLITY, body)
+
+    def write_region(self, d: Dict):
+        body = _REGION.pack(self.ref(d["id"]), self.ref(d["name"]), self.ref(d["terrain"]),
+                            self.ref(d["owner_polity_id"]), d["population"], d["wealth"])
+        body += self._refs(d["neighbors"])
+        buildings = d["buildings"]
+        body += _REF_COUNT.pack(len(buildings))
+        body += b"".join(_BUILDING.pack(self.ref(k), v) for k, v in buildings.items())
+        self._record(TAG_REGION, body)
+
+    def write_schedule(self, char_id: int, month: int):
+        self._record(TAG_SCHEDULE, _SCHEDULE.pack(self.ref(export_id(char_id)), month))
+
+    def close(self):
+        self._record(TAG_END, b"")
+        self._drain()
+        self.f.write(self.compressor.flush())
+
+class SaveReader:
+    def __init__(self, f):
+        self.f = f
+        magic, version, codec_id = _HEADER.unpack(f.read(_HEADER.size))
+        if magic != MAGIC:
+            raise ValueError("Not a binary save file")
+        if version > FORMAT_VERSION:
+            raise ValueError(f"Save format version {version} is newer than supported ({FORMAT_VERSION})")
+        self.version = version
+        self.decompressor = _decompressor(codec_id)
+        self.strings = []
+        self.buffer = bytearray()
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self, size: int):
+        while len(self.buffer) - self.pos < size:
+            if self.eof:
+                raise ValueError("Truncated save file")
+            chunk = self.f.read(CHUNK_SIZE)
+            if not chunk:
+                self.eof = True
+                tail = getattr(self.decompressor, "flush", lambda: b"")()
+                self.buffer += tail
+                continue
+            # Drop consumed bytes so the buffer stays small
+            del self.buffer[:self.pos]
+            self.pos = 0
+            self.buffer += self.decompressor.decompress(chunk)
+
+    def _take(self, size: int) -> bytes:
+        self._fill(size)
+        data = bytes(self.buffer[self.pos:self.pos + size])
+        self.pos += size
+        return data
+
+    def records(self):
+        """Yield (tag, body) for each non-string record; STRING records feed the table."""
+        while True:
+            tag, length = _RECORD.unpack(self._take(_RECORD.size))
+            body = self._take(length)
+            if tag == TAG_STRING:
+                self.strings.append(body.decode("utf-8"))
+            elif tag == TAG_END:
+                return
+            else:
+                yield tag, body
+
+    def _str(self, index: int) -> Optional[str]:
+        return None if index == NO_REF else self.strings[index]
+
+    def _list(self, body: bytes, offset: int):
+        (count,) = _REF_COUNT.unpack_from(body, offset)
+        offset += _REF_COUNT.size
+        items = [self.strings[i] for i in struct.unpack_from(f"<{count}I", body, offset)]
+        return items, offset + 4 * count
+
+    def read_character(self, body: bytes) -> Dict:
+        fields = _CHARACTER.unpack_from(body)
+        age, flags = fields[0], fields[1]
+        stats = fields[2:7]
+        health, stress, wealth = fields[7:10]
+        refs = [self._str(i) for i in fields[10:]]
+        offset = _CHARACTER.size
+        children, offset = self._list(body, offset)
+        traits, offset = self._list(body, offset)
+        (count,) = _REF_COUNT.unpack_from(body, offset)
+        offset += _REF_COUNT.size
+        opinions = {}
+        for _ in range(count):
+            key, value = _OPINION.unpack_from(body, offset)
+            opinions[self.strings[key]] = value
+            offset += _OPINION.size
+        d = dict(zip(("id", "name", "dynasty_id", "culture", "gender",
+                      "father_id", "mother_id", "spouse_id", "location_id"), refs))
+        d.update(zip(_STATS, stats))
+        d.update(age=age, is_alive=bool(flags & 1), health=health, stress=stress, wealth=wealth,
+                 children_ids=children, traits=traits, opinions=opinions)
+        return d
+
+    def read_dynasty(self, body: bytes) -> Dict:
+        id_ref, name_ref, prestige = _DYNASTY.unpack_from(body)
+        members, _ = self._list(body, _DYNASTY.size)
+        return {"id": self._str(id_ref), "name": self._str(name_ref), "prestige": prestige, "members": members}
+
+    def read_polity(self, body: bytes) -> Dict:
+        fields = _POLITY.unpack_from(body)
+        id_ref, name_ref, gov_ref, ruler_ref, capital_ref, law_count = fields[:6]
+        laws = {}
+        offset = _POLITY.size
+        for _ in range(law_count):
+            key, value = struct.unpack_from("<2I", body, offset)
+            laws[self.strings[key]] = self.strings[value]
+            offset += 8
+        return {"id": self._str(id_ref), "name": self._str(name_ref), "government_type": self._str(gov_ref),
+                "ruler_id": self._str(ruler_ref), "capital_id": self._str(capital_ref), "laws": laws,
+                "term_end_date": fields[6], "legitimacy": fields[7], "prestige": fields[8]}
+
+    def read_region(self, body: bytes) -> Dict:
+        id_ref, name_ref, terrain_ref, owner_ref, population, wealth = _REGION.unpack_from(body)
+        neighbors, offset = self._list(body, _REGION.size)
+        (count,) = _REF_COUNT.unpack_from(body, offset)
+        offset += _REF_COUNT.size
+        buildings = {}
+        for _ in range(count):
+            key, value = _BUILDING.unpack_from(body, offset)
+            buildings[self.strings[key]] = value
+            offset += _BUILDING.size
+        return {"id": self._str(id_ref), "name": self._str(name_ref), "terrain": self._str(terrain_ref),
+                "owner_polity_id": self._str(owner_ref), "population": population, "wealth": wealth,
+                "neighbors": neighbors, "buildings": buildings}
+
+def write_stream(f, meta: Dict, characters, dynasties, polities, regions, schedule=None,
+                 codec: str = "zlib", opinions=None):
+    """Write one self-contained binary stream from sized collections of entities.
+
+    schedule, if given, is a sized collection of (char_id, month) pairs;
+    opinions, if given, is the OpinionStore characters' opinions are read from.
+    """
+    writer = SaveWriter(f, codec)
+    writer.write_meta(meta)
+    writer.begin_section(TAG_CHARACTER, len(characters))
+    for char in characters:
+        d = char.to_dict()
+        if opinions is not None:
+            d["opinions"] = {export_id(k): v for k, v in opinions.row(char.id).items()}
+        writer.write_character(d)
+    writer.begin_section(TAG_DYNASTY, len(dynasties))
+    for dynasty in dynasties:
+        writer.write_dynasty(dynasty.to_dict())
+    writer.begin_section(TAG_POLITY, len(polities))
+    for polity in polities:
+        writer.write_polity(polity.to_dict())
+    writer.begin_section(TAG_REGION, len(regions))
+    for region in regions:
+        writer.write_region(region.to_dict())
+    if schedule is not None:
+        writer.begin_section(TAG_SCHEDULE, len(schedule))
+        for char_id, month in schedule:
+            writer.write_schedule(char_id, month)
+    writer.close()
+
+def write_binary(engine, filename: str, meta: Dict, codec: str = "zlib"):
+    """Stream the engine's world into a binary save."""
+    schedule = engine.death_scheduler.due.items() if engine.death_scheduler is not None else None
+    with open(filename, "wb") as f:
+        write_stream(f, meta, engine.characters.values(), engine.dynasties.values(),
+                     engine.polities.values(), engine.regions.values(), schedule, codec, engine.opinions)
+
+def read_stream(f) -> Dict:
+    """Read one binary stream back into entity tables.
+
+    Returns the same shape as a legacy save's JSON document except that the
+    entity tables already hold model objects.
+    """
+    state = {"characters": {}, "dynasties": {}, "polities": {}, "regions": {}}
+    schedule = None
+    reader = SaveReader(f)
+    for tag, body in reader.records():
+        if tag == TAG_CHARACTER:
+            char = Character.from_dict(reader.read_character(body))
+            state["characters"][char.id] = char
+        elif tag == TAG_DYNASTY:
+            dynasty = Dynasty.from_dict(reader.read_dynasty(body))
+            state["dynasties"][dynasty.id] = dynasty
+        elif tag == TAG_POLITY:
+            polity = Polity.from_dict(reader.read_polity(body))
+            state["polities"][polity.id] = polity
+        elif tag == TAG_REGION:
+            region = Region.from_dict(reader.read_region(body))
+            state["regions"][region.id] = region
+        elif tag == TAG_SCHEDULE:
+            if schedule is None:
+                schedule = {}
+            char_ref, month = _SCHEDULE.unpack(body)
+            schedule[intern_id(reader.strings[char_ref])] = month
+        elif tag == TAG_META:
+            state.update(json.loads(body.decode("utf-8")))
+        # TAG_SECTION and unknown (newer) records are skipped
+    if schedule is not None:
+        state.setdefault("death_schedule", {})["due"] = schedule
+    return state
+
+def read_binary(filename: str) -> Dict:
+    """Stream a binary save back into entity tables."""
+    with open(filename, "rb") as f:
+        return read_stream(f)
@@ -0,0 +1,241 @@
+"""Headless simulation runner.
+
+Drives ``GameEngine.advance_month`` without the interactive dashboard so
+campaigns can be run in bulk for balance tuning:
+
+    python3 -m bloodlines.simulation --months 6000 --seeds 1-8 --workers 4
+"""
+from dataclasses import dataclass, field, replace
+from typing import Callable, Dict, List, Optional, Union
+from concurrent.futures import ProcessPoolExecutor
+from .engine import GameEngine
+from .events import Event
+from .logbook import LogLevel
+import argparse
+import hashlib
+import json
+import time
+
+# An event policy picks which option of a pending event to take.
+EventPolicy = Callable[[GameEngine, Event], int]
+
+def first_option_policy(engine: GameEngine, event: Event) -> int:
+    """Always take the first option."""
+    return 0
+
+def random_option_policy(engine: GameEngine, event: Event) -> int:
+    """Take a uniformly random option."""
+    return engine.rng.events.randrange(len(event.options))
+
+POLICIES: Dict[str, EventPolicy] = {
+    "first": first_option_policy,
+    "random": random_option_policy,
+}
+
+def register_policy(name: str, policy: EventPolicy):
+    """Make a policy available to the CLI and to batch runs by name.
+
+    Batch runs hand worker processes the policy itself, so it must be a
+    module-level function for the workers to unpickle it.
+    """
+    POLICIES[name] = policy
+
+@dataclass
+class SimulationConfig:
+    months: int = 120
+    seed: Optional[int] = None
+    load_path: Optional[str] = None
+    policy: Union[str, EventPolicy] = "first"  # A name in POLICIES, or the policy itself
+    checkpoint_every: int = 0  # Months between checkpoints (0 = never)
+    checkpoint_path: Optional[str] = None
+    # Per-kind log verbosity; batch runs skip per-building income chatter by default
+    log_levels: Dict[str, str] = field(default_factory=lambda: {"economy": "OFF"})
+    population_store: bool = False  # Vectorized NumPy aging/mortality
+    death_scheduler: bool = False  # Pre-drawn death months instead of monthly rolls
+    demography: bool = False  # Vectorized NumPy regional population and economy
+
+@dataclass
+class SimulationResult:
+    seed: Optional[int]
+    months_run: int
+    elapsed: float
+    events_resolved: int
+    stats: Dict = field(default_factory=dict)
+
+    @property
+    def months_per_sec(self) -> float:
+        return self.months_run / self.elapsed if self.elapsed > 0 else 0.0
+
+def collect_stats(engine: GameEngine) -> Dict:
+    """Summarize the end-of-run world state."""
+    living = sum(1 for c in engine.characters.values() if c.is_alive)
+    stats = {
+        "date": engine.get_date_string(),
+        "game_over": engine.game_over,
+        "characters": len(engine.characters),
+        "living": living,
+        "dynasties": len(engine.dynasties),
+        "polities": len(engine.polities),
+    }
+    player = engine.characters.get(engine.player_character_id)
+    if player:
+        stats["player"] = player.name
+        stats["player_age"] = player.age
+        stats["player_wealth"] = player.wealth
+    return stats
+
+def world_hash(engine: GameEngine) -> str:
+    """Digest of the world state, for checking that runs are reproducible.
+
+    Entity ids come from a process-wide counter, so they are replaced by
+    their rank: two identical worlds built one after the other hash equal.
+    """
+    tables = {
+        "characters": {k: engine._character_dict(v) for k, v in engine.characters.items()},
+        "dynasties": {k: v.to_dict() for k, v in engine.dynasties.items()},
+        "polities": {k: v.to_dict() for k, v in engine.polities.items()},
+        "regions": {k: v.to_dict() for k, v in engine.regions.items()},
+    }
+    rank = {str(k): f"#{i}" for i, k in enumerate(sorted(k for table in tables.values() for k in table))}
+
+    def canonical(value):
+        if isinstance(value, dict):
+            return {rank.get(str(k), k): canonical(v) for k, v in value.items()}
+        if isinstance(value, list):
+            return [canonical(v) for v in value]
+        if isinstance(value, str):
+            return rank.get(value, value)
+        return value
+
+    state = {"date": [engine.month, engine.year, engine.is_bc], "player": str(engine.player_character_id),
+             "tables": tables}
+    encoded = json.dumps(canonical(state), sort_keys=True).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+def run_simulation(config: SimulationConfig, policy: Optional[EventPolicy] = None) -> SimulationResult:
+    """Run one headless campaign.
+
+    ``policy`` overrides ``config.policy`` when given, which lets Python callers
+    plug in a callable without registering it.
+    """
+    if policy is None:
+        policy = POLICIES[config.policy] if isinstance(config.policy, str) else config.policy
+
+    engine = GameEngine(seed=config.seed)
+    for kind, level in config.log_levels.items():
+        engine.logbook.set_level(kind, LogLevel[level.upper()])
+    if config.load_path:
+        if not engine.load_game(config.load_path):
+            raise RuntimeError(f"Could not load {config.load_path}")
+        if config.seed is not None:
+            engine.rng.reseed(config.seed)  # The save's random state would give every seed the same run
+    else:
+        engine.create_test_scenario()
+    if config.population_store:
+        engine.enable_population_store()
+    if config.death_scheduler and engine.death_scheduler is None:
+        engine.enable_death_scheduler()
+    if config.demography and engine.demography is None:
+        engine.enable_demography()
+
+    checkpoint_path = config.checkpoint_path
+    if checkpoint_path and config.seed is not None:
+        checkpoint_path = f"{checkpoint_path}-seed{config.seed}"
+
+    events_resolved = 0
+    months_run = 0
+    start = time.perf_counter()
+    while months_run < config.months and not engine.game_over:
+        engine.advance_month()
+        months_run += 1
+
+        if engine.current_event:
+            engine.resolve_event(policy(engine, engine.current_event))
+            events_resolved += 1
+
+        if checkpoint_path and config.checkpoint_every and months_run % config.checkpoint_every == 0:
+            engine.save_game(checkpoint_path)
+    elapsed = time.perf_counter() - start
+
+    return SimulationResult(
+        seed=config.seed,
+        months_run=months_run,
+        elapsed=elapsed,
+        events_resolved=events_resolved,
+        stats=collect_stats(engine)
+    )
+
+def run_batch(configs: List[SimulationConfig], workers: int = 1) -> List[SimulationResult]:
+    """Run independent campaigns, spreading them over a process pool."""
+    if workers <= 1:
+        return [run_simulation(c) for c in configs]
+    # Workers started by spawn or forkserver only know the policies defined at
+    # import, so names are resolved here and the functions sent along
+    configs = [replace(c, policy=POLICIES[c.policy]) if isinstance(c.policy, str) else c for c in configs]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(run_simulation, configs))
+
+def _parse_seeds(spec: str) -> List[int]:
+    """Parse '7', '1,2,5' or '1-8' into a list of seeds."""
+    seeds = []
+    for part in spec.split(","):
+        if "-" in part:
+            lo, hi = part.split("-", 1)
+            seeds.extend(range(int(lo), int(hi) + 1))
+        elif part:
+            seeds.append(int(part))
+    return seeds
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Run Project Aeterna campaigns without the UI.")
+    parser.add_argument("--months", type=int, default=120, help="Months to simulate per run")
+    parser.add_argument("--seeds", default=None, help="Seed list, e.g. '7', '1,2,5' or '1-8'")
+    parser.add_argument("--load", default=None, help="Start from a save file instead of a new game")
+    parser.add_argument("--policy", default="first", choices=sorted(POLICIES), help="Event option policy")
+    parser.add_argument("--checkpoint-every", type=int, default=0, help="Save every K months")
+    parser.add_argument("--checkpoint", default=None, help="Checkpoint save file prefix")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes for multi-seed runs")
+    parser.add_argument("--numpy", action="store_true", help="Use the vectorized NumPy population store")
+    parser.add_argument("--death-scheduler", action="store_true", help="Schedule natural deaths up front")
+    parser.add_argument("--demography", action="store_true", help="Simulate regional population and economy")
+    parser.add_argument("--log-level", action="append", default=[], metavar="KIND=LEVEL",
+                        help="Log verbosity per kind, e.g. economy=off or opinion=warning")
+    args = parser.parse_args(argv)
+
+    log_levels = {"economy": "OFF"}
+    for spec in args.log_level:
+        kind, level = spec.split("=", 1)
+        log_levels[kind] = level
+
+    seeds = _parse_seeds(args.seeds) if args.seeds else [None]
+    configs = [SimulationConfig(
+        months=args.months,
+        seed=seed,
+        load_path=args.load,
+        policy=args.policy,
+        checkpoint_every=args.checkpoint_every,
+        checkpoint_path=args.checkpoint,
+        log_levels=log_levels,
+        population_store=args.numpy,
+        death_scheduler=args.death_scheduler,
+        demography=args.demography
+    ) for seed in seeds]
+
+    start = time.perf_counter()
+    results = run_batch(configs, workers=args.workers)
+    wall = time.perf_counter() - start
+
+    for result in results:
+        stats = result.stats
+        print(f"seed={result.seed} months={result.months_run} "
+              f"({result.months_per_sec:.0f} months/sec) events={result.events_resolved} "
+              f"date={stats['date']} living={stats['living']}/{stats['characters']} "
+              f"game_over={stats['game_over']}")
+
+    total_months = sum(r.months_run for r in results)
+    rate = total_months / wall if wall > 0 else 0.0
+    print(f"\n{len(results)} run(s), {total_months} months in {wall:.2f}s ({rate:.0f} months/sec overall)")
+    return results
+
+if __name__ == "__main__":
+    main()
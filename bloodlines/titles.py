@@ -0,0 +1,115 @@
+"""Ruler and heir lookups for character titles.
+
+TitleService keeps a reverse index from ruler to the polities they rule and
+a cached heir for each polity: the ruler's eldest living child, as in
+handle_player_succession. The engine keeps it current on births, deaths
+and ruler changes (set_ruler), so a title is a couple of dict lookups.
+Rulers assigned straight onto a Polity are picked up by a check of every
+polity's ruler_id once a month (or after invalidate()), as IncomeLedger
+does for its ruler totals.
+"""
+from typing import Dict, List, Optional
+
+class TitleService:
+    def __init__(self, engine):
+        self.engine = engine
+        self._checked = None  # (month index, polity count) of the last full check
+
+    def invalidate(self):
+        self._checked = None
+
+    def rebuild(self):
+        self._rulers: Dict[int, Optional[int]] = {}  # polity id -> ruler id, as indexed
+        self._ruled: Dict[int, List[int]] = {}  # ruler id -> polity ids
+        self._heirs: Dict[int, int] = {}  # polity id -> heir id
+        self._heir_of: Dict[int, List[int]] = {}  # heir id -> polity ids
+        for polity_id in self.engine.polities:
+            self._index(polity_id)
+
+    def refresh(self):
+        """Re-index any polity whose ruler changed without set_ruler; at most once a month."""
+        engine = self.engine
+        key = (engine.get_month_index(), len(engine.polities))
+        if key == self._checked:
+            return
+        if self._checked is None or len(self._rulers) != len(engine.polities):
+            self.rebuild()
+        else:
+            for polity_id, polity in engine.polities.items():
+                if self._rulers.get(polity_id) != polity.ruler_id:
+                    self.ruler_changed(polity_id)
+        self._checked = key
+
+    def _index(self, polity_id: int):
+        ruler_id = self.engine.polities[polity_id].ruler_id
+        self._rulers[polity_id] = ruler_id
+        if ruler_id is not None:
+            self._ruled.setdefault(ruler_id, []).append(polity_id)
+        self._set_heir(polity_id, self._eldest_living_child(ruler_id))
+
+    def _unindex(self, polity_id: int):
+        ruler_id = self._rulers.pop(polity_id, None)
+        _remove(self._ruled, ruler_id, polity_id)
+        self._set_heir(polity_id, None)
+
+    def _set_heir(self, polity_id: int, heir_id: Optional[int]):
+        old = self._heirs.pop(polity_id, None)
+        _remove(self._heir_of, old, polity_id)
+        if heir_id is not None:
+            self._heirs[polity_id] = heir_id
+            self._heir_of.setdefault(heir_id, []).append(polity_id)
+
+    def _eldest_living_child(self, char_id: Optional[int]) -> Optional[int]:
+        char = self.engine.characters.get(char_id)
+        if char is None:
+            return None
+        return next((cid for cid in char.children_ids if self.engine.characters[cid].is_alive), None)
+
+    def ruler_changed(self, polity_id: int):
+        if self._checked is None:
+            return  # Not built yet
+        self._unindex(polity_id)
+        if polity_id in self.engine.polities:
+            self._index(polity_id)
+
+    def on_birth(self, child_id: int):
+        """A ruler without a living heir has one now."""
+        if self._checked is None:
+            return
+        child = self.engine.characters[child_id]
+        for parent_id in (child.father_id, child.mother_id):
+            for polity_id in self._ruled.get(parent_id, ()):
+                if polity_id not in self._heirs:
+                    self._set_heir(polity_id, child_id)
+
+    def on_death(self, char_id: int):
+        """A dead heir passes the claim to the next living sibling."""
+        if self._checked is None:
+            return
+        for polity_id in list(self._heir_of.get(char_id, ())):
+            self._set_heir(polity_id, self._eldest_living_child(self._rulers[polity_id]))
+
+    def polities_of(self, char_id: int) -> List[int]:
+        """Polities char rules."""
+        self.refresh()
+        return self._ruled.get(char_id, [])
+
+    def heir(self, polity_id: int) -> Optional[int]:
+        self.refresh()
+        return self._heirs.get(polity_id)
+
+    def title_type(self, char_id: int) -> str:
+        """'ruler', 'heir' or 'noble'."""
+        self.refresh()
+        if char_id in self._ruled:
+            return "ruler"
+        if char_id in self._heir_of:
+            return "heir"
+        return "noble"
+
+def _remove(index: Dict[int, List[int]], key: Optional[int], polity_id: int):
+    ids = index.get(key)
+    if ids is not None:
+        ids.remove(polity_id)
+        if not ids:
+            del index[key]
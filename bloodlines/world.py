@@ -1,10 +1,27 @@
 from .models import Region, Terrain, Polity, GovernmentType
+from .battle import Army, BattleResult, COMMAND_BONUS, resolve_battle, win_probability
+from .pathfinding import Journey, Route, Router
+from .worldgen import RegionGraph, generate_map
 from typing import Dict, List, Optional
 import random
 
 class WorldManager:
     def __init__(self, engine):
         self.engine = engine
+        self._graph: Optional[RegionGraph] = None
+        self.router = Router(engine)
+        self.journeys: Dict[int, Journey] = {}  # char id -> journey under way
+
+    @property
+    def graph(self) -> RegionGraph:
+        """Adjacency of every region in CSR form, built from Region.neighbors on first use."""
+        if self._graph is None:
+            self._graph = RegionGraph.from_regions(self.engine.regions)
+        return self._graph
+
+    def invalidate_graph(self):
+        """Call after adding regions or changing Region.neighbors."""
+        self._graph = None
 
     def create_initial_map(self):
         """Creates the 753 BC map nodes."""
@@ -26,14 +43,41 @@ class WorldManager:
         judaea = self._create_region("Judaea", Terrain.HILLS, neighbors=[egypt.id])
         egypt.neighbors.append(judaea.id)
         
-        self.engine.log("World Map generated (Italy, Greece, Near East).")
+        self.engine.log("World Map generated (Italy, Greece, Near East).", kind="world")
+
+    def generate_map(self, count: int, seed: Optional[int] = None) -> List[Region]:
+        """Add count procedurally generated regions (see worldgen.generate_map).
+
+        The same seed gives the same map; without one the engine's "world"
+        random stream is used.
+        """
+        rng = random.Random(seed) if seed is not None else self.engine.rng.stream("world")
+        regions, graph = generate_map(count, rng)
+        ledger = self.engine.income_ledger
+        for region in regions:
+            self.engine.regions[region.id] = region
+            ledger.invalidate_region(region.id)
+        if self.engine.demography is not None:
+            self.engine.demography.add_regions(regions)
+        # The new regions' graph is the whole graph unless there were regions already
+        self._graph = graph if len(regions) == len(self.engine.regions) else None
+        self.engine.log("World Map generated ({} regions).", count, kind="world")
+        return regions
 
-    def _create_region(self, name: str, terrain: Terrain, neighbors: List[str]) -> Region:
+    def _create_region(self, name: str, terrain: Terrain, neighbors: List[int]) -> Region:
         region = Region(name=name, terrain=terrain, neighbors=neighbors)
         self.engine.regions[region.id] = region
+        self._graph = None
         return region
 
-    def move_character(self, char_id: str, target_region_id: str) -> bool:
+    def set_region_owner(self, region_id: int, polity_id: Optional[int]):
+        """Transfer a region to a polity (or None) and update cached income."""
+        self.engine.regions[region_id].owner_polity_id = polity_id
+        self.engine.income_ledger.invalidate_region(region_id)
+        if self.engine.demography is not None:
+            self.engine.demography.region_changed(region_id)
+
+    def move_character(self, char_id: int, target_region_id: int) -> bool:
         char = self.engine.characters.get(char_id)
         if not char:
             return False
@@ -42,33 +86,109 @@ class WorldManager:
         if not current_region_id:
             # If nowhere, just place them
             char.location_id = target_region_id
-            self.engine.log(f"{char.name} has arrived in {self.engine.regions[target_region_id].name}.")
+            self.engine.relations.update(char_id)
+            self.engine.log("{} has arrived in {}.", char.name, self.engine.regions[target_region_id].name,
+                            kind="world", actors=(char_id,))
             return True
             
         current_region = self.engine.regions.get(current_region_id)
-        if target_region_id in current_region.neighbors:
+        if self.graph.adjacent(current_region_id, target_region_id):
             char.location_id = target_region_id
-            self.engine.log(f"{char.name} moved from {current_region.name} to {self.engine.regions[target_region_id].name}.")
+            self.engine.relations.update(char_id)
+            self.engine.log("{} moved from {} to {}.", char.name, current_region.name,
+                            self.engine.regions[target_region_id].name, kind="world", actors=(char_id,))
             return True
         else:
-            self.engine.log(f"Cannot move to {self.engine.regions[target_region_id].name} - not adjacent!")
+            self.engine.log("Cannot move to {} - not adjacent!", self.engine.regions[target_region_id].name, kind="world")
             return False
 
-    def resolve_combat(self, attacker_id: str, defender_id: str):
+    def plan_route(self, char_id: int, target_region_id: int) -> Optional[Route]:
+        """The quickest route from where char is to target_region_id (see pathfinding.py)."""
+        location_id = self.engine.characters[char_id].location_id
+        if not location_id:
+            return None
+        return self.router.route(location_id, target_region_id)
+
+    def travel(self, char_id: int, target_region_id: int) -> Optional[int]:
+        """Set char off toward target_region_id, one leg at a time. Returns the arrival month index."""
+        route = self.plan_route(char_id, target_region_id)
+        if route is None or not route.legs:
+            self.journeys.pop(char_id, None)
+            return None
+        now = self.engine.get_month_index()
+        first_leg = self.router.leg_cost(route.regions[0], route.regions[1])
+        self.journeys[char_id] = Journey(route.regions[1:], now + first_leg, now + route.cost)
+        return now + route.cost
+
+    def cancel_travel(self, char_id: int):
+        self.journeys.pop(char_id, None)
+
+    def process_travel(self):
+        """Move every traveller whose next leg is done; the month's work is O(travellers)."""
+        if not self.journeys:
+            return
+        now = self.engine.get_month_index()
+        for char_id, journey in list(self.journeys.items()):
+            char = self.engine.characters.get(char_id)
+            if char is None or not char.is_alive:
+                del self.journeys[char_id]
+                continue
+            if journey.next_month > now:
+                continue
+            target = journey.route.pop(0)
+            if not self.move_character(char_id, target):
+                del self.journeys[char_id]  # The map changed under the route
+                continue
+            if journey.route:
+                journey.next_month = now + self.router.leg_cost(target, journey.route[0])
+            else:
+                del self.journeys[char_id]
+
+    def resolve_combat(self, attacker_id: int, defender_id: int):
         attacker = self.engine.characters[attacker_id]
         defender = self.engine.characters[defender_id]
         
-        self.engine.log(f"COMBAT: {attacker.name} attacks {defender.name}!")
+        self.engine.log("COMBAT: {} attacks {}!", attacker.name, defender.name,
+                        kind="combat", actors=(attacker_id, defender_id))
         
         # Simple roll: Martial + d20
-        att_roll = attacker.martial + random.randint(1, 20)
-        def_roll = defender.martial + random.randint(1, 20)
+        dice = self.engine.rng.combat
+        att_roll = attacker.martial + dice.randint(1, 20)
+        def_roll = defender.martial + dice.randint(1, 20)
         
         if att_roll > def_roll:
-            self.engine.log(f"{attacker.name} wins! ({att_roll} vs {def_roll})")
+            self.engine.log("{} wins! ({} vs {})", attacker.name, att_roll, def_roll, kind="combat")
             # Defender wounded
             self.engine.modify_health(defender.id, -2.0)
         else:
-            self.engine.log(f"{defender.name} repels the attack! ({def_roll} vs {att_roll})")
+            self.engine.log("{} repels the attack! ({} vs {})", defender.name, def_roll, att_roll, kind="combat")
             # Attacker wounded
             self.engine.modify_health(attacker.id, -1.0)
+
+    def _command_bonus(self, army: Army) -> float:
+        commander = self.engine.characters.get(army.commander_id)
+        return 1.0 + COMMAND_BONUS * commander.martial if commander is not None and commander.is_alive else 1.0
+
+    def resolve_battle(self, attacker: Army, defender: Army, region_id: int) -> BattleResult:
+        """Fight a battle between two armies in a region (see battle.py); the armies keep their survivors."""
+        region = self.engine.regions[region_id]
+        before = attacker.composition(self.engine.culture_manager), defender.composition(self.engine.culture_manager)
+        self.engine.log("BATTLE of {}: {} against {}!", region.name, _describe(before[0]), _describe(before[1]),
+                        kind="combat", actors=tuple(a.commander_id for a in (attacker, defender) if a.commander_id))
+        result = resolve_battle(attacker, defender, region.terrain, self.engine.rng.generator("combat"),
+                                self._command_bonus(attacker), self._command_bonus(defender))
+        self.engine.log("The {} wins after {} rounds. Losses: {} attackers, {} defenders.", result.winner,
+                        result.rounds, result.attacker_losses, result.defender_losses, kind="combat")
+        return result
+
+    def battle_odds(self, attacker: Army, defender: Army, region_id: int, battles: int = 10_000) -> float:
+        """The attacker's chance of winning in region_id, by Monte Carlo (see battle.win_probability).
+
+        Draws from its own generator, so asking for odds never changes how a battle goes.
+        """
+        terrain = self.engine.regions[region_id].terrain
+        return win_probability(attacker, defender, terrain, self.engine.rng.generator("odds"), battles,
+                               self._command_bonus(attacker), self._command_bonus(defender))
+
+def _describe(composition: Dict[str, int]) -> str:
+    return ", ".join(f"{men} {name}" for name, men in composition.items()) or "no one"
@@ -0,0 +1,196 @@
+"""Region adjacency in compressed sparse row (CSR) form, and a procedural map generator.
+
+RegionGraph numbers the regions 0..n-1 and keeps every region's neighbours
+in one flat array: the neighbours of region i are
+targets[offsets[i]:offsets[i + 1]]. That is two small int arrays instead of
+a list per region, a neighbour listing is one slice and an adjacency check
+scans a handful of entries. Region.neighbors stays the saved form; the
+graph is built from it (WorldManager.graph) or alongside it (generate_map).
+
+generate_map lays the regions out on a jittered grid and triangulates it:
+every cell links to its right and lower neighbours and, in each square of
+four cells, to the nearer of the two diagonals (the choice Delaunay would
+make). The graph is planar and connected, with six neighbours on average.
+Elevation and moisture come from smoothed value noise; they pick the
+terrain, which sets population and wealth. The map's edge is coast.
+"""
+from array import array
+from typing import Dict, List, Optional, Tuple
+import math
+import random
+from .models import Region, Terrain
+
+NOISE_SCALE = 8  # Cells per value-noise lattice step
+
+# Terrain -> (typical population, typical wealth)
+TERRAIN_ECONOMY = {
+    Terrain.PLAINS: (1500, 120),
+    Terrain.COASTAL: (1200, 150),
+    Terrain.HILLS: (800, 90),
+    Terrain.DESERT: (300, 60),
+    Terrain.MOUNTAINS: (250, 50),
+}
+
+_SYLLABLES = ("ar", "be", "ca", "do", "el", "fa", "ga", "hi", "is", "la", "ma", "ne",
+              "or", "pa", "ri", "sa", "ta", "ul", "va", "ze", "th", "mon", "lis", "tor")
+_ENDINGS = ("ia", "um", "a", "on", "is", "ene", "ar", "os")
+
+class RegionGraph:
+    """Adjacency of regions as CSR arrays over region indices."""
+
+    def __init__(self, ids: array, offsets: array, targets: array):
+        self.ids = ids  # index -> region id
+        self.offsets = offsets  # len(ids) + 1 row starts into targets
+        self.targets = targets  # neighbour indices
+        # Regions created together have consecutive ids, so an id's index is id - base
+        contiguous = len(ids) > 0 and all(region_id == ids[0] + i for i, region_id in enumerate(ids))
+        self._base: Optional[int] = ids[0] if contiguous else None
+        self._index: Optional[Dict[int, int]] = (
+            None if contiguous else {region_id: i for i, region_id in enumerate(ids)})
+
+    @classmethod
+    def from_regions(cls, regions: Dict[int, Region]) -> 'RegionGraph':
+        ids = array("l", sorted(regions))
+        index = {region_id: i for i, region_id in enumerate(ids)}
+        offsets = array("i", [0])
+        targets = array("i")
+        for region_id in ids:
+            targets.extend(index[n] for n in regions[region_id].neighbors if n in index)
+            offsets.append(len(targets))
+        return cls(ids, offsets, targets)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.targets) // 2
+
+    def index_of(self, region_id: int) -> int:
+        if self._base is not None:
+            i = region_id - self._base
+            if 0 <= i < len(self.ids):
+                return i
+            raise KeyError(region_id)
+        return self._index[region_id]
+
+    def degree(self, region_id: int) -> int:
+        i = self.index_of(region_id)
+        return self.offsets[i + 1] - self.offsets[i]
+
+    def neighbor_indices(self, index: int) -> array:
+        return self.targets[self.offsets[index]:self.offsets[index + 1]]
+
+    def neighbors(self, region_id: int) -> List[int]:
+        ids = self.ids
+        return [ids[j] for j in self.neighbor_indices(self.index_of(region_id))]
+
+    def adjacent(self, region_id: int, other_id: int) -> bool:
+        base = self._base
+        if base is not None:
+            i, j = region_id - base, other_id - base
+            if not (0 <= i < len(self.ids) and 0 <= j < len(self.ids)):
+                return False
+        else:
+            i, j = self._index.get(region_id), self._index.get(other_id)
+            if i is None or j is None:
+                return False
+        offsets = self.offsets
+        return j in self.targets[offsets[i]:offsets[i + 1]]
+
+    def nbytes(self) -> int:
+        """Memory held by the arrays."""
+        return sum(a.itemsize * len(a) for a in (self.ids, self.offsets, self.targets))
+
+def _triangulate(width: int, count: int, xs: List[float], ys: List[float]) -> Tuple[array, array]:
+    """CSR rows of the jittered-grid triangulation of the first count cells."""
+    degree = [0] * count
+    edges: List[Tuple[int, int]] = []
+
+    def link(a: int, b: int):
+        edges.append((a, b))
+        degree[a] += 1
+        degree[b] += 1
+
+    for i in range(count):
+        col = i % width
+        right, down = i + 1, i + width
+        if col + 1 < width and right < count:
+            link(i, right)
+        if down < count:
+            link(i, down)
+            if col + 1 < width and down + 1 < count:
+                # The shorter diagonal of the square i, right, down, down + 1
+                d1 = (xs[i] - xs[down + 1]) ** 2 + (ys[i] - ys[down + 1]) ** 2
+                d2 = (xs[right] - xs[down]) ** 2 + (ys[right] - ys[down]) ** 2
+                link(*((i, down + 1) if d1 <= d2 else (right, down)))
+    offsets = array("i", [0]) * (count + 1)
+    for i in range(count):
+        offsets[i + 1] = offsets[i] + degree[i]
+    targets = array("i", [0]) * offsets[count]
+    fill = offsets[:count]
+    for a, b in edges:
+        targets[fill[a]] = b
+        fill[a] += 1
+        targets[fill[b]] = a
+        fill[b] += 1
+    return offsets, targets
+
+def _value_noise(rng: random.Random, width: int, height: int, xs: List[float], ys: List[float]) -> List[float]:
+    """Smooth noise in [0, 1) at every cell, bilinearly interpolated from a coarse random lattice."""
+    cols = width // NOISE_SCALE + 2
+    rows = height // NOISE_SCALE + 2
+    lattice = [rng.random() for _ in range(cols * rows)]
+    values = []
+    for x, y in zip(xs, ys):
+        gx, gy = x / NOISE_SCALE, y / NOISE_SCALE
+        c, r = int(gx), int(gy)
+        fx, fy = gx - c, gy - r
+        fx, fy = fx * fx * (3 - 2 * fx), fy * fy * (3 - 2 * fy)  # Smoothstep
+        top = lattice[r * cols + c] * (1 - fx) + lattice[r * cols + c + 1] * fx
+        bottom = lattice[(r + 1) * cols + c] * (1 - fx) + lattice[(r + 1) * cols + c + 1] * fx
+        values.append(top * (1 - fy) + bottom * fy)
+    return values
+
+def _terrain(elevation: float, moisture: float, edge: bool) -> Terrain:
+    if edge or elevation < 0.25:
+        return Terrain.COASTAL
+    if elevation > 0.75:
+        return Terrain.MOUNTAINS
+    if elevation > 0.6:
+        return Terrain.HILLS
+    if moisture < 0.3:
+        return Terrain.DESERT
+    return Terrain.PLAINS
+
+def _name(bits: int) -> str:
+    """One or two syllables and an ending, picked by the digits of a random number."""
+    bits, ending = divmod(bits, len(_ENDINGS))
+    bits, first = divmod(bits, len(_SYLLABLES))
+    bits, second = divmod(bits, len(_SYLLABLES))
+    stem = _SYLLABLES[first] + (_SYLLABLES[second] if bits & 1 else "")
+    return (stem + _ENDINGS[ending]).capitalize()
+
+def generate_map(count: int, rng: random.Random) -> Tuple[List[Region], RegionGraph]:
+    """count new regions with their neighbours filled in, and their graph."""
+    width = max(1, math.ceil(math.sqrt(count)))
+    height = math.ceil(count / width)
+    xs = [i % width + rng.random() for i in range(count)]
+    ys = [i // width + rng.random() for i in range(count)]
+    offsets, targets = _triangulate(width, count, xs, ys)
+    elevation = _value_noise(rng, width, height, xs, ys)
+    moisture = _value_noise(rng, width, height, xs, ys)
+
+    regions = []
+    for i in range(count):
+        col, row = i % width, i // width
+        edge = col == 0 or row == 0 or col == width - 1 or row == height - 1 or i + width >= count
+        terrain = _terrain(elevation[i], moisture[i], edge)
+        population, wealth = TERRAIN_ECONOMY[terrain]
+        scale = rng.lognormvariate(0.0, 0.4)
+        regions.append(Region(name=_name(rng.getrandbits(32)), terrain=terrain,
+                              population=int(population * scale), wealth=int(wealth * scale)))
+    ids = array("l", (region.id for region in regions))
+    for i, region in enumerate(regions):
+        region.neighbors = [ids[j] for j in targets[offsets[i]:offsets[i + 1]]]
+    return regions, RegionGraph(ids, offsets, targets)
@@ -1,9 +1,13 @@
 from bloodlines.engine import GameEngine
+from bloodlines.dashboard import Dashboard
+from bloodlines.fastforward import FAST_FORWARD_LIMIT, dynasty_birth, fast_forward, wealth_crosses
+from bloodlines.logbook import date_of, format_date, month_index, parse_date
+from bloodlines.relations import OPINION_BANDS, RelationView, opinion_band
 from rich.console import Console
-from rich.layout import Layout
 from rich.panel import Panel
 
 from rich.table import Table
+from rich.progress import Progress
 from rich.align import Align
 from time import sleep
 import sys
@@ -50,6 +54,195 @@ def show_start_menu(console):
             print("Invalid option. Please try again.")
             sleep(1)
 
+def show_family_tree(engine, target_id):
+    tree = engine.get_family_tree(target_id)
+    if tree:
+        char = tree["character"]
+        print(f"\n=== Family Tree: {char.name} ===\n")
+
+        # Parents
+        print("Parents:")
+        if tree["father"]:
+            status = "Alive" if tree["father"].is_alive else "Deceased"
+            print(f"  Father: {tree['father'].name} (Age {tree['father'].age}, {status})")
+        else:
+            print("  Father: Unknown")
+
+        if tree["mother"]:
+            status = "Alive" if tree["mother"].is_alive else "Deceased"
+            print(f"  Mother: {tree['mother'].name} (Age {tree['mother'].age}, {status})")
+        else:
+            print("  Mother: Unknown")
+
+        # Spouse
+        print("\nSpouse:")
+        if tree["spouse"]:
+            print(f"  {tree['spouse'].name} (Age {tree['spouse'].age})")
+        else:
+            print("  None")
+
+        # Children
+        print("\nChildren:")
+        if tree["children"]:
+            for child in tree["children"]:
+                status = "" if child.is_alive else " (Deceased)"
+                print(f"  - {child.name} (Age {child.age}){status}")
+        else:
+            print("  None")
+
+        # Siblings
+        print("\nSiblings:")
+        if tree["siblings"]:
+            for sibling in tree["siblings"]:
+                status = "" if sibling.is_alive else " (Deceased)"
+                print(f"  - {sibling.name} (Age {sibling.age}){status}")
+        else:
+            print("  None")
+    input("\nPress Enter to continue...")
+
+def relationships_menu(engine):
+    """Paged, filterable list of characters with the player's opinion of each."""
+    player_id = engine.player_character_id
+    player = engine.characters[player_id]
+    filters = {"relation": "known", "dynasty_id": None, "band": None, "prefix": ""}
+    view, number = RelationView(engine, player_id, **filters), 0
+    while True:
+        page = view.page(number)
+        shown = [filters["relation"].title()]
+        if filters["dynasty_id"] is not None:
+            shown.append("Dynasty")
+        if filters["band"]:
+            shown.append(filters["band"])
+        if filters["prefix"]:
+            shown.append(f"'{filters['prefix']}*'")
+        print(f"\n--- Relationships ({', '.join(shown)}) - Page {number + 1} ---")
+        if not page:
+            print("No characters match.")
+        for i, cid in enumerate(page):
+            char = engine.characters[cid]
+            opinion = engine.get_opinion(player_id, cid)
+            spouse_marker = " [SPOUSE]" if cid == player.spouse_id else ""
+            print(f"[{i+1}] {char.name}{spouse_marker} (Age {char.age}) - Opinion: {opinion:+d} ({opinion_band(opinion)})")
+
+        print("\n[N]/[P] Next/Previous Page | Show: [K] Known [H] Family [C] Spouse Candidates [O] Polity [A] All")
+        print("[D] My Dynasty | [B] Opinion Band | [/name] Search | [X] Clear Filters")
+        print("[M] Arrange Marriage | [F] Family Tree | [Enter] Back")
+        choice = input("> ").strip()
+        key = choice.lower()
+        if not choice:
+            return
+        if key == 'n':
+            if view.has_page(number + 1):
+                number += 1
+            continue
+        if key == 'p':
+            number = max(0, number - 1)
+            continue
+        if key in ('k', 'h', 'c', 'o', 'a'):
+            filters["relation"] = {'k': "known", 'h': "family", 'c': "spouse", 'o': "polity", 'a': "all"}[key]
+        elif key == 'd':
+            filters["dynasty_id"] = None if filters["dynasty_id"] is not None else player.dynasty_id
+        elif key == 'b':
+            labels = [label for label, _ in OPINION_BANDS]
+            print(" | ".join(f"[{i+1}] {label}" for i, label in enumerate(labels)) + " | [Enter] Any")
+            band = input("> ").strip()
+            filters["band"] = labels[int(band) - 1] if band.isdigit() and 0 < int(band) <= len(labels) else None
+        elif choice.startswith('/'):
+            filters["prefix"] = choice[1:].strip()
+            if filters["relation"] == "known":
+                filters["relation"] = "all"  # Search the whole world, not just the few listed
+        elif key == 'x':
+            filters.update(relation="all", dynasty_id=None, band=None, prefix="")
+        elif key in ('m', 'f'):
+            sel = input("Select character (Number)" + (" or press Enter for yourself" if key == 'f' else "")
+                        + ": ").strip()
+            target_id = None
+            if sel.isdigit() and 0 < int(sel) <= len(page):
+                target_id = page[int(sel) - 1]
+            if key == 'f':
+                show_family_tree(engine, target_id if target_id is not None else player_id)
+                continue
+            if target_id is None:
+                print("Invalid input.")
+                sleep(1)
+                continue
+            engine.arrange_marriage(player_id, target_id)
+            sleep(2)
+        else:
+            print("Invalid option.")
+            sleep(1)
+            continue
+        # Filters or the world changed: start a new listing
+        view, number = RelationView(engine, player_id, **filters), 0
+
+STOP_REASONS = {
+    "event": "an event needs your attention",
+    "game_over": "your dynasty has ended",
+    "months": "done",
+    "date": "date reached",
+}
+
+def fast_forward_menu(engine, console):
+    """Ask how far to go, then advance without rendering the dashboard."""
+    print("\n--- Fast Forward ---")
+    print("[Enter] Until an event | [Number] Months | [Date] Until a date (e.g. 1/700 BC)")
+    choice = input("> ").strip()
+    months = until = None
+    try:
+        if choice.isdigit():
+            months = int(choice)
+        elif choice:
+            until = month_index(*parse_date(choice))
+    except ValueError:
+        print("Invalid input.")
+        sleep(1)
+        return
+
+    watches = []
+    threshold = input("Also stop when wealth crosses (blank for no): ").strip()
+    if threshold.lstrip("-").isdigit():
+        watches.append(wealth_crosses(int(threshold)))
+    if input("Also stop at a birth in your dynasty? (y/N): ").strip().lower() == 'y':
+        watches.append(dynasty_birth())
+
+    if months is not None:
+        total = months
+    elif until is not None:
+        total = max(0, until - engine.get_month_index())
+    else:
+        total = FAST_FORWARD_LIMIT
+    with Progress(console=console) as progress:
+        task = progress.add_task("Fast forward", total=total)
+        result = fast_forward(engine, months, until, watches,
+                              on_month=lambda done: progress.update(task, completed=done))
+    reason = STOP_REASONS.get(result.stopped_by, result.stopped_by)
+    print(f"Advanced {result.months_run} months to {engine.get_date_string()} "
+          f"({result.months_per_sec:.0f} months/sec): {reason}.")
+    sleep(1)
+
+def travel_menu(engine, char_id):
+    """Pick a destination by name; the character then travels a leg at a time as months pass."""
+    query = input("Travel to (region name): ").strip().casefold()
+    matches = [r for r in engine.regions.values() if r.name.casefold().startswith(query)] if query else []
+    if not matches:
+        print("No such region.")
+        sleep(1)
+        return
+    target = matches[0]
+    route = engine.world_manager.plan_route(char_id, target.id)
+    if route is None or not route.legs:
+        print(f"There is no road to {target.name}.")
+        sleep(1)
+        return
+    arrival = format_date(*date_of(engine.get_month_index() + route.cost))
+    stops = " -> ".join(engine.regions[rid].name for rid in route.regions[:8])
+    if route.legs >= 8:
+        stops += " -> ..."
+    print(f"Route: {stops}")
+    print(f"{route.legs} legs, {route.cost} months; arriving {arrival}")
+    if input("Set out? (y/n): ").strip().lower() == 'y':
+        engine.world_manager.travel(char_id, target.id)
+
 def main():
     console = Console()
     
@@ -79,290 +272,133 @@ def main():
             engine.create_test_scenario()
     
     
-    def generate_dashboard() -> Layout:
-        layout = Layout()
-        layout.split_column(
-            Layout(name="header", size=3),
-            Layout(name="body"),
-            Layout(name="footer", size=3)
-        )
-        
-        layout["body"].split_row(
-            Layout(name="left"),
-            Layout(name="right")
-        )
-        
-        # Header
-        player = engine.characters[engine.player_character_id]
-        dynasty = engine.dynasties[player.dynasty_id]
-        title = engine.get_character_title(player.id)
-        location = engine.regions[player.location_id].name if player.location_id else "Unknown"
-        header_text = f"DATE: {engine.get_date_string()} | DYNASTY: {dynasty.name} | HEAD: {player.name} ({title}) | LOC: {location}"
-        layout["header"].update(Panel(header_text, style="bold white on blue"))
-        
-        # Left Column: Stats & Info
-        stats_table = Table(title=f"Character Stats ({player.culture})")
-        stats_table.add_column("Stat", style="cyan")
-        stats_table.add_column("Value", style="magenta")
-        stats_table.add_row("Title", title)
-        stats_table.add_row("Age", str(player.age))
-        stats_table.add_row("Wealth", str(player.wealth))
-        stats_table.add_row("Health", f"{player.health:.1f}")
-        stats_table.add_row("Martial", str(player.martial))
-        stats_table.add_row("Diplomacy", str(player.diplomacy))
-        
-        # Neighbors
-        if player.location_id:
-            current_region = engine.regions[player.location_id]
-            neighbors = [engine.regions[nid].name for nid in current_region.neighbors]
-            stats_table.add_row("Neighbors", ", ".join(neighbors))
-            
-            # Buildings
-            if hasattr(current_region, 'buildings') and current_region.buildings:
-                try:
-                    b_list = [f"{k.title()}: {v}" for k, v in current_region.buildings.items()]
-                    stats_table.add_row("Buildings", ", ".join(b_list))
-                except Exception as e:
-                    stats_table.add_row("Buildings", "Error displaying")
-        
-        layout["left"].update(Panel(stats_table, title="Current Character"))
-        
-        # Right Column: Logs / Events
-        if engine.current_event:
-            event = engine.current_event
-            event_text = f"[bold yellow]{event.title}[/bold yellow]\n\n{event.description}\n"
-            for i, option in enumerate(event.options):
-                event_text += f"\n[{i+1}] {option.text} ({option.tooltip})"
-            
-            layout["right"].update(Panel(event_text, title="Active Event", style="bold red"))
-        else:
-            log_text = "\n".join(engine.logs[-10:])
-            layout["right"].update(Panel(log_text, title="Events Log", style="green"))
-        
-        # Footer: Commands
-        layout["footer"].update(Panel("[ENTER] Next Month | [M] Move | [B] Build | [R] Relationships | [S] Save | [L] Load | [Q] Quit", title="Commands"))
-        
-        return layout
-
     # Main Game Loop
-    while not engine.game_over:
-        try:
-            # Render dashboard with separator (no clear)
-            print("\n" + "="*60 + "\n")
-            console.print(generate_dashboard())
-            print("="*60)
-            
-            # Show command prompt
-            if engine.current_event:
-                print("\nCommands: [Number] Select Option | [Q] Quit")
-                print(f"EVENT: {engine.current_event.title}")
-                for i, option in enumerate(engine.current_event.options):
-                    print(f"[{i+1}] {option.text}")
-            else:
-                print("\nCommands: [ENTER] Next Month | [M] Move | [B] Build | [R] Relationships | [S] Save | [L] Load | [Q] Quit")
+    with Dashboard(engine, console) as dashboard:
+        while not engine.game_over:
+            try:
+                if engine.current_event:
+                    cmd = dashboard.prompt("Select an option (Number) > ").strip().lower()
+                else:
+                    cmd = dashboard.prompt("> ").strip().lower()
             
-            cmd = input("> ").strip().lower()
+                # Menus print and read freely below a paused dashboard
+                menu = cmd in ('m', 's', 'l', 'r', 'b', 'f') and not engine.current_event
+                if menu:
+                    dashboard.suspend()
             
-            # Process commands
-            if cmd == 'q':
-                break
-            elif cmd == 'm' and not engine.current_event:
-                # Movement menu
-                player = engine.characters[engine.player_character_id]
-                if player.location_id:
-                    current = engine.regions[player.location_id]
-                    print("\n--- Movement ---")
-                    print(f"Location: {current.name}")
-                    print("Neighbors:")
-                    for i, nid in enumerate(current.neighbors):
-                        n_name = engine.regions[nid].name
-                        print(f"[{i+1}] {n_name}")
+                # Process commands
+                if cmd == 'q':
+                    break
+                elif cmd == 'm' and not engine.current_event:
+                    # Movement menu
+                    player = engine.characters[engine.player_character_id]
+                    if player.location_id:
+                        current = engine.regions[player.location_id]
+                        print("\n--- Movement ---")
+                        print(f"Location: {current.name}")
+                        journey = engine.world_manager.journeys.get(player.id)
+                        if journey:
+                            print(f"Travelling to {engine.regions[journey.route[-1]].name}, "
+                                  f"arriving {format_date(*date_of(journey.arrival_month))}")
+                        print("Neighbors:")
+                        for i, nid in enumerate(current.neighbors):
+                            n_name = engine.regions[nid].name
+                            print(f"[{i+1}] {n_name}")
+                        print("[T] Travel to a distant region")
                     
-                    try:
-                        choice = input("Move to (Number): ")
-                        idx = int(choice) - 1
-                        if 0 <= idx < len(current.neighbors):
-                            target = current.neighbors[idx]
-                            engine.world_manager.move_character(player.id, target)
-                        else:
-                            print("Invalid choice.")
+                        try:
+                            choice = input("Move to (Number): ")
+                            idx = -1 if choice.strip().lower() == 't' else int(choice) - 1
+                            if idx == -1:
+                                travel_menu(engine, player.id)
+                            elif 0 <= idx < len(current.neighbors):
+                                target = current.neighbors[idx]
+                                engine.world_manager.cancel_travel(player.id)
+                                engine.world_manager.move_character(player.id, target)
+                            else:
+                                print("Invalid choice.")
+                                sleep(1)
+                        except ValueError:
+                            print("Invalid input.")
                             sleep(1)
-                    except ValueError:
-                        print("Invalid input.")
-                        sleep(1)
 
-            elif engine.current_event:
-                # Event handling
-                try:
-                    if cmd.isdigit():
-                        idx = int(cmd) - 1
-                        if 0 <= idx < len(engine.current_event.options):
-                            engine.resolve_event(idx)
+                elif engine.current_event:
+                    # Event handling
+                    try:
+                        if cmd.isdigit():
+                            idx = int(cmd) - 1
+                            if 0 <= idx < len(engine.current_event.options):
+                                engine.resolve_event(idx)
+                            else:
+                                print("Invalid option.")
+                                sleep(1)
                         else:
-                            print("Invalid option.")
+                            print("Please select an option to continue.")
                             sleep(1)
+                    except ValueError:
+                        pass
+                elif cmd == 'f' and not engine.current_event:
+                    fast_forward_menu(engine, console)
+                elif cmd == 's' and not engine.current_event:
+                    filename = input("Save to file (default: savegame): ").strip()
+                    if not filename:
+                        filename = "savegame"
+                    engine.save_game(filename)
+                    sleep(1)
+                elif cmd == 'l' and not engine.current_event:
+                    filename = input("Load from file (default: savegame): ").strip()
+                    if not filename:
+                        filename = "savegame"
+                    if engine.load_game(filename):
+                        print("Game loaded successfully!")
                     else:
-                        print("Please select an option to continue.")
-                        sleep(1)
-                except ValueError:
-                    pass
-            elif cmd == 's' and not engine.current_event:
-                filename = input("Save to file (default: savegame): ").strip()
-                if not filename:
-                    filename = "savegame"
-                engine.save_game(filename)
-                sleep(1)
-            elif cmd == 'l' and not engine.current_event:
-                filename = input("Load from file (default: savegame): ").strip()
-                if not filename:
-                    filename = "savegame"
-                if engine.load_game(filename):
-                    print("Game loaded successfully!")
-                else:
-                    print("Failed to load game.")
-                sleep(1)
-            elif cmd == 'r' and not engine.current_event:
-                # Relationships Menu
-                player = engine.characters[engine.player_character_id]
-                print("\n--- Relationships ---")
-                
-                # Get all other characters
-                other_chars = [(cid, engine.characters[cid]) for cid in engine.characters.keys() 
-                              if cid != engine.player_character_id and engine.characters[cid].is_alive]
-                
-                if not other_chars:
-                    print("No other characters known.")
+                        print("Failed to load game.")
                     sleep(1)
-                else:
-                    for i, (cid, char) in enumerate(other_chars):
-                        opinion = engine.get_opinion(engine.player_character_id, cid)
-                        
-                        # Color code by opinion
-                        if opinion >= 50:
-                            status = "(Allied)"
-                        elif opinion >= 10:
-                            status = "(Friendly)"
-                        elif opinion >= -9:
-                            status = "(Neutral)"
-                        elif opinion >= -49:
-                            status = "(Unfriendly)"
-                        else:
-                            status = "(Hostile)"
-                        
-                        spouse_marker = " [SPOUSE]" if char.id == player.spouse_id else ""
-                        print(f"[{i+1}] {char.name}{spouse_marker} - Opinion: {opinion:+d} {status}")
+                elif cmd == 'r' and not engine.current_event:
+                    relationships_menu(engine)
+                elif cmd == 'b' and not engine.current_event:
+                    # Build Menu
+                    player = engine.characters[engine.player_character_id]
+                    if player.location_id:
+                        current = engine.regions[player.location_id]
+                        print("\n--- Construction ---")
+                        print(f"Location: {current.name}")
+                        print(f"Existing Buildings: {current.buildings}")
+                        print("\nAvailable Buildings:")
+                        catalogue = engine.building_catalogue
+                        building_types = catalogue.types()
+                        for i, b_type in enumerate(building_types):
+                            print(f"[{i+1}] {catalogue.get_name(b_type)} (Cost: {catalogue.get_cost(b_type)}, "
+                                  f"+{catalogue.get_income(b_type)} Wealth/Month)")
                     
-                    print("\n[M] Arrange Marriage | [F] Family Tree | [Enter] Back")
-                    choice = input("> ").strip().lower()
-                    
-                    if choice == 'f':
-                        print("\nFamily Tree - Select character (Number) or press Enter for yourself:")
-                        sel = input("> ").strip()
-                        
-                        # Determine which character to view
-                        target_id = engine.player_character_id
-                        if sel:
-                            try:
-                                idx = int(sel) - 1
-                                if 0 <= idx < len(other_chars):
-                                    target_id = other_chars[idx][0]
-                            except ValueError:
-                                pass
-                        
-                        # Display family tree
-                        tree = engine.get_family_tree(target_id)
-                        if tree:
-                            char = tree["character"]
-                            print(f"\n=== Family Tree: {char.name} ===\n")
-                            
-                            # Parents
-                            print("Parents:")
-                            if tree["father"]:
-                                status = "Alive" if tree["father"].is_alive else "Deceased"
-                                print(f"  Father: {tree['father'].name} (Age {tree['father'].age}, {status})")
-                            else:
-                                print("  Father: Unknown")
-                            
-                            if tree["mother"]:
-                                status = "Alive" if tree["mother"].is_alive else "Deceased"
-                                print(f"  Mother: {tree['mother'].name} (Age {tree['mother'].age}, {status})")
-                            else:
-                                print("  Mother: Unknown")
-                            
-                            # Spouse
-                            print("\nSpouse:")
-                            if tree["spouse"]:
-                                print(f"  {tree['spouse'].name} (Age {tree['spouse'].age})")
-                            else:
-                                print("  None")
-                            
-                            # Children
-                            print("\nChildren:")
-                            if tree["children"]:
-                                for child in tree["children"]:
-                                    status = "" if child.is_alive else " (Deceased)"
-                                    print(f"  - {child.name} (Age {child.age}){status}")
-                            else:
-                                print("  None")
-                            
-                            # Siblings
-                            print("\nSiblings:")
-                            if tree["siblings"]:
-                                for sibling in tree["siblings"]:
-                                    status = "" if sibling.is_alive else " (Deceased)"
-                                    print(f"  - {sibling.name} (Age {sibling.age}){status}")
-                            else:
-                                print("  None")
-                        
-                        input("\nPress Enter to continue...")
-                    elif choice == 'm':
-                        print("\nArrange Marriage - Select character (Number):")
                         try:
-                            sel = input("> ").strip()
-                            idx = int(sel) - 1
-                            if 0 <= idx < len(other_chars):
-                                target_id, target_char = other_chars[idx]
-                                engine.arrange_marriage(engine.player_character_id, target_id)
-                            sleep(2)
-                        except ValueError:
-                            print("Invalid input.")
+                            choice = input("Build (Number): ")
+                            idx = int(choice) - 1
+                            if 0 <= idx < len(building_types):
+                                engine.construct_building(current.id, building_types[idx])
+                            else:
+                                print("Invalid choice.")
                             sleep(1)
-            elif cmd == 'b' and not engine.current_event:
-                # Build Menu
-                player = engine.characters[engine.player_character_id]
-                if player.location_id:
-                    current = engine.regions[player.location_id]
-                    print("\n--- Construction ---")
-                    print(f"Location: {current.name}")
-                    print(f"Existing Buildings: {current.buildings}")
-                    print("\nAvailable Buildings:")
-                    print("[1] Farm (Cost: 50, +1 Wealth/Month)")
-                    print("[2] Estate (Cost: 200, +5 Wealth/Month)")
-                    
-                    try:
-                        choice = input("Build (Number): ")
-                        if choice == '1':
-                            engine.construct_building(current.id, "farm")
-                        elif choice == '2':
-                            engine.construct_building(current.id, "estate")
-                        else:
+                        except ValueError:
                             print("Invalid choice.")
-                        sleep(1)
-                    except ValueError:
-                        pass
-            else:
-                # Default: Advance month
-                engine.advance_month()
+                            sleep(1)
+                else:
+                    # Default: Advance month
+                    engine.advance_month()
+            
+                if menu:
+                    dashboard.resume()
                 
-        except KeyboardInterrupt:
-            break
-        except Exception as e:
-            print(f"\n\nCRITICAL ERROR: {e}")
-            import traceback
-            traceback.print_exc()
-            print("\nPress Enter to exit...")
-            input()
-            break
+            except KeyboardInterrupt:
+                break
+            except Exception as e:
+                dashboard.suspend()
+                print(f"\n\nCRITICAL ERROR: {e}")
+                import traceback
+                traceback.print_exc()
+                print("\nPress Enter to exit...")
+                input()
+                break
     
     print("\n\nGame Over")
 
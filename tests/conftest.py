@@ -0,0 +1,7 @@
+import os
+import pytest
+
+@pytest.fixture(autouse=True, scope="session")
+def pack_cache_dir(tmp_path_factory):
+    """Every GameEngine loads the event packs; keep their compiled cache out of the home directory."""
+    os.environ["AETERNA_CACHE_DIR"] = str(tmp_path_factory.mktemp("aeterna-cache"))
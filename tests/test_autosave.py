@@ -0,0 +1,107 @@
+from bloodlines.engine import GameEngine
+from bloodlines import autosave
+import os
+import random
+import tempfile
+
+def snapshot(engine):
+    return {
+        "date": engine.get_date_string(),
+        "player": engine.player_character_id,
+        "characters": {k: v.to_dict() for k, v in engine.characters.items()},
+        "dynasties": {k: v.to_dict() for k, v in engine.dynasties.items()},
+        "polities": {k: v.to_dict() for k, v in engine.polities.items()},
+        "regions": {k: v.to_dict() for k, v in engine.regions.items()},
+        "opinions": {k: engine.opinions.row(k) for k in engine.characters},
+    }
+
+def play_month(engine):
+    engine.advance_month()
+    if engine.current_event:
+        engine.resolve_event(0)
+
+def test_autosave():
+    print("Initializing Engine...")
+    random.seed(7)
+    engine = GameEngine()
+    engine.create_test_scenario()
+    engine.enable_death_scheduler()
+    player_id = engine.player_character_id
+    spouse_id = engine.characters[player_id].spouse_id
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "auto.sav")
+        engine.enable_autosave(path, compact_every=100)
+
+        print("\nTesting Snapshot + Deltas...")
+        kinds = [engine.autosaver.save()]
+        for month in range(14):  # Crosses a January
+            play_month(engine)
+            if month == 3:
+                engine.create_child(spouse_id, player_id)
+                engine.modify_opinion(player_id, spouse_id, 25)
+                engine.modify_wealth(player_id, 300)
+                engine.construct_building(engine.characters[player_id].location_id, "farm")
+                engine.death_scheduler.set_modifier(spouse_id, 2.0)
+            kinds.append(engine.autosaver.save())
+        if kinds[0] == "full" and set(kinds[1:]) == {"delta"}:
+            print("PASS: One snapshot followed by deltas.")
+        else:
+            print(f"FAIL: Unexpected save kinds {kinds}.")
+        assert kinds[0] == "full" and set(kinds[1:]) == {"delta"}
+
+        loaded = GameEngine()
+        ok = loaded.load_game(path)
+        if ok and snapshot(loaded) == snapshot(engine):
+            print("PASS: Snapshot + journal restores the live world.")
+        else:
+            print("FAIL: Replayed world differs.")
+        assert ok and snapshot(loaded) == snapshot(engine)
+        assert loaded.death_scheduler.due == engine.death_scheduler.due
+        assert loaded.death_scheduler.modifiers == engine.death_scheduler.modifiers
+
+        print("\nTesting Compaction...")
+        engine.autosaver.compact_every = 2
+        kinds = [engine.autosaver.save() for _ in range(4)]
+        if kinds == ["full", "delta", "delta", "full"]:
+            print("PASS: Journal compacted into a new snapshot.")
+        else:
+            print(f"FAIL: Expected compaction, got {kinds}.")
+        assert kinds == ["full", "delta", "delta", "full"]
+
+        print("\nTesting Manual Save Discards Journal...")
+        engine.save_game(path)
+        if not os.path.exists(autosave.journal_path(path)):
+            print("PASS: Stale journal removed.")
+        else:
+            print("FAIL: Journal survived a full save.")
+        assert not os.path.exists(autosave.journal_path(path))
+        engine.disable_autosave()
+
+def test_tracking_scoped():
+    bystander = GameEngine()
+    bystander.create_test_scenario()
+    region = next(iter(bystander.regions.values()))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = GameEngine()
+        engine.create_test_scenario()
+        engine.enable_autosave(os.path.join(tmp, "auto.sav"))
+        engine.autosave()
+        tracker = engine.autosaver.tracker
+        tracked = next(iter(engine.regions.values()))
+        tracked.population += 1
+        region.population += 1  # Another engine's models are never marked
+        assert tracked.id in tracker.dirty and region.id not in tracker.dirty and region._tracker is None
+        engine.enable_autosave(os.path.join(tmp, "other.sav"))  # Replaces, does not stack
+        engine.disable_autosave()
+        tracked.population += 1
+        if tracked._tracker is None and not tracker.dirty:
+            print("PASS: Model writes are plain again once autosave is off.")
+        else:
+            print("FAIL: Change tracking outlived its autosaver.")
+        assert tracked._tracker is None and not tracker.dirty
+
+if __name__ == "__main__":
+    test_autosave()
+    test_tracking_scoped()
@@ -0,0 +1,86 @@
+from bloodlines.engine import GameEngine
+from bloodlines.battle import Army, numpy_available, resolve_battle, win_probability
+from bloodlines.models import Terrain
+
+def test_armies():
+    if not numpy_available():
+        print("SKIP: numpy not installed.")
+        return
+    print("Testing Armies...")
+    engine = GameEngine(seed=25)
+    army = Army.levy("Roman", 1050, elite_share=0.2)
+    assert len(army) == 11 and army.men == 1050
+    names = army.composition(engine.culture_manager)
+    if names == {"Hastati": 850, "Triarii": 200}:
+        print("PASS: Units are named by culture.")
+    else:
+        print(f"FAIL: {names}")
+    assert names == {"Hastati": 850, "Triarii": 200}
+    assert Army.levy("Unknown", 300).composition(engine.culture_manager) == {"Warriors": 200, "Veterans": 100}
+
+def test_battle():
+    if not numpy_available():
+        return
+    import numpy as np
+    print("Testing Battles...")
+    big, small = Army.levy("Roman", 3000), Army.levy("Greek", 1500)
+    result = resolve_battle(big, small, Terrain.PLAINS, np.random.default_rng(1))
+    if result.winner == "attacker" and result.defender_losses > result.attacker_losses > 0:
+        print(f"PASS: The larger army won in {result.rounds} rounds.")
+    else:
+        print(f"FAIL: {result}")
+    assert result.winner == "attacker" and result.defender_losses > result.attacker_losses > 0
+    assert big.men == 3000 - result.attacker_losses and small.men == 1500 - result.defender_losses
+    assert result.defender_routed > 0
+
+    # Same seed, same battle
+    replay = [resolve_battle(Army.levy("Roman", 2000), Army.levy("Greek", 2000), Terrain.HILLS,
+                             np.random.default_rng(7)) for _ in range(2)]
+    assert replay[0] == replay[1]
+
+def test_odds():
+    if not numpy_available():
+        return
+    import numpy as np
+    rng = np.random.default_rng(2)
+    attacker = lambda: Army.levy("Roman", 6000)
+    defender = lambda: Army.levy("Greek", 5000, elite_share=0.3)
+    plains = win_probability(attacker(), defender(), Terrain.PLAINS, rng)
+    mountains = win_probability(attacker(), defender(), Terrain.MOUNTAINS, rng)
+    assert mountains < plains
+
+    # The odds agree with fighting the battles out unit by unit
+    hills = win_probability(attacker(), defender(), Terrain.HILLS, rng)
+    fought = sum(resolve_battle(attacker(), defender(), Terrain.HILLS, rng).winner == "attacker"
+                 for _ in range(300)) / 300
+    if abs(hills - fought) < 0.1:
+        print(f"PASS: Monte Carlo odds {hills:.2f}, battles fought {fought:.2f}.")
+    else:
+        print(f"FAIL: Monte Carlo odds {hills:.2f}, battles fought {fought:.2f}.")
+    assert abs(hills - fought) < 0.1
+
+def test_world_battle():
+    if not numpy_available():
+        return
+    results = []
+    for ask_odds in (False, True):
+        engine = GameEngine(seed=25)
+        engine.create_test_scenario()
+        player = engine.characters[engine.player_character_id]
+        latium_id = player.location_id
+        attacker = Army.levy("Roman", 2000, commander_id=player.id)
+        defender = Army.levy("Tribal", 2000)
+        if ask_odds:
+            odds = engine.world_manager.battle_odds(attacker, defender, latium_id, battles=2000)
+            assert 0.5 < odds <= 1.0  # A martial commander tips an even fight
+            assert attacker.men == 2000
+        results.append(engine.world_manager.resolve_battle(attacker, defender, latium_id))
+    assert results[0] == results[1]
+    assert any("BATTLE of Latium: 1600 Hastati, 400 Triarii" in line for line in engine.logs)
+    print("PASS: Asking for the odds leaves the battle's dice alone.")
+
+if __name__ == "__main__":
+    test_armies()
+    test_battle()
+    test_odds()
+    test_world_battle()
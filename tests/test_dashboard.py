@@ -0,0 +1,126 @@
+from bloodlines.engine import GameEngine
+from bloodlines.dashboard import Dashboard
+from rich.console import Console
+from rich.control import Control
+from rich.live import Live
+from rich.live_render import LiveRender
+import inspect
+import io
+
+def make_dashboard():
+    engine = GameEngine(seed=17)
+    engine.create_test_scenario()
+    out = io.StringIO()
+    console = Console(file=out, force_terminal=True, force_interactive=True, width=120, height=40)
+    return engine, Dashboard(engine, console, max_fps=0), out
+
+def test_incremental_sections():
+    print("Testing Incremental Dashboard...")
+    engine, dashboard, out = make_dashboard()
+    with dashboard:  # (print() here would go through the live display)
+        dashboard.update(force=True)
+        first_frame = out.tell()
+        built = dashboard.rebuilds
+        drew = dashboard.update(force=True)
+        idle = out.tell() - first_frame
+
+        engine.month += 1  # Only the date changes
+        dashboard.update(force=True)
+        date_rebuilds = dashboard.rebuilds - built
+        date_bytes = out.tell() - first_frame - idle
+
+        engine.modify_wealth(engine.player_character_id, 5)  # Stats and log
+        dashboard.update(force=True)
+        wealth_rebuilds = dashboard.rebuilds - built - date_rebuilds
+
+    if not drew and idle == 0:
+        print("PASS: Nothing redrawn when nothing changed.")
+    else:
+        print(f"FAIL: Idle frame wrote {idle} bytes.")
+    assert not drew and idle == 0
+    if date_rebuilds == 1 and date_bytes < first_frame / 5:
+        print(f"PASS: Date change rewrote {date_bytes} of {first_frame} bytes.")
+    else:
+        print(f"FAIL: Date change rebuilt {date_rebuilds} sections, {date_bytes} bytes.")
+    assert date_rebuilds == 1 and date_bytes < first_frame / 5
+    assert wealth_rebuilds == 2
+
+def test_frame_cap():
+    print("\nTesting Frame Cap...")
+    engine, dashboard, out = make_dashboard()
+    dashboard.min_interval = 3600.0
+    with dashboard:
+        assert dashboard.update(force=True)
+        engine.month += 1
+        capped = dashboard.update()
+        forced = dashboard.update(force=True)
+    if not capped and forced:
+        print("PASS: Redraws held back until forced.")
+    else:
+        print(f"FAIL: capped={capped}, forced={forced}.")
+    assert not capped and forced
+
+def test_neighbors_follow_graph():
+    print("\nTesting Neighbor Names...")
+    engine, dashboard, out = make_dashboard()
+    region = engine.regions[engine.characters[engine.player_character_id].location_id]
+    neighbor = engine.regions[region.neighbors[0]]
+    with dashboard:
+        dashboard.update(force=True)
+        neighbor.name = "Alba Longa"
+        engine.world_manager.invalidate_graph()
+        out.seek(0)
+        out.truncate()
+        dashboard.update(force=True)
+    if "Alba Longa" in out.getvalue():
+        print("PASS: A new region graph refreshes the Neighbors row.")
+    else:
+        print("FAIL: Neighbors row kept the old names.")
+    assert "Alba Longa" in out.getvalue()
+
+def test_rich_internals():
+    """The line-diffing display replaces Live's private LiveRender; fail loudly if Rich changes how it is used."""
+    print("\nTesting Rich Internals...")
+    params = inspect.signature(LiveRender.__init__).parameters
+    assert {"renderable", "style", "vertical_overflow"} <= set(params)
+    assert list(inspect.signature(Live.process_renderables).parameters) == ["self", "renderables"]
+    assert LiveRender("x")._shape is None
+    assert all(hasattr(LiveRender, name) for name in ("position_cursor", "set_renderable", "__rich_console__"))
+
+    calls = []
+
+    class SpyRender(LiveRender):
+        def position_cursor(self):
+            calls.append("position_cursor")
+            return super().position_cursor()
+
+        def __rich_console__(self, console, options):
+            calls.append("render")
+            yield from super().__rich_console__(console, options)
+
+    class SpyLive(Live):
+        def process_renderables(self, renderables):
+            calls.append(renderables)
+            return super().process_renderables(renderables)
+
+    console = Console(file=io.StringIO(), force_terminal=True, force_interactive=True, width=40, height=10)
+    live = SpyLive("frame", console=console, auto_refresh=False)
+    assert isinstance(live._live_render, LiveRender)
+    live._live_render = SpyRender("frame", vertical_overflow=live.vertical_overflow)
+    with live:
+        calls.clear()
+        live.refresh()
+    # A refresh prints one bare Control, which Live turns into cursor positioning plus our render
+    ok = (len(calls) >= 3 and [type(r) for r in calls[0]] == [Control]
+          and calls[1:3] == ["position_cursor", "render"])
+    if ok:
+        print("PASS: Live still drives its LiveRender the way the dashboard expects.")
+    else:
+        print(f"FAIL: Rich's Live changed: {calls}. Check _DiffRender/_DiffLive against the pin in requirements.txt.")
+    assert ok
+
+if __name__ == "__main__":
+    test_incremental_sections()
+    test_frame_cap()
+    test_neighbors_follow_graph()
+    test_rich_internals()
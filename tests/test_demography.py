@@ -0,0 +1,154 @@
+from bloodlines.engine import GameEngine
+from bloodlines.events import EventManager
+from bloodlines.demography import TAX_RATE, numpy_available
+from bloodlines.models import Region, Terrain
+import math
+import os
+import tempfile
+
+def quiet_engine(seed=24):
+    engine = GameEngine(seed=seed)
+    engine.event_manager = EventManager(packs=())
+    engine.create_test_scenario()
+    return engine
+
+def test_regions_evolve():
+    if not numpy_available():
+        print("SKIP: numpy not installed.")
+        return
+    print("Testing Regional Demography...")
+    engine = quiet_engine()
+    plains = Region(name="Empty Plain", terrain=Terrain.PLAINS, population=500)
+    desert = Region(name="Crowded Desert", terrain=Terrain.DESERT, population=3000)
+    for region in (plains, desert):
+        engine.regions[region.id] = region
+    engine.enable_demography()
+    demography = engine.demography
+    for _ in range(120):
+        engine.advance_month()
+    grown, starved = demography.population_of(plains.id), demography.population_of(desert.id)
+    if grown > 500 and starved < 3000:
+        print(f"PASS: A fertile plain grew to {grown}; an overcrowded desert fell to {starved}.")
+    else:
+        print(f"FAIL: Plain {grown}, desert {starved}.")
+    assert grown > 500 and starved < 3000
+    assert demography.food[demography.slots[desert.id]] < 1.0
+
+    # A farm feeds more mouths
+    latium_id = next(r.id for r in engine.regions.values() if r.name == "Latium")
+    slot = demography.slots[latium_id]
+    player = engine.characters[engine.player_character_id]
+    player.wealth = 1000
+    before = demography.food[slot]
+    assert engine.construct_building(latium_id, "farm")
+    engine.advance_month()
+    assert demography.farms[slot] == 1
+    assert demography.food[slot] > before
+
+def test_taxes():
+    if not numpy_available():
+        return
+    plain, taxed = quiet_engine(), quiet_engine()
+    taxed.enable_demography()
+    player_id = taxed.player_character_id
+    latium_id = next(r.id for r in taxed.regions.values() if r.name == "Latium")
+    slot = taxed.demography.slots[latium_id]
+    owed = 0.0
+    for _ in range(24):
+        plain.advance_month()
+        taxed.advance_month()
+        owed += taxed.demography.output[slot] * TAX_RATE
+    paid = taxed.characters[player_id].wealth - plain.characters[plain.player_character_id].wealth
+    if paid == math.floor(owed) and paid > 0:
+        print(f"PASS: Latium paid its ruler {paid} in taxes over two years.")
+    else:
+        print(f"FAIL: Paid {paid}, owed {owed:.2f}.")
+    assert paid == math.floor(owed) and paid > 0
+
+def test_saved_totals():
+    if not numpy_available():
+        return
+    engine = quiet_engine()
+    engine.world_manager.generate_map(200, seed=24)
+    engine.enable_demography()
+    for _ in range(36):
+        engine.advance_month()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "regions.sav")
+        assert engine.save_game(path)
+        for region_id in engine.demography.ids:
+            assert engine.regions[region_id].population == engine.demography.population_of(region_id)
+        loaded = GameEngine(seed=24)
+        loaded.enable_demography()
+        assert loaded.load_game(path)
+    assert len(loaded.demography.ids) == len(engine.regions)
+    region_id = engine.demography.ids[-1]
+    assert loaded.demography.population_of(region_id) == engine.regions[region_id].population
+    print("PASS: Region totals are saved and the arrays rebuilt on load.")
+
+def test_autosave_round_trip():
+    if not numpy_available():
+        return
+    import numpy as np
+    engine = quiet_engine()
+    engine.world_manager.generate_map(50, seed=24)
+    engine.enable_demography()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "regions.sav")
+        engine.enable_autosave(path, compact_every=100)
+        kinds = [engine.autosaver.save()]
+        for _ in range(5):
+            for _ in range(3):
+                engine.advance_month()
+            kinds.append(engine.autosaver.save())
+        assert kinds == ["full"] + ["delta"] * 5
+        engine.disable_autosave()
+        loaded = quiet_engine()
+        loaded.enable_demography()
+        assert loaded.load_game(path)
+    live = {r.id: (r.population, r.wealth) for r in engine.regions.values()}
+    replayed = {r.id: (r.population, r.wealth) for r in loaded.regions.values()}
+    if live == replayed:
+        print("PASS: Journalled region totals match the live world.")
+    else:
+        print(f"FAIL: {sum(live[k] != replayed.get(k) for k in live)} regions differ after replay.")
+    assert live == replayed
+
+    # The arrays resume too, so both worlds go on in step
+    for _ in range(12):
+        engine.advance_month()
+        loaded.advance_month()
+    assert np.array_equal(loaded.demography.cohorts, engine.demography.cohorts)
+    assert np.array_equal(loaded.demography.wealth, engine.demography.wealth)
+    assert loaded.characters[loaded.player_character_id].wealth == engine.characters[engine.player_character_id].wealth
+
+def test_new_regions():
+    if not numpy_available():
+        return
+    import numpy as np
+    engine = quiet_engine()
+    engine.enable_demography()
+    for _ in range(24):
+        engine.advance_month()
+    cohorts = engine.demography.cohorts.copy()
+    region = Region(name="New Colony", terrain=Terrain.COASTAL, population=1000)
+    engine.regions[region.id] = region
+    engine.demography.step()
+    # The old regions were stepped from their own cohorts, not split afresh
+    expected = quiet_engine()
+    expected.enable_demography()
+    for _ in range(24):
+        expected.advance_month()
+    expected.demography.step()
+    old = len(cohorts[0])
+    assert np.array_equal(engine.demography.cohorts[:, :old], expected.demography.cohorts)
+    assert engine.demography.slots[region.id] == old
+    assert engine.demography.population_of(region.id) < 1000 * 1.01
+    print("PASS: A new region gets a slot without resetting the others.")
+
+if __name__ == "__main__":
+    test_regions_evolve()
+    test_taxes()
+    test_saved_totals()
+    test_autosave_round_trip()
+    test_new_regions()
@@ -0,0 +1,59 @@
+from bloodlines.engine import GameEngine
+from bloodlines.models import Character
+
+def test_economy():
+    print("Initializing Engine...")
+    engine = GameEngine()
+    engine.create_test_scenario()
+    player = engine.characters[engine.player_character_id]
+    latium_id = player.location_id
+
+    print("\nTesting Catalogue...")
+    catalogue = engine.building_catalogue
+    if catalogue.get_cost("farm") == 50 and catalogue.get_income("estate") == 5:
+        print("PASS: Building catalogue loaded.")
+    else:
+        print(f"FAIL: Catalogue data {catalogue.data}")
+    assert catalogue.get_cost("palace") is None
+
+    print("\nTesting Construction...")
+    engine.modify_wealth(player.id, 300)  # 400 total
+    engine.construct_building(latium_id, "farm")
+    engine.construct_building(latium_id, "estate")
+    income = engine.income_ledger.get_monthly_income(player.id)
+    if income == 6 and player.wealth == 150:
+        print("PASS: Ledger updated on construction.")
+    else:
+        print(f"FAIL: Income {income}, Wealth {player.wealth}")
+    assert income == 6 and player.wealth == 150
+
+    engine.process_economy()
+    if player.wealth == 156:
+        print("PASS: Monthly payout applied.")
+    else:
+        print(f"FAIL: Wealth {player.wealth} (Expected 156)")
+    assert player.wealth == 156
+
+    print("\nTesting Ruler Change...")
+    usurper = Character(name="Usurper")
+    engine.characters[usurper.id] = usurper
+    rome = next(iter(engine.polities.values()))
+    rome.ruler_id = usurper.id
+    engine.process_economy()
+    if usurper.wealth == 106 and player.wealth == 156:
+        print("PASS: Income follows new ruler.")
+    else:
+        print(f"FAIL: Usurper {usurper.wealth}, Player {player.wealth}")
+    assert usurper.wealth == 106 and player.wealth == 156
+
+    print("\nTesting Ownership Change...")
+    engine.world_manager.set_region_owner(latium_id, None)
+    engine.process_economy()
+    if usurper.wealth == 106 and engine.income_ledger.get_monthly_income(usurper.id) == 0:
+        print("PASS: Unowned region pays nobody.")
+    else:
+        print(f"FAIL: Usurper {usurper.wealth}")
+    assert usurper.wealth == 106
+
+if __name__ == "__main__":
+    test_economy()
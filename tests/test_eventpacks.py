@@ -0,0 +1,135 @@
+from bloodlines.engine import GameEngine
+from bloodlines.eventpacks import EventPackError, compile_expression, load_pack, parse_pack
+from bloodlines.events import EventManager
+from bloodlines.logbook import LogLevel
+from bloodlines.models import Character
+import json
+import os
+import random
+import tempfile
+
+def test_core_pack():
+    print("Testing Core Event Pack...")
+    with tempfile.TemporaryDirectory() as cache:
+        manager = EventManager(cache_dir=cache)
+    events = {e.id: e for e in manager.events}
+    expected = {"good_harvest": (), "minor_sickness": (), "diplomatic_insult": ("character_count",),
+                "gift_received": ("character_count",), "successful_feast": ("character_count", "wealth")}
+    if {k: e.depends_on for k, e in events.items()} == expected:
+        print("PASS: Built-in events loaded with derived dependencies.")
+    else:
+        print(f"FAIL: {[(e.id, e.depends_on) for e in manager.events]}")
+    assert {k: e.depends_on for k, e in events.items()} == expected
+
+    engine = GameEngine()
+    engine.create_test_scenario()
+    player_id = engine.player_character_id
+    feast = events["successful_feast"]
+    engine.characters[player_id].wealth = 29
+    blocked = feast.trigger_condition(engine, player_id)
+    engine.characters[player_id].wealth = 30
+    assert not blocked and feast.trigger_condition(engine, player_id)
+
+    engine.characters[player_id].wealth = 5
+    health = engine.characters[player_id].health
+    events["minor_sickness"].options[1].effect(engine, player_id)
+    if engine.characters[player_id].health == health - 1.0 and engine.get_wealth(player_id) == 5:
+        print("PASS: Physician refused when the ruler cannot pay.")
+    else:
+        print("FAIL: Physician effect wrong.")
+    assert engine.characters[player_id].health == health - 1.0 and engine.get_wealth(player_id) == 5
+
+    # An AI ruler taking the same option keeps the player's log clean
+    ruler = Character(name="Numitor", age=50, wealth=5)
+    engine.characters[ruler.id] = ruler
+    refusals = lambda: sum("afford a physician" in line for line in engine.logbook.lines())
+    before = refusals()
+    events["minor_sickness"].options[1].effect(engine, ruler.id)
+    assert refusals() == before  # DEBUG is below the default INFO level
+    engine.logbook.set_level("health", LogLevel.DEBUG)
+    events["minor_sickness"].options[1].effect(engine, ruler.id)
+    records = [r for r in engine.logbook.filter(kind="health", actor=ruler.id) if "physician" in r.message]
+    if [r.message for r in records] == ["You cannot afford a physician!"]:
+        print("PASS: AI rulers' effect texts are logged at DEBUG under their name.")
+    else:
+        print(f"FAIL: {engine.logbook.lines()[-3:]}")
+    assert [r.message for r in records] == ["You cannot afford a physician!"]
+
+    lonely = GameEngine()
+    hermit = Character(name="Hermit", age=40)
+    lonely.characters[hermit.id] = hermit
+    events["gift_received"].options[0].effect(lonely, hermit.id)
+    assert lonely.get_wealth(hermit.id) == 100  # No one to receive a gift from
+    print("PASS: Targeted option does nothing without a target.")
+
+def test_pack_validation():
+    print("\nTesting Pack Validation...")
+    bad = ["__import__('os')", "wealth.real", "[wealth]", "unknown > 1", "wealth >", "(lambda: 1)()"]
+    rejected = 0
+    for source in bad:
+        try:
+            compile_expression(source, "test")
+        except EventPackError:
+            rejected += 1
+    code, depends = compile_expression("not married and (wealth - 10) * 2 >= age or year < 0", "test")
+    if rejected == len(bad) and depends == ("age", "date", "spouse", "wealth"):
+        print("PASS: Unsafe or unknown expressions rejected.")
+    else:
+        print(f"FAIL: Rejected {rejected}/{len(bad)}, depends {depends}.")
+    assert rejected == len(bad) and depends == ("age", "date", "spouse", "wealth")
+
+    option = {"text": "Ok", "effects": [{"wealth": 1}]}
+    broken = [
+        {"events": [{"id": "a", "title": "A", "options": [dict(option, effects=[{"gold": 1}])]}]},
+        {"events": [{"id": "a", "title": "A", "options": [dict(option, effects=[{"wealth": "1"}])]}]},
+        {"events": [{"id": "a", "title": "A", "options": [dict(option, target="enemy")]}]},
+        {"events": [{"id": "a", "title": "A", "options": [option]}, {"id": "a", "title": "A", "options": [option]}]},
+        {"events": [{"id": "a", "options": [option]}]},
+        {"events": [{"id": "a", "title": "A", "options": []}]},
+    ]
+    errors = 0
+    for pack in broken:
+        try:
+            parse_pack(pack, "test")
+        except EventPackError:
+            errors += 1
+    if errors == len(broken):
+        print("PASS: Malformed events rejected.")
+    else:
+        print(f"FAIL: Only {errors}/{len(broken)} malformed packs rejected.")
+    assert errors == len(broken)
+
+def test_pack_cache():
+    print("\nTesting Compiled Pack Cache...")
+    pack = {"events": [{"id": "windfall", "title": "Windfall", "trigger": "wealth < 200",
+                        "options": [{"text": "Ok", "effects": [{"chance": 1.0, "then": [{"wealth": 7}]}]}]}]}
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "pack.json")
+        cache = os.path.join(tmp, "cache")
+        with open(path, "w") as f:
+            json.dump(pack, f)
+        load_pack(path, cache)
+        entries = os.listdir(cache)
+        events = load_pack(path, cache)  # Served from the cache
+        pack["events"][0]["weight"] = 3
+        with open(path, "w") as f:
+            json.dump(pack, f)
+        edited = load_pack(path, cache)
+        if len(entries) == 1 and len(os.listdir(cache)) == 2 and edited[0].weight == 3:
+            print("PASS: Cache reused, and invalidated by edits.")
+        else:
+            print(f"FAIL: Cache entries {os.listdir(cache)}.")
+        assert len(entries) == 1 and len(os.listdir(cache)) == 2 and edited[0].weight == 3
+
+    engine = GameEngine()
+    engine.create_test_scenario()
+    player_id = engine.player_character_id
+    random.seed(1)
+    events[0].options[0].effect(engine, player_id)
+    assert events[0].trigger_condition(engine, player_id) and engine.get_wealth(player_id) == 107
+    print("PASS: Cached event runs.")
+
+if __name__ == "__main__":
+    test_core_pack()
+    test_pack_validation()
+    test_pack_cache()
@@ -1,5 +1,9 @@
 from bloodlines.engine import GameEngine
-from bloodlines.events import EventManager
+from bloodlines.events import EventManager, Event, EventOption
+from bloodlines.eligibility import FenwickTree
+from bloodlines.models import Character, Polity, GovernmentType
+from collections import Counter
+import random
 
 def test_events():
     print("Initializing Engine...")
@@ -34,5 +38,149 @@ def test_events():
     else:
         print("FAIL: Event still active.")
 
+def test_event_eligibility():
+    print("\nTesting Eligibility Cache...")
+    engine = GameEngine()
+    engine.create_test_scenario()
+    player_id = engine.player_character_id
+    manager = engine.event_manager
+    calls = Counter()
+
+    def counted(name, condition):
+        def check(engine, char_id):
+            calls[name] += 1
+            return condition(engine, char_id)
+        return check
+
+    manager.add_event(Event(id="rich_only", title="Rich", description="", weight=1000,
+                            options=[EventOption(text="Ok", effect=lambda e, c: None)],
+                            trigger_condition=counted("rich", lambda e, c: e.get_wealth(c) >= 500),
+                            depends_on=("wealth",)))
+    manager.add_event(Event(id="undeclared", title="Undeclared", description="", weight=1,
+                            options=[EventOption(text="Ok", effect=lambda e, c: None)],
+                            trigger_condition=counted("undeclared", lambda e, c: True)))
+
+    random.seed(5)
+    for _ in range(50):
+        manager.get_random_event(engine, player_id)
+    if calls["rich"] == 1 and calls["undeclared"] == 50:
+        print("PASS: Declared conditions cached, undeclared ones re-checked.")
+    else:
+        print(f"FAIL: Condition calls {dict(calls)}.")
+    assert calls["rich"] == 1 and calls["undeclared"] == 50
+
+    engine.modify_wealth(player_id, 1000)
+    picks = Counter(manager.get_random_event(engine, player_id).id for _ in range(200))
+    if calls["rich"] == 2 and picks["rich_only"] > 150:
+        print("PASS: Wealth change re-evaluated the dependent event.")
+    else:
+        print(f"FAIL: Picks {dict(picks)}, calls {dict(calls)}.")
+    assert calls["rich"] == 2 and picks["rich_only"] > 150
+
+    stats = manager.get_stats()
+    if stats["rich_only"]["blocked"] == 50 and stats["rich_only"]["fired"] == picks["rich_only"]:
+        print("PASS: Fired/blocked counts recorded.")
+    else:
+        print(f"FAIL: Stats {stats['rich_only']}.")
+    assert stats["rich_only"] == {"fired": picks["rich_only"], "blocked": 50}
+
+def test_fenwick_sampling():
+    print("\nTesting Weighted Draws...")
+    weights = [5, 0, 1, 3, 0, 11]
+    tree = FenwickTree(len(weights))
+    for i, w in enumerate(weights):
+        tree.add(i, w)
+    counts = Counter(tree.find(r) for r in range(tree.total))
+    if counts == Counter({i: w for i, w in enumerate(weights) if w}):
+        print("PASS: Every unit of weight maps to its event.")
+    else:
+        print(f"FAIL: {counts}")
+    assert counts == Counter({i: w for i, w in enumerate(weights) if w})
+
+def test_ai_events():
+    print("\nTesting AI Ruler Events...")
+    engine = GameEngine()
+    engine.create_test_scenario()
+    rulers = []
+    for i in range(4):
+        ruler = Character(name=f"King {i}", age=40)
+        engine.characters[ruler.id] = ruler
+        polity = Polity(name=f"Realm {i}", government_type=GovernmentType.MONARCHY, ruler_id=ruler.id)
+        engine.polities[polity.id] = polity
+        rulers.append(ruler.id)
+    engine.characters[rulers[3]].is_alive = False
+    manager = engine.event_manager
+    manager.events = []
+    manager.add_event(Event(id="tribute", title="Tribute", description="", weight=1, depends_on=(),
+                            options=[EventOption(text="Keep it", effect=lambda e, c: e.modify_wealth(c, 5)),
+                                     EventOption(text="Share it", effect=lambda e, c: e.modify_wealth(c, 1))],
+                            trigger_condition=lambda e, c: True))
+    chosen = []
+
+    def keep(engine, event, char_id):
+        chosen.append(char_id)
+        return 0
+
+    engine.ai_event_policy = keep
+    with_chance = {}
+    for chance in (0.0, 1.0):
+        with_chance[chance] = manager.roll_batch(engine, engine.ai_rulers(), chance)
+    if not with_chance[0.0] and [c for c, _ in with_chance[1.0]] == rulers[:3]:
+        print("PASS: One roll per living AI ruler.")
+    else:
+        print(f"FAIL: Batch rolls {with_chance}.")
+    assert not with_chance[0.0] and [c for c, _ in with_chance[1.0]] == rulers[:3]
+
+    random.seed(3)
+    for _ in range(24):
+        engine.process_ai_events()
+    wealth = [engine.get_wealth(c) for c in rulers]
+    if set(chosen) == set(rulers[:3]) and all(w == 100 + 5 * chosen.count(c) for c, w in zip(rulers, wealth)):
+        print("PASS: AI choices applied to their rulers.")
+    else:
+        print(f"FAIL: Wealth {wealth}, choices {chosen}.")
+    assert set(chosen) == set(rulers[:3])
+    assert all(w == 100 + 5 * chosen.count(c) for c, w in zip(rulers, wealth))
+    assert engine.current_event is None
+
+def test_event_bookkeeping():
+    print("\nTesting Event Bookkeeping...")
+    engine = GameEngine()
+    engine.create_test_scenario()
+    manager = engine.event_manager
+    player_id = engine.player_character_id
+    for _ in range(5):
+        manager.get_random_event(engine, player_id)
+    manager.events = []
+    assert manager.stats == [] and manager.rolls == 0
+    crowned = Event(id="crowned", title="Crowned", description="", weight=1, depends_on=("government",),
+                    options=[EventOption(text="Ok", effect=lambda e, c: None)],
+                    trigger_condition=lambda e, c: bool(e.titles.polities_of(c)))
+    manager.add_event(crowned)
+    assert len(manager.stats) == 1
+
+    # The government input follows the title index
+    pretender = Character(name="Pretender", age=30)
+    engine.characters[pretender.id] = pretender
+    assert manager.get_random_event(engine, pretender.id) is None
+    realm = Polity(name="New Realm", government_type=GovernmentType.TRIBE)
+    engine.polities[realm.id] = realm
+    engine.set_ruler(realm.id, pretender.id)
+    assert manager.get_random_event(engine, pretender.id) is crowned
+    assert manager.get_stats()["crowned"] == {"fired": 1, "blocked": 1}
+
+    # The dead leave no cached eligibility behind
+    engine.kill_character(pretender.id, "old age")
+    if pretender.id not in manager._indexes:
+        print("PASS: Stats restart with a new event list; the dead are forgotten.")
+    else:
+        print("FAIL: A dead character's eligibility is still cached.")
+    assert pretender.id not in manager._indexes
+    assert manager.get_stats()["crowned"] == {"fired": 1, "blocked": 1}
+
 if __name__ == "__main__":
     test_events()
+    test_event_eligibility()
+    test_fenwick_sampling()
+    test_ai_events()
+    test_event_bookkeeping()
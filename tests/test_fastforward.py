@@ -0,0 +1,71 @@
+from bloodlines.engine import GameEngine
+from bloodlines.events import EventManager
+from bloodlines.fastforward import condition, fast_forward, wealth_crosses
+from bloodlines.logbook import month_index, parse_date
+
+def make_world(events: bool = True) -> GameEngine:
+    engine = GameEngine(seed=18)
+    engine.create_test_scenario()
+    if not events:
+        engine.event_manager = EventManager(packs=())
+    return engine
+
+def test_months_and_date():
+    print("Testing Fast Forward Limits...")
+    engine = make_world(events=False)
+    start = engine.get_month_index()
+    seen = []
+    result = fast_forward(engine, months=30, on_month=seen.append)
+    if result.months_run == 30 and result.stopped_by == "months" and engine.get_month_index() == start + 30:
+        print(f"PASS: Ran 30 months ({result.months_per_sec:.0f} months/sec).")
+    else:
+        print(f"FAIL: {result}")
+    assert result.months_run == 30 and result.stopped_by == "months"
+    assert engine.get_month_index() == start + 30 and seen == list(range(1, 31))
+
+    target = month_index(*parse_date("1/750 BC"))
+    result = fast_forward(engine, until=target)
+    assert result.stopped_by == "date" and engine.get_date_string() == "1/750 BC"
+    assert fast_forward(engine, until=target).months_run == 0
+
+def test_stops():
+    print("\nTesting Fast Forward Stops...")
+    engine = make_world()
+    result = fast_forward(engine)
+    if result.stopped_by == "event" and engine.current_event is not None:
+        print(f"PASS: Stopped for an event after {result.months_run} months.")
+    else:
+        print(f"FAIL: {result}")
+    assert result.stopped_by == "event" and engine.current_event is not None
+    assert fast_forward(engine, months=10).months_run == 0  # Still waiting on the player
+
+    engine = make_world(events=False)
+    player = engine.player_character_id
+    threshold = engine.get_wealth(player) + 1
+    gift = lambda months_run: engine.modify_wealth(player, 1) if months_run == 3 else None
+    result = fast_forward(engine, months=100, on_month=gift,
+                          watches=[condition("never", lambda e: False), wealth_crosses(threshold)])
+    if result.stopped_by == f"wealth reached {threshold}" and result.months_run == 3:
+        print("PASS: Wealth watch fired.")
+    else:
+        print(f"FAIL: {result}")
+    assert result.stopped_by == f"wealth reached {threshold}" and result.months_run == 3
+
+def test_parse_date():
+    print("\nTesting Date Parsing...")
+    assert parse_date("3/700 BC") == (3, 700, True)
+    assert parse_date("12/5") == (12, 5, False)
+    assert parse_date("800 bc") == (1, 800, True)
+    for bad in ("", "13/700 BC", "3/700 XX", "soon"):
+        try:
+            parse_date(bad)
+        except ValueError:
+            continue
+        print(f"FAIL: Parsed {bad!r}")
+        assert False
+    print("PASS: Dates parsed.")
+
+if __name__ == "__main__":
+    test_months_and_date()
+    test_stops()
+    test_parse_date()
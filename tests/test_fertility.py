@@ -0,0 +1,74 @@
+from bloodlines.engine import GameEngine, BIRTH_CHANCE
+from bloodlines.fertility import sample_binomial
+from bloodlines.models import Character
+import random
+
+def add_couple(engine, wife_age):
+    husband = Character(name="Husband", age=30, gender="Male")
+    wife = Character(name="Wife", age=wife_age, gender="Female")
+    engine.characters[husband.id] = husband
+    engine.characters[wife.id] = wife
+    engine.arrange_marriage(husband.id, wife.id)
+    return husband, wife
+
+def test_fertility():
+    print("Initializing Engine...")
+    engine = GameEngine()
+    engine.create_test_scenario()
+    player = engine.characters[engine.player_character_id]
+
+    print("\nTesting Candidate Set...")
+    if player.spouse_id in engine.fertility and len(engine.fertility) == 1:
+        print("PASS: Starting wife is a candidate.")
+    else:
+        print(f"FAIL: Candidates {engine.fertility.candidates()}")
+    assert engine.fertility.candidates() == [player.spouse_id]
+
+    husband, young_wife = add_couple(engine, 15)
+    _, old_wife = add_couple(engine, 45)
+    if young_wife.id not in engine.fertility and old_wife.id in engine.fertility:
+        print("PASS: Age window respected on marriage.")
+    else:
+        print("FAIL: Age window not respected.")
+    assert young_wife.id not in engine.fertility and old_wife.id in engine.fertility
+
+    print("\nTesting Birthdays...")
+    engine.month = 12
+    engine.advance_month()  # January: everyone ages
+    if young_wife.id in engine.fertility and old_wife.id not in engine.fertility:
+        print("PASS: Window slid with the new year.")
+    else:
+        print(f"FAIL: young={young_wife.age} old={old_wife.age}")
+    assert young_wife.id in engine.fertility and old_wife.id not in engine.fertility
+
+    print("\nTesting Spouse Death...")
+    engine.kill_character(husband.id, "Testing")
+    if young_wife.id not in engine.fertility:
+        print("PASS: Widow removed.")
+    else:
+        print("FAIL: Widow still a candidate.")
+    assert young_wife.id not in engine.fertility
+
+    print("\nTesting Binomial Draws...")
+    random.seed(5)
+    n, months = 2000, 300
+    per_candidate = [sum(random.random() < BIRTH_CHANCE for _ in range(n)) for _ in range(months)]
+    binomial = [sample_binomial(n, BIRTH_CHANCE) for _ in range(months)]
+    mean_a = sum(per_candidate) / months
+    mean_b = sum(binomial) / months
+    var_b = sum((x - mean_b) ** 2 for x in binomial) / months
+    expected_var = n * BIRTH_CHANCE * (1 - BIRTH_CHANCE)
+    print(f"Per-candidate mean {mean_a:.2f}, binomial mean {mean_b:.2f} (expected {n * BIRTH_CHANCE:.2f})")
+    if abs(mean_b - n * BIRTH_CHANCE) < 1.0 and abs(var_b - expected_var) < 0.25 * expected_var:
+        print("PASS: Binomial matches per-candidate statistics.")
+    else:
+        print(f"FAIL: Binomial variance {var_b:.2f} (expected {expected_var:.2f})")
+    assert abs(mean_b - mean_a) < 1.0
+    assert abs(var_b - expected_var) < 0.25 * expected_var
+
+    engine.fertility.mode = "binomial"
+    mothers = engine.fertility.pick_mothers(1.0)
+    assert sorted(mothers) == sorted(engine.fertility.candidates())
+
+if __name__ == "__main__":
+    test_fertility()
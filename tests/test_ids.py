@@ -0,0 +1,86 @@
+from bloodlines.engine import GameEngine
+from bloodlines.models import Character
+from bloodlines.ids import IdRegistry
+import gzip
+import json
+import os
+import re
+import tempfile
+import uuid
+
+def snapshot(engine):
+    return {
+        "player": engine.characters[engine.player_character_id].name,
+        "characters": sorted((c.name, c.age, c.wealth, len(c.children_ids)) for c in engine.characters.values()),
+        "regions": sorted((r.name, len(r.neighbors)) for r in engine.regions.values()),
+    }
+
+def test_registry():
+    print("Testing Id Registry...")
+    registry = IdRegistry()
+    first, second = registry.new_id(), registry.new_id()
+    legacy = str(uuid.uuid4())
+    interned = registry.intern(legacy)
+    if first == 1 and second == 2 and registry.intern(legacy) == interned and registry.external(interned) == legacy:
+        print("PASS: Dense ids handed out and legacy uuids interned stably.")
+    else:
+        print("FAIL: Registry mapping wrong.")
+    assert (first, second) == (1, 2)
+    assert registry.intern(legacy) == interned and registry.external(interned) == legacy
+
+    registry.intern("500")
+    if registry.new_id() == 501:
+        print("PASS: Loaded ids are reserved.")
+    else:
+        print("FAIL: New id could collide with a loaded one.")
+    assert registry.new_id() == 502
+
+def test_legacy_uuid_save():
+    print("\nTesting Legacy uuid Save...")
+    engine = GameEngine()
+    engine.create_test_scenario()
+    player_id = engine.player_character_id
+    engine.create_child(engine.characters[player_id].spouse_id, player_id)
+    engine.modify_opinion(player_id, engine.characters[player_id].spouse_id, 30)
+    assert isinstance(player_id, int)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "legacy.sav")
+        engine.save_game(path, save_format="json")
+        # Rewrite every id as a uuid string, as saves made before integer ids were
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            text = f.read()
+        uuids = {}
+        text = re.sub(r'"(\d+)"', lambda m: '"%s"' % uuids.setdefault(m.group(1), str(uuid.uuid4())), text)
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            f.write(text)
+
+        loaded = GameEngine()
+        ok = loaded.load_game(path)
+        player = loaded.characters.get(loaded.player_character_id)
+        consistent = ok and player is not None and all(
+            cid in loaded.characters for cid in player.children_ids + list(player.opinions))
+        if consistent and snapshot(loaded) == snapshot(engine):
+            print("PASS: uuid save loaded into integer ids.")
+        else:
+            print("FAIL: uuid save not mapped correctly.")
+        assert consistent and snapshot(loaded) == snapshot(engine)
+        assert all(isinstance(k, int) for k in loaded.characters)
+
+        fresh = Character()
+        if fresh.id not in loaded.characters:
+            print("PASS: New ids do not collide with loaded ones.")
+        else:
+            print("FAIL: Id collision after load.")
+        assert fresh.id not in loaded.characters
+
+        # Saving again keeps the original uuids on disk
+        resaved = os.path.join(tmp, "resaved.sav")
+        loaded.save_game(resaved, save_format="json")
+        with gzip.open(resaved, "rt", encoding="utf-8") as f:
+            data = json.load(f)
+        assert set(data["characters"]) == {uuids[str(cid)] for cid in engine.characters}
+
+if __name__ == "__main__":
+    test_registry()
+    test_legacy_uuid_save()
@@ -0,0 +1,74 @@
+from bloodlines.engine import GameEngine
+from bloodlines.models import Character
+import os
+import tempfile
+
+def test_lineage():
+    print("Initializing Engine...")
+    engine = GameEngine()
+    engine.create_test_scenario()
+    player = engine.characters[engine.player_character_id]
+    wife = engine.characters[player.spouse_id]
+
+    # Second wife for half-siblings
+    concubine = Character(name="Livia", age=25, gender="Female")
+    engine.characters[concubine.id] = concubine
+    engine.lineage.add(concubine)
+
+    engine.create_child(wife.id, player.id)
+    engine.create_child(concubine.id, player.id)
+    full_id, half_id = player.children_ids[-2], player.children_ids[-1]
+    son_id = player.children_ids[0]
+
+    print("\nTesting Children...")
+    children = engine.lineage.get_children(player.id)
+    if children == player.children_ids:
+        print(f"PASS: {len(children)} children indexed.")
+    else:
+        print(f"FAIL: Children {children} (Expected {player.children_ids})")
+    assert children == player.children_ids
+
+    print("\nTesting Siblings...")
+    full = engine.lineage.get_full_siblings(son_id)
+    half = engine.lineage.get_half_siblings(son_id)
+    if full == [full_id] and half == [half_id]:
+        print("PASS: Full and half siblings separated.")
+    else:
+        print(f"FAIL: full={full} half={half}")
+    assert full == [full_id] and half == [half_id]
+
+    tree = engine.get_family_tree(son_id)
+    assert [c.id for c in tree["siblings"]] == [full_id, half_id]
+
+    print("\nTesting Ancestors/Descendants...")
+    grandchild_mother = Character(name="Cornelia", age=20, gender="Female")
+    engine.characters[grandchild_mother.id] = grandchild_mother
+    engine.lineage.add(grandchild_mother)
+    engine.create_child(grandchild_mother.id, son_id)
+    grandchild_id = engine.characters[son_id].children_ids[-1]
+
+    ancestors = engine.lineage.get_ancestors(grandchild_id, max_depth=2)
+    descendants = engine.lineage.get_descendants(player.id, max_depth=2)
+    if set(ancestors) == {son_id, grandchild_mother.id, player.id, wife.id} and grandchild_id in descendants:
+        print("PASS: Ancestors and descendants resolved.")
+    else:
+        print(f"FAIL: ancestors={ancestors} descendants={descendants}")
+    assert grandchild_id in descendants
+    assert grandchild_id not in engine.lineage.get_descendants(player.id, max_depth=1)
+
+    print("\nTesting Consistency after Load...")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "lineage.sav")
+        engine.save_game(path)
+        loaded = GameEngine()
+        loaded.load_game(path)
+    problems = loaded.lineage.check_consistency(loaded.characters)
+    if not problems:
+        print("PASS: Index consistent after load.")
+    else:
+        print(f"FAIL: {problems}")
+    assert not problems
+    assert loaded.lineage.get_children(player.id) == player.children_ids
+
+if __name__ == "__main__":
+    test_lineage()
@@ -0,0 +1,66 @@
+from bloodlines.engine import GameEngine
+from bloodlines.logbook import LogBook, LogLevel
+import gzip
+import json
+import os
+import tempfile
+
+def test_logbook():
+    print("Testing Ring Buffer...")
+    book = LogBook(capacity=5)
+    for i in range(12):
+        book.record((1, 753, True), "general", "Entry {}", (i,))
+    lines = book.tail(10)
+    if len(lines) == 5 and lines[-1] == "[1/753 BC] Entry 11":
+        print("PASS: Oldest entries evicted.")
+    else:
+        print(f"FAIL: {lines}")
+    assert lines == [f"[1/753 BC] Entry {i}" for i in range(7, 12)]
+
+    print("\nTesting Verbosity...")
+    engine = GameEngine()
+    engine.create_test_scenario()
+    player_id = engine.player_character_id
+    engine.logbook.set_level("economy", LogLevel.OFF)
+    before = len(engine.logbook.records)
+    engine.modify_wealth(player_id, 10)
+    if len(engine.logbook.records) == before:
+        print("PASS: Economy chatter suppressed.")
+    else:
+        print("FAIL: Economy entry recorded.")
+    assert len(engine.logbook.records) == before
+    assert engine.get_wealth(player_id) == 110
+
+    engine.modify_health(player_id, -1.0)
+    record = engine.logbook.records[-1]
+    if record.kind == "health" and record.actors == (player_id,):
+        print("PASS: Structured record kept.")
+    else:
+        print(f"FAIL: {record}")
+    assert record.message == "Lucius Julius health change: -1.0"
+
+    print("\nTesting Legacy Save...")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "legacy.sav")
+        engine.save_game(path, save_format="json")
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            data = json.load(f)
+        if all(isinstance(line, str) for line in data["logs"]):
+            print("PASS: Saved logs are formatted lines.")
+        else:
+            print("FAIL: Saved logs are not strings.")
+
+        # Old saves stored logs as a plain list of strings
+        data["logs"] = ["[3/750 BC] An old entry"]
+        with gzip.open(path, 'wt', encoding='utf-8') as f:
+            json.dump(data, f)
+        loaded = GameEngine()
+        ok = loaded.load_game(path)
+    if ok and loaded.logs[0] == "[3/750 BC] An old entry":
+        print("PASS: Legacy logs restored.")
+    else:
+        print(f"FAIL: {loaded.logs}")
+    assert ok and loaded.logs[0] == "[3/750 BC] An old entry"
+
+if __name__ == "__main__":
+    test_logbook()
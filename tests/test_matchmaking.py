@@ -0,0 +1,90 @@
+from bloodlines.engine import GameEngine
+from bloodlines.matchmaking import IdSet, MARRIAGE_AGE
+from bloodlines.models import Character, Dynasty
+import random
+
+def make_world(singles: int = 400) -> GameEngine:
+    """The test scenario plus unmarried people of two cultures and a few dynasties, ages 10 to 39."""
+    engine = GameEngine(seed=20)
+    engine.create_test_scenario()
+    dynasties = [Dynasty(name=f"House {i}") for i in range(4)]
+    for dynasty in dynasties:
+        engine.dynasties[dynasty.id] = dynasty
+    rng = random.Random(20)
+    for i in range(singles):
+        dynasty = rng.choice(dynasties)
+        char = Character(name=f"Single {i}", age=rng.randint(10, 39), gender=rng.choice(["Male", "Female"]),
+                         culture=rng.choice(["Roman", "Greek"]), dynasty_id=dynasty.id)
+        engine.characters[char.id] = char
+        dynasty.members.append(char.id)
+    return engine
+
+def brute_singles(engine, gender):
+    return sorted(cid for cid, c in engine.characters.items()
+                  if c.is_alive and not c.spouse_id and c.gender == gender and c.age >= MARRIAGE_AGE)
+
+def test_id_set():
+    print("Testing IdSet...")
+    ids = IdSet()
+    for char_id in (500, 3, 70, 3, 12):
+        ids.add(char_id)
+    ids.discard(70)
+    ids.discard(999)
+    if list(ids) == [3, 12, 500] and len(ids) == 3 and ids[2] == 500 and 12 in ids and 70 not in ids:
+        print("PASS: Ordered, deduplicated, k-th member.")
+    else:
+        print(f"FAIL: {list(ids)}")
+    assert list(ids) == [3, 12, 500] and len(ids) == 3 and ids[2] == 500 and 12 in ids and 70 not in ids
+
+def test_marriage_pass():
+    print("\nTesting AI Marriage Pass...")
+    engine = make_world()
+    player = engine.characters[engine.player_character_id]
+    before = sum(1 for c in engine.characters.values() if c.spouse_id)
+    for _ in range(120):
+        engine.advance_month()
+        if engine.current_event:
+            engine.resolve_event(0)
+    chars = engine.characters
+    married = [c for c in chars.values() if c.spouse_id and c.dynasty_id != player.dynasty_id and c.id != player.spouse_id]
+    print(f"{len(married) // 2} AI couples after 10 years ({before // 2} at the start)")
+    assert len(married) > 50
+    for char in married:
+        spouse = chars[char.spouse_id]
+        assert spouse.spouse_id == char.id and spouse.gender != char.gender
+        assert spouse.dynasty_id != char.dynasty_id
+    assert chars[player.spouse_id].spouse_id == player.id  # The player's own marriage untouched
+    same_culture = sum(1 for c in married if chars[c.spouse_id].culture == c.culture)
+    assert same_culture > 0.9 * len(married)  # Other cultures only once a culture runs out of brides
+
+    # The incrementally kept buckets match a scan, across births, deaths and birthdays
+    for gender in ("Male", "Female"):
+        incremental = list(engine.matchmaker.singles(gender))
+        assert incremental == brute_singles(engine, gender)
+        engine.matchmaker.rebuild()
+        assert list(engine.matchmaker.singles(gender)) == incremental
+    print("PASS: Valid couples, buckets match a full scan.")
+
+def test_player_dynasty_reserved():
+    print("\nTesting Player Dynasty Left Alone...")
+    engine = make_world(0)
+    player = engine.characters[engine.player_character_id]
+    son = engine.characters[player.children_ids[0]]
+    son.age = 20
+    for i in range(20):
+        woman = Character(name=f"Bride {i}", age=20, gender="Female", culture=son.culture)
+        engine.characters[woman.id] = woman
+    engine.matchmaker.rebuild()
+    couples = []
+    for _ in range(50):
+        couples += engine.matchmaker.run(chance=1.0)
+    if not couples and not son.spouse_id:
+        print("PASS: The heir is the player's to marry.")
+    else:
+        print(f"FAIL: {couples}")
+    assert not couples and not son.spouse_id
+
+if __name__ == "__main__":
+    test_id_set()
+    test_marriage_pass()
+    test_player_dynasty_reserved()
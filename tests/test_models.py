@@ -0,0 +1,129 @@
+from bloodlines.models import Character, STAT_LIMIT, TraitList
+
+def test_vacant_containers():
+    print("Testing Unallocated Containers...")
+    char = Character()
+    assert char.children_ids == [] and char._children is None
+    char.children_ids[:] = [1, 2]
+    if char.children_ids == [1, 2]:
+        print("PASS: Slice assignment allocates the list.")
+    else:
+        print(f"FAIL: children_ids {char.children_ids}")
+    assert char.children_ids == [1, 2]
+
+    # Every mutator reaches the character, and the stand-in then is the real list
+    for change, expected in [
+        (lambda kids: kids.extend([3, 1]), [3, 1]),
+        (lambda kids: kids.insert(0, 4), [4]),
+        (lambda kids: kids.__iadd__([5]), [5]),
+        (lambda kids: kids.__setitem__(slice(None), [2, 1]), [2, 1]),
+    ]:
+        char = Character()
+        kids = char.children_ids
+        change(kids)
+        assert char.children_ids == expected and char.children_ids is kids
+        kids.append(9)
+        kids.sort()
+        assert char.children_ids == sorted(expected + [9])
+
+    char = Character()
+    kids = char.children_ids
+    kids += [1, 2, 3]
+    kids.remove(2)
+    del kids[0]
+    assert kids.pop() == 3 and char.children_ids == []
+    assert char._children is kids  # Allocated, now empty
+
+    # A second stand-in handed out before the first write writes to the same list
+    char = Character()
+    first, second = char.children_ids, char.children_ids
+    first.append(1)
+    second.append(2)
+    assert char.children_ids == [1, 2]
+
+    # Emptying an unallocated list behaves like an empty list
+    char = Character()
+    try:
+        char.children_ids.pop()
+        raise AssertionError("pop from an empty list succeeded")
+    except IndexError:
+        pass
+
+    char = Character()
+    opinions = char.opinions
+    opinions |= {1: 10}
+    opinions.setdefault(2, -5)
+    del opinions[1]
+    assert char.opinions == {2: -5} and char.opinions is opinions
+    char = Character()
+    char.opinions.update({3: 1})
+    assert char.opinions.pop(3) == 1 and char.opinions == {}
+    print("PASS: Every list and dict mutator allocates the real container.")
+
+def test_traits():
+    char = Character(traits=["Brave", "Zealous", "Brave"])
+    assert isinstance(char.traits, TraitList)
+    assert char.traits == ["Brave", "Zealous"] and len(char.traits) == 2
+    char.traits.append("Ambitious")
+    char.traits.remove("Brave")
+    assert "Brave" not in char.traits and "Ambitious" in char.traits
+    char.traits.discard("Unheard Of")
+    try:
+        char.traits.remove("Brave")
+        raise AssertionError("removed a trait that is not held")
+    except ValueError:
+        pass
+    # Traits are a set, listed in the order the game first saw them
+    Character(traits=["Stargazer"])
+    other = Character(traits=["Beekeeper", "Stargazer"])
+    assert other.traits == ["Stargazer", "Beekeeper"]
+    other.traits.clear()
+    assert other.traits == [] and len(other.traits) == 0
+    # Concatenation gives a plain list; += adds to the bitset like extend
+    other.traits += ["Beekeeper", "Stargazer"]
+    assert isinstance(other.traits, TraitList) and other.traits == ["Stargazer", "Beekeeper"]
+    joined = other.traits + ["Brave"]
+    assert type(joined) is list and joined == ["Stargazer", "Beekeeper", "Brave"]
+    assert ["Brave"] + other.traits == ["Brave", "Stargazer", "Beekeeper"]
+    assert char.traits + other.traits == ["Zealous", "Ambitious", "Stargazer", "Beekeeper"]
+    print("PASS: Traits are held once each in a bitset.")
+
+def test_stats():
+    char = Character(martial=12, diplomacy=0, stewardship=-3, intrigue=20, learning=300)
+    assert (char.martial, char.diplomacy, char.stewardship, char.intrigue, char.learning) == (12, 0, -3, 20, 300)
+    assert Character().martial == 5 and Character().learning == 5
+    char.learning = STAT_LIMIT - 1
+    char.martial = -STAT_LIMIT
+    assert char.learning == STAT_LIMIT - 1 and char.martial == -STAT_LIMIT and char.intrigue == 20
+    for value in (STAT_LIMIT, -STAT_LIMIT - 1):
+        try:
+            char.diplomacy = value
+            raise AssertionError(f"stored out-of-range stat {value}")
+        except ValueError:
+            pass
+    assert char.diplomacy == 0
+    print("PASS: Stats pack into one int within the save format's range.")
+
+def test_dict_round_trip():
+    father = Character(name="Father")
+    char = Character(name="Gaius", age=30, father_id=father.id, children_ids=[father.id], martial=14,
+                     stewardship=-2, traits=["Brave", "Greedy"], health=7.5, wealth=250,
+                     opinions={father.id: -20})
+    data = char.to_dict()
+    assert sorted(data["traits"]) == ["Brave", "Greedy"] and data["martial"] == 14 and data["stewardship"] == -2
+    copy = Character.from_dict(char.to_dict())
+    if copy == char and copy.to_dict() == data:
+        print("PASS: to_dict/from_dict round trip.")
+    else:
+        print(f"FAIL: {copy.to_dict()} != {data}")
+    assert copy == char and copy.to_dict() == data
+    empty = Character.from_dict(Character().to_dict())
+    assert empty._children is None and empty._opinions is None
+    copy.opinions[father.id] = 5
+    assert copy != char
+
+if __name__ == "__main__":
+    test_vacant_containers()
+    test_traits()
+    test_stats()
+    test_dict_round_trip()
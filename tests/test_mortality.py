@@ -0,0 +1,107 @@
+from bloodlines.engine import GameEngine
+from bloodlines.models import Character
+from bloodlines.logbook import LogLevel
+import os
+import random
+import tempfile
+
+def build_elders(count, age=60):
+    engine = GameEngine()
+    engine.logbook.set_level("death", LogLevel.OFF)
+    for _ in range(count):
+        char = Character(name="Elder", age=age)
+        engine.characters[char.id] = char
+    return engine
+
+def test_mortality():
+    print("Testing Month Index...")
+    engine = GameEngine()
+    start = engine.get_month_index()
+    engine.month = 12
+    engine.advance_month()
+    if engine.get_month_index() == start + 12:
+        print("PASS: Month index is continuous.")
+    else:
+        print(f"FAIL: {start} -> {engine.get_month_index()}")
+    assert engine.get_month_index() == start + 12
+    engine.year, engine.month, engine.is_bc = 1, 12, True
+    before = engine.get_month_index()
+    engine.advance_month()
+    assert engine.get_month_index() == before + 1  # 12/1 BC -> 1/1 AD
+
+    print("\nTesting Death Statistics...")
+    random.seed(9)
+    count, months = 3000, 12
+    # 11 ticks at the age-60 monthly hazard of 5%
+    survival = 0.95 ** (months - 1)
+    expected = count * (1 - survival)
+    sigma = (count * survival * (1 - survival)) ** 0.5
+
+    engine = build_elders(count)
+    engine.month = 2
+    for _ in range(months - 1):
+        engine.process_characters()
+    looped = sum(not c.is_alive for c in engine.characters.values())
+
+    engine = build_elders(count)
+    engine.month = 1  # Ticks run February..December, so nobody ages
+    engine.enable_death_scheduler()
+    for _ in range(months - 1):
+        engine.advance_month()
+    scheduled = sum(not c.is_alive for c in engine.characters.values())
+
+    print(f"Deaths: loop={looped}, scheduler={scheduled}, expected={expected:.0f}")
+    if abs(scheduled - expected) < 5 * sigma and abs(looped - expected) < 5 * sigma:
+        print("PASS: Scheduler matches monthly rolls.")
+    else:
+        print("FAIL: Death counts diverge.")
+    assert abs(scheduled - expected) < 5 * sigma and abs(looped - expected) < 5 * sigma
+
+    print("\nTesting Modifiers...")
+    immortal = next(c for c in engine.characters.values() if c.is_alive)
+    engine.death_scheduler.set_modifier(immortal.id, 0.0)
+    doomed = next(c for c in engine.characters.values() if c.is_alive and c.id != immortal.id)
+    engine.death_scheduler.set_modifier(doomed.id, 100.0)
+    engine.advance_month()
+    if immortal.is_alive and not doomed.is_alive:
+        print("PASS: Modifiers redraw the schedule.")
+    else:
+        print("FAIL: Modifiers ignored.")
+    assert immortal.is_alive and not doomed.is_alive
+
+    print("\nTesting Save/Load...")
+    engine = GameEngine()
+    engine.create_test_scenario()
+    engine.enable_death_scheduler()
+    engine.modify_health(engine.player_character_id, -1.0)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "mortality.sav")
+        engine.save_game(path)
+        loaded = GameEngine()
+        ok = loaded.load_game(path)
+    if ok and loaded.death_scheduler and loaded.death_scheduler.due == engine.death_scheduler.due:
+        print("PASS: Schedule survives a round trip.")
+    else:
+        print("FAIL: Schedule lost.")
+    assert ok and loaded.death_scheduler.due == engine.death_scheduler.due
+
+    print("\nTesting Heap Compaction...")
+    engine = build_elders(50)
+    engine.enable_death_scheduler()
+    scheduler = engine.death_scheduler
+    ids = list(engine.characters)
+    largest = 0
+    for i in range(5000):
+        scheduler.reschedule(ids[i % len(ids)])
+        largest = max(largest, len(scheduler._heap))
+    scheduler.cancel(ids[0])
+    live = dict(scheduler.due)
+    dying = scheduler.pop_due(max(live.values()))
+    if largest <= 2 * len(ids) + 1 and sorted(dying) == sorted(live):
+        print(f"PASS: 5000 reschedules of {len(ids)} characters peaked at {largest} heap entries.")
+    else:
+        print(f"FAIL: heap peaked at {largest}, dying {len(dying)} of {len(live)}.")
+    assert largest <= 2 * len(ids) + 1 and sorted(dying) == sorted(live)
+
+if __name__ == "__main__":
+    test_mortality()
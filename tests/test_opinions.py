@@ -0,0 +1,93 @@
+from bloodlines.engine import GameEngine
+from bloodlines.models import Character
+from bloodlines.opinions import DictOpinionStore, OpinionStore, FLUSH_AT
+from bloodlines.population import numpy_available
+import random
+
+def check_store(store, label):
+    print(f"Testing {label}...")
+    store.add(1, 2, 30)
+    store.add(1, 2, 90)
+    store.add(1, 3, -40)
+    store.add(4, 2, 10)
+    if store.get(1, 2) == 100 and store.get(1, 3) == -40 and store.get(2, 1) == 0:
+        print("PASS: Opinions clamp and default to 0.")
+    else:
+        print("FAIL: Wrong stored opinions.")
+    assert store.get(1, 2) == 100 and store.get(1, 3) == -40 and store.get(2, 1) == 0
+
+    store.add_toward(2, [1, 4, 5, 5], 10)
+    if (store.get(1, 2), store.get(4, 2), store.get(5, 2)) == (100, 20, 10):
+        print("PASS: Bulk update applied once per holder.")
+    else:
+        print("FAIL: Bulk update wrong.")
+    assert (store.get(1, 2), store.get(4, 2), store.get(5, 2)) == (100, 20, 10)
+
+    assert store.top(1, 1) == [(2, 100)]
+    assert store.top(1, 5, rivals=True) == [(3, -40)]
+    assert store.top_toward(2, 2) == [(1, 100), (4, 20)]
+
+    for _ in range(10):
+        store.decay(2)
+    if store.row(1) == {2: 80, 3: -20} and store.get(4, 2) == 0 and len(store) == 2:
+        print("PASS: Decay moves toward 0 and drops neutral entries.")
+    else:
+        print(f"FAIL: After decay {store.row(1)}, {len(store)} entries.")
+    assert store.row(1) == {2: 80, 3: -20} and store.get(4, 2) == 0 and len(store) == 2
+
+    # Enough writes to force several merges of the pending buffer
+    rng = random.Random(3)
+    expected = {}
+    for _ in range(3 * FLUSH_AT):
+        holder, target, change = rng.randint(10, 60), rng.randint(10, 60), rng.randint(-30, 30)
+        value = max(-100, min(100, expected.get((holder, target), 0) + change))
+        expected[(holder, target)] = value
+        store.add(holder, target, change)
+    assert all(store.get(h, t) == v for (h, t), v in expected.items())
+
+def test_dict_store():
+    check_store(DictOpinionStore(), "Dict Opinion Store")
+
+def test_array_store():
+    if not numpy_available():
+        print("SKIP: numpy not installed.")
+        return
+    check_store(OpinionStore(), "Array Opinion Store")
+
+def test_engine_opinions():
+    print("\nTesting Engine Integration...")
+    engine = GameEngine()
+    engine.create_test_scenario()
+    player_id = engine.player_character_id
+    guests = []
+    for i in range(20):
+        guest = Character(name=f"Guest {i}", age=30)
+        engine.characters[guest.id] = guest
+        guests.append(guest.id)
+    feast = next(e for e in engine.event_manager.events if e.id == "successful_feast")
+    feast.options[0].effect(engine, player_id)
+    engine.modify_opinion(player_id, guests[0], 60)
+    engine.modify_opinion(player_id, guests[1], -60)
+
+    admirers = engine.get_admirers(player_id, 100)
+    if len(admirers) == len(engine.characters) - 1 and all(v == 10 for _, v in admirers):
+        print("PASS: Feast raised everyone's opinion of the host.")
+    else:
+        print("FAIL: Feast opinions wrong.")
+    assert len(admirers) == len(engine.characters) - 1
+
+    related = engine.get_relationships(player_id)
+    if related[:2] == [engine.characters[player_id].spouse_id, engine.characters[player_id].children_ids[0]] \
+            and guests[0] in related and guests[1] in related:
+        print("PASS: Relationships list family, friends and rivals.")
+    else:
+        print("FAIL: Relationships list wrong.")
+    assert guests[0] in related and guests[1] in related
+
+    engine.advance_month()
+    assert engine.get_opinion(player_id, guests[0]) == 60 - 1
+
+if __name__ == "__main__":
+    test_dict_store()
+    test_array_store()
+    test_engine_opinions()
@@ -0,0 +1,120 @@
+import heapq
+import os
+import random
+import tempfile
+from bloodlines.engine import GameEngine
+from bloodlines.events import EventManager
+from bloodlines.models import Character
+from bloodlines.pathfinding import TERRAIN_COST
+
+def reference_cost(engine, start, end):
+    """Plain Dijkstra over Region.neighbors."""
+    best = {start: 0}
+    heap = [(0, start)]
+    while heap:
+        d, u = heapq.heappop(heap)
+        if u == end:
+            return d
+        if d > best[u]:
+            continue
+        for v in engine.regions[u].neighbors:
+            nd = d + max(TERRAIN_COST[engine.regions[u].terrain], TERRAIN_COST[engine.regions[v].terrain])
+            if nd < best.get(v, float("inf")):
+                best[v] = nd
+                heapq.heappush(heap, (nd, v))
+    return None
+
+def test_quickest_routes():
+    print("Testing Route Planner...")
+    engine = GameEngine(seed=23)
+    regions = engine.world_manager.generate_map(900, seed=23)
+    router = engine.world_manager.router
+    rng = random.Random(23)
+    for _ in range(40):
+        start, end = rng.choice(regions).id, rng.choice(regions).id
+        route = router.route(start, end)
+        assert route.regions[0] == start and route.regions[-1] == end
+        for a, b in zip(route.regions, route.regions[1:]):
+            assert b in engine.regions[a].neighbors
+        assert route.cost == sum(router.leg_cost(a, b) for a, b in zip(route.regions, route.regions[1:]))
+        if route.cost != reference_cost(engine, start, end):
+            print(f"FAIL: Route of {route.cost} months, quickest is {reference_cost(engine, start, end)}.")
+        assert route.cost == reference_cost(engine, start, end)
+    print("PASS: A* with landmarks finds the quickest routes.")
+
+def test_cache_and_islands():
+    engine = GameEngine(seed=23)
+    engine.create_test_scenario()
+    by_name = {region.name: region.id for region in engine.regions.values()}
+    router = engine.world_manager.router
+    assert router.route(by_name["Etruria"], by_name["Lower Egypt"]) is None
+    route = router.route(by_name["Etruria"], by_name["Campania"])
+    assert [engine.regions[r].name for r in route.regions] == ["Etruria", "Latium", "Campania"]
+    router.route(by_name["Etruria"], by_name["Campania"])
+    assert router.hits == 1
+
+    # New regions replace the graph, and the router starts over
+    engine.world_manager.generate_map(50, seed=1)
+    router.route(by_name["Etruria"], by_name["Campania"])
+    if router.hits == 1 and router.misses == 3:
+        print("PASS: Route cache hit, and dropped when the map changed.")
+    else:
+        print(f"FAIL: {router.hits} hits, {router.misses} misses.")
+    assert router.hits == 1 and router.misses == 3
+
+    small = type(router)(engine, cache_size=2)
+    for name in ("Latium", "Campania", "Etruria"):
+        small.route(by_name["Etruria"], by_name[name])
+    assert len(small._cache) == 2
+
+def test_journey():
+    print("Testing Journeys...")
+    engine = GameEngine(seed=23)
+    engine.event_manager = EventManager(packs=())
+    engine.create_test_scenario()
+    regions = engine.world_manager.generate_map(400, seed=5)
+    traveller = Character(name="Traveller", age=30, location_id=regions[0].id)
+    engine.characters[traveller.id] = traveller
+    target = regions[-1].id
+    route = engine.world_manager.plan_route(traveller.id, target)
+    arrival = engine.world_manager.travel(traveller.id, target)
+    assert arrival == engine.get_month_index() + route.cost
+
+    visited = [traveller.location_id]
+    while engine.get_month_index() < arrival:
+        engine.advance_month()
+        if traveller.location_id != visited[-1]:
+            visited.append(traveller.location_id)
+            assert engine.get_month_index() <= arrival
+    if visited == route.regions and traveller.id not in engine.world_manager.journeys:
+        print(f"PASS: Arrived after {route.legs} legs, on the month planned.")
+    else:
+        print("FAIL: Journey did not follow its route.")
+    assert visited == route.regions
+    assert traveller.id not in engine.world_manager.journeys
+
+def test_journey_saved():
+    engine = GameEngine(seed=23)
+    engine.event_manager = EventManager(packs=())
+    engine.create_test_scenario()
+    regions = engine.world_manager.generate_map(100, seed=5)
+    traveller = Character(name="Traveller", age=30, location_id=regions[0].id)
+    engine.characters[traveller.id] = traveller
+    arrival = engine.world_manager.travel(traveller.id, regions[-1].id)
+    engine.advance_month()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "travel.sav")
+        for save_format in ("binary", "json"):
+            assert engine.save_game(path, save_format=save_format)
+            loaded = GameEngine(seed=23)
+            loaded.load_game(path)
+            journey = loaded.world_manager.journeys[traveller.id]
+            assert journey == engine.world_manager.journeys[traveller.id]
+            assert journey.arrival_month == arrival
+    print("PASS: Journeys survive a save and load.")
+
+if __name__ == "__main__":
+    test_quickest_routes()
+    test_cache_and_islands()
+    test_journey()
+    test_journey_saved()
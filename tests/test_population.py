@@ -0,0 +1,113 @@
+from bloodlines.engine import GameEngine
+from bloodlines.models import Character
+from bloodlines.population import numpy_available
+import os
+import tempfile
+
+def test_population():
+    if not numpy_available():
+        print("SKIP: numpy not installed.")
+        return
+
+    print("Initializing Engine...")
+    engine = GameEngine()
+    engine.create_test_scenario()
+    engine.enable_population_store(seed=1)
+    player = engine.characters[engine.player_character_id]
+
+    print("\nTesting Views...")
+    engine.modify_wealth(player.id, 25)
+    if player.wealth == 125 and type(player.wealth) is int:
+        print("PASS: Character reads through to the store.")
+    else:
+        print(f"FAIL: Wealth {player.wealth!r}")
+    assert player.wealth == 125 and type(player.wealth) is int
+    assert player.to_dict()["martial"] == 12
+
+    print("\nTesting Vectorized Aging...")
+    initial_age = player.age
+    for _ in range(12):
+        engine.advance_month()
+    if player.age == initial_age + 1:
+        print("PASS: Player aged correctly.")
+    else:
+        print(f"FAIL: Player age {player.age} (expected {initial_age + 1})")
+    assert player.age == initial_age + 1
+
+    print("\nTesting Vectorized Mortality...")
+    elder = Character(name="Elder", age=300)  # Death chance > 100%
+    engine.characters[elder.id] = elder  # Added behind the engine's back
+    engine.process_characters()
+    if not elder.is_alive:
+        print("PASS: Elder died.")
+    else:
+        print("FAIL: Elder survived.")
+    assert not elder.is_alive
+
+    engine.create_child(player.spouse_id, player.id)
+    child = engine.characters[player.children_ids[-1]]
+    assert child.age == 0 and child.is_alive
+
+    print("\nTesting Save/Load...")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "population.sav")
+        engine.save_game(path)
+        loaded = GameEngine()
+        ok = loaded.load_game(path)
+        loaded.enable_population_store()
+    reloaded = loaded.characters[player.id]
+    if ok and reloaded.wealth == player.wealth and reloaded.age == player.age:
+        print("PASS: Stored fields survive a round trip.")
+    else:
+        print("FAIL: Stored fields lost.")
+    assert ok and reloaded.wealth == player.wealth and reloaded.age == player.age
+
+def test_stored_character():
+    if not numpy_available():
+        return
+    from bloodlines.population import PopulationStore, StoredCharacter
+    store = PopulationStore(capacity=2, seed=1)
+    chars = [Character(name=f"C{i}", health=5.0 + i, wealth=100 * i, martial=3 + i, traits=["Brave"],
+                       children_ids=[7], opinions={7: 3}) for i in range(3)]
+    before = [c.to_dict() for c in chars]
+    for char in chars:
+        store.attach(char)
+    # The health and wealth slots now hold the store and the slot index
+    assert all(type(c) is StoredCharacter for c in chars)
+    assert [c._slot for c in chars] == [0, 1, 2] and all(c._store is store for c in chars)
+    assert [c.to_dict() for c in chars] == before
+    chars[1].wealth += 5
+    chars[1].health = 1.5
+    chars[2].martial = 20
+    assert store.arrays["wealth"][1] == 105 and store.arrays["health"][1] == 1.5
+    assert chars[0].wealth == 0 and chars[2].martial == 20 and chars[2].wealth == 200
+    # Fields that stay on the object are untouched
+    assert chars[1].name == "C1" and chars[1].traits == ["Brave"] and chars[1].children_ids == [7]
+    assert Character.from_dict(chars[1].to_dict()) == chars[1]
+    print("PASS: Stored characters keep their store in the freed slots.")
+
+def test_enable_twice():
+    if not numpy_available():
+        return
+    engine = GameEngine()
+    engine.create_test_scenario()
+    engine.enable_population_store(seed=1)
+    first = engine.population
+    engine.enable_population_store(seed=2)
+    store = engine.population
+    player = engine.characters[engine.player_character_id]
+    assert store is not first and store.count == len(engine.characters)
+    assert all(c._store is store for c in engine.characters.values())
+    age = player.age
+    for _ in range(24):
+        engine.advance_month()
+    if player.age == age + 2 and store.count == len(engine.characters):
+        print("PASS: A second enable moves every character into the new store.")
+    else:
+        print(f"FAIL: Age {player.age} (expected {age + 2}), store holds {store.count}/{len(engine.characters)}.")
+    assert player.age == age + 2 and store.count == len(engine.characters)
+
+if __name__ == "__main__":
+    test_population()
+    test_stored_character()
+    test_enable_twice()
@@ -0,0 +1,99 @@
+from bloodlines.engine import GameEngine
+from bloodlines.models import Character
+from bloodlines.relations import RelationView, opinion_band
+
+def make_world(people: int = 60) -> GameEngine:
+    """The test scenario plus unmarried people: every third one a Julius, ages 10 to 29."""
+    engine = GameEngine(seed=19)
+    engine.create_test_scenario()
+    player = engine.characters[engine.player_character_id]
+    for i in range(people):
+        dynasty_id = player.dynasty_id if i % 3 == 0 else None
+        char = Character(name=f"{'Julia' if i % 3 == 0 else 'Claudia'} {i}", age=10 + i % 20, gender="Female",
+                         dynasty_id=dynasty_id, location_id=player.location_id if i % 2 else None)
+        engine.characters[char.id] = char
+        if dynasty_id is not None:
+            engine.dynasties[dynasty_id].members.append(char.id)
+    return engine
+
+def everyone(view: RelationView):
+    ids, number = [], 0
+    while view.has_page(number):
+        ids += view.page(number)
+        number += 1
+    return ids
+
+def test_filters():
+    print("Testing Relationship Filters...")
+    engine = make_world()
+    player_id = engine.player_character_id
+    chars = engine.characters
+    living = [cid for cid, c in chars.items() if c.is_alive and cid != player_id]
+
+    view = RelationView(engine, player_id, relation="all", page_size=7)
+    listed = everyone(view)
+    names = [chars[cid].name.casefold() for cid in listed]
+    if sorted(listed) == sorted(living) and names == sorted(names) and len(view.page(0)) == 7:
+        print(f"PASS: {len(listed)} characters in pages of 7, by name.")
+    else:
+        print("FAIL: Paging lost or reordered characters.")
+    assert sorted(listed) == sorted(living) and names == sorted(names) and len(view.page(0)) == 7
+    assert view.page(100) == []
+
+    expected = [cid for cid in living if chars[cid].gender == "Female" and chars[cid].age >= 16
+                and not chars[cid].spouse_id]
+    assert sorted(everyone(RelationView(engine, player_id, relation="spouse"))) == sorted(expected)
+    dynasty = everyone(RelationView(engine, player_id, relation="spouse",
+                                    dynasty_id=chars[player_id].dynasty_id))
+    assert dynasty and all(chars[cid].name.startswith("Julia") for cid in dynasty)
+    search = everyone(RelationView(engine, player_id, relation="all", prefix="jul"))
+    assert search and all(chars[cid].name.startswith("Julia") or chars[cid].name.startswith("Julius")
+                           for cid in search)
+    polity = everyone(RelationView(engine, player_id, relation="polity"))
+    assert sorted(polity) == sorted(cid for cid in living if chars[cid].location_id == chars[player_id].location_id)
+    assert everyone(RelationView(engine, player_id, relation="family")) == [chars[player_id].spouse_id] + \
+        chars[player_id].children_ids
+
+    friend, rival = listed[3], listed[5]
+    engine.modify_opinion(player_id, friend, 60)
+    engine.modify_opinion(player_id, rival, -20)
+    assert everyone(RelationView(engine, player_id, relation="all", band="Allied")) == [friend]
+    assert everyone(RelationView(engine, player_id, relation="all", band="Unfriendly")) == [rival]
+    assert opinion_band(60) == "Allied" and opinion_band(0) == "Neutral" and opinion_band(-50) == "Hostile"
+    print("PASS: Relation, dynasty, band and name filters.")
+
+def test_spouse_index_updates():
+    print("\nTesting Eligible-Spouse Index...")
+    engine = make_world()
+    player_id = engine.player_character_id
+    chars = engine.characters
+    singles = lambda: set(engine.matchmaker.singles("Female"))
+    before = singles()
+    bride = next(iter(before))
+    groom = Character(name="Marcus", age=20, gender="Male")
+    chars[groom.id] = groom
+    engine.matchmaker.update(groom.id)
+    engine.modify_opinion(groom.id, bride, 10)
+    engine.modify_opinion(bride, groom.id, 10)
+    assert engine.arrange_marriage(groom.id, bride)
+    assert bride not in singles()
+
+    # The 15-year-olds come of age in January
+    coming = {cid for cid, c in chars.items() if c.gender == "Female" and c.age == 15}
+    engine.month = 12
+    engine.advance_month()
+    after = singles()
+    if after == (before - {bride}) | coming:
+        print(f"PASS: {len(coming)} came of age, the bride left the index.")
+    else:
+        print(f"FAIL: {sorted(after ^ ((before - {bride}) | coming))} misplaced.")
+    assert after == (before - {bride}) | coming
+
+    engine.kill_character(next(iter(coming)), "Fever")
+    assert len(singles()) == len(after) - 1
+    engine.matchmaker.rebuild()
+    assert singles() == after - {next(iter(coming))}
+
+if __name__ == "__main__":
+    test_filters()
+    test_spouse_index_updates()
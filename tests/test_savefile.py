@@ -0,0 +1,80 @@
+from bloodlines.engine import GameEngine
+from bloodlines import savefile
+import os
+import tempfile
+
+def snapshot(engine):
+    return {
+        "date": engine.get_date_string(),
+        "player": engine.player_character_id,
+        "characters": {k: v.to_dict() for k, v in engine.characters.items()},
+        "dynasties": {k: v.to_dict() for k, v in engine.dynasties.items()},
+        "polities": {k: v.to_dict() for k, v in engine.polities.items()},
+        "regions": {k: v.to_dict() for k, v in engine.regions.items()},
+        "opinions": {k: engine.opinions.row(k) for k in engine.characters},
+    }
+
+def test_savefile():
+    print("Initializing Engine...")
+    engine = GameEngine()
+    engine.create_test_scenario()
+    engine.enable_death_scheduler()
+    player_id = engine.player_character_id
+    engine.create_child(engine.characters[player_id].spouse_id, player_id)
+    engine.modify_opinion(player_id, engine.characters[player_id].spouse_id, 40)
+    engine.characters[player_id].traits.append("Brave")
+    engine.modify_wealth(player_id, 200)
+    engine.construct_building(engine.characters[player_id].location_id, "estate")
+    for _ in range(6):
+        engine.advance_month()
+    expected = snapshot(engine)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for codec in savefile.available_codecs():
+            print(f"\nTesting Binary Round Trip ({codec})...")
+            path = os.path.join(tmp, f"binary-{codec}.sav")
+            engine.save_game(path, codec=codec)
+            if savefile.detect_format(path) == "binary":
+                print("PASS: Binary format detected.")
+            else:
+                print("FAIL: Format not detected.")
+            assert savefile.detect_format(path) == "binary"
+
+            loaded = GameEngine()
+            ok = loaded.load_game(path)
+            if ok and snapshot(loaded) == expected:
+                print("PASS: World restored exactly.")
+            else:
+                print("FAIL: World differs after load.")
+            assert ok and snapshot(loaded) == expected
+            assert loaded.death_scheduler.due == engine.death_scheduler.due
+
+        print("\nTesting Legacy JSON Save...")
+        path = os.path.join(tmp, "legacy.sav")
+        engine.save_game(path, save_format="json")
+        loaded = GameEngine()
+        ok = loaded.load_game(path)
+        if ok and savefile.detect_format(path) == "json" and snapshot(loaded) == expected:
+            print("PASS: Legacy save auto-detected and loaded.")
+        else:
+            print("FAIL: Legacy save not loaded.")
+        assert ok and snapshot(loaded) == expected
+
+        print("\nTesting Size...")
+        binary_size = os.path.getsize(os.path.join(tmp, "binary-zlib.sav"))
+        json_size = os.path.getsize(path)
+        print(f"Binary: {binary_size} bytes, JSON: {json_size} bytes")
+        assert binary_size < json_size
+
+        print("\nTesting Corrupt Save...")
+        path = os.path.join(tmp, "corrupt.sav")
+        engine.save_game(path)
+        with open(path, "r+b") as f:
+            f.truncate(os.path.getsize(path) // 2)
+        if not GameEngine().load_game(path):
+            print("PASS: Truncated save rejected.")
+        else:
+            print("FAIL: Truncated save accepted.")
+
+if __name__ == "__main__":
+    test_savefile()
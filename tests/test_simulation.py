@@ -0,0 +1,96 @@
+from bloodlines.engine import GameEngine
+from bloodlines.simulation import SimulationConfig, register_policy, run_simulation, run_batch, world_hash
+import os
+import pickle
+import tempfile
+
+def last_option_policy(engine, event):
+    return len(event.options) - 1
+
+def saved_hash(path):
+    engine = GameEngine()
+    assert engine.load_game(path)
+    return world_hash(engine)
+
+def test_simulation():
+    print("Running headless simulation...")
+    result = run_simulation(SimulationConfig(months=60, seed=42))
+    print(f"Months: {result.months_run}, Rate: {result.months_per_sec:.0f} months/sec")
+    print(f"Stats: {result.stats}")
+
+    if result.months_run == 60 or result.stats["game_over"]:
+        print("PASS: Simulation advanced.")
+    else:
+        print(f"FAIL: Only ran {result.months_run} months.")
+    assert result.months_run == 60 or result.stats["game_over"]
+
+    # Same seed -> same outcome
+    print("\nTesting Seeding...")
+    again = run_simulation(SimulationConfig(months=60, seed=42))
+    if again.stats == result.stats:
+        print("PASS: Seeded runs match.")
+    else:
+        print(f"FAIL: Seeded runs differ: {again.stats}")
+    assert again.stats == result.stats
+
+    # Checkpointing
+    print("\nTesting Checkpoints...")
+    with tempfile.TemporaryDirectory() as tmp:
+        prefix = os.path.join(tmp, "checkpoint")
+        run_simulation(SimulationConfig(months=12, seed=1, checkpoint_every=12, checkpoint_path=prefix))
+        path = prefix + "-seed1.sav"
+        if os.path.exists(path):
+            print("PASS: Checkpoint written.")
+        else:
+            print("FAIL: No checkpoint found.")
+        assert os.path.exists(path)
+
+        # Resuming from the checkpoint ends in the same world as running straight through
+        straight = os.path.join(tmp, "straight")
+        run_simulation(SimulationConfig(months=24, seed=1, checkpoint_every=24, checkpoint_path=straight))
+        resumed_path = os.path.join(tmp, "resumed")
+        resumed = run_simulation(SimulationConfig(months=12, load_path=path, checkpoint_every=12,
+                                                  checkpoint_path=resumed_path))
+        assert resumed.months_run == 12
+        if saved_hash(resumed_path + ".sav") == saved_hash(straight + "-seed1.sav"):
+            print("PASS: Resumed run matches the uninterrupted one.")
+        else:
+            print("FAIL: Resumed run diverged from the uninterrupted one.")
+        assert saved_hash(resumed_path + ".sav") == saved_hash(straight + "-seed1.sav")
+
+        # Seeds given for a run from a save still tell the runs apart
+        hashes = []
+        for seed in (2, 3):
+            branch = os.path.join(tmp, "branch")
+            run_simulation(SimulationConfig(months=36, seed=seed, load_path=path, checkpoint_every=36,
+                                            checkpoint_path=branch))
+            hashes.append(saved_hash(f"{branch}-seed{seed}.sav"))
+        if hashes[0] != hashes[1]:
+            print("PASS: Different seeds from one save play out differently.")
+        else:
+            print("FAIL: Every seed from the save replayed the same campaign.")
+        assert hashes[0] != hashes[1]
+
+    # Batch
+    print("\nTesting Batch...")
+    results = run_batch([SimulationConfig(months=12, seed=s) for s in range(3)])
+    if len(results) == 3:
+        print("PASS: Batch ran all seeds.")
+    else:
+        print(f"FAIL: Batch returned {len(results)} results.")
+    assert len(results) == 3
+
+    # A policy registered at runtime reaches the worker processes
+    register_policy("last", last_option_policy)
+    assert pickle.loads(pickle.dumps(last_option_policy)) is last_option_policy
+    configs = [SimulationConfig(months=24, seed=s, policy="last") for s in range(2)]
+    pooled = run_batch(configs, workers=2)
+    serial = run_batch(configs)
+    if [r.stats for r in pooled] == [r.stats for r in serial]:
+        print("PASS: Registered policy used by the worker pool.")
+    else:
+        print("FAIL: Pooled runs differ from serial ones.")
+    assert [r.stats for r in pooled] == [r.stats for r in serial]
+
+if __name__ == "__main__":
+    test_simulation()
@@ -0,0 +1,92 @@
+from bloodlines.engine import GameEngine
+from bloodlines.models import Character, Polity, GovernmentType
+
+def reference_title_type(engine, char_id):
+    """Rules a polity, or eldest living child of someone who does."""
+    rulers = {p.ruler_id for p in engine.polities.values()}
+    if char_id in rulers:
+        return "ruler"
+    for ruler_id in rulers:
+        ruler = engine.characters.get(ruler_id)
+        if ruler is not None:
+            heir = next((c for c in ruler.children_ids if engine.characters[c].is_alive), None)
+            if heir == char_id:
+                return "heir"
+    return "noble"
+
+def test_heirs():
+    print("Testing Heir Cache...")
+    engine = GameEngine(seed=21)
+    engine.create_test_scenario()
+    player = engine.characters[engine.player_character_id]
+    son_id = player.children_ids[0]
+    assert engine.get_character_title(player.id) == "Rex"
+    assert engine.titles.title_type(son_id) == "heir"
+
+    engine.create_child(player.spouse_id, player.id)
+    second = player.children_ids[1]
+    assert engine.titles.title_type(second) == "noble"
+    engine.kill_character(son_id, "Fever")
+    if engine.titles.title_type(second) == "heir" and engine.titles.title_type(son_id) == "noble":
+        print("PASS: A dead heir's claim passes to the next living child.")
+    else:
+        print("FAIL: Heir not updated on death.")
+    assert engine.titles.title_type(second) == "heir"
+
+    # A childless ruler gets an heir at the first birth
+    king = Character(name="Numa", gender="Male", culture="Roman")
+    queen = Character(name="Tanaquil", gender="Female", culture="Roman", spouse_id=king.id)
+    king.spouse_id = queen.id
+    for char in (king, queen):
+        engine.characters[char.id] = char
+    realm = Polity(name="Sabines", government_type=GovernmentType.MONARCHY)
+    engine.polities[realm.id] = realm
+    engine.set_ruler(realm.id, king.id)
+    assert engine.titles.heir(realm.id) is None
+    engine.create_child(queen.id, king.id)
+    assert engine.titles.heir(realm.id) == king.children_ids[0]
+
+    # Succession hands the player's polities to the new head
+    rome_id = engine.titles.polities_of(player.id)[0]
+    engine.kill_character(player.id, "Old Age")
+    if engine.polities[rome_id].ruler_id == second and engine.titles.title_type(second) == "ruler":
+        print("PASS: Succession crowns the heir.")
+    else:
+        print("FAIL: Polity not passed on.")
+    assert engine.polities[rome_id].ruler_id == second and engine.get_character_title(second) == "Rex"
+
+def test_matches_scan():
+    print("\nTesting Titles Against a Full Scan...")
+    engine = GameEngine(seed=22)
+    engine.create_test_scenario()
+    for i, government in enumerate([GovernmentType.MONARCHY, GovernmentType.REPUBLIC, GovernmentType.TRIBE] * 3):
+        ruler = Character(name=f"Ruler {i}", age=30, gender="Male")
+        wife = Character(name=f"Consort {i}", age=20, gender="Female", spouse_id=ruler.id)
+        ruler.spouse_id = wife.id
+        for char in (ruler, wife):
+            engine.characters[char.id] = char
+            engine.lineage.add(char)
+        polity = Polity(name=f"Realm {i}", government_type=government, ruler_id=ruler.id)
+        engine.polities[polity.id] = polity
+    engine.fertility.rebuild()
+    mismatches = 0
+    for month in range(600):
+        engine.advance_month()
+        if engine.current_event:
+            engine.resolve_event(0)
+        if month == 300:  # A ruler set straight on the polity is seen by the next month
+            polity = next(iter(engine.polities.values()))
+            polity.ruler_id = next(c.id for c in engine.characters.values() if c.is_alive and c.id != polity.ruler_id)
+            engine.advance_month()
+        if month % 50 == 0:
+            mismatches += sum(engine.titles.title_type(cid) != reference_title_type(engine, cid)
+                              for cid in engine.characters)
+    if mismatches == 0:
+        print(f"PASS: {len(engine.characters)} characters titled as a full scan would.")
+    else:
+        print(f"FAIL: {mismatches} titles differ.")
+    assert mismatches == 0
+
+if __name__ == "__main__":
+    test_heirs()
+    test_matches_scan()
@@ -0,0 +1,107 @@
+from collections import deque
+import random
+from bloodlines import demography
+from bloodlines.engine import GameEngine
+from bloodlines.models import Character, Terrain
+from bloodlines.worldgen import RegionGraph, generate_map
+
+def test_generated_graph():
+    print("Testing Generated Map...")
+    regions, graph = generate_map(2500, random.Random(22))
+    assert len(graph) == len(regions) == 2500
+
+    # Symmetric, no self-loops, and the CSR rows match Region.neighbors
+    by_id = {region.id: region for region in regions}
+    for region in regions:
+        assert graph.neighbors(region.id) == region.neighbors
+        assert region.id not in region.neighbors
+        for other in region.neighbors:
+            assert region.id in by_id[other].neighbors
+            assert graph.adjacent(region.id, other)
+
+    degrees = [graph.degree(region.id) for region in regions]
+    mean = sum(degrees) / len(degrees)
+    if 2 <= min(degrees) and max(degrees) <= 8 and 5.5 < mean < 6.5:
+        print(f"PASS: Degrees {min(degrees)}-{max(degrees)}, mean {mean:.2f}.")
+    else:
+        print(f"FAIL: Degrees {min(degrees)}-{max(degrees)}, mean {mean:.2f}.")
+    assert 2 <= min(degrees) and max(degrees) <= 8 and 5.5 < mean < 6.5
+
+    # Connected
+    seen = {0}
+    queue = deque([0])
+    while queue:
+        for j in graph.neighbor_indices(queue.popleft()):
+            if j not in seen:
+                seen.add(j)
+                queue.append(j)
+    if len(seen) == len(regions):
+        print("PASS: Every region is reachable.")
+    else:
+        print(f"FAIL: Only {len(seen)} of {len(regions)} regions reachable.")
+    assert len(seen) == len(regions)
+
+    terrains = {region.terrain for region in regions}
+    assert terrains == set(Terrain)
+    assert all(region.population > 0 and region.wealth > 0 for region in regions)
+
+def test_seeded():
+    first, _ = generate_map(400, random.Random(5))
+    second, _ = generate_map(400, random.Random(5))
+    shape = lambda regions: [(r.name, r.terrain, r.population, r.wealth, [n - regions[0].id for n in r.neighbors])
+                             for r in regions]
+    assert shape(first) == shape(second)
+    print("PASS: The same seed gives the same map.")
+
+def test_graph_from_regions():
+    engine = GameEngine(seed=22)
+    engine.create_test_scenario()
+    graph = engine.world_manager.graph
+    by_name = {region.name: region.id for region in engine.regions.values()}
+    assert graph.adjacent(by_name["Latium"], by_name["Etruria"])
+    assert not graph.adjacent(by_name["Latium"], by_name["Lower Egypt"])
+    assert sorted(graph.neighbors(by_name["Latium"])) == sorted(engine.regions[by_name["Latium"]].neighbors)
+
+    # Ids that are not consecutive fall back to a lookup table
+    subset = {rid: engine.regions[rid] for rid in (by_name["Latium"], by_name["Campania"], by_name["Judaea"])}
+    sparse = RegionGraph.from_regions(subset)
+    assert sparse.neighbors(by_name["Latium"]) == [by_name["Campania"]]
+    assert sparse.neighbors(by_name["Judaea"]) == []
+    print("PASS: Graph built from Region.neighbors.")
+
+def test_move_on_generated_map():
+    engine = GameEngine(seed=22)
+    engine.create_test_scenario()
+    regions = engine.world_manager.generate_map(100, seed=3)
+    assert engine.world_manager.graph.adjacent(regions[0].id, regions[1].id)
+    traveller = Character(name="Traveller", location_id=regions[0].id)
+    engine.characters[traveller.id] = traveller
+    assert engine.world_manager.move_character(traveller.id, regions[0].neighbors[0])
+    far = next(r.id for r in regions if r.id not in engine.regions[traveller.location_id].neighbors
+               and r.id != traveller.location_id)
+    moved = engine.world_manager.move_character(traveller.id, far)
+    if not moved:
+        print("PASS: Movement on a generated map follows its adjacency.")
+    else:
+        print("FAIL: Moved to a region that is not adjacent.")
+    assert not moved
+
+def test_generated_regions_join_caches():
+    engine = GameEngine(seed=22)
+    engine.create_test_scenario()
+    engine.income_ledger.refresh()
+    if demography.numpy_available():
+        engine.enable_demography()
+    regions = engine.world_manager.generate_map(100, seed=3)
+    ledger = engine.income_ledger
+    assert all(region.id in ledger.region_income for region in regions)
+    if engine.demography is not None:
+        assert all(abs(engine.demography.population_of(r.id) - r.population) <= 1 for r in regions)
+    print("PASS: Generated regions join the income ledger and the demography arrays.")
+
+if __name__ == "__main__":
+    test_generated_graph()
+    test_seeded()
+    test_graph_from_regions()
+    test_move_on_generated_map()
+    test_generated_regions_join_caches()